@@ -0,0 +1,119 @@
+"""Benchmarks for IATP attestation signature verification."""
+
+from __future__ import annotations
+
+import base64
+import time
+from typing import Any, Callable, Dict, List
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+
+from iatp.attestation import AttestationValidator, generate_ed25519_keypair
+from iatp.models import AttestationRecord
+
+_PUBLISHERS = 8
+
+
+def _signed_batch(count: int) -> tuple:
+    """*count* attestations signed by a handful of publisher keys."""
+    validator = AttestationValidator()
+    keys = [generate_ed25519_keypair() for _ in range(_PUBLISHERS)]
+    public_keys = {f"publisher-{i}": pub for i, (_, pub) in enumerate(keys)}
+    attestations = [
+        validator.create_attestation(
+            f"agent-{i}", f"code-{i}", f"config-{i}",
+            f"publisher-{i % _PUBLISHERS}", keys[i % _PUBLISHERS][0],
+        )
+        for i in range(count)
+    ]
+    return public_keys, attestations
+
+
+def _verify_parse_every_time(public_keys: Dict[str, str], attestation: AttestationRecord) -> bool:
+    """Baseline: decode and parse the public key for every verification."""
+    try:
+        key = Ed25519PublicKey.from_public_bytes(base64.b64decode(public_keys[attestation.signing_key_id]))
+        message = (
+            f"{attestation.agent_id}:{attestation.codebase_hash}:"
+            f"{attestation.config_hash}:{attestation.timestamp}"
+        )
+        key.verify(base64.b64decode(attestation.signature), message.encode())
+        return True
+    except (InvalidSignature, Exception):
+        return False
+
+
+def _rate(name: str, count: int, run: Callable[[], Any]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    return {
+        "name": name,
+        "verifications": count,
+        "verifications_per_sec": round(count / elapsed),
+    }
+
+
+def bench_verify_parse_every_time(count: int = 2_000) -> Dict[str, Any]:
+    """Baseline: unique attestations, key parsed on every call."""
+    public_keys, attestations = _signed_batch(count)
+
+    def run() -> None:
+        for attestation in attestations:
+            assert _verify_parse_every_time(public_keys, attestation)
+
+    return _rate("Attestation Verify (parse key every call)", count, run)
+
+
+def bench_verify_cold(count: int = 2_000) -> Dict[str, Any]:
+    """Unique attestations: parsed-key cache only, every signature checked."""
+    public_keys, attestations = _signed_batch(count)
+    validator = AttestationValidator(public_keys)
+
+    def run() -> None:
+        for attestation in attestations:
+            assert validator.validate_attestation(attestation)[0]
+
+    return _rate("Attestation Verify (cold, cached keys)", count, run)
+
+
+def bench_verify_repeated(count: int = 20_000, distinct: int = 200) -> Dict[str, Any]:
+    """The same 200 manifests re-presented: served from the verified cache."""
+    public_keys, attestations = _signed_batch(distinct)
+    validator = AttestationValidator(public_keys)
+    batch = [attestations[i % distinct] for i in range(count)]
+
+    def run() -> None:
+        for attestation in batch:
+            assert validator.validate_attestation(attestation)[0]
+
+    return _rate("Attestation Verify (repeated, verified cache)", count, run)
+
+
+def bench_verify_many(count: int = 2_000, workers: int = 8) -> Dict[str, Any]:
+    """Unique attestations verified as one batch on a thread pool."""
+    public_keys, attestations = _signed_batch(count)
+    validator = AttestationValidator(public_keys)
+
+    def run() -> None:
+        assert all(ok for ok, _ in validator.verify_many(attestations, max_workers=workers))
+
+    return _rate(f"Attestation verify_many ({workers} threads)", count, run)
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all attestation benchmarks and return results."""
+    return [
+        bench_verify_parse_every_time(),
+        bench_verify_cold(),
+        bench_verify_repeated(),
+        bench_verify_many(),
+    ]
+
+
+if __name__ == "__main__":
+    import json
+
+    for result in run_all():
+        print(json.dumps(result, indent=2))
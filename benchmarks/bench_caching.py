@@ -0,0 +1,139 @@
+"""Benchmarks for the CaaS context cache."""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Any, Dict, List
+
+from caas.caching import CacheConfig, CacheType, ContextCache
+
+_TEMPLATE = (
+    "Request {rid} received at {ts} from session {session}. You are reviewing "
+    "ticket #{topic} for the platform team. Summarize the incident timeline, "
+    "list follow-up actions with owners, and flag any risk that was escalated "
+    "more than twice. Context block {topic}: "
+)
+
+
+def _sync_timer(func, iterations: int = 10_000) -> Dict[str, Any]:
+    """Run a synchronous function *iterations* times and return latency stats."""
+    latencies: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        latencies.append((time.perf_counter() - start) * 1_000)
+    latencies.sort()
+    total_seconds = sum(latencies) / 1_000
+    return {
+        "iterations": iterations,
+        "total_seconds": round(total_seconds, 4),
+        "ops_per_sec": round(iterations / total_seconds) if total_seconds > 0 else 0,
+        "p50_ms": round(latencies[len(latencies) // 2], 4),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95)], 4),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)], 4),
+    }
+
+
+def _prompt(rng: random.Random, topic: int) -> str:
+    """A ~3 KB prompt for *topic* with a fresh request id, timestamp and session."""
+    header = _TEMPLATE.format(
+        rid=rng.randrange(10**6),
+        ts=f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T"
+        f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00Z",
+        session=f"{rng.getrandbits(64):016x}",
+        topic=topic,
+    )
+    body = " ".join(f"topic{topic}-fact{i}" for i in range(200))
+    spacing = " " * rng.randint(1, 3)
+    return header + spacing + body
+
+
+def _near_duplicate_workload(semantic: bool, topics: int = 200, iterations: int = 5_000) -> Dict[str, Any]:
+    rng = random.Random(42)
+    cache = ContextCache(
+        config=CacheConfig(
+            min_tokens_for_caching=10,
+            enable_provider_cache=False,
+            enable_semantic_cache=semantic,
+            # Request ids and session hashes vary per call in this workload
+            semantic_normalization=(
+                "timestamps", "uuids", "hex_ids", "numbers", "lowercase", "whitespace",
+            ),
+            cleanup_interval_seconds=0,
+        )
+    )
+    for topic in range(topics):
+        cache.store(_prompt(rng, topic), response=f"answer-{topic}")
+
+    queries = [_prompt(rng, rng.randrange(topics)) for _ in range(iterations)]
+    hits = 0
+    position = 0
+
+    def lookup() -> None:
+        nonlocal hits, position
+        result = cache.lookup(queries[position])
+        position += 1
+        if result.cache_type != CacheType.MISS:
+            hits += 1
+
+    stats = _sync_timer(lookup, iterations)
+    stats["hit_rate"] = round(hits / iterations, 4)
+    return stats
+
+
+def bench_exact_lookup_near_duplicates(iterations: int = 5_000) -> Dict[str, Any]:
+    """Baseline: exact-key cache on near-duplicate prompts (expected to miss)."""
+    return {
+        "name": "Context Cache Lookup (exact only, near-dup workload)",
+        **_near_duplicate_workload(semantic=False, iterations=iterations),
+    }
+
+
+def bench_semantic_lookup_near_duplicates(iterations: int = 5_000) -> Dict[str, Any]:
+    """Benchmark the semantic tier on prompts differing in ids/timestamps/whitespace."""
+    return {
+        "name": "Context Cache Lookup (semantic, near-dup workload)",
+        **_near_duplicate_workload(semantic=True, iterations=iterations),
+    }
+
+
+def bench_large_context_lookup(iterations: int = 2_000) -> Dict[str, Any]:
+    """Benchmark exact-key misses on 4 MB contexts under a 64 MB byte budget."""
+    cache = ContextCache(
+        config=CacheConfig(
+            min_tokens_for_caching=10,
+            enable_provider_cache=False,
+            max_bytes=64 * 1024 * 1024,
+            cleanup_interval_seconds=0,
+        )
+    )
+    base = "x" * (4 * 1024 * 1024)
+    for i in range(32):
+        cache.store(f"{i:08d}" + base)
+    query = "miss-key" + base
+
+    result = {
+        "name": "Context Cache Lookup (4 MB context, miss)",
+        **_sync_timer(lambda: cache.lookup(query), iterations),
+    }
+    stats = cache.get_stats()
+    result["current_bytes"] = stats["current_bytes"]
+    result["evictions"] = stats["evictions"]
+    return result
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all caching benchmarks and return results."""
+    return [
+        bench_exact_lookup_near_duplicates(),
+        bench_semantic_lookup_near_duplicates(),
+        bench_large_context_lookup(),
+    ]
+
+
+if __name__ == "__main__":
+    import json
+
+    for result in run_all():
+        print(json.dumps(result, indent=2))
@@ -0,0 +1,138 @@
+"""Benchmarks for constraint-graph loading and resolution."""
+
+from __future__ import annotations
+
+import fnmatch
+import random
+import time
+from typing import Any, Dict, List
+
+from agent_os.constraint_graph import ConstraintEdge, ConstraintGraph, Permission
+
+
+def _constraints(count: int) -> List[ConstraintEdge]:
+    """Generated rule set: mostly exact tool grants plus per-team globs."""
+    rng = random.Random(42)
+    edges = []
+    for i in range(count):
+        kind = i % 10
+        if kind < 7:
+            agent, resource = f"agent-{i}", f"tool_{i}"
+        elif kind < 9:
+            agent, resource = f"team-{i % 500}-*", f"svc_{i % 1000}_*"
+        else:
+            agent, resource = "*", f"data_{i % 200}_v?"
+        permission = Permission.DENY if rng.random() < 0.2 else Permission.ALLOW
+        edges.append(ConstraintEdge(agent, resource, permission, priority=rng.randint(0, 9)))
+    return edges
+
+
+def _lookups(count: int, n: int) -> List[tuple]:
+    rng = random.Random(7)
+    lookups = []
+    for _ in range(n):
+        i = rng.randrange(count)
+        lookups.append(rng.choice([
+            (f"agent-{i}", f"tool_{i}"),
+            (f"team-{i % 500}-bot", f"svc_{i % 1000}_read"),
+            (f"agent-{i}", f"data_{i % 200}_v1"),
+            ("unknown", "nothing"),
+        ]))
+    return lookups
+
+
+def _linear_resolve(edges: List[ConstraintEdge], agent_id: str, resource: str) -> bool:
+    """Baseline: fnmatch against every edge in priority order."""
+    for edge in edges:
+        if fnmatch.fnmatch(agent_id, edge.agent_pattern) and fnmatch.fnmatch(resource, edge.resource):
+            return edge.permission == Permission.ALLOW
+    return False
+
+
+def _timed(name: str, func, iterations: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        func(i)
+        latencies.append((time.perf_counter() - start) * 1_000)
+    latencies.sort()
+    total = sum(latencies) / 1_000
+    return {
+        "name": name,
+        "iterations": iterations,
+        "ops_per_sec": round(iterations / total) if total else 0,
+        "p50_ms": round(latencies[len(latencies) // 2], 4),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)], 4),
+    }
+
+
+def bench_load_resort_per_insert(count: int = 10_000) -> Dict[str, Any]:
+    """Baseline: append and re-sort the whole edge list on every insert."""
+    edges = _constraints(count)
+    started = time.perf_counter()
+    loaded: List[ConstraintEdge] = []
+    for edge in edges:
+        loaded.append(edge)
+        loaded.sort(key=lambda e: e.priority, reverse=True)
+    return {
+        "name": f"Constraint Load ({count:,}, re-sort per insert)",
+        "total_ms": round((time.perf_counter() - started) * 1_000, 1),
+    }
+
+
+def bench_load_lazy_index(count: int) -> Dict[str, Any]:
+    """add_constraint for every edge, then the first resolve builds the index."""
+    edges = _constraints(count)
+    started = time.perf_counter()
+    graph = ConstraintGraph()
+    for edge in edges:
+        graph.add_constraint(edge)
+    graph.resolve("agent-0", "tool_0")
+    return {
+        "name": f"Constraint Load ({count:,}, lazy index)",
+        "total_ms": round((time.perf_counter() - started) * 1_000, 1),
+    }
+
+
+def bench_resolve_linear(count: int, iterations: int = 200) -> Dict[str, Any]:
+    """Baseline: linear fnmatch scan per lookup."""
+    edges = sorted(_constraints(count), key=lambda e: e.priority, reverse=True)
+    lookups = _lookups(count, iterations)
+    return _timed(
+        f"Constraint Resolve ({count:,}, linear fnmatch)",
+        lambda i: _linear_resolve(edges, *lookups[i]),
+        iterations,
+    )
+
+
+def bench_resolve_indexed(count: int, iterations: int = 20_000) -> Dict[str, Any]:
+    """Indexed resolution: hash buckets, glob prefix trie, compiled matchers."""
+    graph = ConstraintGraph()
+    graph.add_constraints(_constraints(count))
+    lookups = _lookups(count, iterations)
+    graph.resolve("agent-0", "tool_0")
+    return _timed(
+        f"Constraint Resolve ({count:,}, indexed)",
+        lambda i: graph.resolve(*lookups[i]),
+        iterations,
+    )
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all constraint-graph benchmarks and return results."""
+    return [
+        bench_load_resort_per_insert(10_000),
+        bench_load_lazy_index(10_000),
+        bench_load_lazy_index(100_000),
+        bench_resolve_linear(10_000),
+        bench_resolve_indexed(10_000),
+        bench_resolve_linear(100_000, iterations=5),
+        bench_resolve_indexed(100_000),
+    ]
+
+
+if __name__ == "__main__":
+    import json
+
+    for result in run_all():
+        print(json.dumps(result, indent=2))
@@ -0,0 +1,92 @@
+"""Benchmarks for IATP typed-pipe pipelines."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+from iatp.ipc_pipes import AgentPipelineStage, Pipeline
+
+
+class _SimulatedAgent:
+    """Agent stage with fixed I/O-bound latency (e.g. a model or tool call)."""
+
+    def __init__(self, latency_s: float) -> None:
+        self._latency = latency_s
+
+    async def process(self, payload: Any) -> Any:
+        await asyncio.sleep(self._latency)
+        return payload
+
+
+def _pipeline(stages: int, latency_s: float, workers: int) -> Pipeline:
+    return Pipeline(
+        [
+            AgentPipelineStage(_SimulatedAgent(latency_s), f"stage-{i}", workers=workers)
+            for i in range(stages)
+        ],
+        name="bench",
+    )
+
+
+async def _execute_each(pipeline: Pipeline, messages: int) -> None:
+    for i in range(messages):
+        await pipeline.execute(i)
+
+
+async def _stream(pipeline: Pipeline, messages: int) -> None:
+    async for _ in pipeline.stream(range(messages)):
+        pass
+
+
+def _throughput(name: str, run, messages: int) -> Dict[str, Any]:
+    started = time.perf_counter()
+    asyncio.run(run)
+    elapsed = time.perf_counter() - started
+    return {
+        "name": name,
+        "messages": messages,
+        "total_seconds": round(elapsed, 4),
+        "messages_per_sec": round(messages / elapsed),
+    }
+
+
+def bench_pipeline_execute_sequential(
+    messages: int = 300, stages: int = 4, latency_s: float = 0.002
+) -> Dict[str, Any]:
+    """Baseline: one execute() per message, stages never overlap."""
+    pipeline = _pipeline(stages, latency_s, workers=1)
+    return _throughput(
+        f"Pipeline ({stages} stages x 2 ms, execute per message)",
+        _execute_each(pipeline, messages),
+        messages,
+    )
+
+
+def bench_pipeline_stream(
+    messages: int = 300, stages: int = 4, latency_s: float = 0.002, workers: int = 1
+) -> Dict[str, Any]:
+    """Streaming execution with bounded queues between stages."""
+    pipeline = _pipeline(stages, latency_s, workers=workers)
+    return _throughput(
+        f"Pipeline ({stages} stages x 2 ms, stream, {workers} worker(s)/stage)",
+        _stream(pipeline, messages),
+        messages,
+    )
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all pipeline benchmarks and return results."""
+    return [
+        bench_pipeline_execute_sequential(),
+        bench_pipeline_stream(workers=1),
+        bench_pipeline_stream(workers=4),
+    ]
+
+
+if __name__ == "__main__":
+    import json
+
+    for result in run_all():
+        print(json.dumps(result, indent=2))
@@ -0,0 +1,217 @@
+"""Benchmarks for control-plane lifecycle management."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, List
+
+from agent_control_plane.lifecycle import (
+    AgentResourceQuota,
+    AgentScaler,
+    HealthCheckConfig,
+    HealthMonitor,
+    ResourceQuotaManager,
+    ScalingConfig,
+)
+
+
+def _sync_timer(func, iterations: int = 10_000) -> Dict[str, Any]:
+    """Run a synchronous function *iterations* times and return latency stats."""
+    latencies: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        latencies.append((time.perf_counter() - start) * 1_000)
+    latencies.sort()
+    total_seconds = sum(latencies) / 1_000
+    return {
+        "iterations": iterations,
+        "total_seconds": round(total_seconds, 4),
+        "ops_per_sec": round(iterations / total_seconds) if total_seconds > 0 else 0,
+        "p50_ms": round(latencies[len(latencies) // 2], 4),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95)], 4),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)], 4),
+    }
+
+
+class _SimulatedAgent:
+    """Agent whose liveness probe takes a few milliseconds, like a remote ping."""
+
+    def __init__(self, rng: random.Random, mean_latency_s: float) -> None:
+        self._latency = rng.expovariate(1.0 / mean_latency_s)
+
+    async def liveness_check(self) -> bool:
+        await asyncio.sleep(self._latency)
+        return True
+
+    async def readiness_check(self) -> bool:
+        await asyncio.sleep(self._latency)
+        return True
+
+
+def _make_monitor(num_agents: int, mean_latency_s: float, **config: Any) -> HealthMonitor:
+    rng = random.Random(7)
+    monitor = HealthMonitor(config=HealthCheckConfig(**config))
+    for i in range(num_agents):
+        monitor.register_agent(f"agent-{i}", _SimulatedAgent(rng, mean_latency_s))
+    return monitor
+
+
+async def _sequential_sweep(monitor: HealthMonitor) -> float:
+    """One agent at a time, as the liveness loop used to probe."""
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for agent_id in list(monitor._agents):
+        result = await monitor._check_liveness(agent_id)
+        await monitor._handle_liveness_result(agent_id, result)
+    return (loop.time() - started) * 1000
+
+
+async def _concurrent_sweep(monitor: HealthMonitor, interval_s: float) -> float:
+    return await monitor._run_sweep(
+        "liveness", monitor._check_liveness, monitor._handle_liveness_result, interval_s
+    )
+
+
+def bench_health_sweep_sequential(num_agents: int = 1_000, mean_latency_s: float = 0.005) -> Dict[str, Any]:
+    """Baseline: probe 1,000 simulated agents one after another."""
+    monitor = _make_monitor(num_agents, mean_latency_s)
+    duration_ms = asyncio.run(_sequential_sweep(monitor))
+    return {
+        "name": f"Health Sweep ({num_agents} agents, sequential)",
+        "agents": num_agents,
+        "sweep_ms": round(duration_ms, 1),
+    }
+
+
+def bench_health_sweep_concurrent(num_agents: int = 1_000, mean_latency_s: float = 0.005) -> Dict[str, Any]:
+    """Probe 1,000 simulated agents with bounded concurrency and no stagger."""
+    monitor = _make_monitor(num_agents, mean_latency_s, max_concurrent_probes=64, stagger_probes=False)
+    duration_ms = asyncio.run(_concurrent_sweep(monitor, interval_s=10.0))
+    return {
+        "name": f"Health Sweep ({num_agents} agents, 64 concurrent)",
+        "agents": num_agents,
+        "sweep_ms": round(duration_ms, 1),
+    }
+
+
+def bench_health_sweep_staggered(num_agents: int = 1_000, mean_latency_s: float = 0.005) -> Dict[str, Any]:
+    """Probe 1,000 agents spread across half of a 2 s interval; reports peak concurrency."""
+    monitor = _make_monitor(num_agents, mean_latency_s, max_concurrent_probes=64)
+    in_flight = 0
+    peak = 0
+    original = monitor._check_liveness
+
+    async def tracked(agent_id: str):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            return await original(agent_id)
+        finally:
+            in_flight -= 1
+
+    monitor._check_liveness = tracked  # type: ignore[method-assign]
+    duration_ms = asyncio.run(_concurrent_sweep(monitor, interval_s=2.0))
+    return {
+        "name": f"Health Sweep ({num_agents} agents, staggered over 1s)",
+        "agents": num_agents,
+        "sweep_ms": round(duration_ms, 1),
+        "peak_in_flight": peak,
+    }
+
+
+def bench_quota_can_execute(recorded_ops: int = 1_000_000, iterations: int = 10_000) -> Dict[str, Any]:
+    """Benchmark ResourceQuotaManager.can_execute after 1M recorded operations."""
+    manager = ResourceQuotaManager()
+    manager.set_quota(
+        "bench-agent",
+        AgentResourceQuota(max_concurrent_operations=10, max_operations_per_minute=10**9),
+    )
+    for _ in range(recorded_ops):
+        manager.record_operation_start("bench-agent")
+        manager.record_operation_end("bench-agent")
+
+    return {
+        "name": f"Quota can_execute ({recorded_ops:,} recorded ops)",
+        **_sync_timer(lambda: manager.can_execute("bench-agent"), iterations),
+    }
+
+
+class _SimulatedReplica:
+    """Single-worker replica: requests queue behind each other; speed varies per replica."""
+
+    def __init__(self, service_time_s: float) -> None:
+        self._service_time = service_time_s
+        self._worker = asyncio.Lock()
+
+    async def handle(self) -> None:
+        async with self._worker:
+            await asyncio.sleep(self._service_time)
+
+
+async def _bursty_load(strategy: str, requests: int, seed: int) -> List[float]:
+    rng = random.Random(seed)
+    # Four fast replicas and one degraded replica at 5x the service time
+    speeds = iter([0.002, 0.002, 0.002, 0.002, 0.010])
+    scaler = AgentScaler()
+    scaler.register_agent_type(
+        "worker",
+        factory=lambda: _SimulatedReplica(next(speeds)),
+        config=ScalingConfig(max_replicas=5, load_balancing=strategy),
+    )
+    await scaler.scale_to("worker", 5)
+
+    latencies: List[float] = []
+
+    async def one_request() -> None:
+        started = time.perf_counter()
+        async with scaler.acquire_replica("worker") as replica:
+            await replica.handle()
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    tasks = []
+    sent = 0
+    while sent < requests:
+        # Alternate quiet periods with bursts of 10-40 back-to-back requests
+        burst = rng.randint(10, 40)
+        for _ in range(min(burst, requests - sent)):
+            tasks.append(asyncio.create_task(one_request()))
+            sent += 1
+        await asyncio.sleep(rng.expovariate(1.0 / (burst * 0.0009)))
+    await asyncio.gather(*tasks)
+    return sorted(latencies)
+
+
+def bench_replica_routing(strategy: str, requests: int = 3_000) -> Dict[str, Any]:
+    """Simulated bursty traffic over 5 replicas (one degraded) with the given routing."""
+    latencies = asyncio.run(_bursty_load(strategy, requests, seed=11))
+    return {
+        "name": f"Replica Routing ({strategy}, bursty load)",
+        "requests": requests,
+        "p50_ms": round(latencies[len(latencies) // 2], 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95)], 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)], 2),
+    }
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all lifecycle benchmarks and return results."""
+    return [
+        bench_health_sweep_sequential(),
+        bench_health_sweep_concurrent(),
+        bench_health_sweep_staggered(),
+        bench_quota_can_execute(),
+        bench_replica_routing("round_robin"),
+        bench_replica_routing("power_of_two"),
+        bench_replica_routing("least_outstanding"),
+    ]
+
+
+if __name__ == "__main__":
+    import json
+
+    for result in run_all():
+        print(json.dumps(result, indent=2))
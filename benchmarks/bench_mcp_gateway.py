@@ -0,0 +1,142 @@
+"""Benchmarks for MCP gateway tool-call interception."""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+from typing import Any, Dict, List, Tuple
+
+from agent_os.integrations.base import GovernancePolicy, PatternType
+from agent_os.mcp_gateway import _BUILTIN_COMPILED, ApprovalStatus, MCPGateway
+
+_TOOLS = [f"tool_{i}" for i in range(40)] + [
+    "read_file", "write_file", "list_dir", "search_code", "http_get", "sql_query",
+]
+_DENIED = ["exec_shell", "delete_repo", "drop_table", "sudo", "kill_process"]
+_SENSITIVE = ["write_file", "http_get"]
+
+
+def _policy() -> GovernancePolicy:
+    """A production-like policy: allow-list plus secret and injection patterns."""
+    return GovernancePolicy(
+        name="bench",
+        max_tool_calls=1_000_000,
+        allowed_tools=list(_TOOLS),
+        blocked_patterns=[
+            "password",
+            "secret_key",
+            "api_key",
+            "BEGIN RSA PRIVATE KEY",
+            "aws_secret_access_key",
+            (r"rm\s+-rf", PatternType.REGEX),
+            (r"\bDROP\s+TABLE\b", PatternType.REGEX),
+            (r"(?:\.\./){2,}", PatternType.REGEX),
+            (r"\bcurl\s+[^|]+\|\s*sh\b", PatternType.REGEX),
+            ("*.pem", PatternType.GLOB),
+        ],
+    )
+
+
+def _calls(n: int) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """Mostly clean calls, with some denied tools and dangerous parameters."""
+    rng = random.Random(3)
+    calls = []
+    for i in range(n):
+        agent = f"agent-{rng.randrange(100)}"
+        roll = rng.random()
+        if roll < 0.05:
+            calls.append((agent, rng.choice(_DENIED), {"target": "prod"}))
+        elif roll < 0.08:
+            calls.append((agent, f"unknown_{i % 50}", {}))
+        elif roll < 0.12:
+            calls.append((agent, "read_file", {"path": "../../../etc/shadow"}))
+        else:
+            calls.append((agent, rng.choice(_TOOLS), {
+                "path": f"/workspace/src/module_{i % 300}/file_{i % 37}.py",
+                "query": f"find usages of handler_{i % 91} in the service layer",
+                "limit": 50,
+                "recursive": True,
+            }))
+    return calls
+
+
+class _UncompiledGateway(MCPGateway):
+    """Baseline: re-evaluates lists and every pattern on each call."""
+
+    def _evaluate(self, agent_id, tool_name, params):
+        if tool_name in self.denied_tools:
+            return False, f"Tool '{tool_name}' is on the deny list", None
+        if self.policy.allowed_tools and tool_name not in self.policy.allowed_tools:
+            return False, f"Tool '{tool_name}' is not on the allow list", None
+        param_text = json.dumps(params, default=str)
+        matches = self.policy.matches_pattern(param_text)
+        if matches:
+            return False, f"Parameters matched blocked pattern(s): {matches}", None
+        for pat_str, compiled in _BUILTIN_COMPILED:
+            if compiled.search(param_text):
+                return False, f"Parameters matched dangerous pattern: {pat_str}", None
+        counts = self.__dict__.setdefault("_counts", {})
+        count = counts.get(agent_id, 0)
+        if count >= self.policy.max_tool_calls:
+            return False, f"Agent '{agent_id}' exceeded call budget", None
+        counts[agent_id] = count + 1
+        if self.policy.require_human_approval or tool_name in self.sensitive_tools:
+            status = self.approval_callback(agent_id, tool_name, params)
+            return True, "Approved by human reviewer", status
+        return True, "Allowed by policy", None
+
+
+def _gateway(cls) -> MCPGateway:
+    return cls(
+        _policy(),
+        denied_tools=list(_DENIED),
+        sensitive_tools=list(_SENSITIVE),
+        approval_callback=lambda agent_id, tool_name, params: ApprovalStatus.APPROVED,
+    )
+
+
+def _throughput(name: str, intercept, calls) -> Dict[str, Any]:
+    started = time.perf_counter()
+    allowed = 0
+    for agent_id, tool_name, params in calls:
+        allowed += intercept(agent_id, tool_name, params)[0]
+    elapsed = time.perf_counter() - started
+    return {
+        "name": name,
+        "iterations": len(calls),
+        "allowed": allowed,
+        "ops_per_sec": round(len(calls) / elapsed),
+        "mean_us": round(elapsed / len(calls) * 1e6, 2),
+    }
+
+
+def bench_intercept_uncompiled(n: int = 100_000) -> Dict[str, Any]:
+    """Baseline: the pre-compilation evaluation pipeline."""
+    return _throughput(
+        "MCP Gateway Intercept (re-evaluated per call)",
+        _gateway(_UncompiledGateway).intercept_tool_call,
+        _calls(n),
+    )
+
+
+def bench_intercept_compiled(n: int = 100_000) -> Dict[str, Any]:
+    """Compiled policy: cached tool decisions, one screening regex, token budgets."""
+    return _throughput(
+        "MCP Gateway Intercept (compiled policy)",
+        _gateway(MCPGateway).intercept_tool_call,
+        _calls(n),
+    )
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all MCP gateway benchmarks and return results."""
+    return [
+        bench_intercept_uncompiled(),
+        bench_intercept_compiled(),
+    ]
+
+
+if __name__ == "__main__":
+    for result in run_all():
+        print(json.dumps(result, indent=2))
@@ -0,0 +1,178 @@
+"""Benchmarks for MCP catalog scanning and cross-server typosquat detection."""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from typing import Any, Dict, List
+
+from agent_os.mcp_security import MCPSecurityScanner
+
+_VERBS = [
+    "get", "list", "create", "update", "delete", "search", "fetch", "read", "write",
+    "send", "sync", "export", "import", "query", "run", "open", "close", "move",
+    "copy", "rename", "archive", "restore", "approve", "reject", "assign", "tag",
+    "schedule", "cancel", "resolve", "merge",
+]
+_NOUNS = [
+    "user", "users", "file", "files", "issue", "ticket", "invoice", "order", "payment",
+    "customer", "account", "project", "task", "comment", "message", "channel", "email",
+    "calendar", "event", "meeting", "document", "page", "record", "table", "row",
+    "report", "dashboard", "metric", "alert", "incident", "deployment", "build",
+    "branch", "commit", "release", "secret", "token", "policy", "role", "group",
+    "bucket", "object", "queue", "topic", "cluster", "node", "pod", "volume",
+    "snapshot", "backup", "contract", "lead", "opportunity", "campaign", "product",
+    "inventory", "shipment", "vendor", "expense", "budget",
+]
+_QUALIFIERS = [
+    "", "_by_id", "_details", "_history", "_summary", "_batch", "_status", "_v2",
+    "_async", "_stream", "_count", "_export", "_archive", "_settings", "_permissions",
+    "_owner", "_metadata", "_attachments", "_preview", "_stats", "_labels", "_links",
+    "_draft", "_template", "_audit", "_events", "_config", "_schema",
+]
+
+
+def _catalog(count: int, servers: int = 100, seed: int = 11) -> Dict[str, List[Dict[str, Any]]]:
+    """Synthetic catalog of *count* uniquely named tools spread over *servers*."""
+    rng = random.Random(seed)
+    names = [f"{v}_{n}{q}" for v in _VERBS for n in _NOUNS for q in _QUALIFIERS]
+    rng.shuffle(names)
+    catalog: Dict[str, List[Dict[str, Any]]] = {f"server-{i}": [] for i in range(servers)}
+    for i, name in enumerate(names[:count]):
+        catalog[f"server-{i % servers}"].append({
+            "name": name,
+            "description": f"{name.replace('_', ' ').capitalize()} in the connected workspace.",
+            "inputSchema": {"type": "object", "properties": {"id": {"type": "string"}}},
+        })
+    return catalog
+
+
+def _quiet() -> None:
+    """Synthetic catalogs flag many near-duplicate names; skip the warning per tool."""
+    logging.getLogger("agent_os.mcp_security").setLevel(logging.ERROR)
+
+
+def _registered(catalog: Dict[str, List[Dict[str, Any]]]) -> MCPSecurityScanner:
+    scanner = MCPSecurityScanner()
+    for server, tools in catalog.items():
+        for tool in tools:
+            scanner.register_tool(tool["name"], tool["description"], tool["inputSchema"], server)
+    return scanner
+
+
+def _pairwise_levenshtein(s: str, t: str) -> int:
+    """The unbounded full-matrix distance used before the name index."""
+    if len(s) < len(t):
+        return _pairwise_levenshtein(t, s)
+    if len(t) == 0:
+        return len(s)
+    prev = list(range(len(t) + 1))
+    for i, cs in enumerate(s):
+        curr = [i + 1]
+        for j, ct in enumerate(t):
+            cost = 0 if cs == ct else 1
+            curr.append(min(curr[j] + 1, prev[j + 1] + 1, prev[j] + cost))
+        prev = curr
+    return prev[-1]
+
+
+def _pairwise_cross_server(scanner: MCPSecurityScanner, tool_name: str, server_name: str) -> int:
+    """Baseline: compare the tool with every registered fingerprint."""
+    found = 0
+    for fp in scanner._tool_registry.values():
+        if fp.server_name == server_name:
+            continue
+        if fp.tool_name == tool_name:
+            found += 1
+            continue
+        la, lb = tool_name.lower(), fp.tool_name.lower()
+        if abs(len(la) - len(lb)) > 2:
+            continue
+        dist = _pairwise_levenshtein(la, lb)
+        if 1 <= dist <= 2 and min(len(la), len(lb)) >= 4:
+            found += 1
+    return found
+
+
+def bench_cross_server_pairwise(count: int = 50_000, sample: int = 10) -> Dict[str, Any]:
+    """Baseline: pairwise comparison, timed on a sample and extrapolated."""
+    catalog = _catalog(count)
+    scanner = _registered(catalog)
+    queries = [
+        (tool["name"], server) for server, tools in catalog.items() for tool in tools
+    ][:sample]
+    started = time.perf_counter()
+    findings = sum(_pairwise_cross_server(scanner, name, server) for name, server in queries)
+    per_tool = (time.perf_counter() - started) / sample
+    return {
+        "name": f"MCP Cross-Server Check (pairwise, {count:,} registered)",
+        "iterations": sample,
+        "findings": findings,
+        "mean_ms": round(per_tool * 1_000, 3),
+        "estimated_full_scan_s": round(per_tool * count, 1),
+    }
+
+
+def bench_cross_server_indexed(count: int = 50_000, sample: int = 1_000) -> Dict[str, Any]:
+    """Name index: segment candidates plus banded Levenshtein verification."""
+    catalog = _catalog(count)
+    scanner = _registered(catalog)
+    queries = [
+        (tool["name"], server) for server, tools in catalog.items() for tool in tools
+    ][:sample]
+    started = time.perf_counter()
+    findings = sum(len(scanner._check_cross_server(name, server)) for name, server in queries)
+    per_tool = (time.perf_counter() - started) / sample
+    return {
+        "name": f"MCP Cross-Server Check (name index, {count:,} registered)",
+        "iterations": sample,
+        "findings": findings,
+        "mean_ms": round(per_tool * 1_000, 3),
+        "estimated_full_scan_s": round(per_tool * count, 1),
+    }
+
+
+def bench_scan_catalog(count: int = 50_000) -> List[Dict[str, Any]]:
+    """Register and fully scan the catalog, then scan it again unchanged."""
+    _quiet()
+    catalog = _catalog(count)
+    started = time.perf_counter()
+    scanner = _registered(catalog)
+    register_s = time.perf_counter() - started
+
+    results = [{
+        "name": f"MCP Catalog Register ({count:,} tools)",
+        "total_ms": round(register_s * 1_000, 1),
+        "ops_per_sec": round(count / register_s),
+    }]
+    for label in ("cold", "repeat, cached"):
+        started = time.perf_counter()
+        flagged = sum(
+            scanner.scan_server(server, tools).tools_flagged
+            for server, tools in catalog.items()
+        )
+        elapsed = time.perf_counter() - started
+        results.append({
+            "name": f"MCP Catalog Scan ({count:,} tools, {label})",
+            "tools_flagged": flagged,
+            "total_ms": round(elapsed * 1_000, 1),
+            "ops_per_sec": round(count / elapsed),
+        })
+    return results
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all MCP security benchmarks and return results."""
+    return [
+        bench_cross_server_pairwise(),
+        bench_cross_server_indexed(),
+        *bench_scan_catalog(),
+    ]
+
+
+if __name__ == "__main__":
+    import json
+
+    for result in run_all():
+        print(json.dumps(result, indent=2))
@@ -0,0 +1,134 @@
+"""Benchmarks for the MCP kernel server stdio transport, driven over OS pipes."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import random
+import time
+from typing import Any, Dict, List
+
+from mcp_kernel_server.server import KernelMCPServer, ServerConfig
+from mcp_kernel_server.tools import ToolResult
+
+
+class _SlowVerifyTool:
+    """Stands in for a slow tools/call such as multi-model CMVK verification."""
+
+    name = "slow_verify"
+    description = "Simulated slow verification"
+    input_schema = {"type": "object"}
+
+    def __init__(self, latency_s: float):
+        self.latency_s = latency_s
+
+    async def execute(self, arguments: dict) -> ToolResult:
+        await asyncio.sleep(self.latency_s)
+        return ToolResult(success=True, data={"verified": True})
+
+
+async def _serve_sequential(server: KernelMCPServer, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Baseline: the previous loop, one request awaited to completion at a time."""
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        response = await server._handle_jsonrpc(json.loads(line.decode()))
+        writer.write((json.dumps(response) + "\n").encode())
+        await writer.drain()
+
+
+async def _pipe_pair():
+    """Connect an asyncio reader and writer to the two ends of an OS pipe."""
+    loop = asyncio.get_running_loop()
+    read_fd, write_fd = os.pipe()
+    reader = asyncio.StreamReader(limit=2 ** 20)
+    read_transport, _ = await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), os.fdopen(read_fd, "rb", 0)
+    )
+    write_transport, write_protocol = await loop.connect_write_pipe(
+        asyncio.streams.FlowControlMixin, os.fdopen(write_fd, "wb", 0)
+    )
+    writer = asyncio.StreamWriter(write_transport, write_protocol, None, loop)
+    return reader, writer, read_transport
+
+
+def _requests(count: int, slow_fraction: float, seed: int = 3) -> List[dict]:
+    rng = random.Random(seed)
+    requests = []
+    for i in range(count):
+        if rng.random() < slow_fraction:
+            params = {"name": "slow_verify", "arguments": {}}
+        else:
+            params = {"name": "verify_code_safety", "arguments": {"code": f"x = {i}", "language": "python"}}
+        requests.append({"jsonrpc": "2.0", "id": i, "method": "tools/call", "params": params})
+    return requests
+
+
+def _run(name: str, concurrent: bool, count: int, slow_fraction: float, slow_latency_s: float) -> Dict[str, Any]:
+    async def run() -> Dict[str, Any]:
+        server = KernelMCPServer(ServerConfig(max_in_flight_requests=32))
+        server.tools["slow_verify"] = _SlowVerifyTool(slow_latency_s)
+        requests = _requests(count, slow_fraction)
+
+        server_in, client_out, server_in_transport = await _pipe_pair()
+        client_in, server_out, client_in_transport = await _pipe_pair()
+        serve = server.serve if concurrent else (lambda r, w: _serve_sequential(server, r, w))
+        server_task = asyncio.ensure_future(serve(server_in, server_out))
+
+        sent_at: Dict[int, float] = {}
+        latencies: Dict[str, List[float]] = {"slow_verify": [], "verify_code_safety": []}
+        started = time.perf_counter()
+        for request in requests:
+            sent_at[request["id"]] = time.perf_counter()
+            client_out.write((json.dumps(request) + "\n").encode())
+        await client_out.drain()
+
+        for _ in range(count):
+            response = json.loads(await client_in.readline())
+            request = requests[response["id"]]
+            latency = (time.perf_counter() - sent_at[response["id"]]) * 1000
+            latencies[request["params"]["name"]].append(latency)
+        elapsed = time.perf_counter() - started
+
+        client_out.close()
+        await server_task
+        server_out.close()
+        server_in_transport.close()
+        client_in_transport.close()
+
+        fast = sorted(latencies["verify_code_safety"])
+        return {
+            "name": name,
+            "requests": count,
+            "slow_requests": len(latencies["slow_verify"]),
+            "requests_per_sec": round(count / elapsed),
+            "fast_p50_ms": round(fast[len(fast) // 2], 2),
+            "fast_p99_ms": round(fast[int(len(fast) * 0.99)], 2),
+        }
+
+    return asyncio.run(run())
+
+
+def bench_stdio_sequential(count: int = 500, slow_fraction: float = 0.05, slow_latency_s: float = 0.05) -> Dict[str, Any]:
+    """Baseline: one request at a time; each 50 ms call stalls everything behind it."""
+    return _run("MCP stdio (sequential dispatch, 5% slow calls)", False, count, slow_fraction, slow_latency_s)
+
+
+def bench_stdio_concurrent(count: int = 500, slow_fraction: float = 0.05, slow_latency_s: float = 0.05) -> Dict[str, Any]:
+    """Concurrent dispatch, responses written as they complete."""
+    return _run("MCP stdio (concurrent dispatch, 5% slow calls)", True, count, slow_fraction, slow_latency_s)
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all MCP stdio benchmarks and return results."""
+    return [
+        bench_stdio_sequential(),
+        bench_stdio_concurrent(),
+    ]
+
+
+if __name__ == "__main__":
+    for result in run_all():
+        print(json.dumps(result, indent=2))
@@ -0,0 +1,134 @@
+"""Overhead of GovernanceMetrics on governed tool calls."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from agent_os.integrations.base import GovernancePolicy, PolicyInterceptor, ToolCallRequest
+from agent_os.metrics import GovernanceMetrics, prometheus_text
+
+
+class _LockedMetrics:
+    """Baseline: the previous single-lock collector (running average, no histogram)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.total_checks = 0
+        self.approvals = 0
+        self.violations = 0
+        self._total_latency_ms = 0.0
+        self.avg_latency_ms = 0.0
+        self._adapter_checks: Dict[str, int] = {}
+
+    def record_check(self, adapter: str, latency_ms: float, approved: bool) -> None:
+        with self._lock:
+            self.total_checks += 1
+            self._total_latency_ms += latency_ms
+            self.avg_latency_ms = self._total_latency_ms / self.total_checks
+            self._adapter_checks[adapter] = self._adapter_checks.get(adapter, 0) + 1
+            if approved:
+                self.approvals += 1
+            else:
+                self.violations += 1
+
+
+def _governed_call(recorder: Optional[Any]) -> Callable[[ToolCallRequest], None]:
+    interceptor = PolicyInterceptor(GovernancePolicy(allowed_tools=["search", "read_file"]))
+    perf_counter = time.perf_counter
+
+    def call(request: ToolCallRequest) -> None:
+        start = perf_counter()
+        result = interceptor.intercept(request)
+        if recorder is not None:
+            recorder.record_check("bench", (perf_counter() - start) * 1000.0, result.allowed)
+
+    return call
+
+
+def _run(name: str, recorder: Optional[Any], threads: int, calls: int) -> Dict[str, Any]:
+    call = _governed_call(recorder)
+    requests = [
+        ToolCallRequest(tool_name=("search" if i % 5 else "delete"), arguments={"q": i})
+        for i in range(calls)
+    ]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        for request in requests:
+            call(request)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - started
+    return {
+        "name": name,
+        "threads": threads,
+        "calls": threads * calls,
+        "ops_per_sec": round(threads * calls / elapsed),
+        "total_ms": round(elapsed * 1_000, 1),
+    }
+
+
+def bench_metrics_off(threads: int = 8, calls: int = 50_000) -> Dict[str, Any]:
+    """Governed calls with no metrics recorded."""
+    return _run("Governed Call (metrics off)", None, threads, calls)
+
+
+def bench_metrics_locked(threads: int = 8, calls: int = 50_000) -> Dict[str, Any]:
+    """Baseline: single global lock per record."""
+    return _run("Governed Call (metrics, single lock)", _LockedMetrics(), threads, calls)
+
+
+def bench_metrics_sharded(threads: int = 8, calls: int = 50_000) -> Dict[str, Any]:
+    """Per-thread shards plus the latency histogram."""
+    return _run("Governed Call (metrics, per-thread shards)", GovernanceMetrics(), threads, calls)
+
+
+def bench_snapshot_and_export(iterations: int = 2_000) -> Dict[str, Any]:
+    """snapshot() + Prometheus rendering across 8 populated shards."""
+    metrics = GovernanceMetrics()
+
+    def fill() -> None:
+        for i in range(1_000):
+            metrics.record_check(f"adapter-{i % 5}", i * 0.01, i % 7 != 0)
+
+    workers = [threading.Thread(target=fill) for _ in range(8)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        prometheus_text(metrics.snapshot())
+    elapsed = time.perf_counter() - started
+    return {
+        "name": "Metrics Snapshot + Prometheus Export",
+        "iterations": iterations,
+        "ops_per_sec": round(iterations / elapsed),
+        "p50_ms": round(elapsed / iterations * 1_000, 4),
+    }
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all metrics benchmarks and return results."""
+    return [
+        bench_metrics_off(),
+        bench_metrics_locked(),
+        bench_metrics_sharded(),
+        bench_snapshot_and_export(),
+    ]
+
+
+if __name__ == "__main__":
+    import json
+
+    for result in run_all():
+        print(json.dumps(result, indent=2))
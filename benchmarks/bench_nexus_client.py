@@ -0,0 +1,132 @@
+"""Benchmarks for Nexus client peer verification against a local stand-in API."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+import aiohttp
+from aiohttp import web
+
+from nexus.client import NexusClient
+from nexus.schemas.manifest import AgentIdentity, AgentManifest
+
+
+class _StandInRegistry:
+    def __init__(self) -> None:
+        self.requests = 0
+
+    async def verify(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        return web.json_response({
+            "verified": True, "peer_did": request.match_info["did"],
+            "trust_score": 850, "trust_tier": "trusted",
+        })
+
+
+def _manifest() -> AgentManifest:
+    return AgentManifest(identity=AgentIdentity(
+        did="did:nexus:bench", verification_key="ed25519:key", owner_id="org-bench",
+    ))
+
+
+async def _serve(run: Callable[[str, _StandInRegistry], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    registry = _StandInRegistry()
+    app = web.Application()
+    app.router.add_get("/agents/{did}/verify", registry.verify)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        result = await run(f"http://127.0.0.1:{port}", registry)
+        result["upstream_requests"] = registry.requests
+        return result
+    finally:
+        await runner.cleanup()
+
+
+async def _session_per_call(url: str, peer_did: str) -> None:
+    """Baseline: the previous client opened a new session for every verification."""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{url}/agents/{peer_did}/verify", params={"min_score": 700}) as resp:
+            await resp.json()
+
+
+def _rate(name: str, count: int, elapsed: float) -> Dict[str, Any]:
+    return {"name": name, "verifications": count, "verifications_per_sec": round(count / elapsed)}
+
+
+def bench_session_per_call(count: int = 1_000) -> Dict[str, Any]:
+    """Baseline: new aiohttp session (and TCP connection) per verification."""
+
+    async def run(url: str, _: _StandInRegistry) -> Dict[str, Any]:
+        started = time.perf_counter()
+        for i in range(count):
+            await _session_per_call(url, f"did:nexus:peer-{i}")
+        return _rate("Nexus verify_peer (session per call)", count, time.perf_counter() - started)
+
+    return asyncio.run(_serve(run))
+
+
+def bench_pooled_uncached(count: int = 1_000) -> Dict[str, Any]:
+    """Shared pooled session, verification cache disabled."""
+
+    async def run(url: str, _: _StandInRegistry) -> Dict[str, Any]:
+        client = NexusClient(_manifest(), "key", api_url=url, verification_ttl_seconds=0)
+        started = time.perf_counter()
+        for i in range(count):
+            await client.verify_peer(f"did:nexus:peer-{i}")
+        elapsed = time.perf_counter() - started
+        await client.close()
+        return _rate("Nexus verify_peer (pooled session, no cache)", count, elapsed)
+
+    return asyncio.run(_serve(run))
+
+
+def bench_pooled_cached(count: int = 20_000, peers: int = 200) -> Dict[str, Any]:
+    """Shared session plus TTL cache, 200 recurring peers."""
+
+    async def run(url: str, _: _StandInRegistry) -> Dict[str, Any]:
+        client = NexusClient(_manifest(), "key", api_url=url)
+        started = time.perf_counter()
+        for i in range(count):
+            await client.verify_peer(f"did:nexus:peer-{i % peers}")
+        elapsed = time.perf_counter() - started
+        await client.close()
+        return _rate(f"Nexus verify_peer (pooled session, TTL cache, {peers} peers)", count, elapsed)
+
+    return asyncio.run(_serve(run))
+
+
+def bench_concurrent_burst(callers: int = 2_000, peers: int = 20) -> Dict[str, Any]:
+    """2,000 concurrent verifications of 20 peers on a cold cache (single-flight)."""
+
+    async def run(url: str, _: _StandInRegistry) -> Dict[str, Any]:
+        client = NexusClient(_manifest(), "key", api_url=url)
+        started = time.perf_counter()
+        await asyncio.gather(*(client.verify_peer(f"did:nexus:peer-{i % peers}") for i in range(callers)))
+        elapsed = time.perf_counter() - started
+        await client.close()
+        return _rate(f"Nexus verify_peer (concurrent burst, {peers} peers)", callers, elapsed)
+
+    return asyncio.run(_serve(run))
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all Nexus client benchmarks and return results."""
+    return [
+        bench_session_per_call(),
+        bench_pooled_uncached(),
+        bench_pooled_cached(),
+        bench_concurrent_burst(),
+    ]
+
+
+if __name__ == "__main__":
+    import json
+
+    for result in run_all():
+        print(json.dumps(result, indent=2))
@@ -0,0 +1,99 @@
+"""Benchmarks for control-plane workflow orchestration."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+from agent_control_plane.orchestrator import AgentNode, AgentRole, DAGScheduler
+
+
+def _wide(width: int) -> Dict[str, AgentNode]:
+    """One fan-out agent, *width* independent agents, one fan-in agent."""
+    nodes = {"source": AgentNode("source", AgentRole.WORKER)}
+    for i in range(width):
+        nodes[f"branch-{i}"] = AgentNode(f"branch-{i}", AgentRole.WORKER, dependencies={"source"})
+    nodes["sink"] = AgentNode(
+        "sink", AgentRole.WORKER, dependencies={f"branch-{i}" for i in range(width)}
+    )
+    return nodes
+
+
+def _deep(depth: int) -> Dict[str, AgentNode]:
+    """A single chain of *depth* agents, declared last-to-first."""
+    nodes = {}
+    for i in reversed(range(depth)):
+        deps = {f"step-{i - 1}"} if i else set()
+        nodes[f"step-{i}"] = AgentNode(f"step-{i}", AgentRole.WORKER, dependencies=deps)
+    return nodes
+
+
+def _executor(latency_s: float):
+    async def run(agent: AgentNode, input_data: Dict[str, Any], upstream: Dict[str, Any]) -> str:
+        if latency_s:
+            await asyncio.sleep(latency_s)
+        return agent.agent_id
+
+    return run
+
+
+async def _scan_in_order(nodes: Dict[str, AgentNode], executor) -> None:
+    """Baseline: rescan all nodes for ready ones and run them one at a time."""
+    executed: set = set()
+    while len(executed) < len(nodes):
+        for agent_id, agent in nodes.items():
+            if agent_id not in executed and agent.dependencies.issubset(executed):
+                await executor(agent, {}, {})
+                executed.add(agent_id)
+
+
+def _run(name: str, nodes: Dict[str, AgentNode], latency_s: float, scheduler: bool) -> Dict[str, Any]:
+    executor = _executor(latency_s)
+    started = time.perf_counter()
+    result: Dict[str, Any] = {"name": name, "agents": len(nodes)}
+    if scheduler:
+        _, report = asyncio.run(DAGScheduler(nodes, executor=executor, max_concurrency=64).run({}))
+        result["critical_path_ms"] = round(report.critical_path_ms, 1)
+        result["max_parallelism"] = report.max_parallelism
+    else:
+        asyncio.run(_scan_in_order(nodes, executor))
+    result["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+def bench_wide_workflow_sequential(width: int = 500, latency_s: float = 0.002) -> Dict[str, Any]:
+    """Baseline: 500 independent 2 ms agents run one after another."""
+    return _run(f"Wide Workflow ({width} branches, sequential scan)", _wide(width), latency_s, False)
+
+
+def bench_wide_workflow_dag(width: int = 500, latency_s: float = 0.002) -> Dict[str, Any]:
+    """500 independent 2 ms agents under the DAG scheduler (64 concurrent)."""
+    return _run(f"Wide Workflow ({width} branches, DAG scheduler)", _wide(width), latency_s, True)
+
+
+def bench_deep_workflow_sequential(depth: int = 2_000) -> Dict[str, Any]:
+    """Baseline: scheduling overhead of a 2,000-step chain with the rescan loop."""
+    return _run(f"Deep Workflow ({depth} steps, sequential scan)", _deep(depth), 0.0, False)
+
+
+def bench_deep_workflow_dag(depth: int = 2_000) -> Dict[str, Any]:
+    """Scheduling overhead of a 2,000-step chain with in-degree tracking."""
+    return _run(f"Deep Workflow ({depth} steps, DAG scheduler)", _deep(depth), 0.0, True)
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all orchestrator benchmarks and return results."""
+    return [
+        bench_wide_workflow_sequential(),
+        bench_wide_workflow_dag(),
+        bench_deep_workflow_sequential(),
+        bench_deep_workflow_dag(),
+    ]
+
+
+if __name__ == "__main__":
+    import json
+
+    for result in run_all():
+        print(json.dumps(result, indent=2))
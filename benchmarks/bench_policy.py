@@ -24,6 +24,7 @@ from agent_os.policies.shared import (
     SharedPolicyRule,
     SharedPolicySchema,
 )
+from agent_os.semantic_policy import SemanticPolicyEngine
 
 
 def _sync_timer(func, iterations: int = 10_000) -> Dict[str, Any]:
@@ -151,6 +152,71 @@ def bench_shared_policy_evaluation(iterations: int = 10_000) -> Dict[str, Any]:
     }
 
 
+_SEMANTIC_CALLS = [
+    ("sql", {"query": "SELECT id, name FROM users WHERE team = 'core'"}),
+    ("shell", {"cmd": "ls -la /var/log && tail -n 50 app.log"}),
+    ("http", {"url": "https://example.com/api/v1/items", "method": "GET"}),
+    ("sql", {"query": "DROP TABLE users"}),
+    ("shell", {"cmd": "rm -rf / && sudo reboot"}),
+    ("python", {"code": "eval(compile(src, 'x', 'exec'))"}),
+]
+
+
+def _brute_force_classify(engine: SemanticPolicyEngine, action: str, params: Dict[str, Any]) -> None:
+    """Baseline: every signal regex on every call, as before the keyword prefilter."""
+    text = engine._build_text(action, params)
+    for sigs in engine._compiled.values():
+        for regex, _, _ in sigs:
+            regex.search(text)
+
+
+def _unique_calls(n: int, start: int = 0) -> List[Any]:
+    return [
+        (action, {**params, "request": i})
+        for i in range(start, start + n)
+        for action, params in [_SEMANTIC_CALLS[i % len(_SEMANTIC_CALLS)]]
+    ]
+
+
+def bench_semantic_classify_brute_force(iterations: int = 10_000) -> Dict[str, Any]:
+    """Baseline: unique inputs, all regexes per call."""
+    engine = SemanticPolicyEngine()
+    calls = iter(_unique_calls(iterations))
+    return {
+        "name": "Semantic Classify (all regexes)",
+        **_sync_timer(lambda: _brute_force_classify(engine, *next(calls)), iterations),
+    }
+
+
+def bench_semantic_classify_prefiltered(iterations: int = 10_000) -> Dict[str, Any]:
+    """Unique inputs: keyword prefilter, no memo hits."""
+    engine = SemanticPolicyEngine()
+    calls = iter(_unique_calls(iterations))
+    return {
+        "name": "Semantic Classify (keyword prefilter)",
+        **_sync_timer(lambda: engine.classify(*next(calls)), iterations),
+    }
+
+
+def bench_semantic_classify_repeated(iterations: int = 10_000) -> Dict[str, Any]:
+    """A small working set of repeated inputs served from the memo."""
+    engine = SemanticPolicyEngine()
+    calls = iter(_SEMANTIC_CALLS * (iterations // len(_SEMANTIC_CALLS) + 1))
+    return {
+        "name": "Semantic Classify (repeated inputs)",
+        **_sync_timer(lambda: engine.classify(*next(calls)), iterations),
+    }
+
+
+def bench_semantic_classify_batch(batches: int = 100, batch_size: int = 100) -> Dict[str, Any]:
+    """classify_batch over 100 unique calls at a time."""
+    engine = SemanticPolicyEngine()
+    groups = iter([_unique_calls(batch_size, b * batch_size) for b in range(batches)])
+    result = _sync_timer(lambda: engine.classify_batch(next(groups)), batches)
+    result["calls_per_batch"] = batch_size
+    return {"name": f"Semantic Classify Batch ({batch_size} calls)", **result}
+
+
 def run_all() -> List[Dict[str, Any]]:
     """Run all policy benchmarks and return results."""
     return [
@@ -159,6 +225,10 @@ def run_all() -> List[Dict[str, Any]]:
         bench_100_rule_policy(),
         bench_yaml_policy_load(),
         bench_shared_policy_evaluation(),
+        bench_semantic_classify_brute_force(),
+        bench_semantic_classify_prefiltered(),
+        bench_semantic_classify_repeated(),
+        bench_semantic_classify_batch(),
     ]
 
 
@@ -0,0 +1,111 @@
+"""Contention benchmarks for the tool-call rate limiters."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List
+
+from agent_os.integrations.rate_limiter import (
+    AsyncRateLimiter,
+    RateLimiter,
+    SharedMemoryRateLimiter,
+)
+
+
+def _threaded(name: str, limiter: Any, threads: int, keys: int) -> Dict[str, Any]:
+    """*threads* workers each call allow() on their slice of *keys* distinct keys."""
+    names = [f"user-{i}:tool-{i % 97}" for i in range(keys)]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(offset: int) -> None:
+        allow = limiter.allow
+        mine = names[offset::threads]
+        barrier.wait()
+        for key in mine:
+            allow(key)
+
+    workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - started
+    result = {
+        "name": name,
+        "threads": threads,
+        "distinct_keys": keys,
+        "ops_per_sec": round(keys / elapsed),
+        "total_ms": round(elapsed * 1_000, 1),
+    }
+    if isinstance(limiter, RateLimiter):
+        result["tracked_buckets"] = len(limiter)
+    return result
+
+
+def bench_single_lock(threads: int = 32, keys: int = 1_000_000) -> Dict[str, Any]:
+    """Baseline: one lock, no key bound (the previous RateLimiter layout)."""
+    return _threaded(
+        "Rate Limiter (1 lock, unbounded)", RateLimiter(shards=1), threads, keys
+    )
+
+
+def bench_striped_bounded(threads: int = 32, keys: int = 1_000_000) -> Dict[str, Any]:
+    """64 lock stripes with a 100k-key LRU bound."""
+    return _threaded(
+        "Rate Limiter (64 stripes, max_keys=100k)",
+        RateLimiter(shards=64, max_keys=100_000),
+        threads,
+        keys,
+    )
+
+
+def bench_shared_memory(threads: int = 32, keys: int = 1_000_000) -> Dict[str, Any]:
+    """Shared-memory table (fixed 128k slots) from threads of one process."""
+    limiter = SharedMemoryRateLimiter(max_keys=131_072)
+    try:
+        return _threaded("Rate Limiter (shared memory, 128k slots)", limiter, threads, keys)
+    finally:
+        limiter.close()
+        limiter.unlink()
+
+
+def bench_async(keys: int = 1_000_000) -> Dict[str, Any]:
+    """AsyncRateLimiter on one event loop, no locks."""
+    limiter = AsyncRateLimiter(max_keys=100_000)
+    names = [f"user-{i}:tool-{i % 97}" for i in range(keys)]
+
+    async def run() -> float:
+        started = time.perf_counter()
+        for key in names:
+            await limiter.acquire(key)
+        return time.perf_counter() - started
+
+    elapsed = asyncio.run(run())
+    return {
+        "name": "Rate Limiter (async, max_keys=100k)",
+        "distinct_keys": keys,
+        "ops_per_sec": round(keys / elapsed),
+        "total_ms": round(elapsed * 1_000, 1),
+        "tracked_buckets": len(limiter),
+    }
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all rate limiter benchmarks and return results."""
+    return [
+        bench_single_lock(),
+        bench_striped_bounded(),
+        bench_shared_memory(),
+        bench_async(),
+    ]
+
+
+if __name__ == "__main__":
+    import json
+
+    for result in run_all():
+        print(json.dumps(result, indent=2))
@@ -0,0 +1,122 @@
+"""Benchmarks for Nexus agent discovery over a large registry."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from nexus.registry import AgentRegistry
+from nexus.schemas.manifest import AgentCapabilities, AgentIdentity, AgentManifest, AgentPrivacy
+
+_DOMAINS = [f"domain-{i}" for i in range(50)]
+_RARE_DOMAINS = [f"rare-{i}" for i in range(100)]
+_POLICIES = ["ephemeral", "session", "permanent"]
+_LEVELS = ["verified_partner", "verified", "registered", "unknown"]
+
+_QUERIES = {
+    "unfiltered": {},
+    "common capability": {"capabilities": ["domain-7"]},
+    "rare capability": {"capabilities": ["rare-42"]},
+    "capability + policy + level": {
+        "capabilities": ["domain-3"], "privacy_policy": "ephemeral", "verification_level": "verified",
+    },
+}
+
+
+def _build(agents: int, seed: int = 7) -> AgentRegistry:
+    rng = random.Random(seed)
+    registry = AgentRegistry()
+
+    async def register() -> None:
+        for i in range(agents):
+            domains = rng.sample(_DOMAINS, 3)
+            if rng.random() < 0.01:
+                domains.append(rng.choice(_RARE_DOMAINS))
+            manifest = AgentManifest(
+                identity=AgentIdentity(
+                    did=f"did:nexus:agent-{i}", verification_key="ed25519:key", owner_id=f"org-{i % 100}",
+                ),
+                capabilities=AgentCapabilities(domains=domains),
+                privacy=AgentPrivacy(retention_policy=rng.choice(_POLICIES)),
+                verification_level=rng.choice(_LEVELS),
+            )
+            await registry.register(manifest, "sig")
+            registry.update_trust_score(manifest.identity.did, rng.randint(0, 1000))
+
+    asyncio.run(register())
+    return registry
+
+
+def _scan_and_sort(
+    registry: AgentRegistry,
+    capabilities: Optional[List[str]] = None,
+    privacy_policy: Optional[str] = None,
+    verification_level: Optional[str] = None,
+    min_score: int = 500,
+    limit: int = 10,
+) -> List[AgentManifest]:
+    """Baseline: filter every manifest, then sort all matches for a correct top-k."""
+    results = []
+    for manifest in registry._manifests.values():
+        if manifest.trust_score < min_score:
+            continue
+        if capabilities and not all(c in manifest.capabilities.domains for c in capabilities):
+            continue
+        if privacy_policy and manifest.privacy.retention_policy != privacy_policy:
+            continue
+        if verification_level and manifest.verification_level != verification_level:
+            continue
+        results.append(manifest)
+    results.sort(key=lambda m: (-m.trust_score, m.identity.did))
+    return results[:limit]
+
+
+def bench_discovery(agents: int = 100_000, iterations: int = 50, limit: int = 10) -> List[Dict[str, Any]]:
+    """Top-k discovery: full scan and sort vs. indexes and the trust ranking."""
+    started = time.perf_counter()
+    registry = _build(agents)
+    build_s = time.perf_counter() - started
+
+    results = []
+    for label, query in _QUERIES.items():
+        expected = _scan_and_sort(registry, limit=limit, **query)
+        indexed = asyncio.run(registry.discover_agents(limit=limit, **query))
+        assert [m.identity.did for m in indexed] == [m.identity.did for m in expected]
+
+        async def indexed_timings() -> List[float]:
+            latencies = []
+            for _ in range(iterations):
+                begin = time.perf_counter()
+                await registry.discover_agents(limit=limit, **query)
+                latencies.append((time.perf_counter() - begin) * 1000)
+            return sorted(latencies)
+
+        scan = []
+        for _ in range(iterations):
+            begin = time.perf_counter()
+            _scan_and_sort(registry, limit=limit, **query)
+            scan.append((time.perf_counter() - begin) * 1000)
+        timings = {"scan": sorted(scan), "indexed": asyncio.run(indexed_timings())}
+        results.append({
+            "name": f"Registry Discovery ({agents // 1000}k agents, {label})",
+            "agents": agents,
+            "registry_build_s": round(build_s, 1),
+            "scan_p50_ms": round(timings["scan"][len(timings["scan"]) // 2], 3),
+            "indexed_p50_ms": round(timings["indexed"][len(timings["indexed"]) // 2], 3),
+            "indexed_p99_ms": round(timings["indexed"][int(len(timings["indexed"]) * 0.99)], 3),
+        })
+    return results
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all registry benchmarks and return results."""
+    return bench_discovery()
+
+
+if __name__ == "__main__":
+    import json
+
+    for result in run_all():
+        print(json.dumps(result, indent=2))
@@ -0,0 +1,115 @@
+"""Benchmarks for Nexus reputation updates and leaderboard reads."""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from nexus.reputation import ReputationEngine
+
+_OUTCOMES = ("success", "success", "success", "failure", "partial")
+
+
+def _engine(agents: int) -> ReputationEngine:
+    engine = ReputationEngine()
+    for i in range(agents):
+        engine.check_trust_threshold(f"did:nexus:agent-{i}")
+    return engine
+
+
+def _events(agents: int, count: int, seed: int = 11) -> List[tuple]:
+    """Skewed traffic: 80% of events come from the busiest 1% of agents."""
+    rng = random.Random(seed)
+    hot = max(1, agents // 100)
+    return [
+        (f"did:nexus:agent-{rng.randrange(hot) if rng.random() < 0.8 else rng.randrange(agents)}",
+         rng.choice(_OUTCOMES))
+        for _ in range(count)
+    ]
+
+
+def _record_histories(engine: ReputationEngine, events: List[tuple]) -> None:
+    """Baseline event path: update histories one by one, scores untouched."""
+    for agent_did, outcome in events:
+        history = engine._get_or_create_history(agent_did)
+        history.total_tasks += 1
+        history.last_activity = datetime.now(timezone.utc)
+        if outcome == "success":
+            history.successful_tasks += 1
+        elif outcome == "failure":
+            history.failed_tasks += 1
+        else:
+            history.successful_tasks += 0.5
+            history.failed_tasks += 0.5
+
+
+def _sort_scores(engine: ReputationEngine, limit: int) -> list:
+    """Baseline read path: sort every cached score."""
+    scores = list(engine._score_cache.values())
+    scores.sort(key=lambda s: s.total_score, reverse=True)
+    return scores[:limit]
+
+
+def _run(name: str, agents: int, rounds: int, events_per_round: int, mode: str, limit: int = 100) -> Dict[str, Any]:
+    engine = _engine(agents)
+    batches = [_events(agents, events_per_round, seed) for seed in range(rounds)]
+    reads: List[float] = []
+
+    started = time.perf_counter()
+    for batch in batches:
+        if mode == "baseline":
+            _record_histories(engine, batch)
+            begin = time.perf_counter()
+            _sort_scores(engine, limit)
+        else:
+            if mode == "batched":
+                engine.apply_events(batch)
+            else:
+                for agent_did, outcome in batch:
+                    engine.record_task_outcome(agent_did, outcome)
+            begin = time.perf_counter()
+            engine.get_leaderboard(limit)
+        reads.append((time.perf_counter() - begin) * 1000)
+    elapsed = time.perf_counter() - started
+
+    reads.sort()
+    return {
+        "name": name,
+        "agents": agents,
+        "events": rounds * events_per_round,
+        "events_per_sec": round(rounds * events_per_round / elapsed),
+        "leaderboard_p50_ms": round(reads[len(reads) // 2], 3),
+    }
+
+
+def bench_leaderboard_full_sort(agents: int = 100_000, rounds: int = 50, events_per_round: int = 1_000) -> Dict[str, Any]:
+    """Baseline: histories updated in place, leaderboard re-sorted on every read."""
+    return _run("Reputation Leaderboard (full sort per read)", agents, rounds, events_per_round, "baseline")
+
+
+def bench_leaderboard_incremental(agents: int = 100_000, rounds: int = 50, events_per_round: int = 1_000) -> Dict[str, Any]:
+    """Each event re-ranks its agent; reads slice the sorted ranking."""
+    return _run("Reputation Leaderboard (incremental, per event)", agents, rounds, events_per_round, "single")
+
+
+def bench_leaderboard_batched(agents: int = 100_000, rounds: int = 50, events_per_round: int = 1_000) -> Dict[str, Any]:
+    """Events coalesced per agent with apply_events before re-ranking."""
+    return _run("Reputation Leaderboard (incremental, apply_events)", agents, rounds, events_per_round, "batched")
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all reputation benchmarks and return results."""
+    return [
+        bench_leaderboard_full_sort(),
+        bench_leaderboard_incremental(),
+        bench_leaderboard_batched(),
+    ]
+
+
+if __name__ == "__main__":
+    import json
+
+    for result in run_all():
+        print(json.dumps(result, indent=2))
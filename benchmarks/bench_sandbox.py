@@ -0,0 +1,149 @@
+"""Benchmarks for ExecutionSandbox static code validation."""
+
+from __future__ import annotations
+
+import ast
+import os
+import random
+import time
+from typing import Any, Dict, List
+
+from agent_os.sandbox import ExecutionSandbox
+
+
+def _snippet(rng: random.Random, i: int) -> str:
+    """A generated agent tool snippet; about one in ten touches a blocked API."""
+    lines = [
+        f"def handler_{i}(items, limit={rng.randrange(5, 50)}):",
+        "    total = 0",
+        "    seen = {}",
+    ]
+    for j in range(rng.randrange(3, 15)):
+        lines += [
+            f"    for k{j}, v{j} in enumerate(items[:limit]):",
+            f"        if v{j} % {rng.randrange(2, 9)} == 0 and k{j} not in seen:",
+            f"            seen[k{j}] = str(v{j}).upper() + 'x{j}'",
+            f"            total += len(seen) * {j}",
+        ]
+    lines.append("    return total, sorted(seen.items())")
+    roll = rng.random()
+    if roll < 0.05:
+        lines.insert(0, "import os")
+        lines.insert(-1, "    os.system('ls')")
+    elif roll < 0.1:
+        lines.insert(-1, "    total = eval(str(total))")
+    return "\n".join(lines)
+
+
+def _corpus(count: int, seed: int = 9) -> List[str]:
+    rng = random.Random(seed)
+    return [_snippet(rng, i) for i in range(count)]
+
+
+class _NodeVisitorValidator(ast.NodeVisitor):
+    """Baseline: the per-rule NodeVisitor used before the single walk."""
+
+    def __init__(self, blocked_modules: set, blocked_builtins: set) -> None:
+        self.blocked_modules = blocked_modules
+        self.blocked_builtins = blocked_builtins
+        self.violations: List[tuple] = []
+
+    def visit_Import(self, node: ast.Import) -> None:  # noqa: N802
+        for alias in node.names:
+            if alias.name.split(".")[0] in self.blocked_modules:
+                self.violations.append((node.lineno, "blocked_import"))
+        self.generic_visit(node)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:  # noqa: N802
+        if node.module and node.module.split(".")[0] in self.blocked_modules:
+            self.violations.append((node.lineno, "blocked_import"))
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> None:  # noqa: N802
+        if isinstance(node.func, ast.Name) and node.func.id in self.blocked_builtins:
+            self.violations.append((node.lineno, "blocked_builtin"))
+        if isinstance(node.func, ast.Attribute) and isinstance(node.func.value, ast.Name):
+            if node.func.value.id in self.blocked_modules:
+                self.violations.append((node.lineno, "blocked_module_call"))
+        self.generic_visit(node)
+
+
+def _throughput(name: str, validate, codes: List[str]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    flagged = sum(1 for code in codes if validate(code))
+    elapsed = time.perf_counter() - started
+    return {
+        "name": name,
+        "iterations": len(codes),
+        "flagged": flagged,
+        "ops_per_sec": round(len(codes) / elapsed),
+        "mean_us": round(elapsed / len(codes) * 1e6, 1),
+    }
+
+
+def bench_validate_node_visitor(count: int = 1_000) -> Dict[str, Any]:
+    """Baseline: parse plus NodeVisitor on every call."""
+    config = ExecutionSandbox().config
+    modules, builtins = set(config.blocked_modules), set(config.blocked_builtins)
+
+    def validate(code: str) -> List[tuple]:
+        visitor = _NodeVisitorValidator(modules, builtins)
+        visitor.visit(ast.parse(code))
+        return visitor.violations
+
+    return _throughput("Sandbox Validate (NodeVisitor, uncached)", validate, _corpus(count))
+
+
+def bench_validate_single_walk(count: int = 1_000) -> Dict[str, Any]:
+    """Screened single walk with the cache disabled."""
+    sandbox = ExecutionSandbox(cache_size=0)
+    return _throughput("Sandbox Validate (single walk, uncached)", sandbox.validate_code, _corpus(count))
+
+
+def bench_validate_resubmitted(unique: int = 200, rounds: int = 25) -> Dict[str, Any]:
+    """Agents resubmitting the same snippets in a loop, with the cache on."""
+    corpus = _corpus(unique)
+    codes = [code for _ in range(rounds) for code in corpus]
+    random.Random(4).shuffle(codes)
+    sandbox = ExecutionSandbox()
+    return _throughput(
+        f"Sandbox Validate ({unique} snippets resubmitted x{rounds}, cached)",
+        sandbox.validate_code,
+        codes,
+    )
+
+
+def bench_validate_many(count: int = 5_000) -> List[Dict[str, Any]]:
+    """Batch review of a fresh corpus, inline and on the process pool."""
+    corpus = _corpus(count, seed=21)
+    workers = os.cpu_count() or 1
+    results = []
+    for label, max_workers in (("inline", 1), (f"{workers} workers", workers)):
+        sandbox = ExecutionSandbox()
+        started = time.perf_counter()
+        flagged = sum(1 for found in sandbox.validate_many(corpus, max_workers=max_workers) if found)
+        elapsed = time.perf_counter() - started
+        results.append({
+            "name": f"Sandbox validate_many ({count:,} snippets, {label})",
+            "flagged": flagged,
+            "total_ms": round(elapsed * 1_000, 1),
+            "ops_per_sec": round(count / elapsed),
+        })
+    return results
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all sandbox benchmarks and return results."""
+    return [
+        bench_validate_node_visitor(),
+        bench_validate_single_walk(),
+        bench_validate_resubmitted(),
+        *bench_validate_many(),
+    ]
+
+
+if __name__ == "__main__":
+    import json
+
+    for result in run_all():
+        print(json.dumps(result, indent=2))
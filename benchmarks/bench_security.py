@@ -0,0 +1,90 @@
+"""Benchmarks for IATP sensitive-data detection."""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Any, Dict, List
+
+from iatp.security import SecurityValidator, _luhn_check
+
+
+def _payload(target_bytes: int, seed: int = 3) -> Dict[str, Any]:
+    """JSON-like body of ~*target_bytes* with ids, amounts and prose but no PII."""
+    rng = random.Random(seed)
+    words = ["invoice", "shipment", "order", "status", "pending", "review", "region", "total"]
+    records = []
+    size = 0
+    while size < target_bytes:
+        record = {
+            "id": f"ord-{rng.randrange(10**8)}",
+            "amount": round(rng.random() * 1000, 2),
+            "created": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "note": " ".join(rng.choice(words) for _ in range(12)),
+            "tags": [rng.choice(words) for _ in range(3)],
+        }
+        records.append(record)
+        size += len(str(record))
+    return {"task": "reconcile", "records": records}
+
+
+def _detect_via_repr(payload: Dict[str, Any]) -> List[str]:
+    """Baseline: every pattern over str(payload), as before."""
+    found = []
+    payload_str = str(payload)
+    for match in SecurityValidator.CREDIT_CARD_PATTERN.finditer(payload_str):
+        if _luhn_check(match.group().replace(" ", "").replace("-", "")):
+            found.append("credit_card")
+            break
+    if SecurityValidator.SSN_PATTERN.search(payload_str):
+        found.append("ssn")
+    if SecurityValidator.EMAIL_PATTERN.search(payload_str):
+        found.append("email")
+    return found
+
+
+def _timed(func, iterations: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        latencies.append((time.perf_counter() - start) * 1_000)
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "p50_ms": round(latencies[len(latencies) // 2], 4),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)], 4),
+    }
+
+
+def bench_detect_sensitive_data(size_bytes: int, iterations: int) -> List[Dict[str, Any]]:
+    """Compare the str(payload) scan with the single-pass field scanner."""
+    payload = _payload(size_bytes)
+    validator = SecurityValidator()
+    assert _detect_via_repr(payload) == validator.detect_sensitive_data(payload) == []
+    label = f"{size_bytes // 1024} KB" if size_bytes < 1024 * 1024 else f"{size_bytes // (1024 * 1024)} MB"
+    return [
+        {
+            "name": f"Sensitive Data Scan ({label}, str(payload) regexes)",
+            **_timed(lambda: _detect_via_repr(payload), iterations),
+        },
+        {
+            "name": f"Sensitive Data Scan ({label}, field scanner)",
+            **_timed(lambda: validator.detect_sensitive_data(payload), iterations),
+        },
+    ]
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all security benchmarks and return results."""
+    results: List[Dict[str, Any]] = []
+    for size_bytes, iterations in ((1024, 2_000), (10 * 1024, 500), (100 * 1024, 100), (1024 * 1024, 10)):
+        results.extend(bench_detect_sensitive_data(size_bytes, iterations))
+    return results
+
+
+if __name__ == "__main__":
+    import json
+
+    for result in run_all():
+        print(json.dumps(result))
@@ -0,0 +1,133 @@
+"""Benchmarks for the IATP sidecar proxy against a local upstream agent."""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+import httpx
+
+from iatp.models import (
+    AgentCapabilities,
+    CapabilityManifest,
+    PrivacyContract,
+    RetentionPolicy,
+    ReversibilityLevel,
+    TrustLevel,
+)
+from iatp.sidecar import create_sidecar
+from iatp.telemetry import FlightRecorder
+
+_BODY = b'{"status":"ok"}'
+_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+    b"Content-Length: " + str(len(_BODY)).encode() + b"\r\n\r\n" + _BODY
+)
+
+
+async def _handle_upstream(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Minimal keep-alive HTTP/1.1 agent that answers every request with 200."""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            writer.write(_RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def _manifest() -> CapabilityManifest:
+    return CapabilityManifest(
+        agent_id="bench-agent",
+        trust_level=TrustLevel.VERIFIED_PARTNER,
+        capabilities=AgentCapabilities(idempotency=True, reversibility=ReversibilityLevel.FULL),
+        privacy_contract=PrivacyContract(retention=RetentionPolicy.EPHEMERAL, human_review=False),
+    )
+
+
+async def _timed(request: Callable[[int], Awaitable[Any]], iterations: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for i in range(iterations):
+        begin = time.perf_counter()
+        await request(i)
+        latencies.append((time.perf_counter() - begin) * 1_000)
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "requests_per_sec": round(iterations / elapsed),
+        "p50_ms": round(latencies[len(latencies) // 2], 3),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)], 3),
+    }
+
+
+async def _with_upstream(run: Callable[[str], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    server = await asyncio.start_server(_handle_upstream, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        return await run(f"http://127.0.0.1:{port}/agent")
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def bench_forward_client_per_request(iterations: int = 1_000) -> Dict[str, Any]:
+    """Baseline: a new httpx.AsyncClient (and TCP connection) per forwarded request."""
+
+    async def run(url: str) -> Dict[str, Any]:
+        async def request(i: int) -> None:
+            async with httpx.AsyncClient() as client:
+                await client.post(url, json={"task": i}, timeout=30.0)
+
+        return await _timed(request, iterations)
+
+    return {"name": "Sidecar Forward (client per request)", **asyncio.run(_with_upstream(run))}
+
+
+def bench_sidecar_proxy_pooled(iterations: int = 1_000) -> Dict[str, Any]:
+    """Full /proxy path: cached manifest checks and the pooled upstream client."""
+
+    async def run(url: str) -> Dict[str, Any]:
+        with tempfile.TemporaryDirectory() as log_dir:
+            sidecar = create_sidecar(agent_url=url, manifest=_manifest())
+            sidecar.flight_recorder = FlightRecorder(log_dir=Path(log_dir))
+            await sidecar.startup()
+            transport = httpx.ASGITransport(app=sidecar.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://sidecar") as client:
+
+                async def request(i: int) -> None:
+                    response = await client.post("/proxy", json={"task": i})
+                    assert response.status_code == 200, response.text
+
+                result = await _timed(request, iterations)
+            await sidecar.shutdown()
+            return result
+
+    return {"name": "Sidecar /proxy (pooled upstream, cached validation)", **asyncio.run(_with_upstream(run))}
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all sidecar benchmarks and return results."""
+    return [
+        bench_forward_client_per_request(),
+        bench_sidecar_proxy_pooled(),
+    ]
+
+
+if __name__ == "__main__":
+    import json
+
+    for result in run_all():
+        print(json.dumps(result, indent=2))
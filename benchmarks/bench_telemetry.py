@@ -0,0 +1,75 @@
+"""Benchmarks for the IATP flight recorder."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from iatp.telemetry import FlightRecorder
+
+
+def _log_requests(recorder: FlightRecorder, events: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    for i in range(events):
+        start = time.perf_counter()
+        recorder.log_request(
+            trace_id=f"trace-{i % 1_000}",
+            agent_id="bench-agent",
+            payload={"task": "summarize", "document_id": i},
+        )
+        latencies.append((time.perf_counter() - start) * 1_000)
+    started_flush = time.perf_counter()
+    recorder.flush()
+    flush_ms = (time.perf_counter() - started_flush) * 1_000
+    total_seconds = sum(latencies) / 1_000
+    latencies.sort()
+    return {
+        "events": events,
+        "events_per_sec": round(events / total_seconds),
+        "p50_ms": round(latencies[len(latencies) // 2], 4),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)], 4),
+        "final_flush_ms": round(flush_ms, 2),
+    }
+
+
+class _PerEventRecorder(FlightRecorder):
+    """Baseline: open, append to and close a per-trace file for every event."""
+
+    def _write_log(self, trace_id: str, entry: Dict[str, Any]) -> None:
+        with open(self.log_dir / f"{trace_id}.jsonl", "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+
+def bench_flight_recorder_per_event(events: int = 20_000) -> Dict[str, Any]:
+    """Baseline: one open/write/close per logged event."""
+    with tempfile.TemporaryDirectory() as log_dir:
+        return {
+            "name": "Flight Recorder (file open per event)",
+            **_log_requests(_PerEventRecorder(log_dir=Path(log_dir)), events),
+        }
+
+
+def bench_flight_recorder_buffered(events: int = 20_000) -> Dict[str, Any]:
+    """Buffered recorder: background writer with batched flush and fsync."""
+    with tempfile.TemporaryDirectory() as log_dir:
+        recorder = FlightRecorder(log_dir=Path(log_dir))
+        result = _log_requests(recorder, events)
+        recorder.close()
+        result["flushes"] = recorder.get_stats()["flushes"]
+        return {"name": "Flight Recorder (buffered, batched fsync)", **result}
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all telemetry benchmarks and return results."""
+    return [
+        bench_flight_recorder_per_event(),
+        bench_flight_recorder_buffered(),
+    ]
+
+
+if __name__ == "__main__":
+    for result in run_all():
+        print(json.dumps(result, indent=2))
@@ -0,0 +1,168 @@
+"""Burst benchmarks for webhook delivery against a local HTTP endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from agent_os.integrations.webhooks import WebhookConfig, WebhookEvent, WebhookNotifier
+
+_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n"
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Minimal keep-alive HTTP/1.1 endpoint that answers every POST with 200."""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            writer.write(_RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+        # Cancelled on shutdown; swallow it so the streams callback stays quiet
+        pass
+    finally:
+        writer.close()
+
+
+class _Endpoint:
+    """Runs the local endpoint on its own event loop thread."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run() -> None:
+            asyncio.set_event_loop(self.loop)
+            self.server = self.loop.run_until_complete(
+                asyncio.start_server(_handle, "127.0.0.1", 0, backlog=4096)
+            )
+            started.set()
+            self.loop.run_forever()
+
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+        started.wait()
+        self.url = f"http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}/hook"
+
+    async def _shutdown(self) -> None:
+        self.server.close()
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def close(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+def _burst(name: str, events: int, send: Callable[[WebhookNotifier, WebhookEvent], Any],
+           wait: Callable[[WebhookNotifier, List[Any]], None], **config: Any) -> Dict[str, Any]:
+    """Fire *events* at once and wait for delivery.
+
+    The burst runs twice: once for throughput, once under tracemalloc for
+    peak Python heap use (tracing slows delivery too much to time both).
+    """
+    endpoint_config = config.pop("endpoint", {})
+    result: Dict[str, Any] = {"name": name, "events": events}
+    endpoint = _Endpoint()
+    try:
+        for traced in (False, True):
+            notifier = WebhookNotifier(
+                [WebhookConfig(url=endpoint.url, retry_count=1, **endpoint_config)], **config
+            )
+            burst = [
+                WebhookEvent(event_type="policy_violation", agent_id=f"a{i}", action="x")
+                for i in range(events)
+            ]
+            peak_threads = threading.active_count()
+            if traced:
+                tracemalloc.start()
+            started = time.perf_counter()
+            handles = []
+            for event in burst:
+                handles.append(send(notifier, event))
+                peak_threads = max(peak_threads, threading.active_count())
+            wait(notifier, handles)
+            elapsed = time.perf_counter() - started
+            if traced:
+                result["peak_traced_mb"] = round(tracemalloc.get_traced_memory()[1] / 1e6, 2)
+                tracemalloc.stop()
+            else:
+                result["delivered"] = sum(r.success for r in notifier.get_history())
+                result["events_per_sec"] = round(events / elapsed)
+                result["total_ms"] = round(elapsed * 1_000, 1)
+                result["peak_threads"] = peak_threads
+            notifier.close(timeout=10.0)
+    finally:
+        endpoint.close()
+    return result
+
+
+def _thread_per_event(notifier: WebhookNotifier, event: WebhookEvent) -> threading.Thread:
+    """Baseline: the previous notify_async, one thread and connection per event."""
+    thread = threading.Thread(target=notifier.notify, args=(event,), daemon=True)
+    thread.start()
+    return thread
+
+
+def bench_thread_per_event(events: int = 5_000) -> Dict[str, Any]:
+    """Baseline: one thread and one connection per event."""
+    return _burst(
+        "Webhook Burst (thread per event)",
+        events,
+        _thread_per_event,
+        lambda n, threads: [t.join() for t in threads],
+    )
+
+
+def bench_pooled(events: int = 5_000) -> Dict[str, Any]:
+    """Bounded queue, 4 keep-alive workers."""
+    return _burst(
+        "Webhook Burst (4 keep-alive workers)",
+        events,
+        WebhookNotifier.notify_async,
+        lambda n, futures: n.flush(),
+        workers_per_endpoint=4,
+        queue_size=events,
+    )
+
+
+def bench_pooled_batched(events: int = 5_000) -> Dict[str, Any]:
+    """Bounded queue, 4 workers, 10 ms batching window."""
+    return _burst(
+        "Webhook Burst (4 workers, 10 ms batches)",
+        events,
+        WebhookNotifier.notify_async,
+        lambda n, futures: n.flush(),
+        workers_per_endpoint=4,
+        queue_size=events,
+        endpoint={"batch_window": 0.01, "max_batch_size": 200},
+    )
+
+
+def run_all() -> List[Dict[str, Any]]:
+    """Run all webhook benchmarks and return results."""
+    return [
+        bench_thread_per_event(),
+        bench_pooled(),
+        bench_pooled_batched(),
+    ]
+
+
+if __name__ == "__main__":
+    import json
+
+    for result in run_all():
+        print(json.dumps(result, indent=2))
@@ -9,7 +9,32 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
 
-from benchmarks import bench_adapters, bench_audit, bench_kernel, bench_policy
+from benchmarks import (
+    bench_adapters,
+    bench_attestation,
+    bench_audit,
+    bench_caching,
+    bench_constraint_graph,
+    bench_ipc_pipes,
+    bench_kernel,
+    bench_lifecycle,
+    bench_mcp_gateway,
+    bench_mcp_security,
+    bench_mcp_stdio,
+    bench_memory_guard,
+    bench_metrics,
+    bench_nexus_client,
+    bench_orchestrator,
+    bench_policy,
+    bench_rate_limiter,
+    bench_registry,
+    bench_reputation,
+    bench_sandbox,
+    bench_security,
+    bench_sidecar,
+    bench_telemetry,
+    bench_webhooks,
+)
 
 
 def collect_results() -> Dict[str, Any]:
@@ -23,6 +48,46 @@ def collect_results() -> Dict[str, Any]:
     results.extend(bench_audit.run_all())
     print("Running adapter benchmarks...", flush=True)
     results.extend(bench_adapters.run_all())
+    print("Running caching benchmarks...", flush=True)
+    results.extend(bench_caching.run_all())
+    print("Running lifecycle benchmarks...", flush=True)
+    results.extend(bench_lifecycle.run_all())
+    print("Running orchestrator benchmarks...", flush=True)
+    results.extend(bench_orchestrator.run_all())
+    print("Running IPC pipeline benchmarks...", flush=True)
+    results.extend(bench_ipc_pipes.run_all())
+    print("Running sidecar benchmarks...", flush=True)
+    results.extend(bench_sidecar.run_all())
+    print("Running telemetry benchmarks...", flush=True)
+    results.extend(bench_telemetry.run_all())
+    print("Running security benchmarks...", flush=True)
+    results.extend(bench_security.run_all())
+    print("Running attestation benchmarks...", flush=True)
+    results.extend(bench_attestation.run_all())
+    print("Running registry benchmarks...", flush=True)
+    results.extend(bench_registry.run_all())
+    print("Running reputation benchmarks...", flush=True)
+    results.extend(bench_reputation.run_all())
+    print("Running Nexus client benchmarks...", flush=True)
+    results.extend(bench_nexus_client.run_all())
+    print("Running MCP stdio benchmarks...", flush=True)
+    results.extend(bench_mcp_stdio.run_all())
+    print("Running constraint graph benchmarks...", flush=True)
+    results.extend(bench_constraint_graph.run_all())
+    print("Running rate limiter benchmarks...", flush=True)
+    results.extend(bench_rate_limiter.run_all())
+    print("Running webhook benchmarks...", flush=True)
+    results.extend(bench_webhooks.run_all())
+    print("Running metrics benchmarks...", flush=True)
+    results.extend(bench_metrics.run_all())
+    print("Running MCP gateway benchmarks...", flush=True)
+    results.extend(bench_mcp_gateway.run_all())
+    print("Running MCP security scanner benchmarks...", flush=True)
+    results.extend(bench_mcp_security.run_all())
+    print("Running memory guard benchmarks...", flush=True)
+    results.extend(bench_memory_guard.run_all())
+    print("Running sandbox benchmarks...", flush=True)
+    results.extend(bench_sandbox.run_all())
     return {
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "python": platform.python_version(),
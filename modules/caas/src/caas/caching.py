@@ -9,9 +9,10 @@ Key Features:
     - Provider-agnostic caching interface
     - Anthropic prompt caching support (cache_control breakpoints)
     - OpenAI predicted outputs / prefix caching detection
-    - Local semantic cache for repeated queries
+    - Local semantic cache for near-duplicate queries (SimHash + LSH)
     - Cache statistics and cost tracking
-    - TTL-based cache expiration
+    - TTL-based cache expiration with a background sweep
+    - Byte-budgeted segmented LRU so a few huge contexts can't exhaust memory
 
 Cost Savings:
     - Anthropic: Up to 90% reduction on cached prompt tokens
@@ -49,12 +50,15 @@ from __future__ import annotations
 
 import hashlib
 import json
+import re
+import sys
 import time
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Protocol, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Protocol, Set, Tuple, Union
 from collections import OrderedDict
 import threading
 
@@ -81,16 +85,37 @@ class CacheConfig:
     Attributes:
         ttl_seconds: Time-to-live for cached entries (default: 1 hour)
         max_entries: Maximum number of entries in local cache
+        max_bytes: Memory budget for cached content in bytes (0 = unbounded)
+        protected_ratio: Share of ``max_bytes`` reserved for entries that
+            have been hit at least once (segmented LRU protected segment)
+        cleanup_interval_seconds: Interval of the background expiry sweep
+            (0 disables it; ``cleanup()`` can still be called manually)
         min_tokens_for_caching: Minimum tokens to consider caching
         semantic_threshold: Similarity threshold for semantic cache (0-1)
+        enable_semantic_cache: Whether near-duplicate contexts may be served
+            from the local cache (``CacheType.LOCAL_SEMANTIC``)
+        semantic_normalization: Names of the rules in ``NORMALIZATION_RULES``
+            applied, in order, before computing a semantic signature.
+            ``"hex_ids"`` and ``"numbers"`` are opt-in: they make contexts
+            that differ only in quantities, versions or hashes match
+        semantic_max_chars: Longest context given a semantic signature;
+            longer contexts only use the exact tier (0 = no limit)
         enable_provider_cache: Whether to use provider-specific caching
         enable_local_cache: Whether to use local caching
         track_costs: Whether to track cost savings
     """
     ttl_seconds: int = 3600
     max_entries: int = 1000
+    max_bytes: int = 256 * 1024 * 1024  # 256 MiB
+    protected_ratio: float = 0.8
+    cleanup_interval_seconds: float = 60.0
     min_tokens_for_caching: int = 1024  # Only cache contexts >= 1024 tokens
     semantic_threshold: float = 0.95
+    enable_semantic_cache: bool = False
+    semantic_normalization: Tuple[str, ...] = (
+        "timestamps", "uuids", "lowercase", "whitespace",
+    )
+    semantic_max_chars: int = 64 * 1024
     enable_provider_cache: bool = True
     enable_local_cache: bool = True
     track_costs: bool = True
@@ -108,6 +133,9 @@ class CacheEntry:
         last_accessed: When the entry was last accessed
         access_count: Number of times this entry was accessed
         token_count: Estimated token count
+        size_bytes: In-memory size of the content (computed on insert if 0)
+        fingerprint: Digest of the full keyed content, used to confirm
+            hits on the sampled cache key
     """
     key: str
     content: str
@@ -116,6 +144,8 @@ class CacheEntry:
     last_accessed: datetime
     access_count: int = 1
     token_count: int = 0
+    size_bytes: int = 0
+    fingerprint: str = ""
     
     def is_expired(self, ttl_seconds: int) -> bool:
         """Check if this entry has expired."""
@@ -133,12 +163,14 @@ class CacheResult:
         cache_key: Key used for caching
         token_savings: Estimated token savings
         cost_savings: Estimated cost savings in USD
+        similarity: Signature similarity of a semantic hit (1.0 for exact hits)
     """
     cache_type: CacheType
     cached_content: Optional[str] = None
     cache_key: Optional[str] = None
     token_savings: int = 0
     cost_savings: float = 0.0
+    similarity: Optional[float] = None
 
 
 @dataclass
@@ -154,6 +186,11 @@ class CacheStats:
         total_tokens_saved: Total tokens saved
         total_cost_saved: Total cost saved in USD
         current_entries: Current number of cache entries
+        current_bytes: Bytes of content currently held in the local cache
+        max_bytes: Configured byte budget (0 = unbounded)
+        evictions: Entries evicted to respect the entry/byte budgets
+        expired: Entries removed because their TTL elapsed
+        semantic_entries: Signatures held in the semantic index
     """
     total_requests: int = 0
     provider_hits: int = 0
@@ -163,6 +200,11 @@ class CacheStats:
     total_tokens_saved: int = 0
     total_cost_saved: float = 0.0
     current_entries: int = 0
+    current_bytes: int = 0
+    max_bytes: int = 0
+    evictions: int = 0
+    expired: int = 0
+    semantic_entries: int = 0
     
     @property
     def hit_rate(self) -> float:
@@ -184,6 +226,11 @@ class CacheStats:
             "total_tokens_saved": self.total_tokens_saved,
             "total_cost_saved": self.total_cost_saved,
             "current_entries": self.current_entries,
+            "current_bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "expired": self.expired,
+            "semantic_entries": self.semantic_entries,
         }
 
 
@@ -464,28 +511,76 @@ class LocalCacheStrategy(CacheStrategy):
 
 
 class LRUCache:
-    """Thread-safe LRU cache implementation."""
+    """
+    Thread-safe, size-aware segmented LRU cache.
+
+    Entries are weighted by the in-memory size of their content and the
+    cache is bounded both by entry count (``max_size``) and by total bytes
+    (``max_bytes``). New entries land in a *probationary* segment and are
+    promoted to a *protected* segment on their first hit, so a burst of
+    one-off contexts only evicts other one-off contexts and never the
+    working set (segmented LRU admission).
+    """
     
-    def __init__(self, max_size: int = 1000):
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+    def __init__(
+        self,
+        max_size: int = 1000,
+        max_bytes: int = 0,
+        protected_ratio: float = 0.8,
+    ):
+        self._probation: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._protected: OrderedDict[str, CacheEntry] = OrderedDict()
         self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._protected_max_bytes = int(max_bytes * protected_ratio)
+        self._protected_max_size = max(1, int(max_size * protected_ratio))
+        self._probation_bytes = 0
+        self._protected_bytes = 0
+        self._evictions = 0
         self._lock = threading.RLock()
     
+    @property
+    def max_bytes(self) -> int:
+        """Configured byte budget (0 = unbounded)."""
+        return self._max_bytes
+    
+    @property
+    def size_bytes(self) -> int:
+        """Total bytes of content currently cached."""
+        with self._lock:
+            return self._probation_bytes + self._protected_bytes
+    
+    @property
+    def evictions(self) -> int:
+        """Number of entries evicted to respect the size budgets."""
+        with self._lock:
+            return self._evictions
+    
     def get(self, key: str, ttl_seconds: int) -> Optional[CacheEntry]:
         """Get an entry from cache."""
         with self._lock:
-            if key not in self._cache:
-                return None
-            
-            entry = self._cache[key]
+            entry = self._protected.get(key)
+            in_protected = entry is not None
+            if entry is None:
+                entry = self._probation.get(key)
+                if entry is None:
+                    return None
             
             # Check expiration
             if entry.is_expired(ttl_seconds):
-                del self._cache[key]
+                self._discard(key)
                 return None
             
-            # Move to end (most recently used)
-            self._cache.move_to_end(key)
+            if in_protected:
+                # Move to end (most recently used)
+                self._protected.move_to_end(key)
+            else:
+                # Second access: promote out of probation
+                del self._probation[key]
+                self._probation_bytes -= entry.size_bytes
+                self._protected[key] = entry
+                self._protected_bytes += entry.size_bytes
+                self._rebalance()
             
             # Update access stats
             entry.access_count += 1
@@ -493,43 +588,319 @@ class LRUCache:
             
             return entry
     
-    def put(self, entry: CacheEntry) -> None:
-        """Add or update an entry in cache."""
+    def put(self, entry: CacheEntry) -> bool:
+        """
+        Add or update an entry in cache.
+        
+        Returns:
+            False if the entry is larger than the whole byte budget and was
+            not admitted, True otherwise.
+        """
+        if not entry.size_bytes:
+            entry.size_bytes = sys.getsizeof(entry.content)
+        
         with self._lock:
-            # Remove oldest entries if at capacity
-            while len(self._cache) >= self._max_size:
-                self._cache.popitem(last=False)
+            self._discard(entry.key)
             
-            self._cache[entry.key] = entry
-            self._cache.move_to_end(entry.key)
+            if self._max_bytes and entry.size_bytes > self._max_bytes:
+                return False
+            
+            # Remove oldest entries until the new one fits
+            while self._probation or self._protected:
+                over_count = len(self) >= self._max_size
+                over_bytes = bool(self._max_bytes) and (
+                    self.size_bytes + entry.size_bytes > self._max_bytes
+                )
+                if not (over_count or over_bytes):
+                    break
+                self._evict_one()
+            
+            self._probation[entry.key] = entry
+            self._probation_bytes += entry.size_bytes
+            return True
     
     def remove(self, key: str) -> bool:
         """Remove an entry from cache."""
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                return True
-            return False
+            return self._discard(key)
     
     def clear(self) -> None:
         """Clear all entries."""
         with self._lock:
-            self._cache.clear()
+            self._probation.clear()
+            self._protected.clear()
+            self._probation_bytes = 0
+            self._protected_bytes = 0
     
     def __len__(self) -> int:
         with self._lock:
-            return len(self._cache)
+            return len(self._probation) + len(self._protected)
+    
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._probation or key in self._protected
     
     def cleanup_expired(self, ttl_seconds: int) -> int:
         """Remove expired entries. Returns count of removed entries."""
         with self._lock:
             expired_keys = [
-                key for key, entry in self._cache.items()
+                key
+                for segment in (self._probation, self._protected)
+                for key, entry in segment.items()
                 if entry.is_expired(ttl_seconds)
             ]
             for key in expired_keys:
-                del self._cache[key]
+                self._discard(key)
             return len(expired_keys)
+    
+    def _discard(self, key: str) -> bool:
+        """Remove ``key`` from whichever segment holds it. Caller holds the lock."""
+        entry = self._probation.pop(key, None)
+        if entry is not None:
+            self._probation_bytes -= entry.size_bytes
+            return True
+        entry = self._protected.pop(key, None)
+        if entry is not None:
+            self._protected_bytes -= entry.size_bytes
+            return True
+        return False
+    
+    def _evict_one(self) -> None:
+        """Evict the LRU probationary entry, falling back to the protected segment."""
+        segment = self._probation if self._probation else self._protected
+        _, entry = segment.popitem(last=False)
+        if segment is self._probation:
+            self._probation_bytes -= entry.size_bytes
+        else:
+            self._protected_bytes -= entry.size_bytes
+        self._evictions += 1
+    
+    def _rebalance(self) -> None:
+        """Demote LRU protected entries back to probation when it outgrows its share."""
+        while len(self._protected) > 1 and (
+            len(self._protected) > self._protected_max_size
+            or (self._max_bytes and self._protected_bytes > self._protected_max_bytes)
+        ):
+            key, entry = self._protected.popitem(last=False)
+            self._protected_bytes -= entry.size_bytes
+            self._probation[key] = entry
+            self._probation_bytes += entry.size_bytes
+
+
+class _ExpirySweeper(threading.Thread):
+    """
+    Daemon thread that periodically drops expired entries from an LRUCache.
+
+    Holds only a weak reference to the cache so that an abandoned
+    ``ContextCache`` can still be garbage collected; the thread exits on the
+    next tick once the cache is gone or ``stop()`` is called.
+    """
+    
+    def __init__(self, cache: LRUCache, ttl_seconds: int, interval_seconds: float):
+        super().__init__(name="caas-cache-expiry", daemon=True)
+        self._cache_ref = weakref.ref(cache)
+        self._ttl_seconds = ttl_seconds
+        self._interval = interval_seconds
+        self._stopped = threading.Event()
+        self.removed = 0
+    
+    def run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            cache = self._cache_ref()
+            if cache is None:
+                return
+            self.removed += cache.cleanup_expired(self._ttl_seconds)
+            del cache
+    
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+# =============================================================================
+# Semantic (near-duplicate) matching
+# =============================================================================
+
+_TIMESTAMP_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?"
+    r"|\b\d{1,2}:\d{2}(?::\d{2})?\b"
+)
+_UUID_RE = re.compile(
+    r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"
+)
+_HEX_ID_RE = re.compile(r"\b(?=[0-9a-fA-F]*\d)[0-9a-fA-F]{12,}\b")
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+NORMALIZATION_RULES: Dict[str, Callable[[str], str]] = {
+    "timestamps": lambda text: _TIMESTAMP_RE.sub("<ts>", text),
+    "uuids": lambda text: _UUID_RE.sub("<id>", text),
+    "hex_ids": lambda text: _HEX_ID_RE.sub("<id>", text),
+    "numbers": lambda text: _NUMBER_RE.sub("<n>", text),
+    "lowercase": str.lower,
+    "whitespace": lambda text: _WHITESPACE_RE.sub(" ", text).strip(),
+}
+
+
+def normalize_text(text: str, rules: Tuple[str, ...]) -> str:
+    """
+    Apply named normalization rules to text before semantic matching.
+    
+    Args:
+        text: Text to normalize
+        rules: Names of entries in ``NORMALIZATION_RULES``, applied in order
+        
+    Raises:
+        KeyError: If a rule name is unknown
+    """
+    for rule in rules:
+        text = NORMALIZATION_RULES[rule](text)
+    return text
+
+
+_SIMHASH_BITS = 64
+_SIMHASH_MASK = (1 << _SIMHASH_BITS) - 1
+_COUNTER_BITS = 32  # Width of each per-bit vote counter packed into one int
+_COUNTER_MASK = (1 << _COUNTER_BITS) - 1
+
+# _SPREAD[i][b] places the 8 bits of byte value b (at byte position i of a
+# 64-bit hash) into their own counter fields, so that summing spread values
+# tallies votes for all 64 bits with 8 big-int additions per feature.
+_SPREAD: List[List[int]] = [
+    [
+        sum(
+            1 << (_COUNTER_BITS * (byte_index * 8 + bit))
+            for bit in range(8)
+            if value >> bit & 1
+        )
+        for value in range(256)
+    ]
+    for byte_index in range(8)
+]
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """
+    Compute a 64-bit SimHash over word shingles of ``text``.
+    
+    Near-duplicate texts produce signatures with a small Hamming distance.
+    Uses Python's string hashing, so signatures are only comparable within
+    one process (the semantic index is in-memory only).
+    """
+    tokens = text.split()
+    if not tokens:
+        return 0
+    if len(tokens) < shingle_size:
+        features: List[Any] = [tuple(tokens)]
+    else:
+        features = list(zip(*(tokens[i:] for i in range(shingle_size))))
+    
+    s0, s1, s2, s3, s4, s5, s6, s7 = _SPREAD
+    votes = 0
+    for feature in features:
+        h = hash(feature) & _SIMHASH_MASK
+        votes += (
+            s0[h & 0xFF] + s1[h >> 8 & 0xFF] + s2[h >> 16 & 0xFF] + s3[h >> 24 & 0xFF]
+            + s4[h >> 32 & 0xFF] + s5[h >> 40 & 0xFF] + s6[h >> 48 & 0xFF] + s7[h >> 56]
+        )
+    
+    half = len(features) / 2
+    signature = 0
+    for bit in range(_SIMHASH_BITS):
+        if (votes >> (_COUNTER_BITS * bit) & _COUNTER_MASK) > half:
+            signature |= 1 << bit
+    return signature
+
+
+class SemanticIndex:
+    """
+    Locality-sensitive index of SimHash signatures.
+    
+    A threshold of ``t`` admits signatures within Hamming distance
+    ``d = floor(64 * (1 - t))``. Signatures are split into ``d + 1`` bands;
+    by the pigeonhole principle any match within ``d`` bits agrees exactly on
+    at least one band, so bucket lookups find every qualifying candidate
+    while only touching entries that share a band.
+    
+    Signatures are partitioned by a metadata scope so that, e.g., contexts
+    cached for different models never match each other.
+    """
+    
+    def __init__(self, threshold: float = 0.95):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self._max_distance = int(_SIMHASH_BITS * (1.0 - threshold) + 1e-9)
+        num_bands = min(self._max_distance + 1, _SIMHASH_BITS)
+        width = _SIMHASH_BITS // num_bands
+        self._bands = [
+            (i * width, (1 << (width if i < num_bands - 1 else _SIMHASH_BITS - i * width)) - 1)
+            for i in range(num_bands)
+        ]
+        self._buckets: Dict[Tuple[str, int, int], Set[str]] = {}
+        self._signatures: Dict[str, Tuple[str, int]] = {}
+        self._lock = threading.RLock()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._signatures)
+    
+    def _band_keys(self, scope: str, signature: int) -> List[Tuple[str, int, int]]:
+        return [
+            (scope, index, signature >> shift & mask)
+            for index, (shift, mask) in enumerate(self._bands)
+        ]
+    
+    def add(self, key: str, signature: int, scope: str = "") -> None:
+        """Index ``signature`` under cache ``key``, replacing any previous one."""
+        with self._lock:
+            self.remove(key)
+            self._signatures[key] = (scope, signature)
+            for band_key in self._band_keys(scope, signature):
+                self._buckets.setdefault(band_key, set()).add(key)
+    
+    def remove(self, key: str) -> bool:
+        """Remove ``key`` from the index."""
+        with self._lock:
+            indexed = self._signatures.pop(key, None)
+            if indexed is None:
+                return False
+            for band_key in self._band_keys(*indexed):
+                bucket = self._buckets.get(band_key)
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del self._buckets[band_key]
+            return True
+    
+    def query(self, signature: int, scope: str = "") -> List[Tuple[str, float]]:
+        """
+        Find indexed keys whose similarity to ``signature`` meets the threshold.
+        
+        Returns:
+            ``(key, similarity)`` pairs, most similar first
+        """
+        with self._lock:
+            candidates: Set[str] = set()
+            for band_key in self._band_keys(scope, signature):
+                bucket = self._buckets.get(band_key)
+                if bucket:
+                    candidates.update(bucket)
+            matches = []
+            for key in candidates:
+                distance = bin(self._signatures[key][1] ^ signature).count("1")
+                if distance <= self._max_distance:
+                    matches.append((key, 1.0 - distance / _SIMHASH_BITS))
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+    
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._signatures)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+            self._signatures.clear()
 
 
 class ContextCache:
@@ -538,9 +909,15 @@ class ContextCache:
     
     Provides unified caching interface for LLM APIs with support for:
     - Provider-specific caching (Anthropic, OpenAI)
-    - Local LRU cache for exact matches
+    - Local byte-budgeted LRU cache for exact matches
+    - Optional semantic tier serving near-duplicate contexts
     - Statistics and cost tracking
     
+    Cache keys hash only a sample of the content (its prefix, tail and
+    length) so lookups of multi-megabyte contexts stay cheap; a full
+    fingerprint is compared only when a sampled key hits, which rules out
+    false positives from contexts that share the sampled regions.
+    
     Example:
         cache = ContextCache(
             strategy=AnthropicCacheStrategy(),
@@ -570,9 +947,21 @@ class ContextCache:
         """
         self._strategy = strategy or LocalCacheStrategy()
         self._config = config or CacheConfig()
-        self._local_cache = LRUCache(max_size=self._config.max_entries)
-        self._stats = CacheStats()
+        self._local_cache = LRUCache(
+            max_size=self._config.max_entries,
+            max_bytes=self._config.max_bytes,
+            protected_ratio=self._config.protected_ratio,
+        )
+        self._stats = CacheStats(max_bytes=self._config.max_bytes)
         self._lock = threading.RLock()
+        self._sweeper: Optional[_ExpirySweeper] = None
+        self._expired_manually = 0
+        self._semantic_index: Optional[SemanticIndex] = None
+        if self._config.enable_semantic_cache:
+            for rule in self._config.semantic_normalization:
+                if rule not in NORMALIZATION_RULES:
+                    raise ValueError(f"Unknown normalization rule: {rule}")
+            self._semantic_index = SemanticIndex(self._config.semantic_threshold)
     
     @property
     def strategy(self) -> CacheStrategy:
@@ -584,22 +973,44 @@ class ContextCache:
         """Get the cache configuration."""
         return self._config
     
+    # Characters hashed from each end of the content by compute_key()
+    KEY_SAMPLE_CHARS = 4096
+    
     def compute_key(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """
         Compute a cache key for content.
         
+        Long content is keyed by its length plus its first and last
+        ``KEY_SAMPLE_CHARS`` characters rather than a hash of the whole
+        string; hits are confirmed against the full fingerprint.
+        
         Args:
             content: The content to hash
             metadata: Optional metadata to include in key
             
         Returns:
-            SHA-256 hash of the content
+            32-character hex digest
         """
-        key_data = content
+        sample = self.KEY_SAMPLE_CHARS
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(str(len(content)).encode())
+        if len(content) <= 2 * sample:
+            hasher.update(content.encode())
+        else:
+            hasher.update(content[:sample].encode())
+            hasher.update(content[-sample:].encode())
         if metadata:
-            key_data += json.dumps(metadata, sort_keys=True)
-        
-        return hashlib.sha256(key_data.encode()).hexdigest()[:32]
+            hasher.update(_metadata_bytes(metadata))
+        return hasher.hexdigest()
+    
+    def _fingerprint(self, content: str, metadata: Optional[Dict[str, Any]]) -> str:
+        """Full-content digest used to confirm a sampled-key hit."""
+        if len(content) <= 2 * self.KEY_SAMPLE_CHARS:
+            return ""  # The key already covers the whole content
+        hasher = hashlib.blake2b(content.encode(), digest_size=16)
+        if metadata:
+            hasher.update(_metadata_bytes(metadata))
+        return hasher.hexdigest()
     
     def lookup(
         self,
@@ -634,6 +1045,10 @@ class ContextCache:
         # Check local cache first
         if self._config.enable_local_cache:
             entry = self._local_cache.get(cache_key, self._config.ttl_seconds)
+            if entry and entry.fingerprint and (
+                entry.fingerprint != self._fingerprint(context, metadata)
+            ):
+                entry = None  # Sampled key collided with different content
             if entry:
                 tokens_saved, cost_saved = self._strategy.estimate_savings(
                     entry.token_count, True
@@ -652,6 +1067,16 @@ class ContextCache:
                     cost_savings=cost_saved,
                 )
         
+        # Near-duplicate of a cached context?
+        if (
+            self._config.enable_local_cache
+            and self._semantic_index is not None
+            and self._semantic_eligible(context)
+        ):
+            semantic = self._semantic_lookup(context, metadata, cache_key)
+            if semantic is not None:
+                return semantic
+        
         # No local hit - check if provider caching is enabled
         if self._config.enable_provider_cache:
             # Provider caching is handled at message preparation time
@@ -673,6 +1098,57 @@ class ContextCache:
             cache_key=cache_key,
         )
     
+    def _semantic_eligible(self, context: str) -> bool:
+        """Whether ``context`` is small enough for the semantic tier."""
+        limit = self._config.semantic_max_chars
+        return limit <= 0 or len(context) <= limit
+    
+    def _semantic_signature(self, context: str) -> int:
+        return simhash(normalize_text(context, self._config.semantic_normalization))
+    
+    def _semantic_lookup(
+        self,
+        context: str,
+        metadata: Optional[Dict[str, Any]],
+        cache_key: str,
+    ) -> Optional[CacheResult]:
+        """Serve a near-duplicate of ``context`` from the local cache, if any."""
+        assert self._semantic_index is not None
+        scope = _metadata_bytes(metadata).hex() if metadata else ""
+        matches = self._semantic_index.query(self._semantic_signature(context), scope)
+        for key, similarity in matches:
+            entry = self._local_cache.get(key, self._config.ttl_seconds)
+            if entry is None:
+                self._semantic_index.remove(key)  # Evicted or expired
+                continue
+            
+            tokens_saved, cost_saved = self._strategy.estimate_savings(
+                entry.token_count, True
+            )
+            with self._lock:
+                self._stats.local_semantic_hits += 1
+                self._stats.total_tokens_saved += tokens_saved
+                self._stats.total_cost_saved += cost_saved
+            
+            return CacheResult(
+                cache_type=CacheType.LOCAL_SEMANTIC,
+                cached_content=entry.content,
+                cache_key=cache_key,
+                token_savings=tokens_saved,
+                cost_savings=cost_saved,
+                similarity=similarity,
+            )
+        return None
+    
+    def _prune_semantic_index(self) -> None:
+        """Drop signatures whose entries were evicted, once the index outgrows the cache."""
+        assert self._semantic_index is not None
+        if len(self._semantic_index) <= 2 * max(len(self._local_cache), 1):
+            return
+        for key in self._semantic_index.keys():
+            if key not in self._local_cache:
+                self._semantic_index.remove(key)
+    
     def store(
         self,
         context: str,
@@ -706,8 +1182,21 @@ class ContextCache:
                 created_at=now,
                 last_accessed=now,
                 token_count=token_count,
+                fingerprint=self._fingerprint(context, metadata),
             )
-            self._local_cache.put(entry)
+            admitted = self._local_cache.put(entry)
+            self._ensure_sweeper()
+            
+            if (
+                admitted
+                and self._semantic_index is not None
+                and self._semantic_eligible(context)
+            ):
+                scope = _metadata_bytes(metadata).hex() if metadata else ""
+                self._semantic_index.add(
+                    cache_key, self._semantic_signature(context), scope
+                )
+                self._prune_semantic_index()
             
             with self._lock:
                 self._stats.current_entries = len(self._local_cache)
@@ -750,6 +1239,8 @@ class ContextCache:
             True if entry was removed, False if not found
         """
         removed = self._local_cache.remove(cache_key)
+        if self._semantic_index is not None:
+            self._semantic_index.remove(cache_key)
         if removed:
             with self._lock:
                 self._stats.current_entries = len(self._local_cache)
@@ -758,6 +1249,8 @@ class ContextCache:
     def clear(self) -> None:
         """Clear all cache entries."""
         self._local_cache.clear()
+        if self._semantic_index is not None:
+            self._semantic_index.clear()
         with self._lock:
             self._stats.current_entries = 0
     
@@ -770,25 +1263,70 @@ class ContextCache:
         """
         removed = self._local_cache.cleanup_expired(self._config.ttl_seconds)
         with self._lock:
+            self._expired_manually += removed
             self._stats.current_entries = len(self._local_cache)
         return removed
     
+    def close(self) -> None:
+        """Stop the background expiry sweep. The cache remains usable."""
+        with self._lock:
+            sweeper, self._sweeper = self._sweeper, None
+        if sweeper is not None:
+            sweeper.stop()
+    
+    def _ensure_sweeper(self) -> None:
+        """Start the background expiry sweep on first store."""
+        interval = self._config.cleanup_interval_seconds
+        if interval <= 0 or self._sweeper is not None:
+            return
+        with self._lock:
+            if self._sweeper is None:
+                self._sweeper = _ExpirySweeper(
+                    self._local_cache, self._config.ttl_seconds, interval
+                )
+                self._sweeper.start()
+    
+    def _refresh_size_stats(self) -> None:
+        """Copy live size counters into the stats object. Caller holds the lock."""
+        self._stats.current_entries = len(self._local_cache)
+        self._stats.current_bytes = self._local_cache.size_bytes
+        self._stats.evictions = self._local_cache.evictions
+        self._stats.expired = self._expired_manually + (
+            self._sweeper.removed if self._sweeper is not None else 0
+        )
+        self._stats.semantic_entries = (
+            len(self._semantic_index) if self._semantic_index is not None else 0
+        )
+    
     def get_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics.
         
         Returns:
-            Dictionary with cache statistics
+            Dictionary with cache statistics, including current memory
+            use (``current_bytes``) against the byte budget (``max_bytes``)
         """
         with self._lock:
-            self._stats.current_entries = len(self._local_cache)
+            self._refresh_size_stats()
             return self._stats.to_dict()
     
     def reset_stats(self) -> None:
         """Reset cache statistics."""
         with self._lock:
-            current_entries = len(self._local_cache)
-            self._stats = CacheStats(current_entries=current_entries)
+            self._stats = CacheStats(max_bytes=self._config.max_bytes)
+            self._refresh_size_stats()
+
+
+def _metadata_bytes(metadata: Dict[str, Any]) -> bytes:
+    """Stable serialization of key metadata without a full json.dumps for flat dicts."""
+    parts = []
+    for name in sorted(metadata):
+        value = metadata[name]
+        if isinstance(value, (str, int, float, bool)) or value is None:
+            parts.append(f"{name}={value!r}")
+        else:
+            parts.append(f"{name}={json.dumps(value, sort_keys=True, default=str)}")
+    return "\x1f".join(parts).encode()
 
 
 # Convenience function for creating caches
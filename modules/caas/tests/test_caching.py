@@ -16,7 +16,10 @@ from caas.caching import (
     OpenAICacheStrategy,
     LocalCacheStrategy,
     LRUCache,
+    SemanticIndex,
     create_cache,
+    normalize_text,
+    simhash,
 )
 
 
@@ -252,6 +255,72 @@ class TestLRUCache:
         assert cache.get("new", 3600) is not None
 
 
+class TestSizeAwareLRUCache:
+    """Tests for byte budgeting and segmented admission in LRUCache."""
+    
+    @staticmethod
+    def _entry(key, content, size_bytes=0, created_at=None):
+        now = created_at or datetime.now(timezone.utc)
+        return CacheEntry(
+            key=key,
+            content=content,
+            metadata={},
+            created_at=now,
+            last_accessed=now,
+            size_bytes=size_bytes,
+        )
+    
+    def test_size_defaults_to_content_size(self):
+        """Test entries are weighted by their content size."""
+        cache = LRUCache(max_size=10)
+        entry = self._entry("k", "x" * 1000)
+        cache.put(entry)
+        
+        assert entry.size_bytes >= 1000
+        assert cache.size_bytes == entry.size_bytes
+    
+    def test_byte_budget_evicts(self):
+        """Test large entries evict others to stay within max_bytes."""
+        cache = LRUCache(max_size=100, max_bytes=1000)
+        for i in range(4):
+            cache.put(self._entry(f"key{i}", "v", size_bytes=300))
+        
+        assert len(cache) == 3
+        assert cache.size_bytes == 900
+        assert cache.get("key0", 3600) is None
+        assert cache.evictions == 1
+    
+    def test_oversized_entry_rejected(self):
+        """Test an entry bigger than the whole budget is not admitted."""
+        cache = LRUCache(max_size=100, max_bytes=1000)
+        cache.put(self._entry("small", "v", size_bytes=100))
+        
+        assert cache.put(self._entry("huge", "v", size_bytes=5000)) is False
+        assert cache.get("huge", 3600) is None
+        assert cache.get("small", 3600) is not None
+    
+    def test_scan_does_not_evict_hot_entries(self):
+        """Test one-off entries only displace other probationary entries."""
+        cache = LRUCache(max_size=100, max_bytes=1000)
+        cache.put(self._entry("hot", "v", size_bytes=200))
+        cache.get("hot", 3600)  # promote to protected
+        
+        for i in range(20):
+            cache.put(self._entry(f"scan{i}", "v", size_bytes=200))
+        
+        assert cache.get("hot", 3600) is not None
+        assert cache.size_bytes <= 1000
+    
+    def test_replace_updates_size(self):
+        """Test re-putting a key replaces its size accounting."""
+        cache = LRUCache(max_size=10, max_bytes=1000)
+        cache.put(self._entry("k", "v", size_bytes=400))
+        cache.put(self._entry("k", "v", size_bytes=100))
+        
+        assert len(cache) == 1
+        assert cache.size_bytes == 100
+
+
 class TestAnthropicCacheStrategy:
     """Tests for AnthropicCacheStrategy."""
     
@@ -557,6 +626,209 @@ class TestContextCache:
         assert stats["total_requests"] == 0
 
 
+class TestContextCacheMemory:
+    """Tests for sampled keys, memory stats and background expiry."""
+    
+    def test_sampled_key_collision_is_confirmed(self):
+        """Test contexts sharing prefix, tail and length don't alias."""
+        cache = ContextCache(
+            config=CacheConfig(min_tokens_for_caching=10, enable_provider_cache=False)
+        )
+        sample = ContextCache.KEY_SAMPLE_CHARS
+        head, tail = "a" * sample, "z" * sample
+        context_a = head + "A" * 100 + tail
+        context_b = head + "B" * 100 + tail
+        
+        assert cache.compute_key(context_a) == cache.compute_key(context_b)
+        
+        cache.store(context_a, response="response a")
+        
+        assert cache.lookup(context_a).cached_content == "response a"
+        assert cache.lookup(context_b).cache_type == CacheType.MISS
+    
+    def test_metadata_order_independent(self):
+        """Test key metadata is canonicalized."""
+        cache = ContextCache()
+        
+        key1 = cache.compute_key("content", metadata={"a": 1, "b": [1, 2]})
+        key2 = cache.compute_key("content", metadata={"b": [1, 2], "a": 1})
+        
+        assert key1 == key2
+    
+    def test_stats_report_memory(self):
+        """Test get_stats reports bytes held against the budget."""
+        cache = ContextCache(
+            config=CacheConfig(
+                min_tokens_for_caching=10,
+                enable_provider_cache=False,
+                max_bytes=10_000,
+            )
+        )
+        for i in range(10):
+            cache.store(f"context {i} " + "x" * 4000)
+        
+        stats = cache.get_stats()
+        
+        assert stats["max_bytes"] == 10_000
+        assert 0 < stats["current_bytes"] <= 10_000
+        assert stats["evictions"] > 0
+        assert stats["current_entries"] < 10
+    
+    def test_background_sweep_removes_expired(self):
+        """Test expired entries are dropped without calling cleanup()."""
+        cache = ContextCache(
+            config=CacheConfig(
+                min_tokens_for_caching=10,
+                ttl_seconds=0,
+                cleanup_interval_seconds=0.01,
+            )
+        )
+        try:
+            cache.store("x" * 100)
+            deadline = time.monotonic() + 2
+            while cache.get_stats()["current_entries"] and time.monotonic() < deadline:
+                time.sleep(0.01)
+            
+            stats = cache.get_stats()
+            assert stats["current_entries"] == 0
+            assert stats["expired"] == 1
+        finally:
+            cache.close()
+
+
+class TestSemanticCache:
+    """Tests for the near-duplicate (semantic) cache tier."""
+    
+    BASE = (
+        "Request {rid} received at {ts}. You are reviewing the quarterly "
+        "infrastructure report for the platform team. Summarize the incidents, "
+        "list the follow-up actions with owners, and flag any risk that was "
+        "escalated more than twice during the quarter. "
+    ) * 8
+    
+    def _cache(self, **overrides):
+        config = dict(
+            min_tokens_for_caching=10,
+            enable_provider_cache=False,
+            enable_semantic_cache=True,
+        )
+        config.update(overrides)
+        return ContextCache(config=CacheConfig(**config))
+    
+    def test_normalize_text(self):
+        """Test built-in normalization rules."""
+        text = "Run  3f2b1c9a-1d2e-4f5a-8b6c-7d8e9f0a1b2c at 2024-05-01T10:00:00Z\n"
+        rules = ("timestamps", "uuids", "whitespace")
+        
+        assert normalize_text(text, rules) == "Run <id> at <ts>"
+    
+    def test_simhash_near_duplicates_close(self):
+        """Test near-duplicates have close signatures and unrelated text doesn't."""
+        a = simhash(" ".join(f"word{i}" for i in range(200)))
+        b = simhash(" ".join(f"word{i}" for i in range(200) if i != 100))
+        c = simhash(" ".join(f"other{i}" for i in range(200)))
+        
+        assert bin(a ^ b).count("1") <= 8
+        assert bin(a ^ c).count("1") > 8
+    
+    def test_index_query_respects_threshold_and_scope(self):
+        """Test LSH query returns only in-threshold, same-scope keys."""
+        index = SemanticIndex(threshold=0.95)
+        index.add("a", 0b1111)
+        index.add("b", 0b1111, scope="other")
+        
+        assert [key for key, _ in index.query(0b1110)] == ["a"]
+        assert index.query(0b1111 ^ (0xFFFF << 16)) == []
+        
+        index.remove("a")
+        assert index.query(0b1111) == []
+    
+    def test_semantic_hit(self):
+        """Test a context differing only in IDs and timestamps hits semantically."""
+        cache = self._cache(semantic_normalization=(
+            "timestamps", "uuids", "hex_ids", "numbers", "lowercase", "whitespace",
+        ))
+        cache.store(self.BASE.format(rid=1001, ts="2024-01-01T09:00:00Z"), response="summary")
+        
+        result = cache.lookup(self.BASE.format(rid=2002, ts="2024-06-30 17:45"))
+        
+        assert result.cache_type == CacheType.LOCAL_SEMANTIC
+        assert result.cached_content == "summary"
+        assert result.similarity >= 0.95
+        stats = cache.get_stats()
+        assert stats["local_semantic_hits"] == 1
+        assert stats["local_exact_hits"] == 0
+        assert stats["semantic_entries"] == 1
+    
+    def test_numbers_distinguish_contexts_by_default(self):
+        """Test contexts differing in numbers only match when "numbers" is opted in."""
+        cache = self._cache()
+        cache.store(self.BASE.format(rid=1001, ts="10:00"), response="summary")
+        
+        result = cache.lookup(self.BASE.format(rid=2002, ts="10:00"))
+        
+        assert result.cache_type == CacheType.MISS
+    
+    def test_semantic_skips_contexts_over_limit(self):
+        """Test contexts longer than semantic_max_chars only use the exact tier."""
+        context = self.BASE.format(rid=1, ts="10:00")
+        near_duplicate = self.BASE.format(rid=1, ts="11:00")
+        unlimited = self._cache(semantic_max_chars=0)
+        unlimited.store(context, response="summary")
+        assert unlimited.lookup(near_duplicate).cache_type == CacheType.LOCAL_SEMANTIC
+        
+        cache = self._cache(semantic_max_chars=len(context) - 1)
+        cache.store(context, response="summary")
+        
+        result = cache.lookup(near_duplicate)
+        
+        assert result.cache_type == CacheType.MISS
+        assert cache.get_stats()["semantic_entries"] == 0
+    
+    def test_semantic_disabled_by_default(self):
+        """Test near-duplicates miss unless the semantic tier is enabled."""
+        cache = self._cache(enable_semantic_cache=False)
+        cache.store(self.BASE.format(rid=1, ts="10:00"), response="summary")
+        
+        result = cache.lookup(self.BASE.format(rid=2, ts="11:00"))
+        
+        assert result.cache_type == CacheType.MISS
+    
+    def test_semantic_miss_for_different_content(self):
+        """Test unrelated contexts don't match."""
+        cache = self._cache()
+        cache.store(self.BASE.format(rid=1, ts="10:00"), response="summary")
+        
+        result = cache.lookup("Translate the following release notes into French. " * 30)
+        
+        assert result.cache_type == CacheType.MISS
+    
+    def test_semantic_scoped_by_metadata(self):
+        """Test contexts cached under different metadata never match."""
+        cache = self._cache()
+        cache.store(self.BASE.format(rid=1, ts="10:00"), metadata={"model": "a"})
+        
+        result = cache.lookup(self.BASE.format(rid=2, ts="11:00"), metadata={"model": "b"})
+        
+        assert result.cache_type == CacheType.MISS
+    
+    def test_invalidate_removes_signature(self):
+        """Test invalidated entries are no longer served semantically."""
+        cache = self._cache()
+        key = cache.store(self.BASE.format(rid=1, ts="10:00"))
+        cache.invalidate(key)
+        
+        result = cache.lookup(self.BASE.format(rid=2, ts="11:00"))
+        
+        assert result.cache_type == CacheType.MISS
+        assert cache.get_stats()["semantic_entries"] == 0
+    
+    def test_unknown_normalization_rule(self):
+        """Test unknown normalization rules are rejected up front."""
+        with pytest.raises(ValueError):
+            self._cache(semantic_normalization=("no-such-rule",))
+
+
 class TestCacheStats:
     """Tests for CacheStats."""
     
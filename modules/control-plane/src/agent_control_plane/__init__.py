@@ -27,6 +27,8 @@ from .policy_engine import (
     create_default_policies,
 )
 
+from .sliding_window import SlidingWindowCounter
+
 from .execution_engine import (
     ExecutionEngine,
     ExecutionContext,
@@ -102,8 +104,11 @@ from .orchestrator import (
     AgentOrchestrator,
     AgentNode,
     AgentRole,
+    DAGScheduler,
+    ExecutionReport,
     Message,
     MessageType,
+    NodeTiming,
     OrchestrationType,
     WorkflowState,
     create_rag_pipeline,
@@ -166,6 +171,11 @@ from .lifecycle import (
     AgentScaler,
     ScalingConfig,
     AgentReplica,
+    ScalingSignals,
+    ScalingPolicy,
+    CpuThresholdPolicy,
+    TargetTrackingPolicy,
+    PredictiveScalingPolicy,
     DistributedCoordinator,
     LeaderElectionConfig,
     LeaderInfo,
@@ -280,6 +290,11 @@ __all__ = [
     "AgentScaler",
     "ScalingConfig",
     "AgentReplica",
+    "ScalingSignals",
+    "ScalingPolicy",
+    "CpuThresholdPolicy",
+    "TargetTrackingPolicy",
+    "PredictiveScalingPolicy",
     "DistributedCoordinator",
     "LeaderElectionConfig",
     "LeaderInfo",
@@ -348,8 +363,11 @@ __all__ = [
     "AgentOrchestrator",
     "AgentNode",
     "AgentRole",
+    "DAGScheduler",
+    "ExecutionReport",
     "Message",
     "MessageType",
+    "NodeTiming",
     "OrchestrationType",
     "WorkflowState",
     "create_rag_pipeline",
@@ -406,6 +424,7 @@ __all__ = [
     "Condition",
     "ConditionalPermission",
     "create_default_policies",
+    "SlidingWindowCounter",
     
     # Execution
     "ExecutionEngine",
@@ -27,8 +27,9 @@ Research Foundations:
 
 from typing import (
     Dict, List, Optional, Any, Union, Callable, Type, Set, Awaitable,
-    TypeVar, Generic, Protocol, runtime_checkable
+    TypeVar, Generic, Protocol, AsyncIterator, runtime_checkable
 )
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from datetime import datetime, timedelta
@@ -43,8 +44,12 @@ import weakref
 import traceback
 import hashlib
 import importlib
+import math
+import random
 import sys
 
+from .sliding_window import SlidingWindowCounter
+
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -135,6 +140,12 @@ class HealthCheckConfig:
     
     # Custom health check function
     custom_health_check: Optional[Callable[[], Awaitable[bool]]] = None
+    
+    # Sweep settings (large fleets)
+    max_concurrent_probes: int = 64  # Probes in flight at once, across both loops
+    stagger_probes: bool = True  # Spread probe start times across the interval
+    stagger_window_ratio: float = 0.5  # Fraction of the interval used for spreading
+    history_size: int = 100  # Results kept per agent in the check history
 
 
 @runtime_checkable
@@ -172,18 +183,29 @@ class HealthMonitor:
         status = monitor.get_agent_health(agent_id)
     """
     
-    def __init__(self, config: Optional[HealthCheckConfig] = None):
+    def __init__(
+        self,
+        config: Optional[HealthCheckConfig] = None,
+        observability: Optional["AgentObservabilityProvider"] = None
+    ):
         self.config = config or HealthCheckConfig()
+        self.observability = observability
         self._agents: Dict[str, Any] = {}
         self._health_status: Dict[str, HealthStatus] = {}
         self._liveness_failures: Dict[str, int] = defaultdict(int)
         self._readiness_failures: Dict[str, int] = defaultdict(int)
         self._last_check: Dict[str, datetime] = {}
-        self._check_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
+        history_size = self.config.history_size
+        self._check_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=history_size))
+        self._sweep_durations: Dict[str, deque] = {
+            "liveness": deque(maxlen=history_size),
+            "readiness": deque(maxlen=history_size),
+        }
         self._running = False
         self._tasks: List[asyncio.Task] = []
         self._callbacks: Dict[str, List[Callable]] = defaultdict(list)
         self._lock = asyncio.Lock()
+        self._probe_semaphore: Optional[asyncio.Semaphore] = None
     
     def register_agent(
         self,
@@ -209,6 +231,8 @@ class HealthMonitor:
             self._health_status.pop(agent_id, None)
             self._liveness_failures.pop(agent_id, None)
             self._readiness_failures.pop(agent_id, None)
+            self._last_check.pop(agent_id, None)
+            self._check_history.pop(agent_id, None)
             logger.info(f"Unregistered agent {agent_id} from health monitoring")
     
     async def start(self) -> None:
@@ -217,6 +241,7 @@ class HealthMonitor:
             return
         
         self._running = True
+        self._probe_semaphore = asyncio.Semaphore(max(1, self.config.max_concurrent_probes))
         self._tasks.append(asyncio.create_task(self._liveness_loop()))
         self._tasks.append(asyncio.create_task(self._readiness_loop()))
         logger.info("Health monitor started")
@@ -236,52 +261,123 @@ class HealthMonitor:
     async def _liveness_loop(self) -> None:
         """Main loop for liveness checks"""
         while self._running:
-            for agent_id in list(self._agents.keys()):
-                try:
-                    result = await self._check_liveness(agent_id)
-                    self._check_history[agent_id].append(result)
-                    
-                    if not result.healthy:
-                        self._liveness_failures[agent_id] += 1
-                        if self._liveness_failures[agent_id] >= self.config.liveness_failure_threshold:
-                            self._health_status[agent_id] = HealthStatus.FAILED
-                            await self._trigger_callbacks("liveness_failed", agent_id)
-                    else:
-                        self._liveness_failures[agent_id] = 0
-                        if self._health_status[agent_id] == HealthStatus.FAILED:
-                            self._health_status[agent_id] = HealthStatus.HEALTHY
-                            await self._trigger_callbacks("liveness_restored", agent_id)
-                            
-                except Exception as e:
-                    logger.error(f"Liveness check failed for {agent_id}: {e}")
-                    self._liveness_failures[agent_id] += 1
-            
-            await asyncio.sleep(self.config.liveness_interval_seconds)
+            started = time.monotonic()
+            await self._run_sweep(
+                "liveness",
+                self._check_liveness,
+                self._handle_liveness_result,
+                self.config.liveness_interval_seconds
+            )
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(0.0, self.config.liveness_interval_seconds - elapsed))
     
     async def _readiness_loop(self) -> None:
         """Main loop for readiness checks"""
         while self._running:
-            for agent_id in list(self._agents.keys()):
-                try:
-                    result = await self._check_readiness(agent_id)
-                    
-                    if not result.healthy:
-                        self._readiness_failures[agent_id] += 1
-                        if self._readiness_failures[agent_id] >= self.config.readiness_failure_threshold:
-                            if self._health_status[agent_id] == HealthStatus.HEALTHY:
-                                self._health_status[agent_id] = HealthStatus.DEGRADED
-                                await self._trigger_callbacks("readiness_failed", agent_id)
-                    else:
-                        self._readiness_failures[agent_id] = 0
-                        if self._health_status[agent_id] == HealthStatus.DEGRADED:
-                            self._health_status[agent_id] = HealthStatus.HEALTHY
-                            await self._trigger_callbacks("readiness_restored", agent_id)
-                            
-                except Exception as e:
-                    logger.error(f"Readiness check failed for {agent_id}: {e}")
-                    self._readiness_failures[agent_id] += 1
-            
-            await asyncio.sleep(self.config.readiness_interval_seconds)
+            started = time.monotonic()
+            await self._run_sweep(
+                "readiness",
+                self._check_readiness,
+                self._handle_readiness_result,
+                self.config.readiness_interval_seconds
+            )
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(0.0, self.config.readiness_interval_seconds - elapsed))
+    
+    async def _run_sweep(
+        self,
+        probe: str,
+        check: Callable[[str], Awaitable[HealthCheckResult]],
+        handle: Callable[[str, HealthCheckResult], Awaitable[None]],
+        interval_seconds: float
+    ) -> float:
+        """
+        Probe every registered agent once and return the sweep duration in ms.
+        
+        Probes run concurrently, bounded by ``max_concurrent_probes``. With
+        ``stagger_probes`` each agent starts at a random offset within the
+        first ``stagger_window_ratio`` of the interval, so a large fleet is
+        not probed in a single burst at the top of every interval.
+        
+        The sweep duration excludes those offsets: it is the longest time any
+        agent took from its stagger offset until its probe was handled,
+        including the wait for a probe slot.
+        """
+        if self._probe_semaphore is None:
+            self._probe_semaphore = asyncio.Semaphore(max(1, self.config.max_concurrent_probes))
+        semaphore = self._probe_semaphore
+        agent_ids = list(self._agents.keys())
+        window = 0.0
+        if self.config.stagger_probes and len(agent_ids) > 1:
+            window = interval_seconds * self.config.stagger_window_ratio
+        failures = self._liveness_failures if probe == "liveness" else self._readiness_failures
+        
+        probe_ms: List[float] = []
+        
+        async def probe_agent(agent_id: str) -> None:
+            if window > 0:
+                await asyncio.sleep(random.uniform(0.0, window))
+            probe_started = time.monotonic()
+            try:
+                async with semaphore:
+                    result = await check(agent_id)
+                if agent_id in self._agents:
+                    await handle(agent_id, result)
+            except Exception as e:
+                logger.error(f"{probe.capitalize()} check failed for {agent_id}: {e}")
+                if agent_id in self._agents:
+                    failures[agent_id] += 1
+            finally:
+                probe_ms.append((time.monotonic() - probe_started) * 1000)
+        
+        started = time.monotonic()
+        await asyncio.gather(*(probe_agent(agent_id) for agent_id in agent_ids))
+        wall_ms = (time.monotonic() - started) * 1000
+        duration_ms = max(probe_ms, default=0.0)
+        
+        self._sweep_durations[probe].append(duration_ms)
+        if self.observability is not None:
+            self.observability.observe_histogram(
+                "health-monitor",
+                "health_sweep_duration_ms",
+                duration_ms,
+                labels={"probe": probe}
+            )
+        if wall_ms > interval_seconds * 1000:
+            logger.warning(
+                f"{probe.capitalize()} sweep of {len(agent_ids)} agents took "
+                f"{wall_ms:.0f}ms, longer than the {interval_seconds}s interval"
+            )
+        return duration_ms
+    
+    async def _handle_liveness_result(self, agent_id: str, result: HealthCheckResult) -> None:
+        """Apply a liveness probe result to an agent's health state"""
+        self._check_history[agent_id].append(result)
+        
+        if not result.healthy:
+            self._liveness_failures[agent_id] += 1
+            if self._liveness_failures[agent_id] >= self.config.liveness_failure_threshold:
+                self._health_status[agent_id] = HealthStatus.FAILED
+                await self._trigger_callbacks("liveness_failed", agent_id)
+        else:
+            self._liveness_failures[agent_id] = 0
+            if self._health_status[agent_id] == HealthStatus.FAILED:
+                self._health_status[agent_id] = HealthStatus.HEALTHY
+                await self._trigger_callbacks("liveness_restored", agent_id)
+    
+    async def _handle_readiness_result(self, agent_id: str, result: HealthCheckResult) -> None:
+        """Apply a readiness probe result to an agent's health state"""
+        if not result.healthy:
+            self._readiness_failures[agent_id] += 1
+            if self._readiness_failures[agent_id] >= self.config.readiness_failure_threshold:
+                if self._health_status[agent_id] == HealthStatus.HEALTHY:
+                    self._health_status[agent_id] = HealthStatus.DEGRADED
+                    await self._trigger_callbacks("readiness_failed", agent_id)
+        else:
+            self._readiness_failures[agent_id] = 0
+            if self._health_status[agent_id] == HealthStatus.DEGRADED:
+                self._health_status[agent_id] = HealthStatus.HEALTHY
+                await self._trigger_callbacks("readiness_restored", agent_id)
     
     async def _check_liveness(self, agent_id: str) -> HealthCheckResult:
         """Perform liveness check for an agent"""
@@ -431,6 +527,18 @@ class HealthMonitor:
     def get_health_history(self, agent_id: str) -> List[HealthCheckResult]:
         """Get health check history for an agent"""
         return list(self._check_history.get(agent_id, []))
+    
+    def get_sweep_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get duration statistics (ms) for recent liveness and readiness sweeps"""
+        stats = {}
+        for probe, durations in self._sweep_durations.items():
+            stats[probe] = {
+                "sweeps": len(durations),
+                "last_ms": durations[-1] if durations else 0.0,
+                "avg_ms": sum(durations) / len(durations) if durations else 0.0,
+                "max_ms": max(durations) if durations else 0.0,
+            }
+        return stats
 
 
 # ============================================================================
@@ -977,6 +1085,25 @@ class ScalingConfig:
     scale_down_cooldown_seconds: float = 300.0
     scale_up_increment: int = 1
     scale_down_increment: int = 1
+    
+    # How often the autoscaler evaluates this agent type
+    evaluation_interval_seconds: float = 10.0
+    
+    # Target tracking (None disables the signal)
+    target_queue_depth_per_replica: Optional[float] = None
+    target_in_flight_per_replica: Optional[float] = None
+    target_p95_latency_ms: Optional[float] = None
+    latency_metric: str = "replica_request_latency_ms"
+    target_tolerance: float = 0.1  # Ignore deviations within +/-10% of target
+    
+    # Predictive scale-up from an EWMA level/trend of in-flight + queued work
+    predictive_scale_up: bool = False
+    ewma_alpha: float = 0.5  # Smoothing of the load level
+    ewma_beta: float = 0.3  # Smoothing of the load trend
+    prediction_horizon_seconds: float = 30.0
+    
+    # Replica selection: "least_outstanding", "power_of_two" or "round_robin"
+    load_balancing: str = "least_outstanding"
 
 
 @dataclass
@@ -988,6 +1115,149 @@ class AgentReplica:
     created_at: datetime = field(default_factory=datetime.now)
     status: AgentState = AgentState.PENDING
     metrics: Dict[str, float] = field(default_factory=dict)
+    in_flight: int = 0
+
+
+@dataclass
+class ScalingSignals:
+    """Load signals for one agent type, as seen by scaling policies"""
+    agent_type: str
+    replicas: int
+    avg_cpu: float = 0.0
+    cpu_reported: bool = False
+    queue_depth: float = 0.0  # Total across replicas
+    in_flight: int = 0  # Total across replicas
+    p95_latency_ms: Optional[float] = None
+    timestamp: float = field(default_factory=time.monotonic)
+
+
+class ScalingPolicy(ABC):
+    """
+    A rule that proposes a replica count from load signals.
+    
+    The scaler asks every policy of an agent type and takes the largest
+    proposal, so any policy can trigger a scale-up while scale-down only
+    happens when all policies agree. Returning None abstains.
+    """
+    
+    @abstractmethod
+    def desired_replicas(self, signals: ScalingSignals, config: ScalingConfig) -> Optional[int]:
+        """Propose a replica count, or None to abstain"""
+        pass
+
+
+class CpuThresholdPolicy(ScalingPolicy):
+    """Step scaling on average CPU (``scale_up_threshold``/``scale_down_threshold``)"""
+    
+    def desired_replicas(self, signals: ScalingSignals, config: ScalingConfig) -> Optional[int]:
+        if signals.avg_cpu > config.scale_up_threshold:
+            return signals.replicas + config.scale_up_increment
+        if signals.avg_cpu < config.scale_down_threshold:
+            return signals.replicas - config.scale_down_increment
+        return signals.replicas
+
+
+class TargetTrackingPolicy(ScalingPolicy):
+    """
+    Keeps a signal at its target value by resizing proportionally.
+    
+    Uses the Kubernetes HPA rule ``desired = ceil(current * value / target)``,
+    where ``value`` is per replica for load signals (queue depth, in-flight
+    operations) and the observed value for latency.
+    """
+    
+    SIGNALS = ("queue_depth", "in_flight", "p95_latency_ms", "cpu")
+    
+    def __init__(self, signal: str, target: float):
+        if signal not in self.SIGNALS:
+            raise ValueError(f"Unknown scaling signal: {signal}")
+        if target <= 0:
+            raise ValueError("target must be positive")
+        self.signal = signal
+        self.target = target
+    
+    def _value(self, signals: ScalingSignals) -> Optional[float]:
+        replicas = max(signals.replicas, 1)
+        if self.signal == "queue_depth":
+            return signals.queue_depth / replicas
+        if self.signal == "in_flight":
+            return signals.in_flight / replicas
+        if self.signal == "cpu":
+            return signals.avg_cpu if signals.cpu_reported else None
+        return signals.p95_latency_ms
+    
+    def desired_replicas(self, signals: ScalingSignals, config: ScalingConfig) -> Optional[int]:
+        value = self._value(signals)
+        if value is None:
+            return None
+        ratio = value / self.target
+        if abs(ratio - 1.0) <= config.target_tolerance:
+            return signals.replicas
+        return math.ceil(max(signals.replicas, 1) * ratio)
+
+
+class PredictiveScalingPolicy(ScalingPolicy):
+    """
+    Scales up ahead of demand using Holt's linear (EWMA level + trend) forecast.
+    
+    Tracks the total outstanding work (in-flight plus queued) and forecasts
+    it ``prediction_horizon_seconds`` ahead; when the forecast needs more
+    replicas than are running, it proposes them now. Never proposes a
+    scale-down - reactive policies handle that.
+    """
+    
+    def __init__(self, target_per_replica: float):
+        if target_per_replica <= 0:
+            raise ValueError("target_per_replica must be positive")
+        self.target_per_replica = target_per_replica
+        self._level: Optional[float] = None
+        self._trend = 0.0
+        self._last_time: Optional[float] = None
+    
+    def forecast(self, horizon_seconds: float) -> Optional[float]:
+        """Forecast load ``horizon_seconds`` ahead (None before the first sample)"""
+        if self._level is None:
+            return None
+        return max(0.0, self._level + self._trend * horizon_seconds)
+    
+    def desired_replicas(self, signals: ScalingSignals, config: ScalingConfig) -> Optional[int]:
+        load = float(signals.in_flight) + signals.queue_depth
+        if self._level is None or self._last_time is None:
+            self._level, self._last_time = load, signals.timestamp
+            return None
+        
+        elapsed = max(signals.timestamp - self._last_time, 1e-6)
+        previous = self._level
+        self._level = config.ewma_alpha * load + (1 - config.ewma_alpha) * (
+            previous + self._trend * elapsed
+        )
+        slope = (self._level - previous) / elapsed
+        self._trend = config.ewma_beta * slope + (1 - config.ewma_beta) * self._trend
+        self._last_time = signals.timestamp
+        
+        forecast = self.forecast(config.prediction_horizon_seconds)
+        assert forecast is not None
+        needed = math.ceil(forecast / self.target_per_replica)
+        return needed if needed > signals.replicas else None
+
+
+def default_scaling_policies(config: ScalingConfig) -> List[ScalingPolicy]:
+    """Build the scaling policies implied by a ScalingConfig"""
+    policies: List[ScalingPolicy] = [CpuThresholdPolicy()]
+    if config.target_queue_depth_per_replica:
+        policies.append(TargetTrackingPolicy("queue_depth", config.target_queue_depth_per_replica))
+    if config.target_in_flight_per_replica:
+        policies.append(TargetTrackingPolicy("in_flight", config.target_in_flight_per_replica))
+    if config.target_p95_latency_ms:
+        policies.append(TargetTrackingPolicy("p95_latency_ms", config.target_p95_latency_ms))
+    if config.predictive_scale_up:
+        per_replica = (
+            config.target_in_flight_per_replica
+            or config.target_queue_depth_per_replica
+            or 1.0
+        )
+        policies.append(PredictiveScalingPolicy(per_replica))
+    return policies
 
 
 class AgentScaler:
@@ -998,51 +1268,66 @@ class AgentScaler:
     scale-up and scale-down with configurable thresholds and cooldowns.
     
     Features:
-    - Automatic scale-up/scale-down based on utilization
+    - Pluggable scaling policies: CPU step scaling, target tracking on
+      queue depth / in-flight operations / p95 latency, and predictive
+      scale-up from an EWMA trend
     - Configurable min/max replicas
-    - Load balancing across replicas
+    - Least-outstanding-requests, power-of-two-choices or round-robin
+      routing over an incrementally maintained set of ready replicas
     - Cooldown periods to prevent thrashing
     
     Usage:
-        scaler = AgentScaler()
+        scaler = AgentScaler(observability=AgentObservabilityProvider())
         
         # Register agent type with factory
         scaler.register_agent_type(
             agent_type="claims_agent",
             factory=create_claims_agent,
-            config=ScalingConfig(min_replicas=2, max_replicas=10)
+            config=ScalingConfig(min_replicas=2, max_replicas=10,
+                                 target_in_flight_per_replica=4)
         )
         
-        # Get available replica
-        agent = await scaler.get_replica("claims_agent")
+        # Route a request; in-flight count and latency are tracked
+        async with scaler.acquire_replica("claims_agent") as agent:
+            await agent.handle(request)
         
         # Manual scaling
         await scaler.scale_to("claims_agent", replicas=5)
     """
     
-    def __init__(self):
+    LOAD_BALANCING_STRATEGIES = ("least_outstanding", "power_of_two", "round_robin")
+    
+    def __init__(self, observability: Optional["AgentObservabilityProvider"] = None):
+        self.observability = observability
         self._agent_types: Dict[str, Dict[str, Any]] = {}
         self._replicas: Dict[str, Dict[str, AgentReplica]] = defaultdict(dict)
+        self._ready: Dict[str, List[AgentReplica]] = defaultdict(list)
         self._last_scale_up: Dict[str, datetime] = {}
         self._last_scale_down: Dict[str, datetime] = {}
+        self._next_evaluation: Dict[str, float] = {}
         self._load_balancer_index: Dict[str, int] = defaultdict(int)
         self._lock = asyncio.Lock()
         self._running = False
         self._scaling_task: Optional[asyncio.Task] = None
+        self._random = random.Random()
     
     def register_agent_type(
         self,
         agent_type: str,
         factory: Callable[[], Any],
         config: Optional[ScalingConfig] = None,
-        replicas: int = 1
+        replicas: int = 1,
+        policies: Optional[List[ScalingPolicy]] = None
     ) -> None:
         """Register an agent type for scaling"""
         config = config or ScalingConfig()
+        if config.load_balancing not in self.LOAD_BALANCING_STRATEGIES:
+            raise ValueError(f"Unknown load balancing strategy: {config.load_balancing}")
         self._agent_types[agent_type] = {
             "factory": factory,
             "config": config,
-            "target_replicas": max(config.min_replicas, replicas)
+            "target_replicas": max(config.min_replicas, replicas),
+            "policies": policies if policies is not None else default_scaling_policies(config),
         }
         logger.info(f"Registered agent type {agent_type} for scaling")
     
@@ -1093,11 +1378,13 @@ class AgentScaler:
                 for _ in range(replicas - current_count):
                     await self._create_replica(agent_type)
             elif replicas < current_count:
-                # Scale down
+                # Scale down, preferring the least busy replicas
                 to_remove = current_count - replicas
-                replica_ids = list(self._replicas[agent_type].keys())[:to_remove]
-                for replica_id in replica_ids:
-                    await self._remove_replica(agent_type, replica_id)
+                candidates = sorted(
+                    self._replicas[agent_type].values(), key=lambda r: r.in_flight
+                )
+                for replica in candidates[:to_remove]:
+                    await self._remove_replica(agent_type, replica.replica_id)
             
             self._agent_types[agent_type]["target_replicas"] = replicas
             logger.info(f"Scaled {agent_type} to {replicas} replicas")
@@ -1136,12 +1423,15 @@ class AgentScaler:
         )
         
         self._replicas[agent_type][replica_id] = replica
+        self._ready[agent_type].append(replica)
         logger.info(f"Created replica {replica_id} for {agent_type}")
         return replica
     
     async def _remove_replica(self, agent_type: str, replica_id: str) -> None:
         """Remove a replica"""
         replica = self._replicas[agent_type].pop(replica_id, None)
+        if replica is not None:
+            self._discard_ready(agent_type, replica)
         if replica and replica.instance:
             # Stop the agent if it has a stop method
             if hasattr(replica.instance, 'stop'):
@@ -1151,61 +1441,166 @@ class AgentScaler:
                     replica.instance.stop()
         logger.info(f"Removed replica {replica_id} from {agent_type}")
     
-    async def get_replica(self, agent_type: str) -> Optional[Any]:
-        """Get an available replica using round-robin load balancing"""
-        replicas = self._replicas.get(agent_type, {})
-        if not replicas:
+    def _discard_ready(self, agent_type: str, replica: AgentReplica) -> None:
+        ready = self._ready.get(agent_type)
+        if ready and replica in ready:
+            ready.remove(replica)
+    
+    def set_replica_status(self, agent_type: str, replica_id: str, status: AgentState) -> None:
+        """Change a replica's status, adding or removing it from the routable set"""
+        replica = self._replicas.get(agent_type, {}).get(replica_id)
+        if replica is None:
+            return
+        replica.status = status
+        self._discard_ready(agent_type, replica)
+        if status == AgentState.RUNNING:
+            self._ready[agent_type].append(replica)
+    
+    def _select_replica(self, agent_type: str) -> Optional[AgentReplica]:
+        """Pick a ready replica according to the agent type's load balancing strategy"""
+        ready = self._ready.get(agent_type)
+        if not ready:
             return None
         
-        # Round-robin selection
-        replica_list = list(replicas.values())
-        running_replicas = [r for r in replica_list if r.status == AgentState.RUNNING]
+        info = self._agent_types.get(agent_type)
+        strategy = info["config"].load_balancing if info else "round_robin"
+        count = len(ready)
         
-        if not running_replicas:
-            return None
+        if strategy == "power_of_two" and count > 1:
+            first, second = self._random.sample(ready, 2)
+            return first if first.in_flight <= second.in_flight else second
         
-        index = self._load_balancer_index[agent_type] % len(running_replicas)
+        start = self._load_balancer_index[agent_type] % count
         self._load_balancer_index[agent_type] += 1
+        if strategy == "round_robin":
+            return ready[start]
+        
+        # Least outstanding requests; ties rotate so idle replicas share load
+        best = ready[start]
+        for offset in range(1, count):
+            candidate = ready[(start + offset) % count]
+            if candidate.in_flight < best.in_flight:
+                best = candidate
+                if best.in_flight == 0:
+                    break
+        return best
+    
+    async def get_replica(self, agent_type: str) -> Optional[Any]:
+        """
+        Get an available replica instance.
+        
+        Selection follows ``ScalingConfig.load_balancing``. Outstanding
+        requests are only known for work routed through ``acquire_replica``.
+        """
+        replica = self._select_replica(agent_type)
+        return replica.instance if replica is not None else None
+    
+    @asynccontextmanager
+    async def acquire_replica(self, agent_type: str) -> AsyncIterator[Optional[Any]]:
+        """
+        Route one request to a replica, tracking it as outstanding until exit.
+        
+        Yields the replica instance (None if no replica is ready). When an
+        observability provider is attached, the request latency is recorded
+        under ``ScalingConfig.latency_metric`` in its bounded recent window,
+        which is all p95 target tracking reads.
+        """
+        replica = self._select_replica(agent_type)
+        if replica is None:
+            yield None
+            return
+        
+        replica.in_flight += 1
+        started = time.monotonic()
+        try:
+            yield replica.instance
+        finally:
+            replica.in_flight -= 1
+            if self.observability is not None:
+                self.observability.record_observation(
+                    agent_type,
+                    self._agent_types[agent_type]["config"].latency_metric,
+                    (time.monotonic() - started) * 1000
+                )
+    
+    def collect_signals(self, agent_type: str) -> ScalingSignals:
+        """Gather the current load signals for an agent type"""
+        replicas = list(self._replicas.get(agent_type, {}).values())
+        config = self._agent_types[agent_type]["config"]
+        cpu_values = [r.metrics["cpu"] for r in replicas if "cpu" in r.metrics]
+        
+        p95 = None
+        if self.observability is not None and config.target_p95_latency_ms:
+            p95 = self.observability.get_percentile(agent_type, config.latency_metric, 0.95)
+        
+        return ScalingSignals(
+            agent_type=agent_type,
+            replicas=len(replicas),
+            avg_cpu=sum(cpu_values) / len(replicas) if replicas else 0.0,
+            cpu_reported=bool(cpu_values),
+            queue_depth=sum(r.metrics.get("queue_depth", 0.0) for r in replicas),
+            in_flight=sum(r.in_flight for r in replicas),
+            p95_latency_ms=p95
+        )
+    
+    async def evaluate_scaling(self, agent_type: str) -> int:
+        """
+        Run the scaling policies for an agent type once and apply the result.
+        
+        Returns:
+            The replica count after any scaling action
+        """
+        info = self._agent_types[agent_type]
+        config: ScalingConfig = info["config"]
+        current = len(self._replicas.get(agent_type, {}))
+        if current == 0:
+            return 0
+        
+        signals = self.collect_signals(agent_type)
+        proposals = [
+            proposal
+            for proposal in (p.desired_replicas(signals, config) for p in info["policies"])
+            if proposal is not None
+        ]
+        if not proposals:
+            return current
+        
+        desired = max(config.min_replicas, min(max(proposals), config.max_replicas))
+        now = datetime.now()
+        
+        if desired > current:
+            last_scale = self._last_scale_up.get(agent_type, datetime.min)
+            if (now - last_scale).total_seconds() > config.scale_up_cooldown_seconds:
+                await self.scale_to(agent_type, desired)
+                self._last_scale_up[agent_type] = now
+        elif desired < current:
+            last_scale = self._last_scale_down.get(agent_type, datetime.min)
+            if (now - last_scale).total_seconds() > config.scale_down_cooldown_seconds:
+                await self.scale_to(agent_type, desired)
+                self._last_scale_down[agent_type] = now
         
-        return running_replicas[index].instance
+        return len(self._replicas.get(agent_type, {}))
     
     async def _autoscaling_loop(self) -> None:
         """Background loop for automatic scaling"""
         while self._running:
+            now = time.monotonic()
             try:
-                for agent_type, info in self._agent_types.items():
-                    config = info["config"]
-                    replicas = self._replicas.get(agent_type, {})
-                    
-                    if not replicas:
+                for agent_type, info in list(self._agent_types.items()):
+                    if now < self._next_evaluation.get(agent_type, 0.0):
                         continue
-                    
-                    # Calculate average utilization
-                    total_cpu = sum(r.metrics.get("cpu", 0) for r in replicas.values())
-                    avg_cpu = total_cpu / len(replicas) if replicas else 0
-                    
-                    now = datetime.now()
-                    
-                    # Check scale up
-                    if avg_cpu > config.scale_up_threshold:
-                        last_scale = self._last_scale_up.get(agent_type, datetime.min)
-                        if (now - last_scale).total_seconds() > config.scale_up_cooldown_seconds:
-                            if len(replicas) < config.max_replicas:
-                                await self.scale_up(agent_type, config.scale_up_increment)
-                                self._last_scale_up[agent_type] = now
-                    
-                    # Check scale down
-                    elif avg_cpu < config.scale_down_threshold:
-                        last_scale = self._last_scale_down.get(agent_type, datetime.min)
-                        if (now - last_scale).total_seconds() > config.scale_down_cooldown_seconds:
-                            if len(replicas) > config.min_replicas:
-                                await self.scale_down(agent_type, config.scale_down_increment)
-                                self._last_scale_down[agent_type] = now
-                
+                    self._next_evaluation[agent_type] = (
+                        now + info["config"].evaluation_interval_seconds
+                    )
+                    await self.evaluate_scaling(agent_type)
             except Exception as e:
                 logger.error(f"Autoscaling loop error: {e}")
             
-            await asyncio.sleep(10)  # Check every 10 seconds
+            intervals = [
+                info["config"].evaluation_interval_seconds
+                for info in self._agent_types.values()
+            ]
+            await asyncio.sleep(min(intervals) if intervals else 10.0)
     
     def update_replica_metrics(
         self,
@@ -1948,7 +2343,7 @@ class ResourceQuotaManager:
     Features:
     - Memory and CPU limits
     - Concurrent operation limits
-    - Rate limiting (operations per minute)
+    - Rate limiting (operations per minute, O(1) sliding window per agent)
     - Usage tracking and reporting
     
     Usage:
@@ -1969,7 +2364,9 @@ class ResourceQuotaManager:
     def __init__(self):
         self._quotas: Dict[str, AgentResourceQuota] = {}
         self._usage: Dict[str, ResourceUsage] = {}
-        self._operation_counts: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+        self._operation_windows: Dict[str, SlidingWindowCounter] = defaultdict(
+            lambda: SlidingWindowCounter(window_seconds=60, buckets=60)
+        )
         self._lock = asyncio.Lock()
     
     def set_quota(self, agent_id: str, quota: AgentResourceQuota) -> None:
@@ -1999,7 +2396,7 @@ class ResourceQuotaManager:
             return False
         
         # Check rate limit
-        ops_this_minute = self._count_recent_operations(agent_id, seconds=60)
+        ops_this_minute = self._count_recent_operations(agent_id)
         if ops_this_minute >= quota.max_operations_per_minute:
             logger.warning(f"Agent {agent_id} at rate limit")
             return False
@@ -2021,8 +2418,11 @@ class ResourceQuotaManager:
         if agent_id not in self._usage:
             self._usage[agent_id] = ResourceUsage(agent_id=agent_id)
         
-        self._usage[agent_id].concurrent_operations += 1
-        self._operation_counts[agent_id].append(datetime.now())
+        usage = self._usage[agent_id]
+        usage.concurrent_operations += 1
+        window = self._operation_windows[agent_id]
+        window.add()
+        usage.operations_this_minute = window.count()
     
     def record_operation_end(self, agent_id: str) -> None:
         """Record the end of an operation"""
@@ -2048,14 +2448,10 @@ class ResourceQuotaManager:
             usage.cpu_percent = cpu_percent
         usage.timestamp = datetime.now()
     
-    def _count_recent_operations(self, agent_id: str, seconds: int) -> int:
-        """Count operations in the last N seconds"""
-        cutoff = datetime.now() - timedelta(seconds=seconds)
-        count = 0
-        for ts in self._operation_counts.get(agent_id, []):
-            if ts > cutoff:
-                count += 1
-        return count
+    def _count_recent_operations(self, agent_id: str) -> int:
+        """Count operations started in the last minute"""
+        window = self._operation_windows.get(agent_id)
+        return window.count() if window is not None else 0
     
     def get_usage(self, agent_id: str) -> Optional[ResourceUsage]:
         """Get current usage for an agent"""
@@ -2154,12 +2550,18 @@ class AgentObservabilityProvider:
         metrics = observability.export_prometheus()
     """
     
+    # Observations per (agent, histogram) kept for get_percentile
+    RECENT_OBSERVATIONS = 1024
+    
     def __init__(self, max_log_entries: int = 10000, max_metrics: int = 10000):
         self._metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_metrics))
         self._logs: deque = deque(maxlen=max_log_entries)
         self._counters: Dict[str, float] = defaultdict(float)
         self._gauges: Dict[str, float] = {}
         self._histograms: Dict[str, List[float]] = defaultdict(list)
+        self._recent_observations: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=self.RECENT_OBSERVATIONS)
+        )
         self._metric_metadata: Dict[str, Dict[str, Any]] = {}
         self._lock = asyncio.Lock()
     
@@ -2192,6 +2594,7 @@ class AgentObservabilityProvider:
             self._gauges[full_name] = value
         elif metric_type == "histogram":
             self._histograms[name].append(value)
+            self._recent_observations[f"{agent_id}:{name}"].append(value)
     
     def increment_counter(
         self,
@@ -2223,6 +2626,34 @@ class AgentObservabilityProvider:
         """Observe a value for a histogram metric"""
         self.record_metric(agent_id, name, value, labels, metric_type="histogram")
     
+    def record_observation(self, agent_id: str, name: str, value: float) -> None:
+        """
+        Record a value for get_percentile only.
+        
+        Unlike observe_histogram, nothing is kept beyond the last
+        ``RECENT_OBSERVATIONS`` values, so this is safe on per-request paths.
+        """
+        self._recent_observations[f"{agent_id}:{name}"].append(value)
+    
+    def get_percentile(
+        self,
+        agent_id: str,
+        name: str,
+        percentile: float
+    ) -> Optional[float]:
+        """
+        Get a percentile (0.0-1.0) of an agent's recent histogram observations.
+        
+        Only the last ``RECENT_OBSERVATIONS`` values are considered, so the
+        result tracks current behaviour. Returns None if nothing was observed.
+        """
+        values = self._recent_observations.get(f"{agent_id}:{name}")
+        if not values:
+            return None
+        sorted_vals = sorted(values)
+        idx = min(int(len(sorted_vals) * percentile), len(sorted_vals) - 1)
+        return sorted_vals[idx]
+    
     def log(
         self,
         agent_id: str,
@@ -2718,10 +3149,15 @@ class EnhancedAgentControlPlane:
         """
         self.node_id = node_id or f"node-{uuid.uuid4().hex[:8]}"
         
+        # Configure observability (shared by health monitoring and scaling)
+        self.observability = AgentObservabilityProvider()
+        
         # Configure health monitoring
         health_config = health_config or HealthCheckConfig()
         health_config.liveness_interval_seconds = health_check_interval
-        self.health_monitor = HealthMonitor(config=health_config)
+        self.health_monitor = HealthMonitor(
+            config=health_config, observability=self.observability
+        )
         
         # Configure auto-recovery
         recovery_config = recovery_config or RecoveryConfig()
@@ -2733,7 +3169,7 @@ class EnhancedAgentControlPlane:
         self.circuit_breaker_registry = CircuitBreakerRegistry()
         
         # Configure scaling
-        self.scaler = AgentScaler()
+        self.scaler = AgentScaler(observability=self.observability)
         self.default_scaling_config = scaling_config or ScalingConfig()
         
         # Configure distributed coordination
@@ -2750,9 +3186,6 @@ class EnhancedAgentControlPlane:
         # Configure resource quotas
         self.quota_manager = ResourceQuotaManager()
         
-        # Configure observability
-        self.observability = AgentObservabilityProvider()
-        
         # Configure hot reload
         self.hot_reload = HotReloadManager(
             config=hot_reload_config or HotReloadConfig()
@@ -16,13 +16,18 @@ Research Foundations:
 See docs/RESEARCH_FOUNDATION.md for complete references.
 """
 
-from typing import Any, Dict, List, Optional, Callable, Set, Tuple
+from typing import Any, Awaitable, Dict, List, Optional, Callable, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 import uuid
 import asyncio
-from collections import defaultdict
+import time
+from collections import defaultdict, deque
+
+
+# Executes one agent: (agent, workflow input, results of its dependencies) -> output
+AgentExecutor = Callable[["AgentNode", Dict[str, Any], Dict[str, Any]], Awaitable[Any]]
 
 
 class AgentRole(Enum):
@@ -82,6 +87,51 @@ class AgentNode:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class NodeTiming:
+    """Timing of one agent in a workflow run (milliseconds from workflow start)"""
+    agent_id: str
+    status: str  # "completed", "failed", "cancelled"
+    start_ms: float = 0.0
+    end_ms: float = 0.0
+    
+    @property
+    def duration_ms(self) -> float:
+        return self.end_ms - self.start_ms
+
+
+@dataclass
+class ExecutionReport:
+    """
+    Timing report for a workflow run.
+    
+    The critical path is the chain of dependent agents with the largest
+    summed duration; it bounds how fast the workflow can finish no matter
+    how much concurrency is available.
+    """
+    total_ms: float
+    critical_path: List[str]
+    critical_path_ms: float
+    max_parallelism: int
+    node_timings: Dict[str, NodeTiming] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_ms": round(self.total_ms, 3),
+            "critical_path": self.critical_path,
+            "critical_path_ms": round(self.critical_path_ms, 3),
+            "max_parallelism": self.max_parallelism,
+            "nodes": {
+                agent_id: {
+                    "status": timing.status,
+                    "start_ms": round(timing.start_ms, 3),
+                    "duration_ms": round(timing.duration_ms, 3),
+                }
+                for agent_id, timing in self.node_timings.items()
+            },
+        }
+
+
 @dataclass
 class WorkflowState:
     """State of an orchestrated workflow"""
@@ -93,6 +143,206 @@ class WorkflowState:
     errors: List[str]
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    report: Optional[ExecutionReport] = None
+
+
+class DAGScheduler:
+    """
+    Executes workflow agents as a dependency graph.
+    
+    The graph is validated and topologically ordered once (Kahn's
+    algorithm); execution then tracks remaining in-degrees so each agent
+    is released the moment its last dependency completes. Independent
+    branches run concurrently, up to ``max_concurrency`` agents at a time.
+    When an agent fails, everything downstream of it is cancelled while
+    unrelated branches run to completion.
+    """
+    
+    def __init__(
+        self,
+        agents: Dict[str, AgentNode],
+        executor: Optional[AgentExecutor] = None,
+        max_concurrency: int = 8
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.agents = agents
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        # Report of the latest run, also set when the run is cancelled
+        self.report: Optional[ExecutionReport] = None
+        self._children: Dict[str, List[str]] = defaultdict(list)
+        self._in_degree: Dict[str, int] = {}
+        self.order = self._topological_order()
+    
+    def _topological_order(self) -> List[str]:
+        for agent_id, agent in self.agents.items():
+            self._in_degree[agent_id] = len(agent.dependencies)
+            for dependency in agent.dependencies:
+                if dependency not in self.agents:
+                    raise RuntimeError(
+                        f"Agent '{agent_id}' depends on '{dependency}', which is not in the workflow"
+                    )
+                self._children[dependency].append(agent_id)
+        
+        remaining = dict(self._in_degree)
+        queue = deque(a for a, degree in remaining.items() if degree == 0)
+        order = []
+        while queue:
+            agent_id = queue.popleft()
+            order.append(agent_id)
+            for child in self._children[agent_id]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    queue.append(child)
+        
+        if len(order) < len(self.agents):
+            raise RuntimeError("Circular dependency detected in workflow")
+        return order
+    
+    async def _run_agent(
+        self,
+        agent_id: str,
+        input_data: Dict[str, Any],
+        results: Dict[str, Any]
+    ) -> Any:
+        agent = self.agents[agent_id]
+        if self.executor is None:
+            return None
+        upstream = {dep: results[dep].get("output") for dep in agent.dependencies}
+        return await self.executor(agent, input_data, upstream)
+    
+    def _cancel_downstream(
+        self,
+        agent_id: str,
+        results: Dict[str, Any],
+        timings: Dict[str, NodeTiming],
+        now_ms: float
+    ) -> None:
+        stack = list(self._children[agent_id])
+        while stack:
+            child = stack.pop()
+            if child in results:
+                continue
+            results[child] = {
+                "agent_id": child,
+                "status": "cancelled",
+                "reason": f"upstream agent '{agent_id}' failed",
+                "timestamp": datetime.now().isoformat()
+            }
+            timings[child] = NodeTiming(child, "cancelled", now_ms, now_ms)
+            stack.extend(self._children[child])
+    
+    async def run(self, input_data: Dict[str, Any]) -> Tuple[Dict[str, Any], ExecutionReport]:
+        """
+        Execute every agent once its dependencies have completed.
+        
+        Returns:
+            Per-agent results and the execution report
+        """
+        results: Dict[str, Any] = {}
+        timings: Dict[str, NodeTiming] = {}
+        remaining = dict(self._in_degree)
+        ready = deque(a for a in self.order if remaining[a] == 0)
+        running: Dict[asyncio.Task, str] = {}
+        max_parallelism = 0
+        started = time.perf_counter()
+        
+        def elapsed_ms() -> float:
+            return (time.perf_counter() - started) * 1000
+        
+        try:
+            while ready or running:
+                while ready and len(running) < self.max_concurrency:
+                    agent_id = ready.popleft()
+                    timings[agent_id] = NodeTiming(agent_id, "running", elapsed_ms())
+                    task = asyncio.ensure_future(self._run_agent(agent_id, input_data, results))
+                    running[task] = agent_id
+                max_parallelism = max(max_parallelism, len(running))
+                
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    agent_id = running.pop(task)
+                    timing = timings[agent_id]
+                    timing.end_ms = elapsed_ms()
+                    error = (
+                        RuntimeError("agent task was cancelled")
+                        if task.cancelled() else task.exception()
+                    )
+                    
+                    if error is not None:
+                        timing.status = "failed"
+                        results[agent_id] = {
+                            "agent_id": agent_id,
+                            "status": "failed",
+                            "error": str(error),
+                            "timestamp": datetime.now().isoformat()
+                        }
+                        self._cancel_downstream(agent_id, results, timings, timing.end_ms)
+                        continue
+                    
+                    timing.status = "completed"
+                    results[agent_id] = {
+                        "agent_id": agent_id,
+                        "status": "completed",
+                        "timestamp": datetime.now().isoformat()
+                    }
+                    if self.executor is not None:
+                        results[agent_id]["output"] = task.result()
+                    
+                    for child in self._children[agent_id]:
+                        remaining[child] -= 1
+                        if remaining[child] == 0 and child not in results:
+                            ready.append(child)
+        except asyncio.CancelledError:
+            # e.g. a workflow timeout: report how far the run got
+            now_ms = elapsed_ms()
+            for agent_id in running.values():
+                timings[agent_id].status = "cancelled"
+                timings[agent_id].end_ms = now_ms
+            self.report = self._report(timings, now_ms, max_parallelism)
+            raise
+        finally:
+            for task in running:
+                task.cancel()
+        
+        self.report = self._report(timings, elapsed_ms(), max_parallelism)
+        return results, self.report
+    
+    def _report(
+        self,
+        timings: Dict[str, NodeTiming],
+        total_ms: float,
+        max_parallelism: int
+    ) -> ExecutionReport:
+        """Find the longest duration-weighted dependency chain"""
+        path_ms: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for agent_id in self.order:
+            timing = timings.get(agent_id)
+            duration = timing.duration_ms if timing else 0.0
+            best_dep, best_ms = None, 0.0
+            for dependency in self.agents[agent_id].dependencies:
+                if path_ms[dependency] > best_ms or best_dep is None:
+                    best_dep, best_ms = dependency, path_ms[dependency]
+            path_ms[agent_id] = best_ms + duration
+            previous[agent_id] = best_dep
+        
+        critical_path: List[str] = []
+        node = max(path_ms, key=path_ms.get) if path_ms else None
+        critical_ms = path_ms[node] if node else 0.0
+        while node is not None:
+            critical_path.append(node)
+            node = previous[node]
+        critical_path.reverse()
+        
+        return ExecutionReport(
+            total_ms=total_ms,
+            critical_path=critical_path,
+            critical_path_ms=critical_ms,
+            max_parallelism=max_parallelism,
+            node_timings=timings
+        )
 
 
 class AgentOrchestrator:
@@ -105,9 +355,11 @@ class AgentOrchestrator:
     - Graph-based workflow definition (inspired by LangGraph)
     - Fault tolerance with circuit breakers and retries
     - Supervision hierarchies to prevent cascade failures
+    - Concurrent DAG execution of independent branches with a
+      critical-path timing report per run
     
     Usage:
-        orchestrator = AgentOrchestrator(control_plane)
+        orchestrator = AgentOrchestrator(control_plane, agent_executor=run_agent)
         
         # Register agents
         orchestrator.register_agent("retriever", AgentRole.SPECIALIST, ["document_search"])
@@ -124,14 +376,24 @@ class AgentOrchestrator:
         result = await orchestrator.execute_workflow(workflow.workflow_id, input_data)
     """
     
-    def __init__(self, control_plane=None):
+    def __init__(
+        self,
+        control_plane=None,
+        agent_executor: Optional[AgentExecutor] = None,
+        max_concurrency: int = 8
+    ):
         """
         Initialize the orchestrator.
         
         Args:
             control_plane: Optional AgentControlPlane for governance integration
+            agent_executor: Optional coroutine ``(agent, input_data, upstream_results)``
+                that runs one agent; without it agents are only marked completed
+            max_concurrency: Maximum agents of one workflow running at once
         """
         self.control_plane = control_plane
+        self.agent_executor = agent_executor
+        self.max_concurrency = max_concurrency
         self._agents: Dict[str, AgentNode] = {}
         self._workflows: Dict[str, WorkflowState] = {}
         self._message_queue: asyncio.Queue = asyncio.Queue()
@@ -322,16 +584,31 @@ class AgentOrchestrator:
         workflow.started_at = datetime.now()
         
         try:
-            # Execute based on workflow structure
-            # This is a simplified implementation
-            # In production, would use proper graph execution engine
-            
-            results = await self._execute_agents_in_order(workflow, input_data)
+            execution = self._execute_agents_in_order(workflow, input_data)
+            if timeout is not None:
+                results = await asyncio.wait_for(execution, timeout)
+            else:
+                results = await execution
             
-            workflow.status = "completed"
             workflow.results = results
             workflow.completed_at = datetime.now()
             
+            failed = [
+                f"Agent '{agent_id}' failed: {result['error']}"
+                for agent_id, result in results.items()
+                if result["status"] == "failed"
+            ]
+            if failed:
+                workflow.status = "failed"
+                workflow.errors.extend(failed)
+                return {
+                    "success": False,
+                    "error": "; ".join(failed),
+                    "results": results,
+                    "workflow_id": workflow_id
+                }
+            
+            workflow.status = "completed"
             return {
                 "success": True,
                 "results": results,
@@ -339,13 +616,17 @@ class AgentOrchestrator:
             }
             
         except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                error = f"workflow timed out after {timeout}s"
+            else:
+                error = str(e) or type(e).__name__
             workflow.status = "failed"
-            workflow.errors.append(str(e))
+            workflow.errors.append(error)
             workflow.completed_at = datetime.now()
             
             return {
                 "success": False,
-                "error": str(e),
+                "error": error,
                 "workflow_id": workflow_id
             }
     
@@ -356,34 +637,19 @@ class AgentOrchestrator:
     ) -> Dict[str, Any]:
         """
         Execute agents respecting dependencies.
-        (Simplified topological sort execution)
-        """
-        results = {}
-        executed = set()
-        
-        # Simple execution order: agents without dependencies first
-        while len(executed) < len(workflow.agents):
-            made_progress = False
-            
-            for agent_id, agent in workflow.agents.items():
-                if agent_id in executed:
-                    continue
-                
-                # Check if dependencies are satisfied
-                if agent.dependencies.issubset(executed):
-                    # Execute this agent
-                    # In production, this would call the actual agent
-                    results[agent_id] = {
-                        "agent_id": agent_id,
-                        "status": "completed",
-                        "timestamp": datetime.now().isoformat()
-                    }
-                    executed.add(agent_id)
-                    made_progress = True
-            
-            if not made_progress:
-                raise RuntimeError("Circular dependency detected in workflow")
         
+        Independent agents run concurrently (see DAGScheduler); the timing
+        report is stored on ``workflow.report``.
+        """
+        scheduler = DAGScheduler(
+            workflow.agents,
+            executor=self.agent_executor,
+            max_concurrency=self.max_concurrency
+        )
+        try:
+            results, _ = await scheduler.run(input_data)
+        finally:
+            workflow.report = scheduler.report
         return results
     
     def get_workflow_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
@@ -399,7 +665,8 @@ class AgentOrchestrator:
             "started_at": workflow.started_at.isoformat() if workflow.started_at else None,
             "completed_at": workflow.completed_at.isoformat() if workflow.completed_at else None,
             "results": workflow.results,
-            "errors": workflow.errors
+            "errors": workflow.errors,
+            "report": workflow.report.to_dict() if workflow.report else None
         }
     
     def get_agent_info(self, agent_id: str) -> Optional[Dict[str, Any]]:
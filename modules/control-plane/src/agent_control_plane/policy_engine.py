@@ -10,6 +10,7 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from .agent_kernel import ExecutionRequest, ActionType, PolicyRule
+from .sliding_window import SlidingWindowCounter
 import fnmatch
 import uuid
 import re
@@ -102,6 +103,8 @@ class PolicyEngine:
 
     def __init__(self):
         self.quotas: Dict[str, ResourceQuota] = {}
+        # Per-agent (minute, hour) sliding windows backing check_rate_limit
+        self._rate_windows: Dict[str, Tuple[SlidingWindowCounter, SlidingWindowCounter]] = {}
         self.risk_policies: Dict[str, RiskPolicy] = {}
         self.custom_rules: List[PolicyRule] = []
         self.blocked_patterns: List[str] = []
@@ -127,6 +130,10 @@ class PolicyEngine:
 
     def set_quota(self, agent_id: str, quota: ResourceQuota):
         self.quotas[agent_id] = quota
+        self._rate_windows[agent_id] = (
+            SlidingWindowCounter(window_seconds=60, buckets=60),
+            SlidingWindowCounter(window_seconds=3600, buckets=60),
+        )
 
     def set_risk_policy(self, policy_id: str, policy: RiskPolicy):
         self.risk_policies[policy_id] = policy
@@ -190,13 +197,16 @@ class PolicyEngine:
         if agent_id not in self.quotas:
             return True
         quota = self.quotas[agent_id]
-        now = datetime.now()
-        if (now - quota.last_reset_minute).total_seconds() >= 60:
-            quota.requests_this_minute = 0
-            quota.last_reset_minute = now
-        if (now - quota.last_reset_hour).total_seconds() >= 3600:
-            quota.requests_this_hour = 0
-            quota.last_reset_hour = now
+        windows = self._rate_windows.get(agent_id)
+        if windows is None:
+            # Quota assigned directly to self.quotas rather than via set_quota
+            windows = self._rate_windows[agent_id] = (
+                SlidingWindowCounter(window_seconds=60, buckets=60),
+                SlidingWindowCounter(window_seconds=3600, buckets=60),
+            )
+        minute, hour = windows
+        quota.requests_this_minute = minute.count()
+        quota.requests_this_hour = hour.count()
         if quota.requests_this_minute >= quota.max_requests_per_minute:
             return False
         if quota.requests_this_hour >= quota.max_requests_per_hour:
@@ -205,6 +215,8 @@ class PolicyEngine:
             return False
         if quota.allowed_action_types and request.action_type not in quota.allowed_action_types:
             return False
+        minute.add()
+        hour.add()
         quota.requests_this_minute += 1
         quota.requests_this_hour += 1
         return True
@@ -0,0 +1,107 @@
+"""
+Sliding-window event counters for rate limiting.
+
+Counts events over a trailing time window using a fixed ring of buckets and
+a running total, so recording an event and reading the count are O(1) in
+both time and memory regardless of how many events have been recorded.
+
+Used by ``ResourceQuotaManager`` (operations per minute) and by
+``PolicyEngine.check_rate_limit`` (requests per minute and per hour).
+
+Example:
+    counter = SlidingWindowCounter(window_seconds=60, buckets=60)
+    if counter.try_acquire(limit=100):
+        ...  # under 100 events in the last minute; this one was recorded
+"""
+
+from typing import Callable, List, Optional
+import threading
+import time
+
+
+class SlidingWindowCounter:
+    """
+    Thread-safe event counter over a trailing time window.
+
+    The window is split into ``buckets`` slots of equal width. Events are
+    added to the slot for the current time; slots that fall out of the
+    window are zeroed (and subtracted from the running total) lazily as the
+    clock advances. An event is therefore counted for between
+    ``window_seconds - bucket_width`` and ``window_seconds`` after it
+    happened; more buckets give finer precision at a fixed memory cost.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 60.0,
+        buckets: int = 60,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+        if buckets < 1:
+            raise ValueError("buckets must be at least 1")
+        self.window_seconds = window_seconds
+        self._bucket_width = window_seconds / buckets
+        self._counts: List[int] = [0] * buckets
+        self._total = 0
+        self._head: Optional[int] = None  # Absolute index of the newest bucket
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def _advance(self, now: float) -> None:
+        """Expire buckets that have left the window. Caller holds the lock."""
+        index = int(now // self._bucket_width)
+        if self._head is None:
+            self._head = index
+            return
+        gap = index - self._head
+        if gap <= 0:
+            return
+        size = len(self._counts)
+        if gap >= size:
+            self._counts = [0] * size
+            self._total = 0
+        else:
+            for step in range(1, gap + 1):
+                slot = (self._head + step) % size
+                self._total -= self._counts[slot]
+                self._counts[slot] = 0
+        self._head = index
+
+    def add(self, count: int = 1, now: Optional[float] = None) -> None:
+        """Record ``count`` events at ``now`` (defaults to the clock)."""
+        with self._lock:
+            self._advance(self._clock() if now is None else now)
+            assert self._head is not None
+            self._counts[self._head % len(self._counts)] += count
+            self._total += count
+
+    def count(self, now: Optional[float] = None) -> int:
+        """Number of events recorded within the window."""
+        with self._lock:
+            self._advance(self._clock() if now is None else now)
+            return self._total
+
+    def try_acquire(self, limit: int, count: int = 1, now: Optional[float] = None) -> bool:
+        """
+        Record ``count`` events only if that keeps the window at or under ``limit``.
+
+        Returns:
+            True if the events were recorded, False if the limit would be exceeded
+        """
+        with self._lock:
+            self._advance(self._clock() if now is None else now)
+            if self._total + count > limit:
+                return False
+            assert self._head is not None
+            self._counts[self._head % len(self._counts)] += count
+            self._total += count
+            return True
+
+    def reset(self) -> None:
+        """Forget all recorded events."""
+        with self._lock:
+            self._counts = [0] * len(self._counts)
+            self._total = 0
+            self._head = None
@@ -44,6 +44,9 @@ from agent_control_plane.lifecycle import (
     ScalingConfig,
     AgentReplica,
     AgentState,
+    ScalingSignals,
+    TargetTrackingPolicy,
+    PredictiveScalingPolicy,
     
     # Distributed Coordination
     DistributedCoordinator,
@@ -62,6 +65,7 @@ from agent_control_plane.lifecycle import (
     # Resource Quotas
     ResourceQuotaManager,
     AgentResourceQuota,
+    SlidingWindowCounter,
     
     # Observability
     AgentObservabilityProvider,
@@ -243,6 +247,130 @@ class TestHealthMonitor:
         
         assert "test-agent" not in monitor._agents
         assert monitor.get_agent_health("test-agent") == HealthStatus.UNKNOWN
+    
+    @pytest.mark.asyncio
+    async def test_sweep_probes_concurrently(self, health_config):
+        """Test a sweep runs slow probes concurrently under the limit"""
+        health_config.max_concurrent_probes = 10
+        health_config.stagger_probes = False
+        monitor = HealthMonitor(config=health_config)
+        in_flight = 0
+        peak = 0
+        
+        async def slow_liveness():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return True
+        
+        for i in range(40):
+            monitor.register_agent(f"agent-{i}", MockAgent(), custom_liveness=slow_liveness)
+        
+        duration_ms = await monitor._run_sweep(
+            "liveness", monitor._check_liveness, monitor._handle_liveness_result, 1.0
+        )
+        
+        assert peak == 10
+        assert duration_ms < 40 * 50 / 2  # far less than probing one at a time
+        assert all(len(monitor.get_health_history(f"agent-{i}")) == 1 for i in range(40))
+    
+    @pytest.mark.asyncio
+    async def test_sweep_staggers_probes(self, health_config):
+        """Test staggered sweeps spread probe start times over the window"""
+        health_config.stagger_window_ratio = 1.0
+        monitor = HealthMonitor(config=health_config)
+        loop = asyncio.get_running_loop()
+        started = []
+        
+        async def record_start():
+            started.append(loop.time())
+            return True
+        
+        for i in range(20):
+            monitor.register_agent(f"agent-{i}", MockAgent(), custom_liveness=record_start)
+        
+        await monitor._run_sweep(
+            "liveness", monitor._check_liveness, monitor._handle_liveness_result, 0.2
+        )
+        
+        assert len(started) == 20
+        assert max(started) - min(started) > 0.05
+    
+    @pytest.mark.asyncio
+    async def test_sweep_duration_excludes_stagger(self, health_config):
+        """Test the stagger offsets do not count towards the sweep duration"""
+        health_config.stagger_window_ratio = 1.0
+        monitor = HealthMonitor(config=health_config)
+        for i in range(20):
+            monitor.register_agent(f"agent-{i}", MockAgent())
+        
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        duration_ms = await monitor._run_sweep(
+            "liveness", monitor._check_liveness, monitor._handle_liveness_result, 0.2
+        )
+        
+        assert (loop.time() - started) * 1000 > 50
+        assert duration_ms < 50
+    
+    @pytest.mark.asyncio
+    async def test_sweep_duration_metric(self, health_config):
+        """Test sweep duration is reported to observability and sweep stats"""
+        observability = AgentObservabilityProvider()
+        monitor = HealthMonitor(config=health_config, observability=observability)
+        monitor.register_agent("test-agent", MockAgent())
+        
+        await monitor._run_sweep(
+            "readiness", monitor._check_readiness, monitor._handle_readiness_result, 0.1
+        )
+        
+        stats = monitor.get_sweep_stats()
+        assert stats["readiness"]["sweeps"] == 1
+        assert stats["liveness"]["sweeps"] == 0
+        metrics = observability.get_metrics(name="health_sweep_duration_ms")
+        assert len(metrics) == 1
+        assert metrics[0].labels["probe"] == "readiness"
+    
+    @pytest.mark.asyncio
+    async def test_check_history_bounded(self, health_config):
+        """Test check history is bounded and dropped on unregister"""
+        health_config.history_size = 3
+        monitor = HealthMonitor(config=health_config)
+        monitor.register_agent("test-agent", MockAgent())
+        
+        for _ in range(5):
+            await monitor._run_sweep(
+                "liveness", monitor._check_liveness, monitor._handle_liveness_result, 0.1
+            )
+        
+        assert len(monitor.get_health_history("test-agent")) == 3
+        monitor.unregister_agent("test-agent")
+        assert monitor.get_health_history("test-agent") == []
+    
+    @pytest.mark.asyncio
+    async def test_monitor_loop_detects_failure(self, health_config):
+        """Test the running loops mark a dead agent as failed"""
+        monitor = HealthMonitor(config=health_config)
+        agent = MockAgent()
+        agent._is_alive = False
+        failed = []
+        
+        async def on_failed(agent_id):
+            failed.append(agent_id)
+        
+        monitor.on_event("liveness_failed", on_failed)
+        monitor.register_agent("test-agent", agent)
+        
+        await monitor.start()
+        try:
+            await asyncio.sleep(0.35)
+        finally:
+            await monitor.stop()
+        
+        assert monitor.get_agent_health("test-agent") == HealthStatus.FAILED
+        assert "test-agent" in failed
 
 
 # ============================================================================
@@ -528,6 +656,154 @@ class TestAgentScaler:
         await scaler.scale_to("test-agent", 10)
         
         assert scaler.get_replica_count("test-agent") == 5
+    
+    @pytest.mark.asyncio
+    async def test_least_outstanding_routing(self):
+        """Test requests go to the replica with the fewest in-flight requests"""
+        scaler = AgentScaler()
+        scaler.register_agent_type("test-agent", factory=lambda: MockAgent())
+        await scaler.scale_to("test-agent", 3)
+        busy, idle_a, idle_b = scaler.get_all_replicas("test-agent")
+        busy.in_flight = 5
+        idle_a.in_flight = 1
+        
+        for _ in range(6):
+            assert await scaler.get_replica("test-agent") is idle_b.instance
+    
+    @pytest.mark.asyncio
+    async def test_acquire_replica_tracks_in_flight_and_latency(self):
+        """Test acquire_replica counts outstanding requests and records latency"""
+        observability = AgentObservabilityProvider()
+        scaler = AgentScaler(observability=observability)
+        scaler.register_agent_type("test-agent", factory=lambda: MockAgent())
+        await scaler.scale_to("test-agent", 2)
+        
+        async with scaler.acquire_replica("test-agent") as first:
+            async with scaler.acquire_replica("test-agent") as second:
+                assert first is not second
+                assert scaler.collect_signals("test-agent").in_flight == 2
+        
+        assert scaler.collect_signals("test-agent").in_flight == 0
+        assert observability.get_percentile(
+            "test-agent", "replica_request_latency_ms", 0.95
+        ) is not None
+    
+    @pytest.mark.asyncio
+    async def test_routing_latency_memory_bounded(self):
+        """Test per-request latency only fills the bounded recent window"""
+        observability = AgentObservabilityProvider()
+        observability.RECENT_OBSERVATIONS = 8
+        scaler = AgentScaler(observability=observability)
+        scaler.register_agent_type("test-agent", factory=lambda: MockAgent())
+        await scaler.scale_to("test-agent", 1)
+        observability.set_gauge("test-agent", "queue_depth", 3)
+        
+        for _ in range(20):
+            async with scaler.acquire_replica("test-agent"):
+                pass
+        
+        assert len(observability._recent_observations[
+            "test-agent:replica_request_latency_ms"
+        ]) == 8
+        assert not observability._histograms
+        assert [m.name for m in observability.get_metrics("test-agent")] == ["queue_depth"]
+    
+    @pytest.mark.asyncio
+    async def test_unready_replica_not_routed(self):
+        """Test replicas leave and rejoin the ready set with their status"""
+        scaler = AgentScaler()
+        scaler.register_agent_type(
+            "test-agent", factory=lambda: MockAgent(),
+            config=ScalingConfig(load_balancing="round_robin")
+        )
+        await scaler.scale_to("test-agent", 2)
+        down, up = scaler.get_all_replicas("test-agent")
+        
+        scaler.set_replica_status("test-agent", down.replica_id, AgentState.FAILED)
+        for _ in range(4):
+            assert await scaler.get_replica("test-agent") is up.instance
+        
+        scaler.set_replica_status("test-agent", down.replica_id, AgentState.RUNNING)
+        seen = {id(await scaler.get_replica("test-agent")) for _ in range(4)}
+        assert len(seen) == 2
+    
+    @pytest.mark.asyncio
+    async def test_target_tracking_scales_on_in_flight(self):
+        """Test target tracking sizes the pool to in-flight work"""
+        config = ScalingConfig(target_in_flight_per_replica=2, max_replicas=10)
+        scaler = AgentScaler()
+        scaler.register_agent_type("test-agent", factory=lambda: MockAgent(), config=config)
+        await scaler.scale_to("test-agent", 2)
+        for replica in scaler.get_all_replicas("test-agent"):
+            replica.in_flight = 5
+            replica.metrics["cpu"] = 0.5
+        
+        # 10 in flight at 2 per replica -> 5 replicas
+        assert await scaler.evaluate_scaling("test-agent") == 5
+    
+    @pytest.mark.asyncio
+    async def test_scale_down_needs_all_policies(self):
+        """Test a busy signal blocks scale-down proposed by another policy"""
+        config = ScalingConfig(target_queue_depth_per_replica=4, scale_down_cooldown_seconds=0)
+        scaler = AgentScaler()
+        scaler.register_agent_type("test-agent", factory=lambda: MockAgent(), config=config)
+        await scaler.scale_to("test-agent", 3)
+        for replica in scaler.get_all_replicas("test-agent"):
+            replica.metrics.update({"cpu": 0.1, "queue_depth": 4})
+        
+        assert await scaler.evaluate_scaling("test-agent") == 3
+        
+        for replica in scaler.get_all_replicas("test-agent"):
+            replica.metrics["queue_depth"] = 0
+        assert await scaler.evaluate_scaling("test-agent") == 2
+    
+    @pytest.mark.asyncio
+    async def test_p95_latency_target(self):
+        """Test scaling on p95 latency from the observability provider"""
+        observability = AgentObservabilityProvider()
+        config = ScalingConfig(target_p95_latency_ms=100)
+        scaler = AgentScaler(observability=observability)
+        scaler.register_agent_type("test-agent", factory=lambda: MockAgent(), config=config)
+        await scaler.scale_to("test-agent", 2)
+        for replica in scaler.get_all_replicas("test-agent"):
+            replica.metrics["cpu"] = 0.5
+        for _ in range(100):
+            observability.observe_histogram("test-agent", "replica_request_latency_ms", 300)
+        
+        assert await scaler.evaluate_scaling("test-agent") == 6
+    
+    def test_target_tracking_tolerance(self):
+        """Test small deviations from target do not resize"""
+        policy = TargetTrackingPolicy("in_flight", target=10)
+        signals = ScalingSignals(agent_type="a", replicas=4, in_flight=42)
+        
+        assert policy.desired_replicas(signals, ScalingConfig()) == 4
+        with pytest.raises(ValueError):
+            TargetTrackingPolicy("unknown", target=1)
+    
+    def test_predictive_policy_scales_up_on_trend(self):
+        """Test the EWMA trend forecast scales up before load arrives"""
+        config = ScalingConfig(prediction_horizon_seconds=30)
+        policy = PredictiveScalingPolicy(target_per_replica=10)
+        
+        proposals = [
+            policy.desired_replicas(
+                ScalingSignals(agent_type="a", replicas=2, in_flight=load, timestamp=t),
+                config
+            )
+            for t, load in enumerate([10, 14, 18, 22])
+        ]
+        
+        assert proposals[0] is None
+        assert proposals[-1] is not None and proposals[-1] > 3
+        
+        # Falling load never proposes a scale-down
+        falling = PredictiveScalingPolicy(target_per_replica=10)
+        for t, load in enumerate([40, 30, 20, 10]):
+            assert falling.desired_replicas(
+                ScalingSignals(agent_type="a", replicas=4, in_flight=load, timestamp=t),
+                config
+            ) is None
 
 
 # ============================================================================
@@ -858,6 +1134,69 @@ class TestResourceQuotas:
         
         assert "test-agent" in violations
         assert any("Memory" in v for v in violations["test-agent"])
+    
+    def test_rate_limit_per_minute(self):
+        """Test execution denied once the per-minute operation limit is reached"""
+        manager = ResourceQuotaManager()
+        manager.set_quota("test-agent", AgentResourceQuota(
+            max_concurrent_operations=100,
+            max_operations_per_minute=3
+        ))
+        
+        for _ in range(3):
+            manager.record_operation_start("test-agent")
+            manager.record_operation_end("test-agent")
+        
+        assert manager.get_usage("test-agent").operations_this_minute == 3
+        assert manager.can_execute("test-agent") is False
+
+
+class TestSlidingWindowCounter:
+    """Tests for the O(1) sliding-window counter used by quotas"""
+    
+    def test_counts_within_window(self):
+        """Test events count until their bucket leaves the window"""
+        counter = SlidingWindowCounter(window_seconds=60, buckets=60)
+        counter.add(now=0.0)
+        counter.add(2, now=30.5)
+        
+        assert counter.count(now=59.9) == 3
+        assert counter.count(now=60.0) == 2
+        assert counter.count(now=91.0) == 0
+    
+    def test_large_gap_resets(self):
+        """Test a gap longer than the window clears every bucket"""
+        counter = SlidingWindowCounter(window_seconds=10, buckets=5)
+        for t in range(10):
+            counter.add(now=float(t))
+        
+        assert counter.count(now=9.0) == 10
+        assert counter.count(now=1000.0) == 0
+    
+    def test_try_acquire(self):
+        """Test try_acquire records only while under the limit"""
+        counter = SlidingWindowCounter(window_seconds=60, buckets=60)
+        
+        assert all(counter.try_acquire(limit=3, now=1.0) for _ in range(3))
+        assert counter.try_acquire(limit=3, now=1.0) is False
+        assert counter.count(now=1.0) == 3
+        assert counter.try_acquire(limit=3, now=61.5) is True
+    
+    def test_memory_constant(self):
+        """Test memory does not grow with the number of recorded events"""
+        counter = SlidingWindowCounter(window_seconds=60, buckets=60)
+        for i in range(100_000):
+            counter.add(now=float(i // 1000))  # 1,000 events per second for 100s
+        
+        assert len(counter._counts) == 60
+        assert counter.count(now=100.0) == 59_000  # seconds 41..99
+    
+    def test_invalid_arguments(self):
+        """Test invalid window configuration is rejected"""
+        with pytest.raises(ValueError):
+            SlidingWindowCounter(window_seconds=0)
+        with pytest.raises(ValueError):
+            SlidingWindowCounter(buckets=0)
 
 
 # ============================================================================
@@ -0,0 +1,210 @@
+"""
+Tests for multi-agent workflow orchestration and the DAG scheduler.
+"""
+
+import asyncio
+
+import pytest
+
+from agent_control_plane.orchestrator import (
+    AgentOrchestrator,
+    AgentRole,
+    DAGScheduler,
+    AgentNode,
+    create_rag_pipeline,
+)
+
+
+def _node(agent_id, *dependencies):
+    return AgentNode(agent_id=agent_id, role=AgentRole.WORKER, dependencies=set(dependencies))
+
+
+def _graph(*nodes):
+    return {node.agent_id: node for node in nodes}
+
+
+class TestDAGScheduler:
+    """Tests for dependency-ordered concurrent execution"""
+
+    def test_topological_order(self):
+        """Test dependencies come before dependents"""
+        scheduler = DAGScheduler(_graph(_node("c", "a", "b"), _node("b", "a"), _node("a")))
+
+        assert scheduler.order == ["a", "b", "c"]
+
+    def test_cycle_detected(self):
+        """Test circular dependencies are rejected up front"""
+        with pytest.raises(RuntimeError, match="Circular dependency"):
+            DAGScheduler(_graph(_node("a", "b"), _node("b", "a")))
+
+    def test_unknown_dependency_rejected(self):
+        """Test a dependency outside the workflow is rejected"""
+        with pytest.raises(RuntimeError, match="not in the workflow"):
+            DAGScheduler(_graph(_node("a", "missing")))
+
+    @pytest.mark.asyncio
+    async def test_independent_branches_run_concurrently(self):
+        """Test a wide workflow runs in parallel up to the concurrency limit"""
+        running = 0
+        peak = 0
+
+        async def executor(agent, input_data, upstream):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return agent.agent_id
+
+        nodes = [_node("root")] + [_node(f"leaf-{i}", "root") for i in range(10)]
+        scheduler = DAGScheduler(_graph(*nodes), executor=executor, max_concurrency=4)
+        results, report = await scheduler.run({})
+
+        assert peak == 4
+        assert report.max_parallelism == 4
+        assert all(r["status"] == "completed" for r in results.values())
+
+    @pytest.mark.asyncio
+    async def test_upstream_outputs_passed_to_dependents(self):
+        """Test each agent receives the outputs of its dependencies"""
+        async def executor(agent, input_data, upstream):
+            return input_data["value"] + sum(upstream.values())
+
+        scheduler = DAGScheduler(
+            _graph(_node("a"), _node("b"), _node("c", "a", "b")), executor=executor
+        )
+        results, _ = await scheduler.run({"value": 1})
+
+        assert results["c"]["output"] == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_only_downstream(self):
+        """Test a failing agent cancels its descendants but not other branches"""
+        async def executor(agent, input_data, upstream):
+            if agent.agent_id == "bad":
+                raise ValueError("boom")
+            return agent.agent_id
+
+        scheduler = DAGScheduler(
+            _graph(
+                _node("bad"), _node("after-bad", "bad"), _node("leaf", "after-bad"),
+                _node("good"), _node("after-good", "good"),
+            ),
+            executor=executor
+        )
+        results, _ = await scheduler.run({})
+
+        assert results["bad"]["status"] == "failed"
+        assert results["after-bad"]["status"] == "cancelled"
+        assert results["leaf"]["status"] == "cancelled"
+        assert results["after-good"]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_critical_path_report(self):
+        """Test the report names the slowest dependency chain"""
+        delays = {"start": 0.01, "slow": 0.05, "fast": 0.0, "end": 0.01}
+
+        async def executor(agent, input_data, upstream):
+            await asyncio.sleep(delays[agent.agent_id])
+
+        scheduler = DAGScheduler(
+            _graph(
+                _node("start"), _node("slow", "start"), _node("fast", "start"),
+                _node("end", "slow", "fast"),
+            ),
+            executor=executor
+        )
+        _, report = await scheduler.run({})
+
+        assert report.critical_path == ["start", "slow", "end"]
+        assert report.critical_path_ms >= 60
+        assert report.critical_path_ms <= report.total_ms + 1
+
+
+class TestAgentOrchestrator:
+    """Tests for workflow execution through the orchestrator"""
+
+    @pytest.mark.asyncio
+    async def test_rag_pipeline_completes(self):
+        """Test the example pipeline runs and reports its critical path"""
+        orchestrator = AgentOrchestrator()
+        workflow_id = create_rag_pipeline(orchestrator)
+
+        result = await orchestrator.execute_workflow(workflow_id, {"query": "q"})
+        status = orchestrator.get_workflow_status(workflow_id)
+
+        assert result["success"]
+        assert status["status"] == "completed"
+        assert status["report"]["critical_path"] == ["retriever", "reasoner"]
+
+    @pytest.mark.asyncio
+    async def test_failed_agent_fails_workflow(self):
+        """Test an agent failure is reported on the workflow"""
+        async def executor(agent, input_data, upstream):
+            raise RuntimeError("agent crashed")
+
+        orchestrator = AgentOrchestrator(agent_executor=executor)
+        orchestrator.register_agent("worker", AgentRole.WORKER)
+        workflow = orchestrator.create_workflow("single")
+        orchestrator.add_agent_to_workflow(workflow.workflow_id, "worker")
+
+        result = await orchestrator.execute_workflow(workflow.workflow_id, {})
+
+        assert not result["success"]
+        assert "agent crashed" in result["error"]
+        assert workflow.status == "failed"
+
+    @pytest.mark.asyncio
+    async def test_circular_workflow_fails(self):
+        """Test a cyclic workflow fails without running agents"""
+        orchestrator = AgentOrchestrator()
+        orchestrator.register_agent("a", AgentRole.WORKER)
+        orchestrator.register_agent("b", AgentRole.WORKER)
+        workflow = orchestrator.create_workflow("cycle")
+        orchestrator.add_agent_to_workflow(workflow.workflow_id, "a", dependencies={"b"})
+        orchestrator.add_agent_to_workflow(workflow.workflow_id, "b", dependencies={"a"})
+
+        result = await orchestrator.execute_workflow(workflow.workflow_id, {})
+
+        assert not result["success"]
+        assert "Circular dependency" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_timeout_reports_error_and_progress(self):
+        """Test a timed-out workflow names the timeout and keeps its report"""
+        async def executor(agent, input_data, upstream):
+            if agent.agent_id == "slow":
+                await asyncio.sleep(10)
+            return agent.agent_id
+
+        orchestrator = AgentOrchestrator(agent_executor=executor)
+        orchestrator.register_agent("fast", AgentRole.WORKER)
+        orchestrator.register_agent("slow", AgentRole.WORKER)
+        workflow = orchestrator.create_workflow("timeout")
+        orchestrator.add_agent_to_workflow(workflow.workflow_id, "fast")
+        orchestrator.add_agent_to_workflow(workflow.workflow_id, "slow", dependencies={"fast"})
+
+        result = await orchestrator.execute_workflow(workflow.workflow_id, {}, timeout=0.05)
+
+        assert not result["success"]
+        assert result["error"] == "workflow timed out after 0.05s"
+        assert workflow.errors == ["workflow timed out after 0.05s"]
+        nodes = orchestrator.get_workflow_status(workflow.workflow_id)["report"]["nodes"]
+        assert nodes["fast"]["status"] == "completed"
+        assert nodes["slow"]["status"] == "cancelled"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_agent_task_fails_workflow(self):
+        """Test an agent whose task is cancelled is reported as failed"""
+        async def executor(agent, input_data, upstream):
+            raise asyncio.CancelledError()
+
+        orchestrator = AgentOrchestrator(agent_executor=executor)
+        orchestrator.register_agent("worker", AgentRole.WORKER)
+        workflow = orchestrator.create_workflow("cancelled")
+        orchestrator.add_agent_to_workflow(workflow.workflow_id, "worker")
+
+        result = await orchestrator.execute_workflow(workflow.workflow_id, {})
+
+        assert not result["success"]
+        assert "agent task was cancelled" in result["error"]
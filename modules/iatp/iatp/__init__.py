@@ -99,10 +99,10 @@ from iatp.recovery import IATPRecoveryEngine
 from iatp.security import PrivacyScrubber, SecurityValidator
 
 # Sidecar Components
-from iatp.sidecar import SidecarProxy, create_sidecar
+from iatp.sidecar import SidecarProxy, UpstreamPoolConfig, create_sidecar
 
 # Telemetry & Tracing
-from iatp.telemetry import FlightRecorder, TraceIDGenerator
+from iatp.telemetry import FlightRecorder, FlightRecorderConfig, TraceIDGenerator
 
 # IPC Pipes - Typed inter-agent communication (v0.4.0)
 from iatp.ipc_pipes import (
@@ -114,6 +114,7 @@ from iatp.ipc_pipes import (
     Pipeline,
     AgentPipelineStage,
     create_pipeline,
+    get_current_trace_id,
     pipe_agents,
 )
 
@@ -137,6 +138,7 @@ __all__ = [
     "ReputationEvent",
     # Sidecar - The proxy that wraps agents
     "SidecarProxy",
+    "UpstreamPoolConfig",
     "create_sidecar",
     # Security - Validation and privacy enforcement
     "SecurityValidator",
@@ -146,6 +148,7 @@ __all__ = [
     "ReputationManager",
     # Telemetry - Distributed tracing and audit logging
     "FlightRecorder",
+    "FlightRecorderConfig",
     "TraceIDGenerator",
     # Policy Engine - Rule-based policy evaluation
     "IATPPolicyEngine",
@@ -160,5 +163,6 @@ __all__ = [
     "Pipeline",
     "AgentPipelineStage",
     "create_pipeline",
+    "get_current_trace_id",
     "pipe_agents",
 ]
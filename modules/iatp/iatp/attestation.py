@@ -8,8 +8,12 @@ This module provides:
 """
 import base64
 import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 try:
     from cryptography.hazmat.primitives.asymmetric.ed25519 import (
@@ -47,17 +51,37 @@ class AttestationValidator:
 
     This implements the "Attestation Handshake" where agents exchange
     cryptographic proof that they're running verified code.
+
+    Parsed public keys are cached per key ID, and successful signature
+    checks are remembered for ``verified_cache_ttl_seconds`` keyed by a
+    digest of the signed message, signature and key, so re-presented
+    attestations skip the Ed25519 verification.
     """
 
-    def __init__(self, control_plane_public_keys: Optional[Dict[str, str]] = None):
+    def __init__(
+        self,
+        control_plane_public_keys: Optional[Dict[str, str]] = None,
+        verified_cache_ttl_seconds: float = 300.0,
+        max_verified_entries: int = 10000,
+    ):
         """
         Initialize the attestation validator.
 
         Args:
             control_plane_public_keys: Dict mapping key_id to public key (PEM format)
+            verified_cache_ttl_seconds: How long a verified signature is trusted
+                without re-verification (0 disables the cache)
+            max_verified_entries: Maximum number of remembered verifications
         """
         self.public_keys = control_plane_public_keys or {}
         self.attestation_cache: Dict[str, AttestationRecord] = {}
+        self.verified_cache_ttl_seconds = verified_cache_ttl_seconds
+        self.max_verified_entries = max_verified_entries
+        # key_id -> (encoded key, parsed key); the encoded form detects replacement
+        self._parsed_keys: Dict[str, Tuple[str, Any]] = {}
+        # digest -> monotonic deadline, oldest first
+        self._verified: "OrderedDict[str, float]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def add_trusted_key(self, key_id: str, public_key: str) -> None:
         """
@@ -68,6 +92,14 @@ class AttestationValidator:
             public_key: PEM-encoded public key
         """
         self.public_keys[key_id] = public_key
+        with self._cache_lock:
+            self._parsed_keys.pop(key_id, None)
+
+    def clear_verification_cache(self) -> None:
+        """Forget all cached parsed keys and verified signatures."""
+        with self._cache_lock:
+            self._parsed_keys.clear()
+            self._verified.clear()
 
     def validate_attestation(
         self,
@@ -111,6 +143,67 @@ class AttestationValidator:
 
         return True, None
 
+    def verify_many(
+        self,
+        attestations: Sequence[AttestationRecord],
+        verify_signature: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Validate a batch of attestations concurrently in a thread pool.
+
+        Args:
+            attestations: The attestation records to validate
+            verify_signature: Whether to verify the cryptographic signatures
+            max_workers: Thread pool size (defaults to the executor's choice)
+
+        Returns:
+            List of (is_valid, error_message) in the same order as the input
+        """
+        if len(attestations) <= 1:
+            return [self.validate_attestation(a, verify_signature) for a in attestations]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(
+                lambda a: self.validate_attestation(a, verify_signature),
+                attestations,
+            ))
+
+    def _get_public_key(self, key_id: str, raw_key: str) -> Any:
+        """Return the parsed Ed25519 key for ``key_id``, parsing it at most once."""
+        cached = self._parsed_keys.get(key_id)
+        if cached is not None and cached[0] == raw_key:
+            return cached[1]
+
+        public_key_obj = Ed25519PublicKey.from_public_bytes(base64.b64decode(raw_key))
+        with self._cache_lock:
+            self._parsed_keys[key_id] = (raw_key, public_key_obj)
+        return public_key_obj
+
+    def _verification_digest(self, attestation: AttestationRecord, raw_key: str, message: str) -> str:
+        """Digest identifying one (message, signature, key) verification."""
+        material = "\x00".join(
+            (message, attestation.signature, attestation.signing_key_id, raw_key)
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def _is_recently_verified(self, digest: str) -> bool:
+        with self._cache_lock:
+            deadline = self._verified.get(digest)
+            if deadline is None:
+                return False
+            if deadline < time.monotonic():
+                del self._verified[digest]
+                return False
+            return True
+
+    def _remember_verified(self, digest: str) -> None:
+        with self._cache_lock:
+            self._verified[digest] = time.monotonic() + self.verified_cache_ttl_seconds
+            self._verified.move_to_end(digest)
+            while len(self._verified) > self.max_verified_entries:
+                self._verified.popitem(last=False)
+
     def _verify_signature(self, attestation: AttestationRecord) -> bool:
         """
         Verify the Ed25519 cryptographic signature of an attestation.
@@ -132,25 +225,33 @@ class AttestationValidator:
             # Graceful fallback: accept if public key exists but library missing
             return True
 
-        try:
-            key_bytes = base64.b64decode(raw_key)
-            public_key_obj = Ed25519PublicKey.from_public_bytes(key_bytes)
-        except Exception:
-            return False
-
         # Reconstruct the canonical message that was signed
         message = (
             f"{attestation.agent_id}:{attestation.codebase_hash}:"
             f"{attestation.config_hash}:{attestation.timestamp}"
         )
 
+        use_cache = self.verified_cache_ttl_seconds > 0
+        if use_cache:
+            digest = self._verification_digest(attestation, raw_key, message)
+            if self._is_recently_verified(digest):
+                return True
+
+        try:
+            public_key_obj = self._get_public_key(attestation.signing_key_id, raw_key)
+        except Exception:
+            return False
+
         try:
             signature_bytes = base64.b64decode(attestation.signature)
             public_key_obj.verify(signature_bytes, message.encode())
-            return True
         except (InvalidSignature, Exception):
             return False
 
+        if use_cache:
+            self._remember_verified(digest)
+        return True
+
     def create_attestation(
         self,
         agent_id: str,
@@ -34,20 +34,34 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum, auto
+from contextvars import ContextVar
 from typing import (
-    Any, AsyncIterator, Callable, Dict, Generic, List, Optional, 
-    TypeVar, Union, Awaitable, Protocol, runtime_checkable
+    Any, AsyncIterable, AsyncIterator, Callable, Dict, Generic, Iterable, List,
+    Optional, Tuple, TypeVar, Union, Awaitable, Protocol, runtime_checkable
 )
 import asyncio
-import hashlib
 import json
 import logging
+import uuid
 from queue import Queue
 from threading import Lock
 
 logger = logging.getLogger(__name__)
 
 
+# Trace id of the pipeline call currently being processed (per task/context)
+_current_trace_id: ContextVar[Optional[str]] = ContextVar("iatp_pipe_trace_id", default=None)
+
+
+def get_current_trace_id() -> Optional[str]:
+    """Return the trace id of the pipeline call running in this context, if any."""
+    return _current_trace_id.get()
+
+
+def _new_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
 # Type variables for generic pipes
 T_In = TypeVar("T_In")
 T_Out = TypeVar("T_Out")
@@ -72,9 +86,7 @@ class PipeMessage(Generic[T]):
     Every message carries metadata for policy enforcement and auditing.
     """
     payload: T
-    message_id: str = field(default_factory=lambda: hashlib.sha256(
-        str(datetime.now(timezone.utc).timestamp()).encode()
-    ).hexdigest()[:16])
+    message_id: str = field(default_factory=_new_id)
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     source_agent: Optional[str] = None
     target_agent: Optional[str] = None
@@ -367,6 +379,10 @@ class AgentPipelineStage:
     """
     Wraps an agent as a pipeline stage.
     
+    ``workers`` sets how many messages the stage processes concurrently
+    when the pipeline is streaming; the agent must tolerate concurrent
+    calls if it is above 1.
+    
     Example:
         stage = AgentPipelineStage(my_agent, input_type="Query", output_type="Response")
     """
@@ -378,12 +394,17 @@ class AgentPipelineStage:
         process_method: str = "process",
         input_type: Optional[str] = None,
         output_type: Optional[str] = None,
+        workers: int = 1,
     ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
         self.agent = agent
         self.agent_id = agent_id
         self._process_method = process_method
         self.input_type = input_type
         self.output_type = output_type
+        # Concurrent messages this stage may process in Pipeline.stream()
+        self.workers = workers
     
     async def process(self, message: PipeMessage) -> Optional[PipeMessage]:
         """Process a message through the agent."""
@@ -417,24 +438,38 @@ class Pipeline:
     """
     A pipeline of connected stages.
     
+    ``execute`` runs one message through every stage. ``stream`` runs many:
+    stages are connected by bounded queues so each stage works on the next
+    message while later stages handle earlier ones, and a slow stage (or a
+    slow consumer of the results) fills its input queue and pauses the
+    stages before it. Each call carries its own trace id, so one Pipeline
+    can serve concurrent calls.
+    
     Example:
         pipeline = Pipeline([
-            AgentPipelineStage(research_agent, "research"),
+            AgentPipelineStage(research_agent, "research", workers=4),
             PolicyCheckPipe(),
             AgentPipelineStage(summary_agent, "summary"),
         ])
         
         result = await pipeline.execute(input_message)
+        
+        async for result in pipeline.stream(requests):
+            ...
     """
     
     def __init__(
         self,
         stages: Optional[List[Union[AgentPipelineStage, TypedPipe]]] = None,
         name: str = "pipeline",
+        queue_size: int = 16,
     ):
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
         self.name = name
         self.stages: List[Union[AgentPipelineStage, TypedPipe]] = stages or []
-        self._trace_id: Optional[str] = None
+        # Bound of each inter-stage queue used by stream()
+        self.queue_size = queue_size
     
     def add_stage(self, stage: Union[AgentPipelineStage, TypedPipe]) -> "Pipeline":
         """Add a stage to the pipeline."""
@@ -444,9 +479,52 @@ class Pipeline:
     def __or__(self, other: Union[AgentPipelineStage, TypedPipe, "Pipeline"]) -> "Pipeline":
         """Support pipe operator: pipeline | stage"""
         if isinstance(other, Pipeline):
-            return Pipeline(self.stages + other.stages, self.name)
+            return Pipeline(self.stages + other.stages, self.name, self.queue_size)
         else:
-            return Pipeline(self.stages + [other], self.name)
+            return Pipeline(self.stages + [other], self.name, self.queue_size)
+    
+    def _stage_name(self, index: int) -> str:
+        stage = self.stages[index]
+        return getattr(stage, 'name', None) or getattr(stage, 'agent_id', f'stage-{index}')
+    
+    async def _run_stage(self, index: int, message: PipeMessage) -> Optional[PipeMessage]:
+        """Run one message through one stage; None means it was filtered out."""
+        stage = self.stages[index]
+        stage_name = self._stage_name(index)
+        logger.debug(f"[Pipeline] Processing stage: {stage_name}")
+        
+        if isinstance(stage, TypedPipe):
+            # The pipe's buffer is shared, so a send/receive pair must not
+            # interleave with another call's pair
+            async with stage._lock:
+                stage.open()
+                try:
+                    if not await stage.send(message):
+                        logger.warning(f"[Pipeline] Stage {stage_name} rejected message")
+                        return None
+                    result = await stage.receive()
+                finally:
+                    stage.close()
+        elif hasattr(stage, 'process'):
+            if asyncio.iscoroutinefunction(stage.process):
+                result = await stage.process(message)
+            else:
+                result = stage.process(message)
+        else:
+            result = message
+        
+        if result is None:
+            logger.info(f"[Pipeline] Stage {stage_name} filtered out message")
+            return None
+        
+        # Update target agent for next stage
+        if index + 1 < len(self.stages):
+            next_stage = self.stages[index + 1]
+            result.target_agent = getattr(
+                next_stage, 'agent_id',
+                getattr(next_stage, 'name', None)
+            )
+        return result
     
     async def execute(
         self,
@@ -458,55 +536,25 @@ class Pipeline:
         
         Returns the final message, or None if pipeline filtered it out.
         """
-        self._trace_id = trace_id or hashlib.sha256(
-            str(datetime.now(timezone.utc).timestamp()).encode()
-        ).hexdigest()[:16]
-        
-        # Create initial message
-        current_message = PipeMessage(
-            payload=input_data,
-            trace_id=self._trace_id,
-        )
-        
-        logger.info(f"[Pipeline] {self.name} executing with trace {self._trace_id}")
-        
-        for i, stage in enumerate(self.stages):
-            stage_name = getattr(stage, 'name', None) or getattr(stage, 'agent_id', f'stage-{i}')
-            logger.debug(f"[Pipeline] Processing stage: {stage_name}")
+        trace_id = trace_id or _new_id()
+        token = _current_trace_id.set(trace_id)
+        try:
+            current_message: Optional[PipeMessage] = PipeMessage(
+                payload=input_data,
+                trace_id=trace_id,
+            )
             
-            if isinstance(stage, TypedPipe):
-                # For pipes, send and receive
-                stage.open()
-                if not await stage.send(current_message):
-                    logger.warning(f"[Pipeline] Stage {stage_name} rejected message")
-                    return None
-                current_message = await stage.receive()
-                stage.close()
-            elif isinstance(stage, AgentPipelineStage):
-                # For agent stages, process directly
-                current_message = await stage.process(current_message)
-            else:
-                # Generic stage with process method
-                if hasattr(stage, 'process'):
-                    if asyncio.iscoroutinefunction(stage.process):
-                        current_message = await stage.process(current_message)
-                    else:
-                        current_message = stage.process(current_message)
+            logger.info(f"[Pipeline] {self.name} executing with trace {trace_id}")
             
-            if current_message is None:
-                logger.info(f"[Pipeline] Stage {stage_name} filtered out message")
-                return None
+            for i in range(len(self.stages)):
+                current_message = await self._run_stage(i, current_message)
+                if current_message is None:
+                    return None
             
-            # Update target agent for next stage
-            if i + 1 < len(self.stages):
-                next_stage = self.stages[i + 1]
-                current_message.target_agent = getattr(
-                    next_stage, 'agent_id', 
-                    getattr(next_stage, 'name', None)
-                )
-        
-        logger.info(f"[Pipeline] {self.name} completed trace {self._trace_id}")
-        return current_message
+            logger.info(f"[Pipeline] {self.name} completed trace {trace_id}")
+            return current_message
+        finally:
+            _current_trace_id.reset(token)
     
     async def execute_streaming(
         self,
@@ -516,35 +564,152 @@ class Pipeline:
         """
         Execute pipeline with streaming output.
         
-        Yields messages as they flow through stages.
+        Yields messages as they flow through stages. To push many inputs
+        through the pipeline with stages overlapping, use ``stream``.
         """
-        self._trace_id = trace_id or hashlib.sha256(
-            str(datetime.now(timezone.utc).timestamp()).encode()
-        ).hexdigest()[:16]
-        
-        current_message = PipeMessage(
+        trace_id = trace_id or _new_id()
+        current_message: Optional[PipeMessage] = PipeMessage(
             payload=input_data,
-            trace_id=self._trace_id,
+            trace_id=trace_id,
         )
         
         yield current_message
         
-        for stage in self.stages:
-            if isinstance(stage, TypedPipe):
-                stage.open()
-                await stage.send(current_message)
-                current_message = await stage.receive()
-                stage.close()
-            elif hasattr(stage, 'process'):
-                if asyncio.iscoroutinefunction(stage.process):
-                    current_message = await stage.process(current_message)
-                else:
-                    current_message = stage.process(current_message)
+        for i in range(len(self.stages)):
+            token = _current_trace_id.set(trace_id)
+            try:
+                current_message = await self._run_stage(i, current_message)
+            finally:
+                _current_trace_id.reset(token)
             
             if current_message:
                 yield current_message
             else:
                 return
+    
+    async def stream(
+        self,
+        inputs: Union[Iterable[Any], AsyncIterable[Any]],
+        trace_id: Optional[str] = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[PipeMessage]:
+        """
+        Execute the pipeline over a stream of inputs with stages overlapping.
+        
+        Every stage runs ``stage.workers`` concurrent workers (1 for pipes)
+        fed by a queue of ``queue_size`` messages. Inputs are read only as
+        fast as the first stage accepts them, and the last stage stops when
+        the caller stops consuming results. In ordered mode at most
+        ``queue_size`` inputs are in flight at once, so results held back
+        behind a slower earlier message stay bounded.
+        
+        Args:
+            inputs: Payloads, as an iterable or async iterable
+            trace_id: Trace id shared by every message of this call
+            ordered: Yield results in input order (otherwise as they finish)
+        
+        Yields:
+            Final messages; inputs filtered out by a stage produce nothing.
+        
+        Raises:
+            The first exception raised by *inputs* or any stage; the rest of
+            the pipeline is cancelled.
+        """
+        trace_id = trace_id or _new_id()
+        count = len(self.stages)
+        queues: List[asyncio.Queue] = [
+            asyncio.Queue(maxsize=self.queue_size) for _ in range(count + 1)
+        ]
+        done = object()
+        failed = object()
+        errors: List[BaseException] = []
+        
+        window = asyncio.Semaphore(self.queue_size) if ordered else None
+        
+        async def feed() -> None:
+            sequence = 0
+            
+            async def put(payload: Any) -> None:
+                nonlocal sequence
+                if window is not None:
+                    await window.acquire()
+                await queues[0].put((sequence, PipeMessage(payload=payload, trace_id=trace_id)))
+                sequence += 1
+            
+            try:
+                if isinstance(inputs, AsyncIterable):
+                    async for payload in inputs:
+                        await put(payload)
+                else:
+                    for payload in inputs:
+                        await put(payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[Pipeline] {self.name} input stream failed: {e}")
+                errors.append(e)
+                await queues[count].put(failed)
+                return
+            await queues[0].put(done)
+        
+        async def work(index: int, remaining: List[int]) -> None:
+            source, sink = queues[index], queues[index + 1]
+            _current_trace_id.set(trace_id)
+            try:
+                while True:
+                    item = await source.get()
+                    if item is done:
+                        # Let sibling workers see the end, then close downstream
+                        await source.put(done)
+                        remaining[0] -= 1
+                        if remaining[0] == 0:
+                            await sink.put(done)
+                        return
+                    sequence, message = item
+                    if message is not None:
+                        message = await self._run_stage(index, message)
+                    # Filtered messages pass on as None so ordering can skip them
+                    await sink.put((sequence, message))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[Pipeline] {self.name} stage {self._stage_name(index)} failed: {e}")
+                errors.append(e)
+                await queues[count].put(failed)
+        
+        tasks = [asyncio.ensure_future(feed())]
+        for index, stage in enumerate(self.stages):
+            workers = 1 if isinstance(stage, TypedPipe) else getattr(stage, 'workers', 1)
+            remaining = [workers]
+            tasks.extend(asyncio.ensure_future(work(index, remaining)) for _ in range(workers))
+        
+        logger.info(f"[Pipeline] {self.name} streaming with trace {trace_id}")
+        pending: Dict[int, Optional[PipeMessage]] = {}
+        next_sequence = 0
+        try:
+            while True:
+                item = await queues[count].get()
+                if item is failed:
+                    raise errors[0]
+                if item is done:
+                    break
+                sequence, message = item
+                if not ordered:
+                    if message is not None:
+                        yield message
+                    continue
+                pending[sequence] = message
+                while next_sequence in pending:
+                    message = pending.pop(next_sequence)
+                    next_sequence += 1
+                    window.release()
+                    if message is not None:
+                        yield message
+            logger.info(f"[Pipeline] {self.name} completed trace {trace_id}")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
 
 # ========== Convenience Functions ==========
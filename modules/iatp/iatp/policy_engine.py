@@ -85,11 +85,15 @@ class IATPPolicyEngine:
     - Self-contained (no external dependencies beyond IATP models)
     - Extensible (custom rules can be added)
     - Protocol-compliant (follows IATP trust semantics)
+
+    ``version`` increases whenever the rule set changes through this API,
+    so callers can tell when cached decisions are stale.
     """
 
     def __init__(self):
         """Initialize the IATP Policy Engine."""
         self.rules: List[PolicyRule] = []
+        self.version = 0
         self._setup_default_policies()
 
     def _setup_default_policies(self):
@@ -136,6 +140,7 @@ class IATPPolicyEngine:
         )
         # Insert at beginning so custom rules take precedence
         self.rules.insert(0, policy_rule)
+        self.version += 1
 
     def validate_manifest(
         self,
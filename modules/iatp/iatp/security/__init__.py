@@ -2,7 +2,7 @@
 Security and privacy validation logic.
 """
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from iatp.attestation import AttestationValidator
 from iatp.models import (
@@ -43,6 +43,35 @@ def _luhn_check(card_number: str) -> bool:
     return checksum % 10 == 0
 
 
+def _iter_text(payload: Any) -> Iterator[str]:
+    """
+    Yield the text of a payload that sensitive-data patterns can match.
+
+    Covers string values and keys at any depth, integers long enough to be
+    card numbers, and the ``str()`` of any other non-container object.
+    """
+    stack = [payload]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+        elif isinstance(item, dict):
+            for key, value in item.items():
+                if isinstance(key, str):
+                    yield key
+                stack.append(value)
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif item is None or isinstance(item, (bool, float)):
+            continue
+        elif isinstance(item, int):
+            # Shorter integers cannot contain a 13+ digit card number
+            if abs(item) >= 10**12:
+                yield str(item)
+        else:
+            yield str(item)
+
+
 class SecurityValidator:
     """Validates requests against capability manifests and security policies."""
 
@@ -51,6 +80,18 @@ class SecurityValidator:
     SSN_PATTERN = re.compile(r'\b\d{3}-\d{2}-\d{4}\b')
     EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
 
+    # Card and SSN candidates found in one pass; only fields containing a
+    # digit are scanned, and only fields containing '@' are checked for email
+    DIGIT_PATTERN = re.compile(
+        f"(?P<credit_card>{CREDIT_CARD_PATTERN.pattern})|(?P<ssn>{SSN_PATTERN.pattern})"
+    )
+    _HAS_DIGIT = re.compile(r'\d')
+
+    # Characters scanned per field; text beyond this is not inspected
+    MAX_FIELD_CHARS = 256 * 1024
+    # Fields are joined into chunks of about this size before scanning
+    SCAN_CHUNK_CHARS = 64 * 1024
+
     def __init__(self):
         self.blocked_requests = []
         self.warnings = []
@@ -82,25 +123,52 @@ class SecurityValidator:
         Detect sensitive data in the request payload.
         Uses Luhn algorithm to validate credit card numbers.
         Returns a list of detected sensitive data types.
-        """
-        sensitive_types = []
-        payload_str = str(payload)
 
-        # Check for credit cards with Luhn validation
-        card_matches = self.CREDIT_CARD_PATTERN.finditer(payload_str)
-        for match in card_matches:
-            card_number = match.group().replace(' ', '').replace('-', '')
-            if _luhn_check(card_number):
-                sensitive_types.append("credit_card")
-                break  # Only need to detect once
+        Text fields are visited once, capped at MAX_FIELD_CHARS each, and
+        joined with NUL separators (which no pattern can match across) into
+        chunks, so each chunk is scanned by a few C-level regex passes.
+        Scanning stops as soon as every type has been found.
+        """
+        found: Set[str] = set()
+        limit = self.MAX_FIELD_CHARS
+        chunk: List[str] = []
+        chunk_chars = 0
+
+        for text in _iter_text(payload):
+            if len(text) > limit:
+                text = text[:limit]
+            chunk.append(text)
+            chunk_chars += len(text) + 1
+            if chunk_chars >= self.SCAN_CHUNK_CHARS:
+                self._scan_text("\x00".join(chunk), found)
+                chunk, chunk_chars = [], 0
+                if len(found) == 3:
+                    break
+
+        if chunk and len(found) < 3:
+            self._scan_text("\x00".join(chunk), found)
+
+        return [kind for kind in ("credit_card", "ssn", "email") if kind in found]
+
+    def _scan_text(self, text: str, found: Set[str]) -> None:
+        """Add the sensitive data types present in ``text`` to ``found``."""
+        if ("credit_card" not in found or "ssn" not in found) and self._HAS_DIGIT.search(text):
+            for match in self.DIGIT_PATTERN.finditer(text):
+                kind = match.lastgroup
+                if kind in found:
+                    continue
+                if kind == "credit_card":
+                    # Luhn only runs on pattern candidates
+                    card_number = match.group().replace(' ', '').replace('-', '')
+                    if not _luhn_check(card_number):
+                        continue
+                found.add(kind)
+                if "credit_card" in found and "ssn" in found:
+                    break
 
-        if self.SSN_PATTERN.search(payload_str):
-            sensitive_types.append("ssn")
         # Email is less sensitive but still PII
-        if self.EMAIL_PATTERN.search(payload_str):
-            sensitive_types.append("email")
-
-        return sensitive_types
+        if "email" not in found and "@" in text and self.EMAIL_PATTERN.search(text):
+            found.add("email")
 
     def validate_privacy_policy(
         self,
@@ -10,9 +10,14 @@ This is the main sidecar that sits in front of an agent and handles:
 - Request routing
 - Telemetry and tracing
 """
+import asyncio
+import hashlib
+import importlib.util
 import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 import httpx
 from fastapi import FastAPI, Header, HTTPException, Request, Response
@@ -31,6 +36,35 @@ from iatp.security import PrivacyScrubber, SecurityValidator
 from iatp.telemetry import FlightRecorder, TraceIDGenerator, _get_utc_timestamp
 
 
+@dataclass
+class UpstreamPoolConfig:
+    """
+    Connection pool settings for forwarding requests to the backend agent.
+
+    HTTP/2 is only negotiated when the optional ``h2`` package is installed
+    (``pip install httpx[http2]``); otherwise HTTP/1.1 keep-alive is used.
+    """
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 30.0
+    timeout_seconds: float = 30.0
+    http2: bool = True
+
+
+@dataclass(frozen=True)
+class ManifestDecision:
+    """Outcome of the manifest-only checks, cached per manifest hash."""
+    policy_allowed: bool
+    policy_error: Optional[str]
+    warning: Optional[str]
+    should_quarantine: bool
+    trust_score: int
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
 class SidecarProxy:
     """
     The Sidecar Proxy that wraps an agent.
@@ -39,23 +73,46 @@ class SidecarProxy:
     - External requests hit the sidecar (e.g., localhost:8001)
     - Sidecar validates, scrubs, and routes to the actual agent (e.g., localhost:8000)
     - All telemetry and security checks happen in the sidecar
+
+    Requests are forwarded over one long-lived connection pool. It is
+    opened on application startup and closed on shutdown, or created on
+    first use when the app runs without lifespan events. Manifest checks
+    (policy rules, warnings, quarantine, trust score) do not depend on the
+    payload, so their results are cached by manifest hash. Assigning a new
+    ``manifest`` switches to that manifest's entry, and rules added with
+    ``policy_engine.add_custom_rule()`` or a replaced ``policy_engine``
+    drop the cache. Call ``invalidate_validation_cache()`` after mutating
+    the manifest or the policy rules in place.
     """
 
+    # Distinct manifests whose decisions are kept
+    MAX_CACHED_DECISIONS = 32
+
     def __init__(
         self,
         agent_url: str,
         manifest: CapabilityManifest,
         sidecar_host: str = "0.0.0.0",
         sidecar_port: int = 8001,
-        attestation: Optional[AttestationRecord] = None
+        attestation: Optional[AttestationRecord] = None,
+        pool_config: Optional[UpstreamPoolConfig] = None
     ):
         self.agent_url = agent_url
+        self._decisions: Dict[str, ManifestDecision] = {}
+        self._decisions_engine: Optional[IATPPolicyEngine] = None
+        self._decisions_policy: Optional[tuple] = None
         self.manifest = manifest
         self.sidecar_host = sidecar_host
         self.sidecar_port = sidecar_port
         self.attestation = attestation
+        self.pool_config = pool_config or UpstreamPoolConfig()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
 
-        self.app = FastAPI(title=f"IATP Sidecar for {manifest.agent_id}")
+        self.app = FastAPI(
+            title=f"IATP Sidecar for {manifest.agent_id}",
+            lifespan=self._lifespan
+        )
         self.validator = SecurityValidator()
         self.scrubber = PrivacyScrubber()
         self.flight_recorder = FlightRecorder()
@@ -70,6 +127,107 @@ class SidecarProxy:
 
         self._setup_routes()
 
+    @property
+    def manifest(self) -> CapabilityManifest:
+        return self._manifest
+
+    @manifest.setter
+    def manifest(self, manifest: CapabilityManifest) -> None:
+        self._manifest = manifest
+        self._manifest_hash = hashlib.sha256(
+            manifest.model_dump_json().encode()
+        ).hexdigest()
+
+    def invalidate_validation_cache(self) -> None:
+        """Drop cached manifest decisions (after in-place edits or policy changes)."""
+        self.manifest = self._manifest
+        self._decisions.clear()
+
+    def _manifest_decision(self) -> ManifestDecision:
+        """Run (or reuse) the checks that depend only on the manifest."""
+        engine = self.policy_engine
+        policy = (getattr(engine, "version", 0), len(engine.rules))
+        if engine is not self._decisions_engine or policy != self._decisions_policy:
+            # The rules changed since these decisions were made
+            self._decisions.clear()
+            self._decisions_engine = engine
+            self._decisions_policy = policy
+        decision = self._decisions.get(self._manifest_hash)
+        if decision is not None:
+            return decision
+
+        manifest = self._manifest
+        policy_allowed, policy_error, policy_warning = \
+            self.policy_engine.validate_manifest(manifest)
+
+        # Combine policy and security warnings (the security warning only
+        # inspects the manifest, not the payload)
+        warning = self.validator.generate_warning_message(manifest, {})
+        if policy_warning and not warning:
+            warning = policy_warning
+        elif policy_warning and warning:
+            warning = f"{warning}\n{policy_warning}"
+
+        decision = ManifestDecision(
+            policy_allowed=policy_allowed,
+            policy_error=policy_error,
+            warning=warning,
+            should_quarantine=self.validator.should_quarantine(manifest),
+            trust_score=manifest.calculate_trust_score()
+        )
+        if len(self._decisions) >= self.MAX_CACHED_DECISIONS:
+            self._decisions.pop(next(iter(self._decisions)))
+        self._decisions[self._manifest_hash] = decision
+        return decision
+
+    def _create_client(self) -> httpx.AsyncClient:
+        config = self.pool_config
+        return httpx.AsyncClient(
+            http2=config.http2 and _http2_available(),
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry_seconds
+            ),
+            timeout=config.timeout_seconds
+        )
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled upstream client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._client
+        if client is None or client.is_closed or self._client_loop is not loop:
+            # Pooled connections belong to the loop that opened them
+            self._client = self._create_client()
+            self._client_loop = loop
+            if client is not None and not client.is_closed:
+                try:
+                    await client.aclose()
+                except Exception:
+                    # The old loop may already be closed; its sockets are
+                    # released with it
+                    pass
+        return self._client
+
+    async def startup(self) -> None:
+        """Open the upstream connection pool."""
+        await self._get_client()
+
+    async def shutdown(self) -> None:
+        """Close the upstream connection pool and flush the flight recorder."""
+        client, self._client, self._client_loop = self._client, None, None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+        self.flight_recorder.flush()
+
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI) -> AsyncIterator[None]:
+        await self.startup()
+        try:
+            yield
+        finally:
+            await self.shutdown()
+
     def _setup_routes(self):
         """Setup FastAPI routes."""
 
@@ -136,10 +294,10 @@ class SidecarProxy:
 
             # Validate using Policy Engine
             # This provides an additional layer of policy validation
-            policy_allowed, policy_error, policy_warning = \
-                self.policy_engine.validate_manifest(self.manifest)
+            decision = self._manifest_decision()
+            policy_error = decision.policy_error
 
-            if not policy_allowed:
+            if not decision.policy_allowed:
                 # Policy engine blocked the request
                 self.flight_recorder.log_blocked_request(
                     trace_id=trace_id,
@@ -181,18 +339,13 @@ class SidecarProxy:
                     }
                 )
 
-            # Check if warning is needed (combine policy and security warnings)
-            warning = self.validator.generate_warning_message(self.manifest, payload)
-            if policy_warning and not warning:
-                warning = policy_warning
-            elif policy_warning and warning:
-                warning = f"{warning}\n{policy_warning}"
-
-            should_quarantine = self.validator.should_quarantine(self.manifest)
+            # Check if warning is needed (combined policy and security warnings)
+            warning = decision.warning
+            should_quarantine = decision.should_quarantine
 
             # If there's a warning and no user override, return the warning
             if warning and not x_user_override:
-                trust_score = self.manifest.calculate_trust_score()
+                trust_score = decision.trust_score
                 return JSONResponse(
                     status_code=449,  # Custom status for "Retry With User Override"
                     content={
@@ -234,65 +387,65 @@ class SidecarProxy:
                 quarantined=should_quarantine
             )
 
-            # Forward to backend agent
+            # Forward to backend agent over the pooled connection
             start_time = time.time()
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        self.agent_url,
-                        json=payload,
-                        headers={
-                            "X-Agent-Trace-ID": trace_id,
-                            "Content-Type": "application/json"
-                        },
-                        timeout=30.0
-                    )
-                    latency_ms = (time.time() - start_time) * 1000
-
-                    # Log the response
-                    try:
-                        response_data = response.json() if 200 <= response.status_code < 300 else {}
-                    except Exception:
-                        response_data = {}
-
-                    self.flight_recorder.log_response(
-                        trace_id=trace_id,
-                        agent_id=self.manifest.agent_id,
-                        response=response_data,
-                        status_code=response.status_code,
-                        latency_ms=latency_ms
-                    )
-
-                    # Record successful transaction for reputation
-                    if 200 <= response.status_code < 300:
-                        self.reputation_manager.record_success(
-                            agent_id=self.manifest.agent_id,
-                            trace_id=trace_id
-                        )
-
-                    # Add tracing headers to response
-                    headers = {
+                client = await self._get_client()
+                response = await client.post(
+                    self.agent_url,
+                    json=payload,
+                    headers={
                         "X-Agent-Trace-ID": trace_id,
-                        "X-Agent-Latency-Ms": str(int(latency_ms)),
-                        "X-Agent-Trust-Score": str(self.manifest.calculate_trust_score())
+                        "Content-Type": "application/json"
                     }
+                )
+                latency_ms = (time.time() - start_time) * 1000
+
+                # Log the response
+                try:
+                    response_data = response.json() if 200 <= response.status_code < 300 else {}
+                except Exception:
+                    response_data = {}
 
-                    if should_quarantine:
-                        headers["X-Agent-Quarantined"] = "true"
+                self.flight_recorder.log_response(
+                    trace_id=trace_id,
+                    agent_id=self.manifest.agent_id,
+                    response=response_data,
+                    status_code=response.status_code,
+                    latency_ms=latency_ms
+                )
 
-                    return Response(
-                        content=response.content,
-                        status_code=response.status_code,
-                        headers=headers,
-                        media_type="application/json"
+                # Record successful transaction for reputation
+                if 200 <= response.status_code < 300:
+                    self.reputation_manager.record_success(
+                        agent_id=self.manifest.agent_id,
+                        trace_id=trace_id
                     )
 
+                # Add tracing headers to response
+                headers = {
+                    "X-Agent-Trace-ID": trace_id,
+                    "X-Agent-Latency-Ms": str(int(latency_ms)),
+                    "X-Agent-Trust-Score": str(decision.trust_score)
+                }
+
+                if should_quarantine:
+                    headers["X-Agent-Quarantined"] = "true"
+
+                return Response(
+                    content=response.content,
+                    status_code=response.status_code,
+                    headers=headers,
+                    media_type="application/json"
+                )
+
             except httpx.TimeoutException as e:
+                timeout_seconds = self.pool_config.timeout_seconds
                 self.flight_recorder.log_error(
                     trace_id=trace_id,
                     agent_id=self.manifest.agent_id,
                     error="Request timeout",
-                    details={"timeout_seconds": 30}
+                    details={"timeout_seconds": timeout_seconds}
                 )
 
                 # Record timeout failure for reputation
@@ -300,7 +453,7 @@ class SidecarProxy:
                     agent_id=self.manifest.agent_id,
                     failure_type="timeout",
                     trace_id=trace_id,
-                    details={"timeout_seconds": 30}
+                    details={"timeout_seconds": timeout_seconds}
                 )
 
                 # Attempt recovery using scak integration
@@ -357,7 +510,8 @@ class SidecarProxy:
         @self.app.get("/trace/{trace_id}")
         async def get_trace(trace_id: str):
             """Retrieve flight recorder logs for a trace ID."""
-            logs = self.flight_recorder.get_trace_logs(trace_id)
+            # The lookup waits for the writer's flush and reads segment files
+            logs = await asyncio.to_thread(self.flight_recorder.get_trace_logs, trace_id)
             if not logs:
                 raise HTTPException(status_code=404, detail="Trace not found")
             return {"trace_id": trace_id, "logs": logs}
@@ -493,7 +647,8 @@ def create_sidecar(
     manifest: CapabilityManifest,
     host: str = "0.0.0.0",
     port: int = 8001,
-    attestation: Optional[AttestationRecord] = None
+    attestation: Optional[AttestationRecord] = None,
+    pool_config: Optional[UpstreamPoolConfig] = None
 ) -> SidecarProxy:
     """
     Factory function to create a sidecar proxy.
@@ -504,6 +659,7 @@ def create_sidecar(
         host: Host to bind the sidecar to
         port: Port to bind the sidecar to
         attestation: Optional attestation record for agent verification
+        pool_config: Optional upstream connection pool settings
 
     Returns:
         Configured SidecarProxy instance
@@ -513,5 +669,6 @@ def create_sidecar(
         manifest=manifest,
         sidecar_host=host,
         sidecar_port=port,
-        attestation=attestation
+        attestation=attestation,
+        pool_config=pool_config
     )
@@ -1,31 +1,123 @@
 """
 Telemetry and flight recorder for request/response tracking.
 """
+import atexit
 import json
+import logging
+import os
+import threading
+import time
 import uuid
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from iatp.models import CapabilityManifest, QuarantineSession, TracingContext
 from iatp.security import PrivacyScrubber
 
+logger = logging.getLogger(__name__)
+
+# Recorders with a running writer, flushed at interpreter exit
+_live_recorders: "weakref.WeakSet[FlightRecorder]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_recorders() -> None:
+    for recorder in list(_live_recorders):
+        recorder.close()
+
 
 def _get_utc_timestamp() -> str:
     """Get current UTC timestamp in ISO 8601 format."""
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+@dataclass
+class FlightRecorderConfig:
+    """
+    Buffering, durability and retention settings for the flight recorder.
+
+    overflow_policy decides what happens when ``max_buffered_entries`` are
+    waiting to be written: "drop_newest" discards the new entry,
+    "drop_oldest" discards the oldest buffered one, and "block" makes the
+    caller wait up to ``block_timeout_seconds`` before dropping it.
+
+    recorder_id names this recorder's segment files so recorders sharing a
+    log directory never append to each other's segments. By default every
+    recorder gets a fresh random id; pass a stable id to continue a previous
+    run's segment numbering.
+
+    max_files applies to the whole log directory: on rotation the oldest
+    ``flight-*.jsonl`` segments by modification time are deleted, including
+    ones left by earlier runs, but never the segment a live recorder in this
+    process is writing to. Recorders in separate processes should use
+    separate log directories.
+    """
+    flush_interval_seconds: float = 1.0
+    flush_bytes: int = 256 * 1024
+    fsync: bool = True
+    max_file_bytes: int = 64 * 1024 * 1024
+    max_files: int = 8
+    max_buffered_entries: int = 10_000
+    overflow_policy: str = "drop_newest"
+    block_timeout_seconds: float = 1.0
+    max_indexed_traces: int = 100_000
+    recorder_id: Optional[str] = None
+
+
 class FlightRecorder:
     """
     Records all requests and responses for audit and debugging.
     This is the "black box" that helps trace what happened.
+
+    Entries are serialized by the caller and queued in memory. A background
+    thread appends them to size-rotated segment files
+    (``flight-<recorder_id>-000001.jsonl``, ...) and flushes and fsyncs them
+    every ``flush_interval_seconds`` or ``flush_bytes``, whichever comes
+    first. ``flush()`` waits until everything logged so far is on disk and
+    reports entries lost to write errors. ``close()`` does the same and stops
+    the writer; it also runs at interpreter exit.
     """
 
-    def __init__(self, log_dir: Optional[Path] = None):
+    SEGMENT_PREFIX = "flight-"
+    OVERFLOW_POLICIES = ("drop_newest", "drop_oldest", "block")
+
+    def __init__(self, log_dir: Optional[Path] = None, config: Optional[FlightRecorderConfig] = None):
         self.log_dir = log_dir or Path("/tmp/iatp_logs")
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.scrubber = PrivacyScrubber()
+        self.config = config or FlightRecorderConfig()
+        if self.config.overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {self.config.overflow_policy}")
+
+        self._cond = threading.Condition()
+        self._buffer: Deque[Tuple[int, str, str]] = deque()
+        self._buffered_bytes = 0
+        self._enqueued = 0  # Sequence number of the last queued entry
+        self._durable = 0  # Sequence number of the last entry handled by the writer
+        self._failed = 0  # Sequence number of the last entry lost to a write error
+        self._failure_reported = 0  # Value of _failed last reported by flush()
+        self._flush_requested = False
+        self._closed = False
+        self._writer: Optional[threading.Thread] = None
+
+        # Trace id -> segment numbers holding its entries (most recent traces)
+        self._trace_segments: "OrderedDict[str, List[int]]" = OrderedDict()
+        self.recorder_id = self.config.recorder_id or uuid.uuid4().hex[:12]
+        self._segment_prefix = f"{self.SEGMENT_PREFIX}{self.recorder_id}-"
+        self._segment = self._latest_segment()
+        self._file = None
+
+        self.stats: Dict[str, int] = {
+            "written_entries": 0,
+            "dropped_entries": 0,
+            "flushes": 0,
+            "rotations": 0,
+            "write_errors": 0,
+        }
 
     def log_request(
         self,
@@ -124,22 +216,270 @@ class FlightRecorder:
         self._write_log(trace_id, log_entry)
 
     def _write_log(self, trace_id: str, entry: Dict[str, Any]) -> None:
-        """Write a log entry to the flight recorder."""
-        log_file = self.log_dir / f"{trace_id}.jsonl"
-        with open(log_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        """Queue a log entry for the background writer."""
+        line = json.dumps(entry) + "\n"
+        config = self.config
+        with self._cond:
+            if self._closed:
+                self.stats["dropped_entries"] += 1
+                return
+            if len(self._buffer) >= config.max_buffered_entries:
+                # The writer wakes on a full buffer; until it drains, apply the policy
+                if config.overflow_policy == "drop_oldest":
+                    _, _, oldest = self._buffer.popleft()
+                    self._buffered_bytes -= len(oldest)
+                    self.stats["dropped_entries"] += 1
+                elif config.overflow_policy == "block":
+                    self._cond.wait_for(
+                        lambda: len(self._buffer) < config.max_buffered_entries or self._closed,
+                        timeout=config.block_timeout_seconds
+                    )
+                if len(self._buffer) >= config.max_buffered_entries or self._closed:
+                    self.stats["dropped_entries"] += 1
+                    return
+
+            self._enqueued += 1
+            self._buffer.append((self._enqueued, trace_id, line))
+            self._buffered_bytes += len(line)
+            if self._writer is None:
+                self._start_writer()
+            elif (self._buffered_bytes >= config.flush_bytes
+                  or len(self._buffer) >= config.max_buffered_entries):
+                self._cond.notify_all()
+
+    def _start_writer(self) -> None:
+        """Start the background writer. Caller holds the lock."""
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="iatp-flight-recorder", daemon=True
+        )
+        self._writer.start()
+        _live_recorders.add(self)
+
+    def _writer_loop(self) -> None:
+        config = self.config
+        last_sync = time.monotonic()
+        unsynced_bytes = 0
+        written = 0  # Sequence number of the last entry written
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed or self._flush_requested
+                    or self._buffered_bytes >= config.flush_bytes
+                    or len(self._buffer) >= config.max_buffered_entries,
+                    timeout=config.flush_interval_seconds
+                )
+                batch = list(self._buffer)
+                self._buffer.clear()
+                self._buffered_bytes = 0
+                flush_requested, self._flush_requested = self._flush_requested, False
+                closing = self._closed
+                # Wake producers waiting for buffer space
+                self._cond.notify_all()
+
+            failed = False
+            if batch:
+                batch_bytes = self._write_batch(batch)
+                written = batch[-1][0]
+                if batch_bytes is None:
+                    # Entries buffered in the dropped file are lost too
+                    failed = True
+                    unsynced_bytes = 0
+                else:
+                    unsynced_bytes += batch_bytes
+
+            now = time.monotonic()
+            if unsynced_bytes and (
+                flush_requested or closing or unsynced_bytes >= config.flush_bytes
+                or now - last_sync >= config.flush_interval_seconds
+            ):
+                failed = not self._sync()
+                unsynced_bytes = 0
+                last_sync = now
+
+            with self._cond:
+                if failed:
+                    self._failed = written
+                if not unsynced_bytes:
+                    self._durable = written
+                self._cond.notify_all()
+                if closing and not self._buffer:
+                    break
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write_batch(self, batch: List[Tuple[int, str, str]]) -> Optional[int]:
+        """
+        Append a batch to the current segment, rotating as needed.
+
+        Returns:
+            Bytes written, or None if a write failed
+        """
+        written = 0
+        try:
+            for _, trace_id, line in batch:
+                if self._file is None:
+                    self._open_segment()
+                elif self._file.tell() >= self.config.max_file_bytes:
+                    self._rotate()
+                self._file.write(line)
+                written += len(line)
+                segments = self._trace_segments.get(trace_id)
+                if segments is None:
+                    with self._cond:
+                        self._trace_segments[trace_id] = [self._segment]
+                        if len(self._trace_segments) > self.config.max_indexed_traces:
+                            self._trace_segments.popitem(last=False)
+                elif segments[-1] != self._segment:
+                    segments.append(self._segment)
+            self.stats["written_entries"] += len(batch)
+        except OSError as e:
+            logger.error(f"Flight recorder write failed: {e}")
+            self.stats["write_errors"] += 1
+            self._discard_file()
+            return None
+        return written
+
+    def _sync(self) -> bool:
+        """Flush (and fsync) the current segment. Returns False on failure."""
+        if self._file is None:
+            return True
+        try:
+            self._file.flush()
+            if self.config.fsync:
+                os.fsync(self._file.fileno())
+            self.stats["flushes"] += 1
+            return True
+        except OSError as e:
+            logger.error(f"Flight recorder flush failed: {e}")
+            self.stats["write_errors"] += 1
+            self._discard_file()
+            return False
+
+    def _discard_file(self) -> None:
+        """Drop the current segment handle after an error; the next write reopens it."""
+        file, self._file = self._file, None
+        if file is not None:
+            try:
+                file.close()
+            except OSError:
+                pass
+
+    def _segment_path(self, number: int) -> Path:
+        return self.log_dir / f"{self._segment_prefix}{number:06d}.jsonl"
+
+    def _segment_numbers(self) -> List[int]:
+        """Numbers of this recorder's segments, oldest first."""
+        numbers = []
+        for path in self.log_dir.glob(f"{self._segment_prefix}*.jsonl"):
+            suffix = path.stem[len(self._segment_prefix):]
+            if suffix.isdigit():
+                numbers.append(int(suffix))
+        return sorted(numbers)
+
+    def _latest_segment(self) -> int:
+        numbers = self._segment_numbers()
+        return numbers[-1] if numbers else 1
+
+    def _open_segment(self) -> None:
+        self._file = open(self._segment_path(self._segment), "a", buffering=1024 * 1024)
+
+    def _rotate(self) -> None:
+        """Start a new segment and delete the oldest beyond ``max_files``."""
+        if not self._sync():
+            raise OSError(f"could not flush segment {self._segment} before rotating")
+        self._file.close()
+        self._segment += 1
+        self._open_segment()
+        self.stats["rotations"] += 1
+        self._prune()
+
+    def _prune(self) -> None:
+        """Delete the oldest segments in the directory beyond ``max_files``."""
+        active = {
+            recorder._segment_path(recorder._segment)
+            for recorder in list(_live_recorders)
+            if recorder.log_dir == self.log_dir
+        }
+        segments = []
+        for path in self.log_dir.glob(f"{self.SEGMENT_PREFIX}*.jsonl"):
+            try:
+                segments.append((path.stat().st_mtime, path.name, path))
+            except OSError:
+                continue
+        segments.sort(reverse=True)
+        for _, _, path in segments[self.config.max_files:]:
+            if path in active:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every entry logged so far has been written and flushed.
+
+        Returns:
+            True if flushed, False on timeout or if entries were lost to a
+            write or flush error since the previous call
+        """
+        with self._cond:
+            if self._writer is None or not self._writer.is_alive():
+                done = self._durable >= self._enqueued
+            else:
+                target = self._enqueued
+                self._flush_requested = True
+                self._cond.notify_all()
+                done = self._cond.wait_for(lambda: self._durable >= target, timeout=timeout)
+            lost = self._failed > self._failure_reported
+            self._failure_reported = self._failed
+            return done and not lost
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush everything queued and stop the background writer."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            writer = self._writer
+        if writer is not None:
+            writer.join(timeout)
+        _live_recorders.discard(self)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Writer counters plus the number of entries waiting in the buffer."""
+        with self._cond:
+            return {**self.stats, "buffered_entries": len(self._buffer)}
 
     def get_trace_logs(self, trace_id: str) -> List[Dict[str, Any]]:
         """Retrieve all log entries for a given trace ID."""
-        log_file = self.log_dir / f"{trace_id}.jsonl"
-        if not log_file.exists():
-            return []
+        self.flush()
+
+        with self._cond:
+            paths = [self._segment_path(n) for n in self._trace_segments.get(trace_id, ())]
+        if not paths:
+            # Not indexed (older trace or written by another recorder): scan all
+            paths = sorted(self.log_dir.glob(f"{self.SEGMENT_PREFIX}*.jsonl"))
 
         logs = []
-        with open(log_file) as f:
-            for line in f:
-                if line.strip():
-                    logs.append(json.loads(line))
+        # Per-trace files written by earlier versions of the recorder
+        legacy_file = self.log_dir / f"{trace_id}.jsonl"
+        if legacy_file.exists():
+            with open(legacy_file) as f:
+                logs.extend(json.loads(line) for line in f if line.strip())
+
+        needle = json.dumps(trace_id)
+        for path in paths:
+            try:
+                with open(path) as f:
+                    for line in f:
+                        if needle in line:
+                            entry = json.loads(line)
+                            if entry.get("trace_id") == trace_id:
+                                logs.append(entry)
+            except FileNotFoundError:
+                continue
         return logs
 
 
@@ -207,3 +207,76 @@ class TestRealCryptoSignAndVerify:
         is_valid, error = v.validate_attestation(attestation, verify_signature=True)
         assert not is_valid
         assert "expired" in error.lower()
+
+
+class TestVerificationCaching:
+    def test_repeat_verification_skips_crypto(self, keypair, validator_with_key, monkeypatch):
+        """A verified attestation is not re-verified within the TTL."""
+        priv_b64, _ = keypair
+        v = validator_with_key
+        attestation = v.create_attestation("agent-001", "aabb", "ccdd", "test-key", priv_b64)
+        assert v.validate_attestation(attestation) == (True, None)
+
+        def fail(*args):
+            raise AssertionError("signature verified again")
+
+        monkeypatch.setattr(v, "_get_public_key", fail)
+        assert v.validate_attestation(attestation) == (True, None)
+
+    def test_tampered_copy_of_cached_attestation_rejected(self, keypair, validator_with_key):
+        """Caching a valid attestation must not vouch for a modified one."""
+        priv_b64, _ = keypair
+        v = validator_with_key
+        attestation = v.create_attestation("agent-001", "aabb", "ccdd", "test-key", priv_b64)
+        assert v.validate_attestation(attestation) == (True, None)
+
+        attestation.codebase_hash = "deadbeef"
+        is_valid, _ = v.validate_attestation(attestation)
+        assert not is_valid
+
+    def test_key_rotation_invalidates_cache(self, keypair, validator_with_key):
+        """Replacing a trusted key drops cached keys and verifications."""
+        priv_b64, _ = keypair
+        v = validator_with_key
+        attestation = v.create_attestation("agent-001", "aabb", "ccdd", "test-key", priv_b64)
+        assert v.validate_attestation(attestation) == (True, None)
+
+        _, other_pub = generate_ed25519_keypair()
+        v.add_trusted_key("test-key", other_pub)
+        is_valid, _ = v.validate_attestation(attestation)
+        assert not is_valid
+
+    def test_cache_entries_expire(self, keypair, monkeypatch):
+        """Verifications older than the TTL are checked again."""
+        import iatp.attestation as attestation_module
+
+        priv_b64, pub_b64 = keypair
+        v = AttestationValidator({"test-key": pub_b64}, verified_cache_ttl_seconds=10)
+        attestation = v.create_attestation("agent-001", "aabb", "ccdd", "test-key", priv_b64)
+        v.validate_attestation(attestation)
+        assert len(v._verified) == 1
+
+        now = attestation_module.time.monotonic()
+        monkeypatch.setattr(attestation_module.time, "monotonic", lambda: now + 11)
+        calls = []
+        original = v._get_public_key
+        monkeypatch.setattr(v, "_get_public_key", lambda *a: calls.append(a) or original(*a))
+
+        assert v.validate_attestation(attestation) == (True, None)
+        assert len(calls) == 1
+
+    def test_verify_many_preserves_order(self, keypair, validator_with_key):
+        """Batch verification returns one result per input, in order."""
+        priv_b64, _ = keypair
+        v = validator_with_key
+        good = [
+            v.create_attestation(f"agent-{i}", "aabb", "ccdd", "test-key", priv_b64)
+            for i in range(20)
+        ]
+        bad = v.create_attestation("agent-bad", "aabb", "ccdd", "test-key", None)
+        batch = good[:10] + [bad] + good[10:]
+
+        results = v.verify_many(batch, max_workers=4)
+
+        assert [ok for ok, _ in results] == [True] * 10 + [False] + [True] * 10
+        assert "invalid signature" in results[10][1].lower()
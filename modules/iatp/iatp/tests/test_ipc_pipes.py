@@ -0,0 +1,181 @@
+"""
+Tests for IATP typed pipes and pipelines.
+"""
+import asyncio
+
+import pytest
+
+from iatp.ipc_pipes import (
+    AgentPipelineStage,
+    Pipeline,
+    PolicyCheckPipe,
+    get_current_trace_id,
+)
+
+
+class SlowAgent:
+    """Agent that sleeps, records overlap, and tags payloads."""
+
+    def __init__(self, tag: str, delay: float = 0.01):
+        self.tag = tag
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.traces = []
+
+    async def process(self, payload):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.traces.append(get_current_trace_id())
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return f"{payload}|{self.tag}"
+
+
+class DropOdd:
+    """Agent that filters out odd numbers."""
+
+    def process(self, payload):
+        return payload if payload % 2 == 0 else None
+
+
+@pytest.mark.asyncio
+async def test_execute_runs_all_stages():
+    """Test a single message passes through every stage and the pipe."""
+    pipeline = Pipeline([
+        AgentPipelineStage(SlowAgent("a", 0), "a"),
+        PolicyCheckPipe(),
+        AgentPipelineStage(SlowAgent("b", 0), "b"),
+    ])
+
+    result = await pipeline.execute("in", trace_id="trace-1")
+
+    assert result.payload == "in|a|b"
+    assert result.trace_id == "trace-1"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_execute_keeps_trace_per_call():
+    """Test concurrent calls through a shared pipe keep their own trace and payload."""
+    agent = SlowAgent("a")
+    pipeline = Pipeline([
+        AgentPipelineStage(agent, "a"),
+        PolicyCheckPipe(),
+        AgentPipelineStage(SlowAgent("b"), "b"),
+    ])
+
+    results = await asyncio.gather(
+        *(pipeline.execute(i, trace_id=f"trace-{i}") for i in range(10))
+    )
+
+    for i, result in enumerate(results):
+        assert result.payload == f"{i}|a|b"
+        assert result.trace_id == f"trace-{i}"
+    assert sorted(agent.traces) == sorted(f"trace-{i}" for i in range(10))
+    assert get_current_trace_id() is None
+
+
+@pytest.mark.asyncio
+async def test_stream_overlaps_stages_and_preserves_order():
+    """Test streaming keeps stages busy concurrently and yields in input order."""
+    first, second = SlowAgent("a"), SlowAgent("b")
+    pipeline = Pipeline([
+        AgentPipelineStage(first, "a", workers=4),
+        AgentPipelineStage(second, "b"),
+    ])
+
+    results = [m.payload async for m in pipeline.stream(range(20), trace_id="t")]
+
+    assert results == [f"{i}|a|b" for i in range(20)]
+    assert first.peak == 4
+    assert second.peak == 1
+    assert set(first.traces) == {"t"}
+
+
+@pytest.mark.asyncio
+async def test_stream_skips_filtered_messages():
+    """Test filtered inputs produce no output and do not stall ordering."""
+    pipeline = Pipeline([AgentPipelineStage(DropOdd(), "filter")])
+
+    async def inputs():
+        for i in range(10):
+            yield i
+
+    results = [m.payload async for m in pipeline.stream(inputs())]
+
+    assert results == [0, 2, 4, 6, 8]
+
+
+@pytest.mark.asyncio
+async def test_stream_backpressure_bounds_reads():
+    """Test inputs are only read as fast as a slow consumer allows."""
+    pipeline = Pipeline([AgentPipelineStage(SlowAgent("a", 0), "a")], queue_size=2)
+    produced = 0
+
+    def inputs():
+        nonlocal produced
+        for i in range(1000):
+            produced += 1
+            yield i
+
+    stream = pipeline.stream(inputs())
+    await stream.__anext__()
+    await asyncio.sleep(0.05)
+
+    # Bounded by the two queues (2 each) plus the messages held by workers
+    assert produced < 10
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stream_propagates_stage_errors():
+    """Test a failing stage aborts the stream with its exception."""
+    class Failing:
+        async def process(self, payload):
+            if payload == 3:
+                raise ValueError("bad payload")
+            return payload
+
+    pipeline = Pipeline([AgentPipelineStage(Failing(), "failing")])
+
+    with pytest.raises(ValueError, match="bad payload"):
+        async for _ in pipeline.stream(range(10)):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_stream_propagates_input_errors():
+    """Test an input iterator that raises aborts the stream instead of hanging."""
+    pipeline = Pipeline([AgentPipelineStage(SlowAgent("a", 0), "a")])
+
+    def inputs():
+        yield 1
+        raise RuntimeError("source broke")
+
+    async def drain():
+        return [m async for m in pipeline.stream(inputs())]
+
+    with pytest.raises(RuntimeError, match="source broke"):
+        await asyncio.wait_for(drain(), timeout=5.0)
+
+
+@pytest.mark.asyncio
+async def test_stream_ordered_bounds_held_results():
+    """Test a slow first message cannot make later results pile up unbounded."""
+    class SlowFirst:
+        def __init__(self):
+            self.started = 0
+
+        async def process(self, payload):
+            self.started += 1
+            await asyncio.sleep(0.1 if payload == 0 else 0)
+            return payload
+
+    agent = SlowFirst()
+    pipeline = Pipeline([AgentPipelineStage(agent, "a", workers=8)], queue_size=4)
+    stream = pipeline.stream(range(1000))
+
+    assert (await stream.__anext__()).payload == 0
+    # Only the queue_size inputs in flight could start before the first finished
+    assert agent.started <= 4 + 1
+    await stream.aclose()
@@ -54,6 +54,38 @@ def test_detect_email():
     assert "email" in sensitive
 
 
+def test_detect_sensitive_data_nested_fields():
+    """Test detection walks nested values, keys and long integers."""
+    validator = SecurityValidator()
+
+    payload = {
+        "items": [{"note": "ok"}, {"notes": ("call 123-45-6789",)}],
+        "billing": {"card": 4532015112830366},
+        "user@example.com": True,
+    }
+    assert validator.detect_sensitive_data(payload) == ["credit_card", "ssn", "email"]
+    assert validator.detect_sensitive_data({"count": 12345, "text": "no pii"}) == []
+
+
+def test_detect_card_number_in_email_local_part():
+    """Test a card-like email local part is reported as both types."""
+    validator = SecurityValidator()
+
+    sensitive = validator.detect_sensitive_data({"data": "4532015112830366@example.com"})
+
+    assert sensitive == ["credit_card", "email"]
+
+
+def test_detect_sensitive_data_field_size_cap():
+    """Test text beyond MAX_FIELD_CHARS in a single field is not scanned."""
+    validator = SecurityValidator()
+    padding = "x " * (SecurityValidator.MAX_FIELD_CHARS // 2)
+
+    assert validator.detect_sensitive_data({"data": "123-45-6789 " + padding}) == ["ssn"]
+    assert validator.detect_sensitive_data({"data": padding + "123-45-6789"}) == []
+    assert validator.detect_sensitive_data({"a": padding, "b": "123-45-6789"}) == ["ssn"]
+
+
 def test_validate_privacy_policy_blocks_credit_card_forever():
     """Test that credit cards are blocked for permanent retention."""
     validator = SecurityValidator()
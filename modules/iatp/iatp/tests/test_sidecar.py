@@ -1,6 +1,9 @@
 """
 Integration tests for the IATP Sidecar.
 """
+import asyncio
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
@@ -12,7 +15,7 @@ from iatp.models import (
     ReversibilityLevel,
     TrustLevel,
 )
-from iatp.sidecar import create_sidecar
+from iatp.sidecar import UpstreamPoolConfig, create_sidecar
 
 
 @pytest.fixture
@@ -163,3 +166,120 @@ def test_trace_id_injection(trusted_manifest):
     # Even if backend fails, trace ID should be in error response
     data = response.json()
     assert "trace_id" in data
+
+
+def _mock_upstream(sidecar, calls):
+    """Route the sidecar's pooled client to an in-process upstream."""
+    created = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"echo": request.headers["X-Agent-Trace-ID"]})
+
+    def create_client():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        created.append(client)
+        return client
+
+    sidecar._create_client = create_client
+    return created
+
+
+def test_upstream_pool_reused_and_closed_with_lifespan(trusted_manifest):
+    """Test one pooled client serves all requests and closes on shutdown."""
+    sidecar = create_sidecar(
+        agent_url="http://upstream.local/agent",
+        manifest=trusted_manifest,
+        pool_config=UpstreamPoolConfig(max_connections=4)
+    )
+    calls = []
+    created = _mock_upstream(sidecar, calls)
+
+    with TestClient(sidecar.app) as client:
+        for i in range(5):
+            response = client.post(
+                "/proxy", json={"task": i}, headers={"X-Agent-Trace-ID": f"t-{i}"}
+            )
+            assert response.status_code == 200
+            assert response.json() == {"echo": f"t-{i}"}
+
+    assert len(calls) == 5
+    assert len(created) == 1
+    assert created[0].is_closed
+
+
+def test_manifest_validation_cached_until_manifest_changes(trusted_manifest, untrusted_manifest):
+    """Test manifest checks run once per manifest, and a new manifest re-validates."""
+    sidecar = create_sidecar(agent_url="http://upstream.local/agent", manifest=trusted_manifest)
+    _mock_upstream(sidecar, [])
+    evaluations = []
+    validate = sidecar.policy_engine.validate_manifest
+
+    def counting_validate(manifest):
+        evaluations.append(manifest.agent_id)
+        return validate(manifest)
+
+    sidecar.policy_engine.validate_manifest = counting_validate
+
+    with TestClient(sidecar.app) as client:
+        for _ in range(3):
+            assert client.post("/proxy", json={"task": "x"}).status_code == 200
+        assert evaluations == ["test-trusted-agent"]
+
+        sidecar.manifest = untrusted_manifest
+        assert client.post("/proxy", json={"task": "x"}).status_code == 449
+        assert evaluations == ["test-trusted-agent", "test-untrusted-agent"]
+
+        sidecar.invalidate_validation_cache()
+        client.post("/proxy", json={"task": "x"})
+        assert len(evaluations) == 3
+
+
+def test_manifest_validation_cache_follows_policy_rules(untrusted_manifest):
+    """Test adding a policy rule re-validates without a manual invalidation."""
+    sidecar = create_sidecar(agent_url="http://upstream.local/agent", manifest=untrusted_manifest)
+    _mock_upstream(sidecar, [])
+
+    with TestClient(sidecar.app) as client:
+        headers = {"X-User-Override": "true"}
+        assert client.post("/proxy", json={"task": "x"}, headers=headers).status_code == 200
+
+        sidecar.policy_engine.add_custom_rule({
+            "name": "DenyUntrusted",
+            "action": "deny",
+            "conditions": {"trust_level": ["untrusted"]},
+        })
+        assert client.post("/proxy", json={"task": "x"}, headers=headers).status_code == 403
+
+
+def test_upstream_client_closed_when_event_loop_changes(trusted_manifest):
+    """Test a client left over from an earlier event loop is closed when replaced."""
+    sidecar = create_sidecar(agent_url="http://upstream.local/agent", manifest=trusted_manifest)
+    created = _mock_upstream(sidecar, [])
+
+    first = asyncio.run(sidecar._get_client())
+    second = asyncio.run(sidecar._get_client())
+
+    assert created == [first, second]
+    assert first.is_closed
+    assert not second.is_closed
+    asyncio.run(sidecar.shutdown())
+
+
+def test_trace_lookup_runs_off_the_event_loop(trusted_manifest):
+    """Test /trace reads the flight recorder in a worker thread."""
+    sidecar = create_sidecar(agent_url="http://localhost:9999", manifest=trusted_manifest)
+    lookups = []
+
+    def get_trace_logs(trace_id):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            lookups.append(trace_id)
+        return [{"trace_id": trace_id}]
+
+    sidecar.flight_recorder.get_trace_logs = get_trace_logs
+    response = TestClient(sidecar.app).get("/trace/trace-1")
+
+    assert response.status_code == 200
+    assert lookups == ["trace-1"]
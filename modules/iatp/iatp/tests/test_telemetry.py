@@ -3,6 +3,7 @@ Unit tests for IATP telemetry module.
 """
 import shutil
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
@@ -13,7 +14,7 @@ from iatp.models import (
     PrivacyContract,
     RetentionPolicy,
 )
-from iatp.telemetry import FlightRecorder, TraceIDGenerator
+from iatp.telemetry import FlightRecorder, FlightRecorderConfig, TraceIDGenerator
 
 
 @pytest.fixture
@@ -171,3 +172,143 @@ def test_flight_recorder_nonexistent_trace(temp_log_dir):
     recorder = FlightRecorder(log_dir=temp_log_dir)
     logs = recorder.get_trace_logs("nonexistent-trace")
     assert logs == []
+
+
+def test_flight_recorder_batches_into_segment(temp_log_dir):
+    """Test entries are buffered and written to one segment file on flush."""
+    recorder = FlightRecorder(
+        log_dir=temp_log_dir,
+        config=FlightRecorderConfig(flush_interval_seconds=60, flush_bytes=10**9)
+    )
+    for i in range(50):
+        recorder.log_error(trace_id=f"trace-{i % 5}", agent_id="a", error="e")
+
+    assert recorder.flush(timeout=5)
+    assert [p.name for p in temp_log_dir.iterdir()] == [f"flight-{recorder.recorder_id}-000001.jsonl"]
+    assert len(recorder.get_trace_logs("trace-3")) == 10
+    assert recorder.get_stats()["written_entries"] == 50
+    recorder.close()
+
+
+def test_flight_recorder_rotates_by_size(temp_log_dir):
+    """Test segments rotate at max_file_bytes and old ones are deleted."""
+    recorder = FlightRecorder(
+        log_dir=temp_log_dir,
+        config=FlightRecorderConfig(max_file_bytes=2_000, max_files=3, fsync=False)
+    )
+    for i in range(200):
+        recorder.log_error(trace_id=f"trace-{i}", agent_id="a", error="x" * 50)
+    recorder.close()
+
+    segments = sorted(p.name for p in temp_log_dir.iterdir())
+    assert len(segments) == 3
+    assert recorder.get_stats()["rotations"] > 3
+    assert recorder.get_trace_logs("trace-199")
+    assert recorder.get_trace_logs("trace-0") == []
+
+
+def test_flight_recorders_sharing_dir_keep_their_segments(temp_log_dir):
+    """Test a recorder never rotates away the segment another live one writes to."""
+    config = dict(max_file_bytes=2_000, max_files=2, fsync=False)
+    first = FlightRecorder(log_dir=temp_log_dir, config=FlightRecorderConfig(**config))
+    first.log_error(trace_id="first", agent_id="a", error="one")
+    assert first.flush(timeout=5)
+    second = FlightRecorder(log_dir=temp_log_dir, config=FlightRecorderConfig(**config))
+    for i in range(200):
+        second.log_error(trace_id=f"trace-{i}", agent_id="a", error="x" * 50)
+    second.close()
+    first.log_error(trace_id="first", agent_id="a", error="two")
+    first.close()
+
+    assert [e["error"] for e in first.get_trace_logs("first")] == ["one", "two"]
+    names = [p.name for p in temp_log_dir.iterdir()]
+    assert sum(name.startswith(f"flight-{second.recorder_id}-") for name in names) == 2
+
+
+def test_flight_recorder_prunes_segments_from_earlier_runs(temp_log_dir):
+    """Test max_files also removes segments left by recorders that have exited."""
+    config = dict(max_file_bytes=2_000, max_files=3, fsync=False)
+    for _ in range(3):
+        recorder = FlightRecorder(log_dir=temp_log_dir, config=FlightRecorderConfig(**config))
+        for i in range(100):
+            recorder.log_error(trace_id=f"trace-{i}", agent_id="a", error="x" * 50)
+        recorder.close()
+
+    names = [p.name for p in temp_log_dir.iterdir()]
+    assert len(names) == 3
+    assert all(name.startswith(f"flight-{recorder.recorder_id}-") for name in names)
+
+
+def test_flight_recorder_resumes_with_stable_id(temp_log_dir):
+    """Test a recorder with the same recorder_id appends to the previous run's segment."""
+    config = FlightRecorderConfig(recorder_id="sidecar")
+    for error in ("one", "two"):
+        recorder = FlightRecorder(log_dir=temp_log_dir, config=config)
+        recorder.log_error(trace_id="trace", agent_id="a", error=error)
+        recorder.close()
+
+    assert [p.name for p in temp_log_dir.iterdir()] == ["flight-sidecar-000001.jsonl"]
+
+
+def test_flight_recorder_flush_reports_write_errors(temp_log_dir):
+    """Test flush() returns False when entries were lost to a write error."""
+    recorder = FlightRecorder(log_dir=temp_log_dir)
+    open_segment = recorder._open_segment
+
+    def failing_open():
+        raise OSError("disk full")
+
+    recorder._open_segment = failing_open
+    recorder.log_error(trace_id="trace", agent_id="a", error="lost")
+    assert recorder.flush(timeout=5) is False
+    assert recorder.get_stats()["write_errors"] == 1
+
+    recorder._open_segment = open_segment
+    recorder.log_error(trace_id="trace", agent_id="a", error="kept")
+    assert recorder.flush(timeout=5) is True
+    assert [e["error"] for e in recorder.get_trace_logs("trace")] == ["kept"]
+    recorder.close()
+
+
+def test_flight_recorder_drops_when_buffer_full(temp_log_dir):
+    """Test a full buffer drops entries and counts them."""
+    recorder = FlightRecorder(
+        log_dir=temp_log_dir,
+        config=FlightRecorderConfig(max_buffered_entries=5, overflow_policy="drop_newest")
+    )
+    release = threading.Event()
+    write_batch = recorder._write_batch
+
+    def stalled_write(batch):
+        release.wait(5)
+        return write_batch(batch)
+
+    recorder._write_batch = stalled_write
+    for i in range(30):
+        recorder.log_error(trace_id="trace", agent_id="a", error=str(i))
+    release.set()
+    recorder.close()
+
+    stats = recorder.get_stats()
+    assert stats["dropped_entries"] > 0
+    assert stats["written_entries"] + stats["dropped_entries"] == 30
+
+
+def test_flight_recorder_close_flushes_and_rejects(temp_log_dir):
+    """Test close writes pending entries and later entries are dropped."""
+    recorder = FlightRecorder(
+        log_dir=temp_log_dir,
+        config=FlightRecorderConfig(flush_interval_seconds=60, flush_bytes=10**9)
+    )
+    recorder.log_error(trace_id="trace", agent_id="a", error="before")
+    recorder.close()
+    recorder.log_error(trace_id="trace", agent_id="a", error="after")
+
+    assert [e["error"] for e in FlightRecorder(log_dir=temp_log_dir).get_trace_logs("trace")] == ["before"]
+    assert recorder.get_stats()["dropped_entries"] == 1
+
+
+def test_flight_recorder_invalid_overflow_policy(temp_log_dir):
+    """Test unknown overflow policies are rejected."""
+    with pytest.raises(ValueError):
+        FlightRecorder(log_dir=temp_log_dir, config=FlightRecorderConfig(overflow_policy="spill"))
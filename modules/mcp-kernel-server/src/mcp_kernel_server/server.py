@@ -50,6 +50,10 @@ class ServerConfig:
     policy_mode: str = "strict"
     cmvk_threshold: float = 0.85
     vfs_backend: str = "memory"
+    # Stdio transport: requests executing at once, and requests read ahead
+    # of completion before the transport stops reading
+    max_in_flight_requests: int = 16
+    max_pending_requests: int = 256
 
 
 # =============================================================================
@@ -432,30 +436,108 @@ class KernelMCPServer:
         )
         writer = asyncio.StreamWriter(writer_transport, writer_protocol, reader, asyncio.get_event_loop())
         
+        await self.serve(reader, writer)
+    
+    async def serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve newline-delimited JSON-RPC from ``reader`` until EOF.
+        
+        Requests run concurrently (at most ``max_in_flight_requests`` at a
+        time) and each response is written as soon as it is ready, so
+        clients match responses to requests by id. Batch arrays get one
+        array response, notifications get none, and a
+        ``notifications/cancelled`` message cancels the named request.
+        """
+        slots = asyncio.Semaphore(self.config.max_in_flight_requests)
+        write_lock = asyncio.Lock()
+        pending: set[asyncio.Task] = set()
+        in_flight: dict[Any, asyncio.Task] = {}
+        
+        async def send(payload: Any) -> None:
+            async with write_lock:
+                writer.write((json.dumps(payload) + "\n").encode())
+                await writer.drain()
+        
+        def start(message: Any) -> asyncio.Task:
+            async def run() -> dict:
+                async with slots:
+                    return await self._handle_jsonrpc(message)
+            
+            task = asyncio.ensure_future(run())
+            if isinstance(message, dict) and "id" in message:
+                request_id = message["id"]
+                in_flight[request_id] = task
+                
+                def forget(done: asyncio.Task) -> None:
+                    if in_flight.get(request_id) is done:
+                        del in_flight[request_id]
+                
+                task.add_done_callback(forget)
+            return task
+        
+        async def respond(message: Any) -> None:
+            try:
+                response = await start(message)
+            except asyncio.CancelledError:
+                return  # Cancelled requests get no response
+            if _expects_response(message):
+                await send(response)
+        
+        async def respond_batch(messages: list) -> None:
+            results = await asyncio.gather(
+                *(start(m) for m in messages), return_exceptions=True
+            )
+            responses = [
+                r for m, r in zip(messages, results)
+                if _expects_response(m) and isinstance(r, dict)
+            ]
+            if responses:
+                await send(responses)
+        
         while True:
             try:
                 line = await reader.readline()
                 if not line:
                     break
+                if not line.strip():
+                    continue
                 
-                request = json.loads(line.decode())
-                response = await self._handle_jsonrpc(request)
+                message = json.loads(line.decode())
                 
-                writer.write((json.dumps(response) + "\n").encode())
-                await writer.drain()
+                if isinstance(message, dict) and message.get("method") == "notifications/cancelled":
+                    params = message.get("params") or {}
+                    task = in_flight.get(params.get("requestId"))
+                    if task is not None:
+                        logger.info(f"Cancelling request {params.get('requestId')}: {params.get('reason', '')}")
+                        task.cancel()
+                    continue
+                
+                if isinstance(message, list):
+                    if not message:
+                        await send(_jsonrpc_error(-32600, "Invalid Request: empty batch", None))
+                        continue
+                    task = asyncio.ensure_future(respond_batch(message))
+                else:
+                    task = asyncio.ensure_future(respond(message))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+                
+                # Stop reading ahead when too many requests are outstanding
+                if len(pending) >= self.config.max_pending_requests:
+                    await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
                 
             except Exception as e:
                 logger.exception("Stdio handler error")
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "error": {"code": -32603, "message": str(e)},
-                    "id": None
-                }
-                writer.write((json.dumps(error_response) + "\n").encode())
-                await writer.drain()
+                await send(_jsonrpc_error(-32603, str(e), None))
+        
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
     
     async def _handle_jsonrpc(self, request: dict) -> dict:
         """Handle JSON-RPC request."""
+        if not isinstance(request, dict):
+            return _jsonrpc_error(-32600, "Invalid Request", None)
+        
         method = request.get("method", "")
         params = request.get("params", {})
         request_id = request.get("id")
@@ -511,6 +593,19 @@ class KernelMCPServer:
         logger.info("Stopping MCP Kernel Server")
 
 
+def _expects_response(message: Any) -> bool:
+    """JSON-RPC notifications (requests without an id) get no response."""
+    return not isinstance(message, dict) or "id" in message
+
+
+def _jsonrpc_error(code: int, message: str, request_id: Any) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "error": {"code": code, "message": message},
+        "id": request_id
+    }
+
+
 # =========================================================================
 # Stateless Execution Helper (for direct integration)
 # =========================================================================
@@ -3,11 +3,13 @@
 import sys
 import os
 import json
+import asyncio
 import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from mcp_kernel_server.server import KernelMCPServer, ServerConfig, stateless_execute
+from mcp_kernel_server.tools import ToolResult
 
 
 class TestServerConfig:
@@ -133,6 +135,120 @@ class TestKernelMCPServer:
         assert result["isError"] is True
 
 
+class SleepTool:
+    """Tool that sleeps for the requested time and tracks concurrency."""
+
+    name = "sleep"
+    description = "Sleep"
+    input_schema = {"type": "object"}
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def execute(self, arguments):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(arguments.get("seconds", 0))
+        finally:
+            self.active -= 1
+        return ToolResult(success=True, data={"slept": arguments.get("seconds", 0)})
+
+
+class CollectingWriter:
+    """Stand-in StreamWriter that records each written JSON line."""
+
+    def __init__(self):
+        self.messages = []
+
+    def write(self, data):
+        self.messages.append(json.loads(data))
+
+    async def drain(self):
+        pass
+
+
+def _call(request_id, seconds):
+    return {"jsonrpc": "2.0", "id": request_id, "method": "tools/call",
+            "params": {"name": "sleep", "arguments": {"seconds": seconds}}}
+
+
+class TestConcurrentStdio:
+    """Tests for KernelMCPServer.serve() dispatch."""
+
+    def setup_method(self):
+        self.server = KernelMCPServer(ServerConfig(max_in_flight_requests=2))
+        self.tool = SleepTool()
+        self.server.tools["sleep"] = self.tool
+
+    async def _serve(self, *lines):
+        reader = asyncio.StreamReader()
+        writer = CollectingWriter()
+
+        async def feed():
+            for line in lines:
+                if isinstance(line, (int, float)):
+                    await asyncio.sleep(line)
+                    continue
+                payload = line if isinstance(line, str) else json.dumps(line)
+                reader.feed_data((payload + "\n").encode())
+            reader.feed_eof()
+
+        await asyncio.gather(self.server.serve(reader, writer), feed())
+        return writer.messages
+
+    @pytest.mark.asyncio
+    async def test_fast_request_overtakes_slow_one(self):
+        messages = await self._serve(_call(1, 0.1), _call(2, 0))
+        assert [m["id"] for m in messages] == [2, 1]
+        assert messages[1]["result"]["isError"] is False
+
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_bounded(self):
+        messages = await self._serve(*(_call(i, 0.02) for i in range(6)))
+        assert sorted(m["id"] for m in messages) == list(range(6))
+        assert self.tool.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_gets_single_array_response(self):
+        batch = [
+            {"jsonrpc": "2.0", "id": "a", "method": "initialize", "params": {}},
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {"jsonrpc": "2.0", "id": "b", "method": "tools/list"},
+            42,
+        ]
+        messages = await self._serve(batch)
+        assert len(messages) == 1
+        response = messages[0]
+        assert [r["id"] for r in response] == ["a", "b", None]
+        assert response[2]["error"]["code"] == -32600
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_is_invalid(self):
+        messages = await self._serve([])
+        assert messages[0]["error"]["code"] == -32600
+
+    @pytest.mark.asyncio
+    async def test_notifications_get_no_response(self):
+        messages = await self._serve(
+            {"jsonrpc": "2.0", "method": "notifications/initialized"}, _call(1, 0)
+        )
+        assert [m["id"] for m in messages] == [1]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_gets_no_response(self):
+        messages = await self._serve(
+            _call(1, 5),
+            _call(2, 0),
+            0.01,
+            {"jsonrpc": "2.0", "method": "notifications/cancelled",
+             "params": {"requestId": 1, "reason": "user abort"}},
+        )
+        assert [m["id"] for m in messages] == [2]
+        assert self.tool.active == 0
+
+
 class TestStatelessExecute:
     @pytest.mark.asyncio
     async def test_basic_execute(self):
@@ -5,9 +5,12 @@ Client for Agent OS agents to interact with Nexus.
 Handles registration, peer verification, and reputation sync.
 """
 
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Optional, Literal
+from functools import partial
+from typing import Generic, Hashable, Optional, Literal, TypeVar
 import asyncio
+import time
 import aiohttp
 
 from .schemas.manifest import AgentManifest
@@ -22,6 +25,55 @@ from .exceptions import (
 )
 
 
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Bounded LRU cache whose entries expire after a fixed time-to-live.
+    
+    Used by NexusClient to remember peer verifications without holding
+    every peer ever seen forever.
+    """
+    
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return a live entry (refreshing its LRU position) or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: V) -> None:
+        """Store an entry, evicting the least recently used beyond maxsize."""
+        if self.maxsize <= 0 or self.ttl_seconds <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self, predicate=None) -> None:
+        """Drop every entry, or only those whose key matches ``predicate``."""
+        if predicate is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if predicate(k)]:
+            del self._entries[key]
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class NexusClient:
     """
     Client for Agent OS agents to interact with Nexus.
@@ -34,6 +86,11 @@ class NexusClient:
     - Reputation sync for local cache
     - Escrow/reward management
     - DMZ data transfer
+    
+    Remote calls share one pooled aiohttp session per client (close it with
+    ``close()`` or ``async with``). Peer verifications are cached in a
+    bounded LRU with TTL, and concurrent verifications of the same peer are
+    collapsed into a single request.
     """
     
     # Default API endpoints
@@ -48,17 +105,33 @@ class NexusClient:
         trust_threshold: int = DEFAULT_TRUST_THRESHOLD,
         # For local/testing - use in-memory components
         local_mode: bool = False,
+        max_connections: int = 100,
+        request_timeout_seconds: float = 30.0,
+        verification_cache_size: int = 10_000,
+        verification_ttl_seconds: float = 300.0,
     ):
         self.manifest = agent_manifest
         self.api_key = api_key
         self.base_url = api_url or self.DEFAULT_API_URL
         self.trust_threshold = trust_threshold
         self.local_mode = local_mode
+        self.max_connections = max_connections
+        self.request_timeout_seconds = request_timeout_seconds
         
-        # Local cache of peer reputations
+        # Local cache of peer reputations (replaced wholesale by sync_reputation)
         self._known_peers: dict[str, int] = {}  # DID -> Trust Score
         self._last_sync: Optional[datetime] = None
         
+        # Verified peers: (DID, threshold, capabilities) -> PeerVerification
+        self._verifications: TTLCache[PeerVerification] = TTLCache(
+            verification_cache_size, verification_ttl_seconds
+        )
+        self._inflight_verifications: dict[Hashable, asyncio.Future] = {}
+        
+        # Shared HTTP session, bound to the event loop that created it
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # For local mode testing
         if local_mode:
             self._local_registry = AgentRegistry()
@@ -85,14 +158,14 @@ class NexusClient:
             signature = self._generate_signature(self.manifest.model_dump())
             return await self._local_registry.register(self.manifest, signature)
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/agents",
-                json=self.manifest.model_dump(),
-                headers=self._headers(),
-            ) as resp:
-                data = await resp.json()
-                return RegistrationResult(**data)
+        session = await self._get_session()
+        async with session.post(
+            f"{self.base_url}/agents",
+            json=self.manifest.model_dump(),
+            headers=self._headers(),
+        ) as resp:
+            data = await resp.json()
+            return RegistrationResult(**data)
     
     async def update_manifest(self, manifest: AgentManifest) -> RegistrationResult:
         """Update this agent's manifest."""
@@ -102,14 +175,14 @@ class NexusClient:
             signature = self._generate_signature(manifest.model_dump())
             return await self._local_registry.update(self.agent_did, manifest, signature)
         
-        async with aiohttp.ClientSession() as session:
-            async with session.put(
-                f"{self.base_url}/agents/{self.agent_did}",
-                json=manifest.model_dump(),
-                headers=self._headers(),
-            ) as resp:
-                data = await resp.json()
-                return RegistrationResult(**data)
+        session = await self._get_session()
+        async with session.put(
+            f"{self.base_url}/agents/{self.agent_did}",
+            json=manifest.model_dump(),
+            headers=self._headers(),
+        ) as resp:
+            data = await resp.json()
+            return RegistrationResult(**data)
     
     async def deregister(self) -> bool:
         """Remove this agent from Nexus."""
@@ -117,12 +190,12 @@ class NexusClient:
             signature = self._generate_signature({"did": self.agent_did})
             return await self._local_registry.deregister(self.agent_did, signature)
         
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(
-                f"{self.base_url}/agents/{self.agent_did}",
-                headers=self._headers(),
-            ) as resp:
-                return resp.status == 200
+        session = await self._get_session()
+        async with session.delete(
+            f"{self.base_url}/agents/{self.agent_did}",
+            headers=self._headers(),
+        ) as resp:
+            return resp.status == 200
     
     # ==================== Peer Verification ====================
     
@@ -165,32 +238,66 @@ class NexusClient:
                     peer_did, cached_score, threshold
                 )
         
-        # Verify with Nexus API
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.base_url}/agents/{peer_did}/verify",
-                params={
-                    "min_score": threshold,
-                    "capabilities": ",".join(required_capabilities or []),
-                },
-                headers=self._headers(),
-            ) as resp:
-                if resp.status == 404:
-                    raise IATPUnverifiedPeerException(peer_did)
-                
-                data = await resp.json()
-                
-                if data.get("error") == "IATP_INSUFFICIENT_TRUST":
-                    raise IATPInsufficientTrustException(
-                        peer_did,
-                        data["current_score"],
-                        data["required_score"],
-                    )
-                
-                # Update cache
-                self._known_peers[peer_did] = data.get("trust_score", 0)
-                
-                return PeerVerification(**data)
+        key = (peer_did, threshold, tuple(sorted(required_capabilities or ())))
+        cached = self._verifications.get(key)
+        if cached is not None:
+            return cached
+        
+        # Collapse concurrent verifications of the same peer into one request
+        inflight = self._inflight_verifications.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(
+                self._fetch_verification(peer_did, threshold, required_capabilities)
+            )
+            self._inflight_verifications[key] = inflight
+            inflight.add_done_callback(partial(self._verification_done, key))
+        
+        verification = await asyncio.shield(inflight)
+        self._verifications.set(key, verification)
+        return verification
+    
+    async def _fetch_verification(
+        self,
+        peer_did: str,
+        threshold: int,
+        required_capabilities: Optional[list[str]],
+    ) -> PeerVerification:
+        """Verify a peer with the Nexus API."""
+        session = await self._get_session()
+        async with session.get(
+            f"{self.base_url}/agents/{peer_did}/verify",
+            params={
+                "min_score": threshold,
+                "capabilities": ",".join(required_capabilities or []),
+            },
+            headers=self._headers(),
+        ) as resp:
+            if resp.status == 404:
+                raise IATPUnverifiedPeerException(peer_did)
+            
+            data = await resp.json()
+            
+            if data.get("error") == "IATP_INSUFFICIENT_TRUST":
+                raise IATPInsufficientTrustException(
+                    peer_did,
+                    data["current_score"],
+                    data["required_score"],
+                )
+            
+            return PeerVerification(**data)
+    
+    def _verification_done(self, key: Hashable, future: asyncio.Future) -> None:
+        self._inflight_verifications.pop(key, None)
+        if not future.cancelled():
+            # Mark the error retrieved even if every waiter was cancelled
+            future.exception()
+    
+    def invalidate_peer(self, peer_did: Optional[str] = None) -> None:
+        """Forget cached verifications for one peer, or for all peers."""
+        if peer_did is None:
+            self._verifications.invalidate()
+        else:
+            self._verifications.invalidate(lambda key: key[0] == peer_did)
     
     async def quick_verify(self, peer_did: str) -> bool:
         """
@@ -230,13 +337,13 @@ class NexusClient:
         if self.local_mode:
             self._known_peers = await self._local_registry.get_reputation_sync()
         else:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/reputation/sync",
-                    headers=self._headers(),
-                ) as resp:
-                    data = await resp.json()
-                    self._known_peers = data.get("scores", {})
+            session = await self._get_session()
+            async with session.get(
+                f"{self.base_url}/reputation/sync",
+                headers=self._headers(),
+            ) as resp:
+                data = await resp.json()
+                self._known_peers = data.get("scores", {})
         
         self._last_sync = datetime.now(timezone.utc)
         return self._known_peers
@@ -252,16 +359,18 @@ class NexusClient:
             self._local_reputation.record_task_outcome(peer_did, outcome)
             return
         
-        async with aiohttp.ClientSession() as session:
-            await session.post(
-                f"{self.base_url}/reputation/{peer_did}/report",
-                json={
-                    "task_id": task_id,
-                    "reporter_did": self.agent_did,
-                    "outcome": outcome,
-                },
-                headers=self._headers(),
-            )
+        session = await self._get_session()
+        async with session.post(
+            f"{self.base_url}/reputation/{peer_did}/report",
+            json={
+                "task_id": task_id,
+                "reporter_did": self.agent_did,
+                "outcome": outcome,
+            },
+            headers=self._headers(),
+        ):
+            # The outcome changes the peer's score; re-verify next time
+            self.invalidate_peer(peer_did)
     
     # ==================== Escrow / Proof of Outcome ====================
     
@@ -292,19 +401,19 @@ class NexusClient:
             )
             return receipt.model_dump()
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/escrow",
-                json={
-                    "requester_did": self.agent_did,
-                    "provider_did": provider_did,
-                    "task_hash": task_hash,
-                    "credits": credits,
-                    "timeout_seconds": timeout_seconds,
-                },
-                headers=self._headers(),
-            ) as resp:
-                return await resp.json()
+        session = await self._get_session()
+        async with session.post(
+            f"{self.base_url}/escrow",
+            json={
+                "requester_did": self.agent_did,
+                "provider_did": provider_did,
+                "task_hash": task_hash,
+                "credits": credits,
+                "timeout_seconds": timeout_seconds,
+            },
+            headers=self._headers(),
+        ) as resp:
+            return await resp.json()
     
     async def release_escrow(
         self,
@@ -327,16 +436,16 @@ class NexusClient:
                 "credits_to_requester": resolution.credits_to_requester,
             }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/escrow/{escrow_id}/release",
-                json={
-                    "outcome": outcome,
-                    "output_hash": output_hash,
-                },
-                headers=self._headers(),
-            ) as resp:
-                return await resp.json()
+        session = await self._get_session()
+        async with session.post(
+            f"{self.base_url}/escrow/{escrow_id}/release",
+            json={
+                "outcome": outcome,
+                "output_hash": output_hash,
+            },
+            headers=self._headers(),
+        ) as resp:
+            return await resp.json()
     
     # ==================== DMZ Protocol ====================
     
@@ -404,20 +513,20 @@ class NexusClient:
             )
             return [m.model_dump() for m in manifests]
         
-        async with aiohttp.ClientSession() as session:
-            params = {"min_score": min_score, "limit": limit}
-            if capabilities:
-                params["capabilities"] = ",".join(capabilities)
-            if privacy_policy:
-                params["privacy_policy"] = privacy_policy
-            
-            async with session.get(
-                f"{self.base_url}/agents/discover",
-                params=params,
-                headers=self._headers(),
-            ) as resp:
-                data = await resp.json()
-                return data.get("agents", [])
+        session = await self._get_session()
+        params = {"min_score": min_score, "limit": limit}
+        if capabilities:
+            params["capabilities"] = ",".join(capabilities)
+        if privacy_policy:
+            params["privacy_policy"] = privacy_policy
+        
+        async with session.get(
+            f"{self.base_url}/agents/discover",
+            params=params,
+            headers=self._headers(),
+        ) as resp:
+            data = await resp.json()
+            return data.get("agents", [])
     
     # ==================== Credits ====================
     
@@ -426,16 +535,52 @@ class NexusClient:
         if self.local_mode:
             return self._local_escrow.get_agent_credits(self.agent_did)
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.base_url}/credits/{self.agent_did}",
-                headers=self._headers(),
-            ) as resp:
-                data = await resp.json()
-                return data.get("credits", 0)
+        session = await self._get_session()
+        async with session.get(
+            f"{self.base_url}/credits/{self.agent_did}",
+            headers=self._headers(),
+        ) as resp:
+            data = await resp.json()
+            return data.get("credits", 0)
     
     # ==================== Internal Helpers ====================
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared session, creating it on the running event loop.
+        
+        A session left over from an event loop that has since closed is
+        closed and replaced. Using the client from a second loop while the
+        session's loop is still open raises RuntimeError, since that session
+        cannot be closed from here; call close() on its own loop first.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._session
+        if session is not None and not session.closed and self._session_loop is not loop:
+            if not self._session_loop.is_closed():
+                raise RuntimeError(
+                    "NexusClient session belongs to another event loop; "
+                    "call close() on that loop before using the client here"
+                )
+            self._session = None
+            await session.close()
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    ttl_dns_cache=300,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout_seconds),
+            )
+            self._session_loop = loop
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+    
     def _headers(self) -> dict:
         """Get API request headers."""
         return {
@@ -461,4 +606,4 @@ class NexusClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         # Don't deregister on exit - agent should persist
-        pass
+        await self.close()
@@ -7,7 +7,9 @@ Manages agent registration, discovery, and manifest storage for the Nexus networ
 from datetime import datetime, timezone
 from typing import Optional, AsyncIterator
 from dataclasses import dataclass, field
+import bisect
 import hashlib
+import heapq
 import json
 import asyncio
 
@@ -69,6 +71,10 @@ class AgentRegistry:
     - Manifest storage and retrieval
     - Peer discovery and verification
     - Integration with reputation engine
+    
+    Discovery is served from secondary indexes (capability domain, privacy
+    policy, verification level) and a ranking ordered by trust score, so a
+    filtered top-k query only touches matching candidates.
     """
     
     def __init__(self, reputation_engine: Optional[ReputationEngine] = None):
@@ -79,6 +85,18 @@ class AgentRegistry:
         self._manifest_hashes: dict[str, str] = {}
         self._did_to_owner: dict[str, str] = {}
         
+        # Secondary indexes: attribute value -> DIDs
+        self._by_capability: dict[str, set[str]] = {}
+        self._by_privacy_policy: dict[str, set[str]] = {}
+        self._by_verification_level: dict[str, set[str]] = {}
+        # Keys each DID was indexed under, so unindexing does not depend on
+        # the stored manifest staying unmodified
+        self._indexed_keys: dict[str, tuple[frozenset[str], str, str]] = {}
+        
+        # (-trust_score, did) in ascending order, i.e. highest score first
+        self._ranking: list[tuple[int, str]] = []
+        self._indexed_scores: dict[str, int] = {}
+        
     async def register(
         self,
         manifest: AgentManifest,
@@ -134,6 +152,7 @@ class AgentRegistry:
         self._manifests[agent_did] = manifest
         self._manifest_hashes[agent_did] = manifest_hash
         self._did_to_owner[agent_did] = manifest.identity.owner_id
+        self._index(agent_did, manifest)
         
         # Generate Nexus attestation
         nexus_signature = self._sign_registration(agent_did, manifest_hash)
@@ -177,8 +196,10 @@ class AgentRegistry:
         
         # Update storage
         manifest_hash = self._compute_manifest_hash(manifest)
+        self._unindex(agent_did)
         self._manifests[agent_did] = manifest
         self._manifest_hashes[agent_did] = manifest_hash
+        self._index(agent_did, manifest)
         
         return RegistrationResult(
             success=True,
@@ -196,6 +217,7 @@ class AgentRegistry:
         
         # TODO: Verify signature
         
+        self._unindex(agent_did)
         del self._manifests[agent_did]
         del self._manifest_hashes[agent_did]
         del self._did_to_owner[agent_did]
@@ -284,46 +306,121 @@ class AgentRegistry:
         min_score: int = 500,
         privacy_policy: Optional[str] = None,
         limit: int = 100,
+        verification_level: Optional[str] = None,
     ) -> list[AgentManifest]:
         """
-        Discover agents matching criteria.
+        Discover the highest-scoring agents matching criteria.
         
         Args:
             capabilities: Required capability domains
             min_score: Minimum trust score
             privacy_policy: Required privacy policy (e.g., "ephemeral")
             limit: Maximum results
+            verification_level: Required verification tier (e.g., "verified")
             
         Returns:
-            List of matching agent manifests
+            Up to ``limit`` matching manifests, highest trust score first
+            (ties broken by DID)
         """
-        results = []
+        if limit <= 0:
+            return []
+        
+        candidates = self._candidates(capabilities, privacy_policy, verification_level)
+        if candidates is not None and not candidates:
+            return []
+        
+        scores = self._indexed_scores
+        if candidates is not None and len(candidates) ** 2 <= limit * len(self._ranking):
+            # Few candidates: rank them directly
+            top = heapq.nsmallest(
+                limit,
+                ((-scores[did], did) for did in candidates if scores[did] >= min_score),
+            )
+            return [self._manifests[did] for _, did in top]
         
-        for agent_did, manifest in self._manifests.items():
-            # Filter by trust score
-            if manifest.trust_score < min_score:
-                continue
-            
-            # Filter by capabilities
-            if capabilities:
-                if not all(c in manifest.capabilities.domains for c in capabilities):
-                    continue
-            
-            # Filter by privacy policy
-            if privacy_policy:
-                if manifest.privacy.retention_policy != privacy_policy:
-                    continue
-            
-            results.append(manifest)
-            
-            if len(results) >= limit:
+        # Many candidates: walk the ranking from the top until limit matches
+        results = []
+        for neg_score, did in self._ranking:
+            if -neg_score < min_score:
                 break
-        
-        # Sort by trust score descending
-        results.sort(key=lambda m: m.trust_score, reverse=True)
+            if candidates is None or did in candidates:
+                results.append(self._manifests[did])
+                if len(results) >= limit:
+                    break
         
         return results
     
+    def update_trust_score(self, agent_did: str, trust_score: int) -> None:
+        """Set an agent's trust score and reposition it in the ranking."""
+        if agent_did not in self._manifests:
+            raise AgentNotFoundError(agent_did)
+        
+        self._remove_ranking(agent_did)
+        self._manifests[agent_did].trust_score = trust_score
+        self._add_ranking(agent_did, trust_score)
+    
+    def _candidates(
+        self,
+        capabilities: Optional[list[str]],
+        privacy_policy: Optional[str],
+        verification_level: Optional[str],
+    ) -> Optional[set[str]]:
+        """Intersect the index sets for the given filters (None = no filter)."""
+        sets = [self._by_capability.get(c, set()) for c in capabilities or ()]
+        if privacy_policy:
+            sets.append(self._by_privacy_policy.get(privacy_policy, set()))
+        if verification_level:
+            sets.append(self._by_verification_level.get(verification_level, set()))
+        if not sets:
+            return None
+        
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+    
+    def _index(self, agent_did: str, manifest: AgentManifest) -> None:
+        """Add a manifest to the secondary indexes and the ranking."""
+        domains = frozenset(manifest.capabilities.domains)
+        retention_policy = manifest.privacy.retention_policy
+        verification_level = manifest.verification_level
+        for domain in domains:
+            self._by_capability.setdefault(domain, set()).add(agent_did)
+        self._by_privacy_policy.setdefault(retention_policy, set()).add(agent_did)
+        self._by_verification_level.setdefault(verification_level, set()).add(agent_did)
+        self._indexed_keys[agent_did] = (domains, retention_policy, verification_level)
+        self._add_ranking(agent_did, manifest.trust_score)
+    
+    def _unindex(self, agent_did: str) -> None:
+        """Remove a DID from the secondary indexes and the ranking."""
+        keys = self._indexed_keys.pop(agent_did, None)
+        if keys is not None:
+            domains, retention_policy, verification_level = keys
+            for domain in domains:
+                self._discard(self._by_capability, domain, agent_did)
+            self._discard(self._by_privacy_policy, retention_policy, agent_did)
+            self._discard(self._by_verification_level, verification_level, agent_did)
+        self._remove_ranking(agent_did)
+    
+    @staticmethod
+    def _discard(index: dict[str, set[str]], key: str, agent_did: str) -> None:
+        dids = index.get(key)
+        if dids is not None:
+            dids.discard(agent_did)
+            if not dids:
+                del index[key]
+    
+    def _add_ranking(self, agent_did: str, trust_score: int) -> None:
+        bisect.insort(self._ranking, (-trust_score, agent_did))
+        self._indexed_scores[agent_did] = trust_score
+    
+    def _remove_ranking(self, agent_did: str) -> None:
+        trust_score = self._indexed_scores.pop(agent_did, None)
+        if trust_score is None:
+            return
+        entry = (-trust_score, agent_did)
+        i = bisect.bisect_left(self._ranking, entry)
+        if i < len(self._ranking) and self._ranking[i] == entry:
+            del self._ranking[i]
+    
     async def get_reputation_sync(
         self,
         agent_dids: Optional[list[str]] = None,
@@ -6,11 +6,13 @@ Implements the viral trust mechanism that drives network adoption.
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Literal
+from typing import Iterable, Optional, Literal
 from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
 
+from sortedcontainers import SortedList
+
 
 class TrustTier(str, Enum):
     """Trust tier classification based on score."""
@@ -138,6 +140,9 @@ class ReputationEngine:
     
     The core engine that determines which agents can communicate
     and drives the viral adoption loop.
+    
+    Cached scores are mirrored in a sorted ranking that is updated in
+    O(log n) as scores change, so leaderboard reads never re-sort.
     """
     
     # Base scores by verification level
@@ -164,6 +169,9 @@ class ReputationEngine:
         self._score_cache: dict[str, TrustScore] = {}
         self._history_cache: dict[str, ReputationHistory] = {}
         self._slash_events: list[SlashEvent] = []
+        
+        # (-total_score, agent_did) for every cached score, best first
+        self._ranking = SortedList()
     
     def calculate_trust_score(
         self,
@@ -190,16 +198,7 @@ class ReputationEngine:
         base_score = self.BASE_SCORES.get(verification_level, 100)
         
         # Behavioral modifiers
-        behavioral_modifier = 0
-        behavioral_modifier += history.successful_tasks * 2      # +2 per success
-        behavioral_modifier -= history.failed_tasks * 10         # -10 per failure
-        behavioral_modifier -= history.disputes_lost * 50        # -50 per lost dispute
-        behavioral_modifier += history.disputes_won * 10         # +10 per won dispute
-        behavioral_modifier += int(history.uptime_days * 0.5)    # +0.5 per day online
-        behavioral_modifier -= history.times_slashed * 75        # -75 per slash
-        
-        # Cap behavioral modifier
-        behavioral_modifier = max(-300, min(300, behavioral_modifier))
+        behavioral_modifier = self._behavioral_modifier(history)
         
         # Capability modifiers
         capability_modifier = 0
@@ -224,6 +223,29 @@ class ReputationEngine:
             if privacy.get("pii_handling") == "reject":
                 capability_modifier += 20
         
+        return self._build_score(history, base_score, behavioral_modifier, capability_modifier)
+    
+    @staticmethod
+    def _behavioral_modifier(history: ReputationHistory) -> int:
+        """Score adjustment from an agent's task, dispute and slash history."""
+        behavioral_modifier = 0
+        behavioral_modifier += history.successful_tasks * 2      # +2 per success
+        behavioral_modifier -= history.failed_tasks * 10         # -10 per failure
+        behavioral_modifier -= history.disputes_lost * 50        # -50 per lost dispute
+        behavioral_modifier += history.disputes_won * 10         # +10 per won dispute
+        behavioral_modifier += int(history.uptime_days * 0.5)    # +0.5 per day online
+        behavioral_modifier -= history.times_slashed * 75        # -75 per slash
+        
+        # Cap behavioral modifier
+        return max(-300, min(300, behavioral_modifier))
+    
+    @staticmethod
+    def _build_score(
+        history: ReputationHistory,
+        base_score: int,
+        behavioral_modifier: int,
+        capability_modifier: int,
+    ) -> TrustScore:
         # Calculate total
         total_score = base_score + behavioral_modifier + capability_modifier
         total_score = max(0, min(1000, total_score))  # Clamp to 0-1000
@@ -262,8 +284,52 @@ class ReputationEngine:
             history.successful_tasks += 0.5
             history.failed_tasks += 0.5
         
+        self._rescore(agent_did, history)
         return history
     
+    def apply_events(
+        self,
+        outcomes: Iterable[tuple[str, Literal["success", "failure", "partial"]]],
+    ) -> dict[str, ReputationHistory]:
+        """
+        Record many task outcomes at once.
+        
+        Outcomes are coalesced per agent, so each affected agent's history
+        is updated and its cached score re-ranked once per batch.
+        
+        Args:
+            outcomes: (agent_did, outcome) pairs
+            
+        Returns:
+            Updated history for every agent in the batch
+        """
+        # agent_did -> [successes, failures, partials]
+        counts: dict[str, list[int]] = {}
+        slot = {"success": 0, "failure": 1}
+        for agent_did, outcome in outcomes:
+            agent_counts = counts.get(agent_did)
+            if agent_counts is None:
+                agent_counts = counts[agent_did] = [0, 0, 0]
+            agent_counts[slot.get(outcome, 2)] += 1
+        
+        now = datetime.now(timezone.utc)
+        updated = {}
+        for agent_did, (successes, failures, partials) in counts.items():
+            history = self._get_or_create_history(agent_did)
+            history.total_tasks += successes + failures + partials
+            if partials:
+                history.successful_tasks += successes + partials * 0.5
+                history.failed_tasks += failures + partials * 0.5
+            else:
+                history.successful_tasks += successes
+                history.failed_tasks += failures
+            history.last_activity = now
+            
+            self._rescore(agent_did, history)
+            updated[agent_did] = history
+        
+        return updated
+    
     def record_dispute_outcome(
         self,
         agent_did: str,
@@ -280,6 +346,7 @@ class ReputationEngine:
         else:
             history.disputes_lost += 1
         
+        self._rescore(agent_did, history)
         return history
     
     def slash_reputation(
@@ -330,8 +397,7 @@ class ReputationEngine:
         self._slash_events.append(slash_event)
         
         # Invalidate score cache
-        if agent_did in self._score_cache:
-            del self._score_cache[agent_did]
+        self._evict_score(agent_did)
         
         return slash_event
     
@@ -353,7 +419,7 @@ class ReputationEngine:
         if not score:
             history = self._get_or_create_history(agent_did)
             score = self.calculate_trust_score("registered", history)
-            self._score_cache[agent_did] = score
+            self._cache_score(score)
         
         return score.meets_threshold(threshold), score
     
@@ -400,11 +466,34 @@ class ReputationEngine:
             )
         return self._history_cache[agent_did]
     
+    def _cache_score(self, score: TrustScore) -> None:
+        """Store a score and place it in the ranking."""
+        self._evict_score(score.agent_did)
+        self._score_cache[score.agent_did] = score
+        self._ranking.add((-score.total_score, score.agent_did))
+    
+    def _evict_score(self, agent_did: str) -> None:
+        """Drop a cached score and its ranking entry."""
+        score = self._score_cache.pop(agent_did, None)
+        if score is not None:
+            self._ranking.discard((-score.total_score, agent_did))
+    
+    def _rescore(self, agent_did: str, history: ReputationHistory) -> None:
+        """Refresh a cached score after its history changed, keeping its base and capabilities."""
+        cached = self._score_cache.get(agent_did)
+        if cached is None:
+            return
+        
+        self._cache_score(self._build_score(
+            history,
+            cached.base_score,
+            self._behavioral_modifier(history),
+            cached.capability_modifier,
+        ))
+    
     def get_leaderboard(self, limit: int = 100) -> list[TrustScore]:
-        """Get top agents by trust score."""
-        scores = list(self._score_cache.values())
-        scores.sort(key=lambda s: s.total_score, reverse=True)
-        return scores[:limit]
+        """Get top agents by trust score (ties broken by DID)."""
+        return [self._score_cache[did] for _, did in self._ranking.islice(0, limit)]
     
     def get_slash_history(
         self,
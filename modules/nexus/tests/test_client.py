@@ -0,0 +1,176 @@
+"""Tests for the Nexus client against a local stand-in registry server."""
+
+import asyncio
+import os
+import sys
+
+import pytest
+from aiohttp import web
+
+_nexus_parent = os.path.join(os.path.dirname(__file__), "..", "..")
+if _nexus_parent not in sys.path:
+    sys.path.insert(0, _nexus_parent)
+
+from nexus.client import NexusClient, TTLCache
+from nexus.exceptions import IATPInsufficientTrustException, IATPUnverifiedPeerException
+from tests.conftest import make_manifest
+
+
+class StandInRegistry:
+    """Minimal Nexus API that answers peer verifications and counts traffic."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests = 0
+        self.connections = set()
+
+    async def verify(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self.connections.add(request.transport.get_extra_info("peername"))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        did = request.match_info["did"]
+        if did == "did:nexus:ghost":
+            return web.json_response({}, status=404)
+        if did == "did:nexus:low":
+            return web.json_response({
+                "error": "IATP_INSUFFICIENT_TRUST", "current_score": 100, "required_score": 700,
+            })
+        return web.json_response({
+            "verified": True, "peer_did": did, "trust_score": 850, "trust_tier": "trusted",
+        })
+
+    async def report(self, request: web.Request) -> web.Response:
+        return web.json_response({"ok": True})
+
+
+@pytest.fixture
+async def nexus_server():
+    registry = StandInRegistry()
+    app = web.Application()
+    app.router.add_get("/agents/{did}/verify", registry.verify)
+    app.router.add_post("/reputation/{did}/report", registry.report)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield registry, f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+def _client(url, **kwargs):
+    return NexusClient(make_manifest(), api_key="test", api_url=url, **kwargs)
+
+
+class TestVerifyPeerRemote:
+    """Tests for NexusClient.verify_peer() against the HTTP API."""
+
+    @pytest.mark.asyncio
+    async def test_verifications_share_one_connection(self, nexus_server):
+        registry, url = nexus_server
+        client = _client(url, verification_ttl_seconds=0)
+        for i in range(5):
+            result = await client.verify_peer(f"did:nexus:peer-{i}")
+            assert result.verified and result.trust_score == 850
+        await client.close()
+        assert registry.requests == 5
+        assert len(registry.connections) == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_verification_skips_request(self, nexus_server):
+        registry, url = nexus_server
+        client = _client(url)
+        await client.verify_peer("did:nexus:peer")
+        await client.verify_peer("did:nexus:peer")
+        await client.verify_peer("did:nexus:peer", min_score=900)
+        await client.close()
+        assert registry.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_verifications_single_flight(self, nexus_server):
+        registry, url = nexus_server
+        registry.delay = 0.05
+        client = _client(url)
+        results = await asyncio.gather(*(client.verify_peer("did:nexus:peer") for _ in range(20)))
+        await client.close()
+        assert registry.requests == 1
+        assert all(r.peer_did == "did:nexus:peer" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_waiter_and_are_not_cached(self, nexus_server):
+        registry, url = nexus_server
+        registry.delay = 0.02
+        client = _client(url)
+        results = await asyncio.gather(
+            *(client.verify_peer("did:nexus:ghost") for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, IATPUnverifiedPeerException) for r in results)
+        with pytest.raises(IATPInsufficientTrustException):
+            await client.verify_peer("did:nexus:low")
+        with pytest.raises(IATPUnverifiedPeerException):
+            await client.verify_peer("did:nexus:ghost")
+        await client.close()
+        assert registry.requests == 3
+
+    @pytest.mark.asyncio
+    async def test_report_outcome_invalidates_peer(self, nexus_server):
+        registry, url = nexus_server
+        client = _client(url)
+        await client.verify_peer("did:nexus:peer")
+        await client.report_outcome("task-1", "did:nexus:peer", "failure")
+        await client.verify_peer("did:nexus:peer")
+        await client.close()
+        assert registry.requests == 2
+
+
+class TestSession:
+    """Tests for the shared session across event loops."""
+
+    def test_session_from_closed_loop_is_closed_and_replaced(self):
+        client = _client("http://127.0.0.1:1")
+        first = asyncio.run(client._get_session())
+        second = asyncio.run(client._get_session())
+        assert first is not second
+        assert first.closed
+        assert not second.closed
+        asyncio.run(client.close())
+
+    def test_session_from_open_loop_is_not_shared(self):
+        client = _client("http://127.0.0.1:1")
+        loop = asyncio.new_event_loop()
+        try:
+            session = loop.run_until_complete(client._get_session())
+            with pytest.raises(RuntimeError):
+                asyncio.run(client._get_session())
+            assert client._session is session
+            loop.run_until_complete(client.close())
+        finally:
+            loop.close()
+        assert session.closed
+
+
+class TestTTLCache:
+    """Tests for the bounded verification cache."""
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    def test_entries_expire(self, monkeypatch):
+        import nexus.client as client_module
+
+        now = [1000.0]
+        monkeypatch.setattr(client_module.time, "monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=10, ttl_seconds=5)
+        cache.set("a", 1)
+        now[0] += 4
+        assert cache.get("a") == 1
+        now[0] += 2
+        assert cache.get("a") is None
@@ -212,6 +212,61 @@ class TestDiscoverAgents:
         results = await registry.discover_agents(privacy_policy="ephemeral", min_score=1)
         assert len(results) == 1
 
+    @pytest.mark.asyncio
+    async def test_discover_returns_true_top_k(self, registry):
+        for i in range(10):
+            await registry.register(make_manifest(did=f"did:nexus:agent-{i}"), f"sig_{i}")
+            registry.update_trust_score(f"did:nexus:agent-{i}", 100 + i * 50)
+        results = await registry.discover_agents(min_score=1, limit=3)
+        assert [m.identity.did for m in results] == [
+            "did:nexus:agent-9", "did:nexus:agent-8", "did:nexus:agent-7",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_discover_filtered_top_k(self, registry):
+        for i in range(20):
+            domains = ["code-gen"] if i % 2 else ["data-analysis"]
+            await registry.register(make_manifest(did=f"did:nexus:agent-{i}", domains=domains), f"sig_{i}")
+            registry.update_trust_score(f"did:nexus:agent-{i}", 900 - i * 10)
+        results = await registry.discover_agents(capabilities=["code-gen"], min_score=1, limit=2)
+        assert [m.identity.did for m in results] == ["did:nexus:agent-1", "did:nexus:agent-3"]
+
+    @pytest.mark.asyncio
+    async def test_discover_by_verification_level(self, registry):
+        m1 = make_manifest(did="did:nexus:agent-a", verification_level="verified")
+        m2 = make_manifest(did="did:nexus:agent-b", verification_level="registered")
+        await registry.register(m1, "sig1")
+        await registry.register(m2, "sig2")
+        results = await registry.discover_agents(verification_level="verified", min_score=1)
+        assert [m.identity.did for m in results] == ["did:nexus:agent-a"]
+
+    @pytest.mark.asyncio
+    async def test_discover_reflects_update_and_deregister(self, registry):
+        await registry.register(make_manifest(did="did:nexus:agent-a", domains=["code-gen"]), "sig1")
+        await registry.register(make_manifest(did="did:nexus:agent-b", domains=["code-gen"]), "sig2")
+        await registry.update(
+            "did:nexus:agent-a", make_manifest(did="did:nexus:agent-a", domains=["search"]), "sig3"
+        )
+        await registry.deregister("did:nexus:agent-b", "sig4")
+        assert await registry.discover_agents(capabilities=["code-gen"], min_score=1) == []
+        results = await registry.discover_agents(capabilities=["search"], min_score=1)
+        assert [m.identity.did for m in results] == ["did:nexus:agent-a"]
+
+
+    @pytest.mark.asyncio
+    async def test_mutated_manifest_unindexed_by_original_keys(self, registry):
+        await registry.register(make_manifest(did="did:nexus:agent-a", domains=["code-gen"]), "sig1")
+        await registry.register(make_manifest(did="did:nexus:agent-b", domains=["code-gen"]), "sig2")
+        # Callers hold the stored manifest and may edit it in place
+        (await registry.get_manifest("did:nexus:agent-a")).capabilities.domains = ["other"]
+        (await registry.get_manifest("did:nexus:agent-b")).capabilities.domains = ["other"]
+        await registry.update(
+            "did:nexus:agent-a", make_manifest(did="did:nexus:agent-a", domains=["search"]), "sig3"
+        )
+        await registry.deregister("did:nexus:agent-b", "sig4")
+        assert await registry.discover_agents(capabilities=["code-gen"], min_score=1) == []
+        results = await registry.discover_agents(capabilities=["search"], min_score=1)
+        assert [m.identity.did for m in results] == ["did:nexus:agent-a"]
 
 class TestRegistryHelpers:
     """Tests for is_registered() and get_agent_count()."""
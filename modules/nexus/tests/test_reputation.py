@@ -305,6 +305,50 @@ class TestLeaderboard:
         board = reputation_engine.get_leaderboard(limit=3)
         assert len(board) == 3
 
+    def test_leaderboard_follows_task_outcomes(self, reputation_engine):
+        for did in ("did:nexus:a", "did:nexus:b", "did:nexus:c"):
+            reputation_engine.check_trust_threshold(did)
+        for _ in range(5):
+            reputation_engine.record_task_outcome("did:nexus:c", "success")
+        reputation_engine.record_task_outcome("did:nexus:a", "failure")
+        board = reputation_engine.get_leaderboard()
+        assert [s.agent_did for s in board] == ["did:nexus:c", "did:nexus:b", "did:nexus:a"]
+        assert board[0].total_score == 410
+
+    def test_slashed_agent_leaves_leaderboard(self, reputation_engine):
+        reputation_engine.check_trust_threshold("did:nexus:a")
+        reputation_engine.check_trust_threshold("did:nexus:b")
+        reputation_engine.slash_reputation("did:nexus:a", reason="fraud", severity="high")
+        assert [s.agent_did for s in reputation_engine.get_leaderboard()] == ["did:nexus:b"]
+
+
+class TestApplyEvents:
+    """Tests for ReputationEngine.apply_events()."""
+
+    def test_matches_individual_outcomes(self, reputation_engine):
+        events = [("did:nexus:a", "success"), ("did:nexus:b", "failure"),
+                  ("did:nexus:a", "partial"), ("did:nexus:a", "success")]
+        other = type(reputation_engine)()
+        for did in ("did:nexus:a", "did:nexus:b"):
+            reputation_engine.check_trust_threshold(did)
+            other.check_trust_threshold(did)
+        for did, outcome in events:
+            other.record_task_outcome(did, outcome)
+
+        updated = reputation_engine.apply_events(events)
+
+        assert updated["did:nexus:a"].total_tasks == 3
+        assert updated["did:nexus:a"].successful_tasks == 2.5
+        assert updated["did:nexus:b"].failed_tasks == 1
+        assert [(s.agent_did, s.total_score) for s in reputation_engine.get_leaderboard()] == [
+            (s.agent_did, s.total_score) for s in other.get_leaderboard()
+        ]
+
+    def test_uncached_agents_only_update_history(self, reputation_engine):
+        reputation_engine.apply_events([("did:nexus:new", "success")])
+        assert reputation_engine.get_leaderboard() == []
+        assert reputation_engine._get_or_create_history("did:nexus:new").successful_tasks == 1
+
 
 class TestSlashHistory:
     """Tests for ReputationEngine.get_slash_history()."""
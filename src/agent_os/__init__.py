@@ -25,6 +25,9 @@ Stateless API (MCP June 2026):
     ...     policies=["read_only"]
     ... )
 
+Exports are loaded lazily: ``import agent_os`` only defines the names
+below, and the module providing one is imported on first attribute access.
+
 Installation:
     pip install agent-os-kernel[full]  # Everything
     pip install agent-os-kernel        # Core
@@ -36,332 +39,396 @@ __version__ = "2.0.1"
 __author__ = "Imran Siddique"
 __license__ = "MIT"
 
+import importlib
 import logging
+from typing import TYPE_CHECKING, Any
 
 logger = logging.getLogger(__name__)
 
 # ============================================================================
-# Layer 1: Primitives
+# Optional Packages (Layers 1-4)
 # ============================================================================
-
-# Agent Primitives - Base failure models
-try:
-    from agent_primitives import (
-        AgentFailure,
-        FailureSeverity,
-        FailureType,
-    )
-    _PRIMITIVES_AVAILABLE = True
-except ImportError:
-    _PRIMITIVES_AVAILABLE = False
-
-# CMVK - Verification Kernel
-# DriftDetector (#138): Compares agent outputs across models or over time to
-# detect semantic drift — situations where an agent's behaviour diverges from
-# its stated intent or baseline.  Drift is quantified as a float score in
-# [0.0, 1.0] (0 = identical, 1 = completely divergent).  When the score
-# exceeds GovernancePolicy.drift_threshold a ``DRIFT_DETECTED`` governance
-# event is emitted.
-#
-# SemanticDrift: Data class holding drift metadata (score, drift type, etc.).
-# verify_outputs: Pure function that compares two text outputs for drift.
-#
-# Threshold parameters (from GovernancePolicy):
-#   - confidence_threshold (float): Minimum confidence for acceptance.
-#   - drift_threshold (float): Maximum tolerable drift before alerting.
-#
-# Example — detecting agent behaviour drift:
-#   >>> from agent_os import DriftDetector  # requires cmvk package
-#   >>> detector = DriftDetector(threshold=0.15)
-#   >>> drift = detector.compare(
-#   ...     baseline="Transfer $100 to savings account",
-#   ...     current="Transfer $10,000 to external account XYZ",
-#   ... )
-#   >>> if drift.score > 0.15:
-#   ...     print(f"DRIFT DETECTED: {drift.score:.2f}")
-try:
-    from cmvk import (
-        DriftDetector,
-        SemanticDrift,
-        verify_outputs,
-    )
-    _CMVK_AVAILABLE = True
-except ImportError:
-    _CMVK_AVAILABLE = False
-
-# CaaS - Context as a Service
-# ContextPipeline (#139): A composable, multi-stage pipeline for transforming
-# and filtering context before it reaches an agent.  The architecture follows
-# a pipes-and-filters pattern where each stage receives a context object,
-# applies a transformation (e.g. PII redaction, summarisation, relevance
-# scoring), and passes the result to the next stage.
-#
-# Pipeline stages:
-#   1. Ingestion  — parse raw documents into structured Sections.
-#   2. Enrichment — add metadata (timestamps, source citations).
-#   3. Filtering  — remove irrelevant or sensitive content.
-#   4. Routing    — classify the query and select the right model tier.
-#   5. Assembly   — build the final context window within token budget.
-#
-# RAGContext: Holds retrieval-augmented generation context with citations.
 #
-# Example — building a context pipeline:
-#   >>> from agent_os import ContextPipeline  # requires caas package
-#   >>> pipeline = ContextPipeline(stages=[
-#   ...     RedactPIIStage(),
-#   ...     SummarizeStage(max_tokens=512),
-#   ...     RelevanceScoringStage(threshold=0.7),
-#   ... ])
-#   >>> context = pipeline.run(raw_documents, query="quarterly revenue")
-try:
-    from caas import (
-        ContextPipeline,
-        RAGContext,
-    )
-    _CAAS_AVAILABLE = True
-except ImportError:
-    _CAAS_AVAILABLE = False
-
-# EMK - Episodic Memory Kernel
-try:
-    from emk import (
-        Episode,
-        EpisodicMemory,
-        MemoryStore,
-    )
-    _EMK_AVAILABLE = True
-except ImportError:
-    _EMK_AVAILABLE = False
+# AVAILABLE_PACKAGES key -> (package, exported names).  A package counts as
+# available when it imports and provides all of its names.
 
-# ============================================================================
-# Layer 2: Infrastructure
-# ============================================================================
-
-# IATP - Inter-Agent Trust Protocol
-try:
-    from iatp import (
-        CapabilityManifest,
-        Pipeline,
-        PipeMessage,
-        PolicyCheckPipe,
-        SidecarProxy,
-        TrustLevel,
-        TypedPipe,
-    )
-    _IATP_AVAILABLE = True
-except ImportError:
-    _IATP_AVAILABLE = False
-
-# AMB - Agent Message Bus
-try:
-    from amb_core import (
-        Message,
-        MessageBus,
-        Topic,
-    )
-    _AMB_AVAILABLE = True
-except ImportError:
-    _AMB_AVAILABLE = False
-
-# ATR - Agent Tool Registry
-try:
-    from atr import (
-        Tool,
-        ToolExecutor,
-        ToolRegistry,
-    )
-    _ATR_AVAILABLE = True
-except ImportError:
-    _ATR_AVAILABLE = False
-
-# ============================================================================
-# Layer 3: Framework (Control Plane)
-# ============================================================================
+_OPTIONAL_EXPORTS: dict[str, tuple[str, tuple[str, ...]]] = {
+    # Layer 1: Primitives
+    # Agent Primitives - Base failure models
+    "primitives": ("agent_primitives", (
+        "AgentFailure",
+        "FailureSeverity",
+        "FailureType",
+    )),
+    # CMVK - Verification Kernel
+    # DriftDetector (#138): Compares agent outputs across models or over time to
+    # detect semantic drift — situations where an agent's behaviour diverges from
+    # its stated intent or baseline.  Drift is quantified as a float score in
+    # [0.0, 1.0] (0 = identical, 1 = completely divergent).  When the score
+    # exceeds GovernancePolicy.drift_threshold a ``DRIFT_DETECTED`` governance
+    # event is emitted.
+    #
+    # SemanticDrift: Data class holding drift metadata (score, drift type, etc.).
+    # verify_outputs: Pure function that compares two text outputs for drift.
+    #
+    # Threshold parameters (from GovernancePolicy):
+    #   - confidence_threshold (float): Minimum confidence for acceptance.
+    #   - drift_threshold (float): Maximum tolerable drift before alerting.
+    #
+    # Example — detecting agent behaviour drift:
+    #   >>> from agent_os import DriftDetector  # requires cmvk package
+    #   >>> detector = DriftDetector(threshold=0.15)
+    #   >>> drift = detector.compare(
+    #   ...     baseline="Transfer $100 to savings account",
+    #   ...     current="Transfer $10,000 to external account XYZ",
+    #   ... )
+    #   >>> if drift.score > 0.15:
+    #   ...     print(f"DRIFT DETECTED: {drift.score:.2f}")
+    "cmvk": ("cmvk", (
+        "DriftDetector",
+        "SemanticDrift",
+        "verify_outputs",
+    )),
+    # CaaS - Context as a Service
+    # ContextPipeline (#139): A composable, multi-stage pipeline for transforming
+    # and filtering context before it reaches an agent.  The architecture follows
+    # a pipes-and-filters pattern where each stage receives a context object,
+    # applies a transformation (e.g. PII redaction, summarisation, relevance
+    # scoring), and passes the result to the next stage.
+    #
+    # Pipeline stages:
+    #   1. Ingestion  — parse raw documents into structured Sections.
+    #   2. Enrichment — add metadata (timestamps, source citations).
+    #   3. Filtering  — remove irrelevant or sensitive content.
+    #   4. Routing    — classify the query and select the right model tier.
+    #   5. Assembly   — build the final context window within token budget.
+    #
+    # RAGContext: Holds retrieval-augmented generation context with citations.
+    #
+    # Example — building a context pipeline:
+    #   >>> from agent_os import ContextPipeline  # requires caas package
+    #   >>> pipeline = ContextPipeline(stages=[
+    #   ...     RedactPIIStage(),
+    #   ...     SummarizeStage(max_tokens=512),
+    #   ...     RelevanceScoringStage(threshold=0.7),
+    #   ... ])
+    #   >>> context = pipeline.run(raw_documents, query="quarterly revenue")
+    "caas": ("caas", (
+        "ContextPipeline",
+        "RAGContext",
+    )),
+    # EMK - Episodic Memory Kernel
+    "emk": ("emk", (
+        "Episode",
+        "EpisodicMemory",
+        "MemoryStore",
+    )),
 
-try:
-    from agent_control_plane import (
-        AgentContext,
+    # Layer 2: Infrastructure
+    # IATP - Inter-Agent Trust Protocol
+    "iatp": ("iatp", (
+        "CapabilityManifest",
+        "Pipeline",
+        "PipeMessage",
+        "PolicyCheckPipe",
+        "SidecarProxy",
+        "TrustLevel",
+        "TypedPipe",
+    )),
+    # AMB - Agent Message Bus
+    "amb": ("amb_core", (
+        "Message",
+        "MessageBus",
+        "Topic",
+    )),
+    # ATR - Agent Tool Registry
+    "atr": ("atr", (
+        "Tool",
+        "ToolExecutor",
+        "ToolRegistry",
+    )),
+
+    # Layer 3: Framework (Control Plane)
+    "control_plane": ("agent_control_plane", (
+        "AgentContext",
         # Main Interface
-        AgentControlPlane,
-        AgentKernelPanic,
-        # Kernel Architecture (v0.3.0)
-        AgentSignal,
+        "AgentControlPlane",
+        "AgentKernelPanic",
+        # Kernel Architecture (v0.3.0); AgentSignal is exported from
+        # agent_os.context_budget instead
         # Agent VFS
-        AgentVFS,
+        "AgentVFS",
         # Execution
-        ExecutionEngine,
-        ExecutionStatus,
-        FileMode,
+        "ExecutionEngine",
+        "ExecutionStatus",
+        "FileMode",
         # Flight Recorder
-        FlightRecorder,
+        "FlightRecorder",
         # Kernel/User Space
-        KernelSpace,
-        KernelState,
-        MemoryBackend,
+        "KernelSpace",
+        "KernelState",
+        "MemoryBackend",
         # Policy Engine
-        PolicyEngine,
-        PolicyRule,
-        ProtectionRing,
-        SignalAwareAgent,
-        SignalDispatcher,
-        SyscallRequest,
-        SyscallResult,
-        SyscallType,
-        VFSBackend,
-        create_agent_vfs,
-        create_control_plane,
-        create_kernel,
-        kill_agent,
-        pause_agent,
-        policy_violation,
-        resume_agent,
-        user_space_execution,
-    )
-    _CONTROL_PLANE_AVAILABLE = True
-except ImportError:
-    _CONTROL_PLANE_AVAILABLE = False
+        "PolicyEngine",
+        "PolicyRule",
+        "ProtectionRing",
+        "SignalAwareAgent",
+        "SignalDispatcher",
+        "SyscallRequest",
+        "SyscallResult",
+        "SyscallType",
+        "VFSBackend",
+        "create_agent_vfs",
+        "create_control_plane",
+        "create_kernel",
+        "kill_agent",
+        "pause_agent",
+        "policy_violation",
+        "resume_agent",
+        "user_space_execution",
+    )),
+
+    # Layer 4: Intelligence
+    # SCAK - Self-Correcting Agent Kernel
+    "scak": ("agent_kernel", (
+        "DifferentialAuditor",
+        "LazinessDetector",
+        "SelfCorrectingKernel",
+    )),
+    # Mute Agent (external module)
+    "mute_agent": ("mute_agent", (
+        "ExecutionAgent",
+        "MuteAgent",
+        "ReasoningAgent",
+    )),
+}
 
 # ============================================================================
-# Layer 4: Intelligence
+# Local Components (Always Available)
 # ============================================================================
 
-# SCAK - Self-Correcting Agent Kernel
-try:
-    from agent_kernel import (
-        DifferentialAuditor,
-        LazinessDetector,
-        SelfCorrectingKernel,
+_LOCAL_EXPORTS: dict[str, tuple[str, ...]] = {
+    # AGENTS.md Compatibility
+    "agent_os.agents_compat": (
+        "AgentSkill",
+        "AgentsParser",
+        "discover_agents",
+    ),
+    # Base Agent Classes
+    "agent_os.base_agent": (
+        "AgentConfig",
+        "AuditEntry",
+        "BaseAgent",
+        "PolicyDecision",
+        "ToolUsingAgent",
+        "TypedResult",
+    ),
+    # Context Budget Scheduler — token budget as a kernel primitive
+    "agent_os.context_budget": (
+        "AgentSignal",
+        "BudgetExceeded",
+        "ContextPriority",
+        "ContextScheduler",
+        "ContextWindow",
+    ),
+    # LlamaFirewall Integration — defense-in-depth with Meta's LlamaFirewall
+    "agent_os.integrations.llamafirewall": (
+        "FirewallMode",
+        "FirewallResult",
+        "FirewallVerdict",
+        "LlamaFirewallAdapter",
+    ),
+    # MCP Security — tool poisoning defense
+    "agent_os.mcp_security": (
+        "MCPSecurityScanner",
+        "MCPSeverity",
+        "MCPThreat",
+        "MCPThreatType",
+        "ScanResult",
+        "ToolFingerprint",
+    ),
+    # Mute Agent Primitives — Face/Hands kernel-level decorators
+    "agent_os.mute": (
+        "ActionStatus",
+        "ActionStep",
+        "CapabilityViolation",
+        "ExecutionPlan",
+        "PipelineResult",
+        "StepResult",
+        "face_agent",
+        "mute_agent",
+        "pipe",
+    ),
+    # Prompt Injection Detection — input screening
+    "agent_os.prompt_injection": (
+        "DetectionConfig",
+        "DetectionResult",
+        "InjectionType",
+        "PromptInjectionDetector",
+        "ThreatLevel",
+    ),
+    # Semantic Policy Engine — intent-based enforcement
+    "agent_os.semantic_policy": (
+        "IntentCategory",
+        "IntentClassification",
+        "PolicyDenied",
+        "SemanticPolicyEngine",
+    ),
+    # Stateless Kernel (MCP June 2026)
+    "agent_os.stateless": (
+        "ExecutionContext",
+        "ExecutionRequest",
+        "ExecutionResult",
+        "StatelessKernel",
+        "stateless_execute",
+    ),
+}
+
+# Exported name -> (module, attribute) for names renamed to avoid conflicts
+_RENAMED_EXPORTS: dict[str, tuple[str, str]] = {
+    "AgentsConfig": ("agent_os.agents_compat", "AgentConfig"),
+    "StatelessMemoryBackend": ("agent_os.stateless", "MemoryBackend"),
+}
+
+# Exported name -> (module, attribute, optional package key).  Local
+# components come last so they win name clashes (AgentSignal).
+_LAZY_EXPORTS: dict[str, tuple[str, str, str | None]] = {}
+for _package, (_module, _names) in _OPTIONAL_EXPORTS.items():
+    _LAZY_EXPORTS.update((name, (_module, name, _package)) for name in _names)
+for _module, _names in _LOCAL_EXPORTS.items():
+    _LAZY_EXPORTS.update((name, (_module, name, None)) for name in _names)
+for _name, (_module, _attr) in _RENAMED_EXPORTS.items():
+    _LAZY_EXPORTS[_name] = (_module, _attr, None)
+del _package, _module, _names, _name, _attr
+
+if TYPE_CHECKING:
+    from agent_os.agents_compat import AgentConfig as AgentsConfig
+    from agent_os.agents_compat import AgentSkill, AgentsParser, discover_agents
+    from agent_os.base_agent import (
+        AgentConfig,
+        AuditEntry,
+        BaseAgent,
+        PolicyDecision,
+        ToolUsingAgent,
+        TypedResult,
     )
-    _SCAK_AVAILABLE = True
-except ImportError:
-    _SCAK_AVAILABLE = False
-
-# Mute Agent (external module)
-try:
-    from mute_agent import (
-        ExecutionAgent,
-        MuteAgent,
-        ReasoningAgent,
+    from agent_os.context_budget import (
+        AgentSignal,
+        BudgetExceeded,
+        ContextPriority,
+        ContextScheduler,
+        ContextWindow,
     )
-    _MUTE_AGENT_AVAILABLE = True
-except ImportError:
-    _MUTE_AGENT_AVAILABLE = False
-
-# Mute Agent Primitives — Face/Hands kernel-level decorators (always available)
-from agent_os.agents_compat import (
-    AgentConfig as AgentsConfig,  # Renamed to avoid conflict
-)
-
-# AGENTS.md Compatibility
-from agent_os.agents_compat import (
-    AgentSkill,
-    AgentsParser,
-    discover_agents,
-)
-
-# Base Agent Classes
-from agent_os.base_agent import (
-    AgentConfig,
-    AuditEntry,
-    BaseAgent,
-    PolicyDecision,
-    ToolUsingAgent,
-    TypedResult,
-)
-
-# Context Budget Scheduler — token budget as a kernel primitive (always available)
-from agent_os.context_budget import (
-    AgentSignal,
-    BudgetExceeded,
-    ContextPriority,
-    ContextScheduler,
-    ContextWindow,
-)
-
-# LlamaFirewall Integration — defense-in-depth with Meta's LlamaFirewall
-from agent_os.integrations.llamafirewall import (
-    FirewallMode,
-    FirewallResult,
-    FirewallVerdict,
-    LlamaFirewallAdapter,
-)
-
-# MCP Security — tool poisoning defense (always available)
-from agent_os.mcp_security import (
-    MCPSecurityScanner,
-    MCPSeverity,
-    MCPThreat,
-    MCPThreatType,
-    ScanResult,
-    ToolFingerprint,
-)
-from agent_os.mute import (
-    ActionStatus,
-    ActionStep,
-    CapabilityViolation,
-    ExecutionPlan,
-    PipelineResult,
-    StepResult,
-    face_agent,
-    mute_agent,
-    pipe,
-)
-
-# Prompt Injection Detection — input screening (always available)
-from agent_os.prompt_injection import (
-    DetectionConfig,
-    DetectionResult,
-    InjectionType,
-    PromptInjectionDetector,
-    ThreatLevel,
-)
-
-# Semantic Policy Engine — intent-based enforcement (always available)
-from agent_os.semantic_policy import (
-    IntentCategory,
-    IntentClassification,
-    PolicyDenied,
-    SemanticPolicyEngine,
-)
-
-# ============================================================================
-# Local Components (Always Available)
-# ============================================================================
-# Stateless Kernel (MCP June 2026)
-from agent_os.stateless import (
-    ExecutionContext,
-    ExecutionRequest,
-    ExecutionResult,
-    StatelessKernel,
-    stateless_execute,
-)
-from agent_os.stateless import (
-    MemoryBackend as StatelessMemoryBackend,
-)
+    from agent_os.integrations.llamafirewall import (
+        FirewallMode,
+        FirewallResult,
+        FirewallVerdict,
+        LlamaFirewallAdapter,
+    )
+    from agent_os.mcp_security import (
+        MCPSecurityScanner,
+        MCPSeverity,
+        MCPThreat,
+        MCPThreatType,
+        ScanResult,
+        ToolFingerprint,
+    )
+    from agent_os.mute import (
+        ActionStatus,
+        ActionStep,
+        CapabilityViolation,
+        ExecutionPlan,
+        PipelineResult,
+        StepResult,
+        face_agent,
+        mute_agent,
+        pipe,
+    )
+    from agent_os.prompt_injection import (
+        DetectionConfig,
+        DetectionResult,
+        InjectionType,
+        PromptInjectionDetector,
+        ThreatLevel,
+    )
+    from agent_os.semantic_policy import (
+        IntentCategory,
+        IntentClassification,
+        PolicyDenied,
+        SemanticPolicyEngine,
+    )
+    from agent_os.stateless import (
+        ExecutionContext,
+        ExecutionRequest,
+        ExecutionResult,
+        StatelessKernel,
+        stateless_execute,
+    )
+    from agent_os.stateless import MemoryBackend as StatelessMemoryBackend
 
 # ============================================================================
 # Availability Flags
 # ============================================================================
 
-AVAILABLE_PACKAGES = {
-    "primitives": _PRIMITIVES_AVAILABLE if '_PRIMITIVES_AVAILABLE' in dir() else False,
-    "cmvk": _CMVK_AVAILABLE if '_CMVK_AVAILABLE' in dir() else False,
-    "caas": _CAAS_AVAILABLE if '_CAAS_AVAILABLE' in dir() else False,
-    "emk": _EMK_AVAILABLE if '_EMK_AVAILABLE' in dir() else False,
-    "iatp": _IATP_AVAILABLE if '_IATP_AVAILABLE' in dir() else False,
-    "amb": _AMB_AVAILABLE if '_AMB_AVAILABLE' in dir() else False,
-    "atr": _ATR_AVAILABLE if '_ATR_AVAILABLE' in dir() else False,
-    "control_plane": _CONTROL_PLANE_AVAILABLE if '_CONTROL_PLANE_AVAILABLE' in dir() else False,
-    "scak": _SCAK_AVAILABLE if '_SCAK_AVAILABLE' in dir() else False,
-    "mute_agent": _MUTE_AGENT_AVAILABLE if '_MUTE_AGENT_AVAILABLE' in dir() else False,
-}
+# Optional package key -> imported package, or None when unavailable
+_optional_packages: dict[str, Any] = {}
+
+
+def _optional_package(key: str) -> Any:
+    """Import an optional package on first use; None when unavailable."""
+    try:
+        return _optional_packages[key]
+    except KeyError:
+        pass
+    module_name, names = _OPTIONAL_EXPORTS[key]
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        module = None
+    else:
+        if not all(hasattr(module, name) for name in names):
+            module = None
+    _optional_packages[key] = module
+    return module
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve exports and ``AVAILABLE_PACKAGES`` on first access."""
+    if name == "AVAILABLE_PACKAGES":
+        value: Any = {
+            key: _optional_package(key) is not None for key in _OPTIONAL_EXPORTS
+        }
+    else:
+        try:
+            module_name, attr, optional = _LAZY_EXPORTS[name]
+        except KeyError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        if optional is None:
+            value = getattr(importlib.import_module(module_name), attr)
+        else:
+            module = _optional_package(optional)
+            if module is None:
+                raise AttributeError(
+                    f"module {__name__!r} has no attribute {name!r} "
+                    f"(optional package {module_name!r} is not installed)"
+                )
+            value = getattr(module, attr)
+    # Cache in the module namespace so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | {"AVAILABLE_PACKAGES"})
 
 
 def check_installation() -> None:
     """Check which Agent OS packages are installed."""
     logger.info("Agent OS Installation Status:")
     logger.info("=" * 40)
-    for pkg, available in AVAILABLE_PACKAGES.items():
+    # Module-level __getattr__ does not see global lookups made from inside
+    # this module, so resolve the lazy value explicitly
+    for pkg, available in __getattr__("AVAILABLE_PACKAGES").items():
         status = "✓ Installed" if available else "✗ Not installed"
         logger.info(f"  {pkg:15} {status}")
     logger.info("=" * 40)
@@ -0,0 +1,66 @@
+"""
+Literal prefilters for regular expressions.
+
+Scanners that run many regexes over the same text can skip a regex when
+none of the literals it requires occurs in the (lower-cased) text, which
+is far cheaper than running the regex itself.
+"""
+
+from __future__ import annotations
+
+import re
+
+try:  # Python 3.11+
+    from re import _parser as _sre_parse
+except ImportError:  # pragma: no cover
+    import sre_parse as _sre_parse
+
+
+def required_literals(pattern: str) -> frozenset[str] | None:
+    """
+    Lower-case literals of which at least one occurs in every match.
+
+    Derived from the parsed pattern. Returns None when no such set can be
+    found, in which case the regex always has to run.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, re.IGNORECASE)
+    except Exception:
+        return None
+    best = _best_requirement(list(parsed))
+    return frozenset(best) if best else None
+
+
+def _best_requirement(items: list) -> set[str] | None:
+    """Pick the most selective literal requirement from a parsed sequence."""
+    candidates: list[set[str]] = []
+    run: list[str] = []
+
+    def flush() -> None:
+        literal = "".join(run).lower()
+        # Non-ASCII literals can case-fold onto ASCII text; never rely on them
+        if literal and literal.isascii():
+            candidates.append({literal})
+        run.clear()
+
+    for op, av in items:
+        if op is _sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        flush()
+        requirement = None
+        if op is _sre_parse.SUBPATTERN:
+            requirement = _best_requirement(list(av[-1]))
+        elif op is _sre_parse.BRANCH:
+            alternatives = [_best_requirement(list(alt)) for alt in av[1]]
+            if all(alternatives):
+                requirement = set().union(*alternatives)
+        elif op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT) and av[0] >= 1:
+            requirement = _best_requirement(list(av[2]))
+        if requirement:
+            candidates.append(requirement)
+    flush()
+
+    if not candidates:
+        return None
+    return max(candidates, key=lambda literals: min(len(lit) for lit in literals))
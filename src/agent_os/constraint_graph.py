@@ -21,9 +21,12 @@ from __future__ import annotations
 
 import fnmatch
 import logging
+import os
+import re
+import threading
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +89,96 @@ class ConstraintEdge:
     priority: int = 0
 
 
+# ---------------------------------------------------------------------------
+# Compiled index
+# ---------------------------------------------------------------------------
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+# (rank, edge, agent matcher, resource matcher); a ``None`` matcher always matches
+_IndexEntry = tuple[int, ConstraintEdge, Optional[Callable[[str], Any]], Optional[Callable[[str], Any]]]
+
+
+def _compile_glob(pattern: str) -> Optional[Callable[[str], Any]]:
+    """Return a matcher equivalent to ``fnmatch.fnmatch(name, pattern)``.
+
+    Literal patterns compare by equality and ``"*"`` always matches; all
+    other wildcards use the regex :func:`fnmatch.translate` produces.
+    """
+    pattern = os.path.normcase(pattern)
+    if pattern == "*":
+        return None
+    if not _GLOB_CHARS.search(pattern):
+        return pattern.__eq__
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+class _TrieNode:
+    """Prefix-trie node holding entries whose glob starts with the path to it."""
+
+    __slots__ = ("children", "entries")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.entries: list[_IndexEntry] = []
+
+
+class _ResourceIndex:
+    """Edges bucketed by resource pattern, each bucket in priority order.
+
+    Literal resource patterns live in a hash map; globs live in a trie keyed
+    by their literal prefix (``"db_*"`` under ``d``/``b``/``_``, ``"*"`` at the
+    root), so a lookup only visits buckets that can possibly match.
+    """
+
+    __slots__ = ("exact", "trie")
+
+    def __init__(self, edges: list[ConstraintEdge]) -> None:
+        self.exact: dict[str, list[_IndexEntry]] = {}
+        self.trie = _TrieNode()
+        matchers: dict[str, Optional[Callable[[str], Any]]] = {}
+
+        def matcher(pattern: str) -> Optional[Callable[[str], Any]]:
+            try:
+                return matchers[pattern]
+            except KeyError:
+                compiled = matchers[pattern] = _compile_glob(pattern)
+                return compiled
+
+        for rank, edge in enumerate(edges):
+            resource = os.path.normcase(edge.resource)
+            glob = _GLOB_CHARS.search(resource)
+            if glob is None:
+                self.exact.setdefault(resource, []).append(
+                    (rank, edge, matcher(edge.agent_pattern), None)
+                )
+                continue
+            node = self.trie
+            for char in resource[: glob.start()]:
+                node = node.children.setdefault(char, _TrieNode())
+            # "<prefix>*" matches everything under its trie node
+            resource_match = None if resource[glob.start():] == "*" else matcher(resource)
+            node.entries.append((rank, edge, matcher(edge.agent_pattern), resource_match))
+
+    def buckets(self, resource: str) -> list[list[_IndexEntry]]:
+        """Candidate buckets for *resource*, each sorted by rank."""
+        found = []
+        exact = self.exact.get(resource)
+        if exact:
+            found.append(exact)
+        node: Optional[_TrieNode] = self.trie
+        for char in resource:
+            if node.entries:
+                found.append(node.entries)
+            node = node.children.get(char)
+            if node is None:
+                break
+        else:
+            if node.entries:
+                found.append(node.entries)
+        return found
+
+
 # ---------------------------------------------------------------------------
 # Constraint Graph
 # ---------------------------------------------------------------------------
@@ -96,11 +189,17 @@ class ConstraintGraph:
     Edges are evaluated in priority order (highest first).  The first matching
     edge determines the outcome.  If no edge matches, access is **denied** by
     default (deny-by-default posture).
+
+    Resolution goes through a compiled index of the edges (see
+    ``_ResourceIndex``).  Adding constraints only marks the index stale; it is
+    re-sorted and rebuilt once, on the next query, so bulk loads stay linear.
     """
 
     def __init__(self) -> None:
         self._nodes: dict[str, ResourceNode] = {}
         self._edges: list[ConstraintEdge] = []
+        self._index: Optional[_ResourceIndex] = None
+        self._lock = threading.Lock()
 
     # -- mutators -----------------------------------------------------------
 
@@ -109,9 +208,16 @@ class ConstraintGraph:
         self._nodes[node.name] = node
 
     def add_constraint(self, edge: ConstraintEdge) -> None:
-        """Add a constraint edge and re-sort by descending priority."""
-        self._edges.append(edge)
-        self._edges.sort(key=lambda e: e.priority, reverse=True)
+        """Add a constraint edge; edges are re-sorted by descending priority on next query."""
+        with self._lock:
+            self._edges.append(edge)
+            self._index = None
+
+    def add_constraints(self, edges: list[ConstraintEdge]) -> None:
+        """Add many constraint edges at once."""
+        with self._lock:
+            self._edges.extend(edges)
+            self._index = None
 
     # -- query --------------------------------------------------------------
 
@@ -123,6 +229,7 @@ class ConstraintGraph:
     @property
     def edges(self) -> list[ConstraintEdge]:
         """Read-only copy of constraint edges (sorted by priority)."""
+        self._compiled_index()
         return list(self._edges)
 
     # -- resolution ---------------------------------------------------------
@@ -144,15 +251,27 @@ class ConstraintGraph:
             ``True`` if access is allowed, ``False`` otherwise.
         """
         context = context or {}
-
-        for edge in self._edges:
-            if not fnmatch.fnmatch(agent_id, edge.agent_pattern):
-                continue
-            if not fnmatch.fnmatch(resource, edge.resource):
-                continue
-            if not self._conditions_met(edge.conditions, context):
-                continue
-
+        agent_key = os.path.normcase(agent_id)
+        resource_key = os.path.normcase(resource)
+
+        # Lowest rank (highest priority, earliest added) matching edge wins
+        best: Optional[_IndexEntry] = None
+        for bucket in self._compiled_index().buckets(resource_key):
+            for entry in bucket:
+                rank, candidate, agent_match, resource_match = entry
+                if best is not None and rank >= best[0]:
+                    break
+                if agent_match is not None and not agent_match(agent_key):
+                    continue
+                if resource_match is not None and not resource_match(resource_key):
+                    continue
+                if not self._conditions_met(candidate.conditions, context):
+                    continue
+                best = entry
+                break
+
+        if best is not None:
+            edge = best[1]
             allowed = edge.permission == Permission.ALLOW
             logger.debug(
                 "constraint resolved: agent=%s resource=%s -> %s (priority=%d)",
@@ -173,6 +292,18 @@ class ConstraintGraph:
 
     # -- internals ----------------------------------------------------------
 
+    def _compiled_index(self) -> _ResourceIndex:
+        """Return the edge index, sorting and rebuilding it if stale."""
+        index = self._index
+        if index is None:
+            with self._lock:
+                index = self._index
+                if index is None:
+                    # Stable sort keeps insertion order among equal priorities
+                    self._edges.sort(key=lambda e: e.priority, reverse=True)
+                    index = self._index = _ResourceIndex(self._edges)
+        return index
+
     @staticmethod
     def _conditions_met(
         conditions: dict[str, Any],
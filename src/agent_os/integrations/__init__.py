@@ -36,6 +36,9 @@ Usage:
     governed = SemanticKernelWrapper().wrap(sk_kernel)
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from agent_os.exceptions import (
     AdapterNotFoundError,
     AdapterTimeoutError,
@@ -56,51 +59,132 @@ from agent_os.exceptions import (
     PolicyViolationError,
     RateLimitError,
 )
-from agent_os.integrations.a2a_adapter import A2AEvaluation, A2AGovernanceAdapter, A2APolicy
-from agent_os.integrations.anthropic_adapter import AnthropicKernel, GovernedAnthropicClient
-from agent_os.integrations.autogen_adapter import AutoGenKernel
-from agent_os.integrations.crewai_adapter import CrewAIKernel
-from agent_os.integrations.gemini_adapter import GeminiKernel, GovernedGeminiModel
-from agent_os.integrations.google_adk_adapter import GoogleADKKernel
-from agent_os.integrations.guardrails_adapter import GuardrailsKernel
-from agent_os.integrations.langchain_adapter import LangChainKernel
-from agent_os.integrations.maf_adapter import MAFKernel, govern as maf_govern
-from agent_os.integrations.llamafirewall import (
-    FirewallMode,
-    FirewallResult,
-    FirewallVerdict,
-    LlamaFirewallAdapter,
-)
-from agent_os.integrations.llamaindex_adapter import LlamaIndexKernel
-from agent_os.integrations.mistral_adapter import GovernedMistralClient, MistralKernel
-from agent_os.integrations.openai_adapter import GovernedAssistant, OpenAIKernel
-from agent_os.integrations.pydantic_ai_adapter import PydanticAIKernel
-from agent_os.integrations.semantic_kernel_adapter import (
-    GovernedSemanticKernel,
-    SemanticKernelWrapper,
-)
 
-from .base import (
-    AsyncGovernedWrapper,
-    BaseIntegration,
-    BoundedSemaphore,
-    CompositeInterceptor,
-    DriftResult,
-    GovernancePolicy,
-    PolicyInterceptor,
-    ToolCallInterceptor,
-    ToolCallRequest,
-    ToolCallResult,
-)
-from .config import AgentOSConfig, get_config, reset_config
-from .dry_run import DryRunCollector, DryRunDecision, DryRunPolicy, DryRunResult
-from .health import ComponentHealth, HealthChecker, HealthReport, HealthStatus
-from .logging import GovernanceLogger, JSONFormatter, get_logger
-from .policy_compose import PolicyHierarchy, compose_policies, override_policy
-from .rate_limiter import RateLimiter, RateLimitStatus
-from .templates import PolicyTemplates
-from .token_budget import TokenBudgetStatus, TokenBudgetTracker
-from .webhooks import DeliveryRecord, WebhookConfig, WebhookEvent, WebhookNotifier
+# Exported name -> (module, attribute).  Adapters and helpers are imported on
+# first access, so importing one integration does not load every framework.
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    name: (f"agent_os.integrations.{module}", name)
+    for module, names in {
+        "a2a_adapter": ("A2AEvaluation", "A2AGovernanceAdapter", "A2APolicy"),
+        "anthropic_adapter": ("AnthropicKernel", "GovernedAnthropicClient"),
+        "autogen_adapter": ("AutoGenKernel",),
+        "base": (
+            "AsyncGovernedWrapper",
+            "BaseIntegration",
+            "BoundedSemaphore",
+            "CompositeInterceptor",
+            "DriftResult",
+            "GovernancePolicy",
+            "PolicyInterceptor",
+            "ToolCallInterceptor",
+            "ToolCallRequest",
+            "ToolCallResult",
+        ),
+        "config": ("AgentOSConfig", "get_config", "reset_config"),
+        "crewai_adapter": ("CrewAIKernel",),
+        "dry_run": ("DryRunCollector", "DryRunDecision", "DryRunPolicy", "DryRunResult"),
+        "gemini_adapter": ("GeminiKernel", "GovernedGeminiModel"),
+        "google_adk_adapter": ("GoogleADKKernel",),
+        "guardrails_adapter": ("GuardrailsKernel",),
+        "health": ("ComponentHealth", "HealthChecker", "HealthReport", "HealthStatus"),
+        "langchain_adapter": ("LangChainKernel",),
+        "llamafirewall": (
+            "FirewallMode",
+            "FirewallResult",
+            "FirewallVerdict",
+            "LlamaFirewallAdapter",
+        ),
+        "llamaindex_adapter": ("LlamaIndexKernel",),
+        "logging": ("GovernanceLogger", "JSONFormatter", "get_logger"),
+        "maf_adapter": ("MAFKernel",),
+        "mistral_adapter": ("GovernedMistralClient", "MistralKernel"),
+        "openai_adapter": ("GovernedAssistant", "OpenAIKernel"),
+        "policy_compose": ("PolicyHierarchy", "compose_policies", "override_policy"),
+        "pydantic_ai_adapter": ("PydanticAIKernel",),
+        "rate_limiter": (
+            "AsyncRateLimiter",
+            "RateLimiter",
+            "RateLimitStatus",
+            "SharedMemoryRateLimiter",
+        ),
+        "semantic_kernel_adapter": ("GovernedSemanticKernel", "SemanticKernelWrapper"),
+        "templates": ("PolicyTemplates",),
+        "token_budget": ("TokenBudgetStatus", "TokenBudgetTracker"),
+        "webhooks": ("DeliveryRecord", "WebhookConfig", "WebhookEvent", "WebhookNotifier"),
+    }.items()
+    for name in names
+}
+_LAZY_EXPORTS["maf_govern"] = ("agent_os.integrations.maf_adapter", "govern")
+
+if TYPE_CHECKING:
+    from agent_os.integrations.a2a_adapter import A2AEvaluation, A2AGovernanceAdapter, A2APolicy
+    from agent_os.integrations.anthropic_adapter import AnthropicKernel, GovernedAnthropicClient
+    from agent_os.integrations.autogen_adapter import AutoGenKernel
+    from agent_os.integrations.crewai_adapter import CrewAIKernel
+    from agent_os.integrations.gemini_adapter import GeminiKernel, GovernedGeminiModel
+    from agent_os.integrations.google_adk_adapter import GoogleADKKernel
+    from agent_os.integrations.guardrails_adapter import GuardrailsKernel
+    from agent_os.integrations.langchain_adapter import LangChainKernel
+    from agent_os.integrations.llamafirewall import (
+        FirewallMode,
+        FirewallResult,
+        FirewallVerdict,
+        LlamaFirewallAdapter,
+    )
+    from agent_os.integrations.llamaindex_adapter import LlamaIndexKernel
+    from agent_os.integrations.maf_adapter import MAFKernel
+    from agent_os.integrations.maf_adapter import govern as maf_govern
+    from agent_os.integrations.mistral_adapter import GovernedMistralClient, MistralKernel
+    from agent_os.integrations.openai_adapter import GovernedAssistant, OpenAIKernel
+    from agent_os.integrations.pydantic_ai_adapter import PydanticAIKernel
+    from agent_os.integrations.semantic_kernel_adapter import (
+        GovernedSemanticKernel,
+        SemanticKernelWrapper,
+    )
+
+    from .base import (
+        AsyncGovernedWrapper,
+        BaseIntegration,
+        BoundedSemaphore,
+        CompositeInterceptor,
+        DriftResult,
+        GovernancePolicy,
+        PolicyInterceptor,
+        ToolCallInterceptor,
+        ToolCallRequest,
+        ToolCallResult,
+    )
+    from .config import AgentOSConfig, get_config, reset_config
+    from .dry_run import DryRunCollector, DryRunDecision, DryRunPolicy, DryRunResult
+    from .health import ComponentHealth, HealthChecker, HealthReport, HealthStatus
+    from .logging import GovernanceLogger, JSONFormatter, get_logger
+    from .policy_compose import PolicyHierarchy, compose_policies, override_policy
+    from .rate_limiter import (
+        AsyncRateLimiter,
+        RateLimiter,
+        RateLimitStatus,
+        SharedMemoryRateLimiter,
+    )
+    from .templates import PolicyTemplates
+    from .token_budget import TokenBudgetStatus, TokenBudgetTracker
+    from .webhooks import DeliveryRecord, WebhookConfig, WebhookEvent, WebhookNotifier
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module providing an export on first access."""
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    # Cache in the package namespace so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Base
@@ -168,6 +252,8 @@ __all__ = [
     # Rate Limiting
     "RateLimiter",
     "RateLimitStatus",
+    "AsyncRateLimiter",
+    "SharedMemoryRateLimiter",
     # Policy Templates
     "PolicyTemplates",
     # Webhooks
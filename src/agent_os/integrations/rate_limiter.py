@@ -3,12 +3,29 @@ Rate Limiting for Tool Calls
 
 Token bucket algorithm to rate-limit tool invocations per agent.
 Integrates with GovernancePolicy's max_tool_calls field.
+
+Three flavours share the same bucket arithmetic:
+
+* ``RateLimiter`` — thread-safe; buckets are spread over lock-striped shards
+  and idle buckets are evicted, so per-user/per-tool keys neither serialize
+  callers nor grow memory without bound.
+* ``AsyncRateLimiter`` — for a single event loop; no locks, plus an
+  awaitable ``acquire()`` that waits for a token.
+* ``SharedMemoryRateLimiter`` — one fixed-size bucket table in
+  ``multiprocessing.shared_memory`` shared by worker processes.
 """
 
+import asyncio
+import contextlib
+import hashlib
+import multiprocessing
+import struct
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional
+from multiprocessing import shared_memory
+from typing import Any, Optional
 
 from .base import GovernancePolicy
 
@@ -22,9 +39,47 @@ class RateLimitStatus:
     wait_seconds: float
 
 
+def _refilled(tokens: float, last: float, now: float, max_calls: int, rate: float) -> tuple[float, float]:
+    """Return ``(tokens, last_refill)`` after adding tokens accrued since *last*."""
+    elapsed = now - last
+    if elapsed > 0:
+        return min(max_calls, tokens + elapsed * rate), now
+    return tokens, last
+
+
+def _status(tokens: float, now: float, rate: float, time_window: float) -> RateLimitStatus:
+    remaining = int(tokens)
+    allowed = remaining >= 1
+    wait = 0.0 if allowed else ((1.0 - tokens) / rate if rate > 0 else 0.0)
+    return RateLimitStatus(
+        allowed=allowed,
+        remaining_calls=remaining,
+        reset_at=now + time_window,
+        wait_seconds=wait,
+    )
+
+
+class _Shard:
+    """A lock plus the buckets it guards, in least-recently-used order."""
+
+    __slots__ = ("lock", "buckets")
+
+    def __init__(self, lock: Any) -> None:
+        self.lock = lock
+        # key -> [tokens, last_refill]
+        self.buckets: "OrderedDict[str, list]" = OrderedDict()
+
+
 class RateLimiter:
     """Thread-safe token-bucket rate limiter for tool calls.
 
+    Keys are hashed across *shards* bucket maps, each with its own lock, so
+    callers contend only when their keys share a shard.  A bucket left idle
+    for a full *time_window* has refilled completely and is indistinguishable
+    from a new one, so such buckets are dropped; *idle_ttl* shortens or
+    lengthens that horizon and *max_keys* hard-caps the number of tracked
+    keys by evicting the least recently used ones.
+
     Args:
         max_calls: Maximum number of calls allowed per time window (bucket size).
         time_window: Duration of the time window in seconds.
@@ -32,6 +87,11 @@ class RateLimiter:
             If ``False``, a single global bucket is used for all agents.
         policy: Optional GovernancePolicy whose ``max_tool_calls`` overrides
             *max_calls*.
+        shards: Number of lock stripes.
+        max_keys: Upper bound on tracked keys (``None`` for no bound).  Evicted
+            keys start again with a full bucket.
+        idle_ttl: Seconds after which an untouched bucket is evicted
+            (defaults to *time_window*).
     """
 
     _GLOBAL_KEY = "__global__"
@@ -42,18 +102,33 @@ class RateLimiter:
         time_window: float = 60.0,
         per_agent: bool = True,
         policy: Optional[GovernancePolicy] = None,
+        shards: int = 16,
+        max_keys: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
     ) -> None:
         if max_calls <= 0:
             raise ValueError("max_calls must be positive")
         if time_window <= 0:
             raise ValueError("time_window must be positive")
+        if shards <= 0:
+            raise ValueError("shards must be positive")
+        if max_keys is not None and max_keys <= 0:
+            raise ValueError("max_keys must be positive")
 
         self._max_calls = policy.max_tool_calls if policy is not None else max_calls
         self._time_window = float(time_window)
+        self._rate = self._max_calls / self._time_window
         self._per_agent = per_agent
-        self._lock = threading.Lock()
-        # Each bucket: (tokens: float, last_refill: float)
-        self._buckets: dict[str, list] = {}
+        self._idle_ttl = self._time_window if idle_ttl is None else float(idle_ttl)
+        count = shards if per_agent else 1
+        if max_keys is not None:
+            count = min(count, max_keys)
+        self._shards = [_Shard(self._new_lock()) for _ in range(count)]
+        self._shard_capacity = None if max_keys is None else max_keys // count
+
+    @staticmethod
+    def _new_lock() -> Any:
+        return threading.Lock()
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -62,23 +137,41 @@ class RateLimiter:
     def _key(self, agent_id: str) -> str:
         return agent_id if self._per_agent else self._GLOBAL_KEY
 
+    def _shard(self, key: str) -> _Shard:
+        shards = self._shards
+        return shards[hash(key) % len(shards)]
+
     def _refill(self, bucket: list, now: float) -> None:
         """Add tokens accrued since the last refill."""
-        elapsed = now - bucket[1]
-        if elapsed > 0:
-            rate = self._max_calls / self._time_window
-            bucket[0] = min(self._max_calls, bucket[0] + elapsed * rate)
-            bucket[1] = now
-
-    def _get_bucket(self, key: str, now: float) -> list:
-        bucket = self._buckets.get(key)
+        bucket[0], bucket[1] = _refilled(bucket[0], bucket[1], now, self._max_calls, self._rate)
+
+    def _get_bucket(self, shard: _Shard, key: str, now: float) -> list:
+        """Return the refilled bucket for *key*; call with ``shard.lock`` held."""
+        buckets = shard.buckets
+        bucket = buckets.get(key)
         if bucket is None:
+            self._evict(shard, now)
             bucket = [float(self._max_calls), now]
-            self._buckets[key] = bucket
+            buckets[key] = bucket
         else:
+            buckets.move_to_end(key)
             self._refill(bucket, now)
         return bucket
 
+    def _evict(self, shard: _Shard, now: float) -> None:
+        """Drop idle buckets from the LRU end, then enforce the per-shard cap."""
+        buckets = shard.buckets
+        horizon = now - self._idle_ttl
+        while buckets:
+            oldest = next(iter(buckets.values()))
+            if oldest[1] > horizon:
+                break
+            buckets.popitem(last=False)
+        capacity = self._shard_capacity
+        if capacity is not None:
+            while len(buckets) >= capacity:
+                buckets.popitem(last=False)
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -86,8 +179,10 @@ class RateLimiter:
     def allow(self, agent_id: str) -> bool:
         """Try to consume one token. Returns ``True`` if the call is allowed."""
         now = time.monotonic()
-        with self._lock:
-            bucket = self._get_bucket(self._key(agent_id), now)
+        key = self._key(agent_id)
+        shard = self._shard(key)
+        with shard.lock:
+            bucket = self._get_bucket(shard, key, now)
             if bucket[0] >= 1.0:
                 bucket[0] -= 1.0
                 return True
@@ -96,22 +191,181 @@ class RateLimiter:
     def check(self, agent_id: str) -> RateLimitStatus:
         """Return current rate-limit status without consuming a token."""
         now = time.monotonic()
-        with self._lock:
-            bucket = self._get_bucket(self._key(agent_id), now)
-            remaining = int(bucket[0])
-            allowed = remaining >= 1
-            if allowed:
-                wait = 0.0
-            else:
-                rate = self._max_calls / self._time_window
-                wait = (1.0 - bucket[0]) / rate if rate > 0 else 0.0
-            reset_at = now + self._time_window
-        return RateLimitStatus(
-            allowed=allowed,
-            remaining_calls=remaining,
-            reset_at=reset_at,
-            wait_seconds=wait,
+        key = self._key(agent_id)
+        shard = self._shard(key)
+        with shard.lock:
+            tokens = self._get_bucket(shard, key, now)[0]
+        return _status(tokens, now, self._rate, self._time_window)
+
+    def wait_time(self, agent_id: str) -> float:
+        """Return seconds until at least one token is available (0.0 if available now)."""
+        return self.check(agent_id).wait_seconds
+
+    def reset(self, agent_id: str) -> None:
+        """Reset the bucket for *agent_id* (or the global bucket if ``per_agent=False``)."""
+        key = self._key(agent_id)
+        shard = self._shard(key)
+        with shard.lock:
+            shard.buckets.pop(key, None)
+
+    def __len__(self) -> int:
+        """Number of buckets currently tracked."""
+        return sum(len(shard.buckets) for shard in self._shards)
+
+
+class AsyncRateLimiter(RateLimiter):
+    """Token-bucket limiter for use from a single asyncio event loop.
+
+    Buckets are only touched from the loop thread, so shards carry no locks.
+    ``acquire()`` waits for a token instead of failing fast.
+    """
+
+    @staticmethod
+    def _new_lock() -> Any:
+        return contextlib.nullcontext()
+
+    async def acquire(self, agent_id: str, timeout: Optional[float] = None) -> bool:
+        """Wait until a token is available and consume it.
+
+        Returns ``False`` if no token became available within *timeout* seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.allow(agent_id):
+            wait = self.wait_time(agent_id)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining < wait:
+                    return False
+            await asyncio.sleep(wait)
+        return True
+
+
+class SharedMemoryRateLimiter:
+    """Token-bucket limiter whose buckets live in shared memory.
+
+    Worker processes attach to the same fixed-size table, so a limit holds
+    across the whole pool.  The table is set-associative: a key hashes to one
+    set of *ways* slots, and when the set is full its least recently refilled
+    bucket is evicted.  Sets are guarded by *locks* striped
+    ``multiprocessing`` locks.
+
+    Create the limiter in the parent and pass it to workers as a
+    ``multiprocessing.Process`` argument; ``close()`` it in every process
+    and ``unlink()`` it once in the parent.
+
+    Args:
+        max_calls: Maximum number of calls allowed per time window (bucket size).
+        time_window: Duration of the time window in seconds.
+        per_agent: If ``False``, a single global bucket is used for all agents.
+        policy: Optional GovernancePolicy whose ``max_tool_calls`` overrides
+            *max_calls*.
+        max_keys: Number of bucket slots in the table.
+        ways: Slots per set.
+        locks: Number of lock stripes.
+        mp_context: ``multiprocessing`` context the workers will be started
+            from (defaults to the global one).
+    """
+
+    _GLOBAL_KEY = "__global__"
+    # Slot layout: key hash (0 = empty), tokens, last refill
+    _SLOT = struct.Struct("<Qdd")
+
+    def __init__(
+        self,
+        max_calls: int = 10,
+        time_window: float = 60.0,
+        per_agent: bool = True,
+        policy: Optional[GovernancePolicy] = None,
+        max_keys: int = 65_536,
+        ways: int = 8,
+        locks: int = 64,
+        mp_context: Optional[Any] = None,
+    ) -> None:
+        if max_calls <= 0:
+            raise ValueError("max_calls must be positive")
+        if time_window <= 0:
+            raise ValueError("time_window must be positive")
+        if max_keys <= 0 or ways <= 0 or locks <= 0:
+            raise ValueError("max_keys, ways and locks must be positive")
+
+        self._max_calls = policy.max_tool_calls if policy is not None else max_calls
+        self._time_window = float(time_window)
+        self._rate = self._max_calls / self._time_window
+        self._per_agent = per_agent
+        self._ways = ways
+        self._sets = max(1, -(-max_keys // ways))
+        ctx = mp_context or multiprocessing
+        self._locks = [ctx.Lock() for _ in range(min(locks, self._sets))]
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=self._sets * ways * self._SLOT.size
         )
+        self._shm.buf[:] = bytes(self._shm.size)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_shm"] = self._shm.name
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._shm = shared_memory.SharedMemory(name=state["_shm"])
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _key_hash(self, agent_id: str) -> int:
+        key = agent_id if self._per_agent else self._GLOBAL_KEY
+        # Stable across processes, unlike hash(); 0 marks an empty slot
+        digest = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little")
+        return digest or 1
+
+    def _locate(self, key_hash: int, now: float) -> int:
+        """Return the byte offset of *key_hash*'s slot, claiming one if needed.
+
+        Call with the set's lock held.
+        """
+        slot, buf = self._SLOT, self._shm.buf
+        base = (key_hash % self._sets) * self._ways * slot.size
+        victim, victim_last = base, float("inf")
+        for way in range(self._ways):
+            offset = base + way * slot.size
+            stored, _, last = slot.unpack_from(buf, offset)
+            if stored == key_hash:
+                return offset
+            if stored == 0:
+                victim, victim_last = offset, float("-inf")
+            elif last < victim_last:
+                victim, victim_last = offset, last
+        slot.pack_into(buf, victim, key_hash, float(self._max_calls), now)
+        return victim
+
+    def _update(self, agent_id: str, consume: bool) -> tuple[float, float, bool]:
+        key_hash = self._key_hash(agent_id)
+        now = time.monotonic()
+        slot, buf = self._SLOT, self._shm.buf
+        with self._locks[(key_hash % self._sets) % len(self._locks)]:
+            offset = self._locate(key_hash, now)
+            _, tokens, last = slot.unpack_from(buf, offset)
+            tokens, last = _refilled(tokens, last, now, self._max_calls, self._rate)
+            allowed = tokens >= 1.0
+            if consume and allowed:
+                tokens -= 1.0
+            slot.pack_into(buf, offset, key_hash, tokens, last)
+        return tokens, now, allowed
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def allow(self, agent_id: str) -> bool:
+        """Try to consume one token. Returns ``True`` if the call is allowed."""
+        return self._update(agent_id, consume=True)[2]
+
+    def check(self, agent_id: str) -> RateLimitStatus:
+        """Return current rate-limit status without consuming a token."""
+        tokens, now, _ = self._update(agent_id, consume=False)
+        return _status(tokens, now, self._rate, self._time_window)
 
     def wait_time(self, agent_id: str) -> float:
         """Return seconds until at least one token is available (0.0 if available now)."""
@@ -119,5 +373,19 @@ class RateLimiter:
 
     def reset(self, agent_id: str) -> None:
         """Reset the bucket for *agent_id* (or the global bucket if ``per_agent=False``)."""
-        with self._lock:
-            self._buckets.pop(self._key(agent_id), None)
+        key_hash = self._key_hash(agent_id)
+        slot, buf = self._SLOT, self._shm.buf
+        base = (key_hash % self._sets) * self._ways * slot.size
+        with self._locks[(key_hash % self._sets) % len(self._locks)]:
+            for way in range(self._ways):
+                offset = base + way * slot.size
+                if slot.unpack_from(buf, offset)[0] == key_hash:
+                    slot.pack_into(buf, offset, 0, 0.0, 0.0)
+
+    def close(self) -> None:
+        """Detach this process from the shared table."""
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Free the shared table; call once, from the creating process."""
+        self._shm.unlink()
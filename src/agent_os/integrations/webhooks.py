@@ -3,14 +3,30 @@ Webhook notifications for policy violations and governance events.
 
 Sends POST requests to configured webhook endpoints when policy violations,
 budget warnings, or other governance events are detected.
+
+``notify()`` delivers inline.  ``notify_async()`` hands events to a delivery
+subsystem started on first use: each endpoint gets a bounded queue drained by
+a fixed number of worker threads that hold keep-alive connections, optionally
+batch events over a short window, and retry with jittered exponential
+backoff.  Like ``notify()``, workers honour the ``HTTP_PROXY``,
+``HTTPS_PROXY`` and ``NO_PROXY`` environment variables, read when delivery
+starts.  When an endpoint's queue is full, events are dropped or spilled to
+disk and replayed once the endpoint catches up.
 """
 
+import base64
+import http.client
 import json
 import logging
+import os
+import queue
+import random
 import threading
 import time
 import urllib.error
+import urllib.parse
 import urllib.request
+from concurrent.futures import Future
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Optional
@@ -27,6 +43,10 @@ class WebhookConfig:
     retry_count: int = 3
     retry_delay: float = 1.0
     events: list[str] = field(default_factory=list)
+    # Async delivery only: collect events for up to batch_window seconds and
+    # POST them together as {"events": [...]}; 0 sends one event per request
+    batch_window: float = 0.0
+    max_batch_size: int = 100
 
 
 @dataclass
@@ -59,17 +79,127 @@ class DeliveryRecord:
     error: Optional[str] = None
 
 
+_STOP = object()
+
+
+class _PendingEvent:
+    """Collects one event's delivery records across endpoints into a future."""
+
+    __slots__ = ("event", "future", "records", "remaining", "lock")
+
+    def __init__(self, event: "WebhookEvent", endpoints: int):
+        self.event = event
+        self.future: "Future[list[DeliveryRecord]]" = Future()
+        self.records: list[DeliveryRecord] = []
+        self.remaining = endpoints
+        self.lock = threading.Lock()
+
+    def resolve(self, record: DeliveryRecord) -> None:
+        with self.lock:
+            self.records.append(record)
+            self.remaining -= 1
+            done = self.remaining == 0
+        if done:
+            self.future.set_result(self.records)
+
+
+class _Endpoint:
+    """Delivery state for one webhook endpoint."""
+
+    def __init__(self, index: int, config: WebhookConfig, queue_size: int, spill_dir: Optional[str]):
+        self.config = config
+        self.queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self.threads: list[threading.Thread] = []
+        self.spill_path = (
+            os.path.join(spill_dir, f"endpoint-{index}.jsonl") if spill_dir else None
+        )
+        self.spill_lock = threading.Lock()
+        parts = urllib.parse.urlsplit(config.url)
+        self.connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self.netloc = parts.netloc
+        self.path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self.headers = {"Content-Type": "application/json", **config.headers}
+        self.address = parts.netloc
+        self.tunnel: Optional[tuple[str, dict[str, str]]] = None
+
+        # Honour HTTP(S)_PROXY / NO_PROXY the way urllib does for notify()
+        proxy = urllib.request.getproxies().get(parts.scheme)
+        if proxy and not urllib.request.proxy_bypass(parts.hostname or ""):
+            if "://" not in proxy:
+                proxy = f"http://{proxy}"
+            proxy_parts = urllib.parse.urlsplit(proxy)
+            self.address = proxy_parts.netloc.rpartition("@")[2]
+            proxy_headers: dict[str, str] = {}
+            if proxy_parts.username is not None:
+                credentials = "%s:%s" % (
+                    urllib.parse.unquote(proxy_parts.username),
+                    urllib.parse.unquote(proxy_parts.password or ""),
+                )
+                token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+                proxy_headers["Proxy-Authorization"] = f"Basic {token}"
+            if parts.scheme == "https":
+                self.tunnel = (parts.netloc, proxy_headers)
+            else:
+                # Plain HTTP goes through the proxy with the absolute URL
+                self.path = urllib.parse.urlunsplit(
+                    (parts.scheme, parts.netloc, parts.path or "/", parts.query, "")
+                )
+                self.headers.update(proxy_headers)
+
+    def connect(self, timeout: float) -> http.client.HTTPConnection:
+        """Open a connection to the endpoint, through its proxy if any."""
+        connection = self.connection_class(self.address, timeout=timeout)
+        if self.tunnel is not None:
+            connection.set_tunnel(self.tunnel[0], headers=self.tunnel[1])
+        return connection
+
+
 class WebhookNotifier:
     """Sends webhook notifications for governance events.
 
     Thread-safe notifier that delivers events to configured webhook endpoints
     with retry logic and delivery history tracking.
+
+    Args:
+        configs: Webhook endpoints.
+        workers_per_endpoint: Delivery threads per endpoint for
+            ``notify_async``.
+        queue_size: Events buffered per endpoint before *overflow* applies.
+        overflow: ``"drop"`` discards events when an endpoint's queue is
+            full; ``"spill"`` appends them to *spill_dir* for later replay.
+        spill_dir: Directory for spilled events (required for ``"spill"``).
+        max_backoff: Cap in seconds on the jittered retry delay.
     """
 
-    def __init__(self, configs: list[WebhookConfig]):
+    def __init__(
+        self,
+        configs: list[WebhookConfig],
+        workers_per_endpoint: int = 2,
+        queue_size: int = 1000,
+        overflow: str = "drop",
+        spill_dir: Optional[str] = None,
+        max_backoff: float = 30.0,
+    ):
+        if overflow not in ("drop", "spill"):
+            raise ValueError(f"overflow must be 'drop' or 'spill', got '{overflow}'")
+        if overflow == "spill" and not spill_dir:
+            raise ValueError("overflow='spill' requires spill_dir")
+        if workers_per_endpoint <= 0 or queue_size <= 0:
+            raise ValueError("workers_per_endpoint and queue_size must be positive")
         self._configs = list(configs)
         self._history: list[DeliveryRecord] = []
         self._lock = threading.Lock()
+        self._workers_per_endpoint = workers_per_endpoint
+        self._queue_size = queue_size
+        self._overflow = overflow
+        self._spill_dir = spill_dir
+        self._max_backoff = max_backoff
+        self._endpoints: Optional[list[_Endpoint]] = None
+        self._in_flight = 0
+        self._idle = threading.Condition(threading.Lock())
+        self._stats = {"delivered": 0, "failed": 0, "dropped": 0, "spilled": 0}
 
     def _matches(self, config: WebhookConfig, event: WebhookEvent) -> bool:
         """Check if a config subscribes to the given event type."""
@@ -136,11 +266,54 @@ class WebhookNotifier:
                 records.append(self._send(config, event))
         return records
 
-    def notify_async(self, event: WebhookEvent) -> threading.Thread:
-        """Send event to all matching webhooks in a background thread."""
-        thread = threading.Thread(target=self.notify, args=(event,), daemon=True)
-        thread.start()
-        return thread
+    def notify_async(self, event: WebhookEvent) -> "Future[list[DeliveryRecord]]":
+        """Queue event for all matching webhooks and return immediately.
+
+        The returned future resolves to one DeliveryRecord per matching
+        endpoint.  Events that did not fit in a full queue resolve with an
+        unsuccessful record saying whether they were dropped or spilled.
+        """
+        endpoints = [
+            endpoint for endpoint in self._start()
+            if self._matches(endpoint.config, event)
+        ]
+        pending = _PendingEvent(event, len(endpoints))
+        if not endpoints:
+            pending.future.set_result([])
+            return pending.future
+        for endpoint in endpoints:
+            with self._idle:
+                self._in_flight += 1
+            try:
+                endpoint.queue.put_nowait(pending)
+            except queue.Full:
+                self._overflowed(endpoint, pending)
+        return pending.future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event has been delivered or has failed.
+
+        Spilled events are not waited for.  Returns ``False`` on timeout.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._in_flight == 0, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush pending deliveries and stop the worker threads."""
+        self.flush(timeout)
+        endpoints, self._endpoints = self._endpoints, None
+        for endpoint in endpoints or ():
+            for _ in endpoint.threads:
+                endpoint.queue.put(_STOP)
+            for thread in endpoint.threads:
+                thread.join(timeout)
+
+    def stats(self) -> dict[str, int]:
+        """Counters for asynchronous delivery."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["queued"] = sum(e.queue.qsize() for e in self._endpoints or ())
+        return stats
 
     def notify_violation(
         self, agent_id: str, action: str, policy_name: str, reason: str
@@ -173,3 +346,226 @@ class WebhookNotifier:
         """Return a copy of all delivery records."""
         with self._lock:
             return list(self._history)
+
+    # -- asynchronous delivery ---------------------------------------------
+
+    def _start(self) -> list[_Endpoint]:
+        """Create endpoint queues and worker threads on first use."""
+        endpoints = self._endpoints
+        if endpoints is not None:
+            return endpoints
+        with self._lock:
+            if self._endpoints is None:
+                if self._spill_dir:
+                    os.makedirs(self._spill_dir, exist_ok=True)
+                endpoints = [
+                    _Endpoint(i, config, self._queue_size, self._spill_dir)
+                    for i, config in enumerate(self._configs)
+                ]
+                for endpoint in endpoints:
+                    for n in range(self._workers_per_endpoint):
+                        thread = threading.Thread(
+                            target=self._worker,
+                            args=(endpoint,),
+                            name=f"webhook-{endpoint.netloc}-{n}",
+                            daemon=True,
+                        )
+                        endpoint.threads.append(thread)
+                        thread.start()
+                self._endpoints = endpoints
+            return self._endpoints
+
+    def _overflowed(self, endpoint: _Endpoint, pending: _PendingEvent) -> None:
+        """Drop or spill an event that did not fit in the endpoint queue."""
+        outcome = "dropped"
+        if self._overflow == "spill":
+            try:
+                line = json.dumps(asdict(pending.event))
+                with endpoint.spill_lock, open(endpoint.spill_path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+                outcome = "spilled"
+            except (OSError, TypeError, ValueError) as exc:
+                logger.warning("Webhook spill to %s failed: %s", endpoint.spill_path, exc)
+        with self._lock:
+            self._stats[outcome] += 1
+        self._complete(endpoint, [pending], None, f"queue full: event {outcome}", record=False)
+
+    def _replay_spill(self, endpoint: _Endpoint) -> None:
+        """Re-queue spilled events while the endpoint has spare capacity."""
+        if endpoint.spill_path is None or not os.path.exists(endpoint.spill_path):
+            return
+        with endpoint.spill_lock:
+            try:
+                with open(endpoint.spill_path, encoding="utf-8") as f:
+                    lines = f.readlines()
+            except OSError:
+                return
+            replayed = 0
+            for line in lines:
+                try:
+                    event = WebhookEvent(**json.loads(line))
+                except (TypeError, ValueError) as exc:
+                    # A corrupt line must not stop the worker or block the file
+                    logger.warning("Discarding unreadable spilled webhook event: %s", exc)
+                    with self._lock:
+                        self._stats["dropped"] += 1
+                    replayed += 1
+                    continue
+                pending = _PendingEvent(event, 1)
+                with self._idle:
+                    self._in_flight += 1
+                try:
+                    endpoint.queue.put_nowait(pending)
+                except queue.Full:
+                    self._finish(1)
+                    break
+                replayed += 1
+            rest = lines[replayed:]
+            try:
+                if rest:
+                    with open(endpoint.spill_path, "w", encoding="utf-8") as f:
+                        f.writelines(rest)
+                else:
+                    os.remove(endpoint.spill_path)
+            except OSError as exc:
+                logger.warning("Webhook spill rewrite of %s failed: %s", endpoint.spill_path, exc)
+
+    def _worker(self, endpoint: _Endpoint) -> None:
+        """Deliver events for one endpoint over a keep-alive connection."""
+        config = endpoint.config
+        connection: Optional[http.client.HTTPConnection] = None
+        stopping = False
+        while not stopping:
+            try:
+                item = endpoint.queue.get(timeout=1.0)
+            except queue.Empty:
+                self._replay_spill(endpoint)
+                continue
+            if item is _STOP:
+                break
+            batch = [item]
+            if config.batch_window > 0:
+                deadline = time.monotonic() + config.batch_window
+                while len(batch) < config.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = endpoint.queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+            connection = self._deliver(endpoint, batch, connection)
+            if endpoint.queue.empty():
+                self._replay_spill(endpoint)
+        if connection is not None:
+            connection.close()
+
+    def _deliver(
+        self,
+        endpoint: _Endpoint,
+        batch: list[_PendingEvent],
+        connection: Optional[http.client.HTTPConnection],
+    ) -> Optional[http.client.HTTPConnection]:
+        """POST a batch with retries; returns the connection to keep alive.
+
+        Every event in *batch* is resolved exactly once, whatever goes wrong,
+        so a bad payload cannot stop the worker or leave futures pending.
+        """
+        config = endpoint.config
+        status: Optional[int] = None
+        error: Optional[str] = None
+        try:
+            if config.batch_window > 0:
+                body = {"events": [asdict(p.event) for p in batch]}
+            else:
+                body = asdict(batch[0].event)
+            payload = json.dumps(body).encode("utf-8")
+        except Exception as exc:
+            error = f"payload not serializable: {exc}"
+            logger.warning(
+                "Webhook delivery failed for %d event(s) to %s: %s",
+                len(batch), config.url, error,
+            )
+            self._complete(endpoint, batch, None, error)
+            return connection
+
+        attempt = 0
+        while attempt < max(config.retry_count, 1):
+            reused = connection is not None
+            try:
+                if connection is None:
+                    connection = endpoint.connect(config.timeout)
+                connection.request("POST", endpoint.path, body=payload, headers=endpoint.headers)
+                response = connection.getresponse()
+                response.read()
+                status = response.status
+                if response.will_close:
+                    connection.close()
+                    connection = None
+                if status < 400:
+                    self._complete(endpoint, batch, status, None)
+                    return connection
+                error = f"HTTP Error {status}: {response.reason}"
+            except Exception as exc:
+                if connection is not None:
+                    connection.close()
+                    connection = None
+                if reused and isinstance(exc, (OSError, http.client.HTTPException)):
+                    # The server closed an idle keep-alive connection; retry
+                    # right away on a fresh one without spending an attempt
+                    continue
+                error = str(exc) or type(exc).__name__
+            attempt += 1
+            if attempt < config.retry_count:
+                time.sleep(self._backoff(config, attempt))
+
+        logger.warning(
+            "Webhook delivery failed for %d event(s) to %s: %s",
+            len(batch), config.url, error,
+        )
+        self._complete(endpoint, batch, status, error)
+        return connection
+
+    def _backoff(self, config: WebhookConfig, attempt: int) -> float:
+        """Exponential backoff with jitter in [delay / 2, delay]."""
+        delay = min(self._max_backoff, config.retry_delay * 2 ** (attempt - 1))
+        return random.uniform(delay / 2, delay)
+
+    def _complete(
+        self,
+        endpoint: _Endpoint,
+        batch: list[_PendingEvent],
+        status: Optional[int],
+        error: Optional[str],
+        record: bool = True,
+    ) -> None:
+        """Record delivery outcomes and resolve the events' futures."""
+        timestamp = datetime.now(timezone.utc).isoformat()
+        records = [
+            DeliveryRecord(
+                url=endpoint.config.url,
+                event_type=pending.event.event_type,
+                status_code=status,
+                success=error is None,
+                timestamp=timestamp,
+                error=error,
+            )
+            for pending in batch
+        ]
+        if record:
+            with self._lock:
+                self._history.extend(records)
+                self._stats["delivered" if error is None else "failed"] += len(batch)
+        for pending, delivery in zip(batch, records):
+            pending.resolve(delivery)
+        self._finish(len(batch))
+
+    def _finish(self, count: int) -> None:
+        with self._idle:
+            self._in_flight -= count
+            if self._in_flight == 0:
+                self._idle.notify_all()
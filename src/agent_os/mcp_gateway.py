@@ -10,19 +10,26 @@ Addresses OWASP ASI02 (Tool Misuse & Exploitation) by providing:
 - Per-agent rate limiting / call budget enforcement
 - Structured audit logging of every tool invocation
 - Human-in-the-loop approval for sensitive tools
+
+The configuration is compiled once: allow/deny decisions are cached per
+tool name, regexes that need a literal only run when it is present, and the
+remaining patterns are merged into a single screening regex.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import operator
 import re
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 from agent_os.integrations.base import GovernancePolicy, PatternType
+from agent_os._regex_prefilter import required_literals
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +46,29 @@ _BUILTIN_DANGEROUS_PATTERNS: list[tuple[str, PatternType]] = [
     (r"`[^`]+`", PatternType.REGEX),                          # backtick execution
 ]
 
+_BUILTIN_COMPILED: tuple[tuple[str, re.Pattern], ...] = tuple(
+    (pat_str, re.compile(pat_str, re.IGNORECASE))
+    for pat_str, _ in _BUILTIN_DANGEROUS_PATTERNS
+)
+
+# Patterns that refer to their own groups cannot be merged into one alternation
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+def _search_form(pattern: str) -> str:
+    """Drop the leading ``.*`` of a translated glob.
+
+    ``search`` already tries every start position, so the prefix never
+    changes whether a match exists; it only makes each scan quadratic.
+    """
+    if pattern.startswith("(?s:.*") and not pattern.startswith("(?s:.*?"):
+        return "(?s:" + pattern[6:]
+    return pattern
+
+
+# Upper bound on distinct tool names remembered by the decision cache
+_DECISION_CACHE_SIZE = 4096
+
 
 class ApprovalStatus(Enum):
     """Result of a human-approval check."""
@@ -82,12 +112,159 @@ class GatewayConfig:
     builtin_sanitization: bool
 
 
+class _Budget:
+    """Remaining tool calls for one agent.
+
+    Taking a token is a single ``next()`` on a range iterator, which cannot
+    interleave with another thread's, so concurrent calls never overspend
+    the budget even though no lock is taken.
+    """
+
+    __slots__ = ("limit", "tokens")
+
+    def __init__(self, used: int, limit: int) -> None:
+        self.limit = max(used, limit)
+        self.tokens: Iterator[int] = iter(range(used, self.limit))
+
+    @property
+    def used(self) -> int:
+        return self.limit - operator.length_hint(self.tokens)
+
+
+@dataclass
+class _CompiledPolicy:
+    """Gateway configuration precomputed for :meth:`MCPGateway.intercept_tool_call`."""
+    policy: GovernancePolicy
+    denied: frozenset[str]
+    allowed: frozenset[str]
+    # None means every tool requires approval
+    approval_required: frozenset[str] | None
+    max_tool_calls: int
+    # Lower-cased substring patterns
+    substrings: tuple[str, ...]
+    # Regexes run only when one of their required literals is present
+    # (no literals: always run)
+    keyed: tuple[tuple[tuple[str, ...], re.Pattern], ...]
+    # Every other regex/glob/built-in pattern as one alternation
+    screen: re.Pattern | None
+    builtins: tuple[tuple[str, re.Pattern], ...]
+    # tool name -> (deny reason or None, requires approval)
+    decisions: dict[str, tuple[str | None, bool]] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        policy: GovernancePolicy,
+        denied_tools: list[str],
+        sensitive_tools: list[str],
+        builtin_sanitization: bool,
+    ) -> _CompiledPolicy:
+        builtins = _BUILTIN_COMPILED if builtin_sanitization else ()
+        patterns = [
+            _search_form(compiled.pattern)
+            for _, pat_type, compiled in policy._compiled_patterns
+            if pat_type != PatternType.SUBSTRING and compiled is not None
+        ]
+        patterns += [compiled.pattern for _, compiled in builtins]
+        keyed: list[tuple[tuple[str, ...], re.Pattern]] = []
+        merged: list[str] = []
+        for pattern in patterns:
+            literals = required_literals(pattern)
+            if literals is None and not _GROUP_REFERENCE.search(pattern):
+                merged.append(pattern)
+            else:
+                keyed.append((tuple(literals or ()), re.compile(pattern, re.IGNORECASE)))
+        screen = None
+        if merged:
+            try:
+                screen = re.compile(
+                    "|".join(f"(?:{pattern})" for pattern in merged), re.IGNORECASE
+                )
+            except re.error:
+                # e.g. duplicate group names or a global inline flag
+                keyed += [((), re.compile(pattern, re.IGNORECASE)) for pattern in merged]
+        return cls(
+            policy=policy,
+            denied=frozenset(denied_tools),
+            allowed=frozenset(policy.allowed_tools),
+            approval_required=(
+                None if policy.require_human_approval else frozenset(sensitive_tools)
+            ),
+            max_tool_calls=policy.max_tool_calls,
+            substrings=tuple(
+                pat_str.lower()
+                for pat_str, pat_type, _ in policy._compiled_patterns
+                if pat_type == PatternType.SUBSTRING
+            ),
+            keyed=tuple(keyed),
+            screen=screen,
+            builtins=builtins,
+        )
+
+    def decide(self, tool_name: str) -> tuple[str | None, bool]:
+        """Allow/deny decision for *tool_name*, computed once per tool."""
+        decision = self.decisions.get(tool_name)
+        if decision is not None:
+            return decision
+        reason = None
+        if tool_name in self.denied:
+            reason = f"Tool '{tool_name}' is on the deny list"
+        elif self.allowed and tool_name not in self.allowed:
+            reason = f"Tool '{tool_name}' is not on the allow list"
+        decision = (
+            reason,
+            self.approval_required is None or tool_name in self.approval_required,
+        )
+        if len(self.decisions) >= _DECISION_CACHE_SIZE:
+            self.decisions.clear()
+        self.decisions[tool_name] = decision
+        return decision
+
+    def screen_parameters(self, param_text: str) -> str | None:
+        """Return why *param_text* is blocked, or None when it is clean."""
+        lowered = param_text.lower()
+        if not self._matches(param_text, lowered):
+            return None
+        # Rare path: report the hit exactly as pattern-by-pattern checks would
+        matches = self.policy.matches_pattern(param_text)
+        if matches:
+            return f"Parameters matched blocked pattern(s): {matches}"
+        for pat_str, compiled in self.builtins:
+            if compiled.search(param_text):
+                return f"Parameters matched dangerous pattern: {pat_str}"
+        return None
+
+    def _matches(self, param_text: str, lowered: str) -> bool:
+        for substring in self.substrings:
+            if substring in lowered:
+                return True
+        if self.screen is not None and self.screen.search(param_text):
+            return True
+        # json.dumps escapes non-ASCII, so lower-cased literal checks are exact
+        for literals, regex in self.keyed:
+            if literals:
+                for literal in literals:
+                    if literal in lowered:
+                        break
+                else:
+                    continue
+            if regex.search(param_text):
+                return True
+        return False
+
+
 class MCPGateway:
     """Security gateway that sits between MCP clients and servers.
 
     Enforces governance policies on all tool calls passing through,
     providing defense against tool misuse, data exfiltration, and
     unauthorized access (OWASP ASI02).
+
+    The policy is compiled on construction and whenever ``policy``,
+    ``denied_tools``, ``sensitive_tools`` or ``enable_builtin_sanitization``
+    is reassigned.  In-place edits to the tool lists or to the policy's
+    allow-list, patterns, approval flag or call budget are detected on the
+    next call and recompile it too.
     """
 
     def __init__(
@@ -109,23 +286,99 @@ class MCPGateway:
             enable_builtin_sanitization: When True, apply built-in dangerous-
                 parameter patterns in addition to the policy's blocked_patterns.
         """
-        self.policy = policy
-        self.denied_tools: list[str] = denied_tools or []
-        self.sensitive_tools: list[str] = sensitive_tools or []
+        self._policy = policy
+        self._denied_tools: list[str] = denied_tools or []
+        self._sensitive_tools: list[str] = sensitive_tools or []
         self.approval_callback = approval_callback
-        self.enable_builtin_sanitization = enable_builtin_sanitization
+        self._enable_builtin_sanitization = enable_builtin_sanitization
 
-        # Per-agent call counters for rate limiting
-        self._agent_call_counts: dict[str, int] = {}
+        # Per-agent remaining call budgets for rate limiting
+        self._budgets: dict[str, _Budget] = {}
         # Audit log
         self._audit_log: list[AuditEntry] = []
-        # Pre-compile built-in patterns
-        self._builtin_compiled: list[tuple[str, re.Pattern]] = []
-        if enable_builtin_sanitization:
-            for pat_str, _ in _BUILTIN_DANGEROUS_PATTERNS:
-                self._builtin_compiled.append(
-                    (pat_str, re.compile(pat_str, re.IGNORECASE))
-                )
+        self._compile_lock = threading.Lock()
+        self._compiled: _CompiledPolicy | None = None
+        self._signature: tuple | None = None
+        self.refresh_policy()
+
+    # ── Configuration ────────────────────────────────────────────────────
+
+    @property
+    def policy(self) -> GovernancePolicy:
+        return self._policy
+
+    @policy.setter
+    def policy(self, policy: GovernancePolicy) -> None:
+        self._policy = policy
+        self.refresh_policy()
+
+    @property
+    def denied_tools(self) -> list[str]:
+        return self._denied_tools
+
+    @denied_tools.setter
+    def denied_tools(self, tools: list[str]) -> None:
+        self._denied_tools = tools
+        self.refresh_policy()
+
+    @property
+    def sensitive_tools(self) -> list[str]:
+        return self._sensitive_tools
+
+    @sensitive_tools.setter
+    def sensitive_tools(self, tools: list[str]) -> None:
+        self._sensitive_tools = tools
+        self.refresh_policy()
+
+    @property
+    def enable_builtin_sanitization(self) -> bool:
+        return self._enable_builtin_sanitization
+
+    @enable_builtin_sanitization.setter
+    def enable_builtin_sanitization(self, enabled: bool) -> None:
+        self._enable_builtin_sanitization = enabled
+        self.refresh_policy()
+
+    def refresh_policy(self) -> None:
+        """Recompile the gateway policy and drop cached tool decisions.
+
+        Calls already made keep counting against the (possibly new)
+        ``max_tool_calls`` budget.
+        """
+        with self._compile_lock:
+            signature = self._policy_signature()
+            compiled = _CompiledPolicy.build(
+                self._policy,
+                self._denied_tools,
+                self._sensitive_tools,
+                self._enable_builtin_sanitization,
+            )
+            previous = self._compiled
+            if previous is not None and previous.max_tool_calls != compiled.max_tool_calls:
+                self._budgets = {
+                    agent_id: _Budget(budget.used, compiled.max_tool_calls)
+                    for agent_id, budget in list(self._budgets.items())
+                }
+            self._compiled = compiled
+            self._signature = signature
+
+    def _policy_signature(self) -> tuple:
+        """Everything the compiled policy is built from, for change detection."""
+        policy = self._policy
+        return (
+            tuple(self._denied_tools),
+            tuple(self._sensitive_tools),
+            tuple(policy.allowed_tools),
+            tuple(policy._compiled_patterns),
+            policy.require_human_approval,
+            policy.max_tool_calls,
+        )
+
+    def _current_policy(self) -> _CompiledPolicy:
+        """Compiled policy, rebuilt when its inputs were edited in place."""
+        if self._policy_signature() != self._signature:
+            self.refresh_policy()
+        return self._compiled
 
     # ── Core interception ────────────────────────────────────────────────
 
@@ -183,50 +436,34 @@ class MCPGateway:
         tool_name: str,
         params: dict[str, Any],
     ) -> tuple[bool, str, ApprovalStatus | None]:
-        # 1. Deny-list check
-        if tool_name in self.denied_tools:
-            return False, f"Tool '{tool_name}' is on the deny list", None
+        compiled = self._current_policy()
 
-        # 2. Allow-list check (empty list means all tools allowed)
-        if self.policy.allowed_tools and tool_name not in self.policy.allowed_tools:
-            return False, f"Tool '{tool_name}' is not on the allow list", None
+        # 1–2. Deny-list, then allow-list (empty allow-list means all tools)
+        denial, needs_approval = compiled.decide(tool_name)
+        if denial is not None:
+            return False, denial, None
 
-        # 3. Parameter sanitization
+        # 3. Parameter sanitization (policy blocked patterns, then built-ins)
         param_text = json.dumps(params, default=str)
-
-        # 3a. Policy blocked patterns
-        matches = self.policy.matches_pattern(param_text)
-        if matches:
-            return (
-                False,
-                f"Parameters matched blocked pattern(s): {matches}",
-                None,
+        blocked = compiled.screen_parameters(param_text)
+        if blocked is not None:
+            return False, blocked, None
+
+        # 4. Rate limiting — only calls that get this far spend budget
+        budget = self._budgets.get(agent_id)
+        if budget is None:
+            budget = self._budgets.setdefault(
+                agent_id, _Budget(0, compiled.max_tool_calls)
             )
-
-        # 3b. Built-in dangerous patterns
-        if self.enable_builtin_sanitization:
-            for pat_str, compiled in self._builtin_compiled:
-                if compiled.search(param_text):
-                    return (
-                        False,
-                        f"Parameters matched dangerous pattern: {pat_str}",
-                        None,
-                    )
-
-        # 4. Rate limiting
-        count = self._agent_call_counts.get(agent_id, 0)
-        if count >= self.policy.max_tool_calls:
+        if next(budget.tokens, None) is None:
             return (
                 False,
-                f"Agent '{agent_id}' exceeded call budget ({self.policy.max_tool_calls})",
+                f"Agent '{agent_id}' exceeded call budget ({compiled.max_tool_calls})",
                 None,
             )
 
-        # Increment call counter (only on successful evaluation past this point)
-        self._agent_call_counts[agent_id] = count + 1
-
         # 5. Human approval
-        if self.policy.require_human_approval or tool_name in self.sensitive_tools:
+        if needs_approval:
             if self.approval_callback is not None:
                 try:
                     status = self.approval_callback(agent_id, tool_name, params)
@@ -283,12 +520,13 @@ class MCPGateway:
 
     def get_agent_call_count(self, agent_id: str) -> int:
         """Return the number of calls made by *agent_id*."""
-        return self._agent_call_counts.get(agent_id, 0)
+        budget = self._budgets.get(agent_id)
+        return budget.used if budget is not None else 0
 
     def reset_agent_budget(self, agent_id: str) -> None:
         """Reset the call counter for *agent_id*."""
-        self._agent_call_counts.pop(agent_id, None)
+        self._budgets.pop(agent_id, None)
 
     def reset_all_budgets(self) -> None:
         """Reset call counters for every agent."""
-        self._agent_call_counts.clear()
+        self._budgets.clear()
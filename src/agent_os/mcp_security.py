@@ -32,10 +32,13 @@ from __future__ import annotations
 
 import base64
 import hashlib
+import itertools
 import json
 import logging
 import re
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -182,6 +185,107 @@ _SUSPICIOUS_DECODED_KEYWORDS: list[str] = [
     "send", "curl", "fetch",
 ]
 
+# Typosquatting: names of at least this length within this many edits
+_TYPOSQUAT_MIN_LENGTH = 4
+_TYPOSQUAT_MAX_EDITS = 2
+
+
+# ---------------------------------------------------------------------------
+# Tool name index
+# ---------------------------------------------------------------------------
+
+def _segments(length: int) -> list[tuple[int, int]]:
+    """Split a name of *length* into (start, end) spans for the name index.
+
+    With ``2 * _TYPOSQUAT_MAX_EDITS + 1`` spans, at least
+    ``_TYPOSQUAT_MAX_EDITS + 1`` of them survive any allowed edit unchanged.
+    """
+    parts = min(2 * _TYPOSQUAT_MAX_EDITS + 1, length)
+    bounds = [length * i // parts for i in range(parts + 1)]
+    return list(zip(bounds, bounds[1:]))
+
+
+class _ToolNameIndex:
+    """Registered tool names, indexed for exact and near-duplicate lookup.
+
+    Near-duplicates are found by the pigeonhole principle: each edit
+    touches at most one segment of a name, so when two names are within
+    ``_TYPOSQUAT_MAX_EDITS`` edits, all but that many of the other name's
+    segments appear unchanged, shifted by at most that many positions.
+    Each name is stored under its segments; a lookup probes a few dozen keys
+    and only verifies names that hit enough distinct segments.
+    """
+
+    def __init__(self) -> None:
+        # tool name -> [(registration order, fingerprint)]
+        self._by_name: dict[str, list[tuple[int, ToolFingerprint]]] = {}
+        # lower-cased name -> [(registration order, fingerprint)]
+        self._by_lowered: dict[str, list[tuple[int, ToolFingerprint]]] = {}
+        # (name length, segment number, segment text) -> lower-cased names
+        self._segments: dict[tuple[int, int, str], list[str]] = {}
+        self._count = 0
+
+    def add(self, fp: ToolFingerprint) -> None:
+        entry = (self._count, fp)
+        self._count += 1
+        self._by_name.setdefault(fp.tool_name, []).append(entry)
+        lowered = fp.tool_name.lower()
+        same = self._by_lowered.get(lowered)
+        if same is not None:
+            same.append(entry)
+            return
+        self._by_lowered[lowered] = [entry]
+        if len(lowered) < _TYPOSQUAT_MIN_LENGTH:
+            return
+        for number, (start, end) in enumerate(_segments(len(lowered))):
+            self._segments.setdefault(
+                (len(lowered), number, lowered[start:end]), []
+            ).append(lowered)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def exact(self, tool_name: str) -> list[tuple[int, ToolFingerprint]]:
+        """Fingerprints registered under exactly *tool_name*."""
+        return self._by_name.get(tool_name, [])
+
+    def similar(self, tool_name: str) -> list[tuple[int, ToolFingerprint]]:
+        """Fingerprints whose name is 1 to ``_TYPOSQUAT_MAX_EDITS`` edits away.
+
+        Names are compared case-insensitively and both must be at least
+        ``_TYPOSQUAT_MIN_LENGTH`` characters long.
+        """
+        query = tool_name.lower()
+        size = len(query)
+        if size < _TYPOSQUAT_MIN_LENGTH:
+            return []
+        k = _TYPOSQUAT_MAX_EDITS
+        segments = self._segments
+        found: list[tuple[int, ToolFingerprint]] = []
+        for length in range(max(size - k, _TYPOSQUAT_MIN_LENGTH), size + k + 1):
+            # An unedited segment shifted by s needs |s| edits before it and
+            # |size - length - s| after it, which bounds s to this window
+            delta = size - length
+            low, high = -((k - delta) // 2), (k + delta) // 2
+            spans = _segments(length)
+            # Names of this length sharing each segment with the query
+            matched: list[set[str]] = []
+            for number, (start, end) in enumerate(spans):
+                width = end - start
+                names: set[str] = set()
+                for pos in range(max(start + low, 0), min(start + high, size - width) + 1):
+                    names.update(segments.get((length, number, query[pos:pos + width]), ()))
+                matched.append(names)
+            # All but k of a candidate's segments must have been found
+            candidates: set[str] = set()
+            for group in itertools.combinations(matched, len(spans) - k):
+                candidates |= set.intersection(*group)
+            candidates.discard(query)
+            for name in candidates:
+                if _levenshtein(query, name, k) <= k:
+                    found.extend(self._by_lowered[name])
+        return found
+
 
 # ---------------------------------------------------------------------------
 # MCPSecurityScanner
@@ -201,10 +305,24 @@ class MCPSecurityScanner:
             print(f"Found {len(threats)} threat(s)")
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, cache_size: int = 65_536) -> None:
+        """
+        Args:
+            cache_size: Number of tool definitions whose findings are kept
+                between scans (0 disables the cache).
+        """
         self._tool_registry: dict[str, ToolFingerprint] = {}
+        self._name_index = _ToolNameIndex()
         self._audit_log: list[dict[str, Any]] = []
         self._injection_detector = PromptInjectionDetector()
+        self._cache_size = cache_size
+        # (server, tool, description hash, schema hash) -> content findings
+        self._content_cache: OrderedDict[tuple[str, str, str, str], list[MCPThreat]] = OrderedDict()
+        # (tool, server) -> cross-server findings, valid while no tool is added
+        self._cross_server_cache: OrderedDict[tuple[str, str], list[MCPThreat]] = OrderedDict()
+        self._cross_server_indexed = 0
+        # Guards both caches, which concurrent scans share
+        self._cache_lock = threading.Lock()
 
     # -- public API ---------------------------------------------------------
 
@@ -226,15 +344,13 @@ class MCPSecurityScanner:
         Returns:
             List of ``MCPThreat`` findings (empty if clean).
         """
-        threats: list[MCPThreat] = []
-
-        threats.extend(self._check_hidden_instructions(description, tool_name, server_name))
-        threats.extend(self._check_description_injection(description, tool_name, server_name))
-        if schema is not None:
-            threats.extend(self._check_schema_abuse(schema, tool_name, server_name))
+        desc_hash, schema_hash = _definition_hashes(description, schema)
+        threats = list(self._check_content(
+            tool_name, description, schema, server_name, desc_hash, schema_hash,
+        ))
         threats.extend(self._check_cross_server(tool_name, server_name))
 
-        rug_pull = self.check_rug_pull(tool_name, description, schema, server_name)
+        rug_pull = self._rug_pull_threat(tool_name, server_name, desc_hash, schema_hash)
         if rug_pull is not None:
             threats.append(rug_pull)
 
@@ -292,11 +408,7 @@ class MCPSecurityScanner:
         """
         key = f"{server_name}::{tool_name}"
         now = time.time()
-        desc_hash = hashlib.sha256(description.encode("utf-8")).hexdigest()
-        schema_hash = hashlib.sha256(
-            json.dumps(schema, sort_keys=True, default=str).encode("utf-8")
-            if schema else b""
-        ).hexdigest()
+        desc_hash, schema_hash = _definition_hashes(description, schema)
 
         existing = self._tool_registry.get(key)
         if existing is not None:
@@ -319,6 +431,7 @@ class MCPSecurityScanner:
             version=1,
         )
         self._tool_registry[key] = fp
+        self._name_index.add(fp)
         return fp
 
     def check_rug_pull(
@@ -333,16 +446,28 @@ class MCPSecurityScanner:
         Returns:
             An ``MCPThreat`` if a rug pull is detected, else ``None``.
         """
-        key = f"{server_name}::{tool_name}"
-        existing = self._tool_registry.get(key)
-        if existing is None:
+        if f"{server_name}::{tool_name}" not in self._tool_registry:
             return None
+        desc_hash, schema_hash = _definition_hashes(description, schema)
+        return self._rug_pull_threat(tool_name, server_name, desc_hash, schema_hash)
+
+    @property
+    def audit_log(self) -> list[dict[str, Any]]:
+        """Return a copy of the scan audit history."""
+        return list(self._audit_log)
 
-        desc_hash = hashlib.sha256(description.encode("utf-8")).hexdigest()
-        schema_hash = hashlib.sha256(
-            json.dumps(schema, sort_keys=True, default=str).encode("utf-8")
-            if schema else b""
-        ).hexdigest()
+    # -- private detection methods ------------------------------------------
+
+    def _rug_pull_threat(
+        self,
+        tool_name: str,
+        server_name: str,
+        desc_hash: str,
+        schema_hash: str,
+    ) -> MCPThreat | None:
+        existing = self._tool_registry.get(f"{server_name}::{tool_name}")
+        if existing is None:
+            return None
 
         changes: list[str] = []
         if existing.description_hash != desc_hash:
@@ -364,12 +489,45 @@ class MCPSecurityScanner:
             )
         return None
 
-    @property
-    def audit_log(self) -> list[dict[str, Any]]:
-        """Return a copy of the scan audit history."""
-        return list(self._audit_log)
+    def _check_content(
+        self,
+        tool_name: str,
+        description: str,
+        schema: dict[str, Any] | None,
+        server_name: str,
+        desc_hash: str,
+        schema_hash: str,
+    ) -> list[MCPThreat]:
+        """Findings that depend only on the tool definition, cached by its hashes."""
+        key = (server_name, tool_name, desc_hash, schema_hash)
+        cache = self._content_cache
+        cached = self._cached(cache, key)
+        if cached is not None:
+            return cached
 
-    # -- private detection methods ------------------------------------------
+        threats: list[MCPThreat] = []
+        threats.extend(self._check_hidden_instructions(description, tool_name, server_name))
+        threats.extend(self._check_description_injection(description, tool_name, server_name))
+        if schema is not None:
+            threats.extend(self._check_schema_abuse(schema, tool_name, server_name))
+
+        self._remember(cache, key, threats)
+        return threats
+
+    def _cached(self, cache: OrderedDict, key: tuple) -> list[MCPThreat] | None:
+        """Cached findings for *key*, marked as most recently used."""
+        with self._cache_lock:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+            return cached
+
+    def _remember(self, cache: OrderedDict, key: tuple, threats: list[MCPThreat]) -> None:
+        if self._cache_size > 0:
+            with self._cache_lock:
+                cache[key] = threats
+                if len(cache) > self._cache_size:
+                    cache.popitem(last=False)
 
     def _check_hidden_instructions(
         self,
@@ -597,11 +755,30 @@ class MCPSecurityScanner:
         server_name: str,
     ) -> list[MCPThreat]:
         """Check for cross-server attack patterns."""
-        threats: list[MCPThreat] = []
+        index = self._name_index
+        cache = self._cross_server_cache
+        if self._cross_server_indexed != len(index):
+            with self._cache_lock:
+                cache.clear()
+                self._cross_server_indexed = len(index)
+        key = (tool_name, server_name)
+        cached = self._cached(cache, key)
+        if cached is not None:
+            return list(cached)
 
-        for _key, fp in self._tool_registry.items():
-            # Same tool name from a different server
-            if fp.tool_name == tool_name and fp.server_name != server_name:
+        threats: list[MCPThreat] = []
+        impersonated = [
+            (order, fp) for order, fp in index.exact(tool_name)
+            if fp.server_name != server_name
+        ]
+        similar = [
+            (order, fp) for order, fp in index.similar(tool_name)
+            if fp.server_name != server_name and fp.tool_name != tool_name
+        ]
+
+        # Report in registration order, as a scan of the registry would
+        for _order, fp in sorted(impersonated + similar, key=lambda entry: entry[0]):
+            if fp.tool_name == tool_name:
                 threats.append(MCPThreat(
                     threat_type=MCPThreatType.CROSS_SERVER_ATTACK,
                     severity=MCPSeverity.CRITICAL,
@@ -613,27 +790,25 @@ class MCPSecurityScanner:
                     ),
                     details={"original_server": fp.server_name},
                 ))
+            else:
+                threats.append(MCPThreat(
+                    threat_type=MCPThreatType.CROSS_SERVER_ATTACK,
+                    severity=MCPSeverity.WARNING,
+                    tool_name=tool_name,
+                    server_name=server_name,
+                    message=(
+                        f"Tool name '{tool_name}' resembles "
+                        f"'{fp.tool_name}' from server '{fp.server_name}' "
+                        f"— potential typosquatting"
+                    ),
+                    details={
+                        "similar_tool": fp.tool_name,
+                        "similar_server": fp.server_name,
+                    },
+                ))
 
-            # Typosquatting: similar name from a different server
-            if fp.server_name != server_name and fp.tool_name != tool_name:
-                if self._is_typosquat(tool_name, fp.tool_name):
-                    threats.append(MCPThreat(
-                        threat_type=MCPThreatType.CROSS_SERVER_ATTACK,
-                        severity=MCPSeverity.WARNING,
-                        tool_name=tool_name,
-                        server_name=server_name,
-                        message=(
-                            f"Tool name '{tool_name}' resembles "
-                            f"'{fp.tool_name}' from server '{fp.server_name}' "
-                            f"— potential typosquatting"
-                        ),
-                        details={
-                            "similar_tool": fp.tool_name,
-                            "similar_server": fp.server_name,
-                        },
-                    ))
-
-        return threats
+        self._remember(cache, key, threats)
+        return list(threats)
 
     # -- helpers ------------------------------------------------------------
 
@@ -642,14 +817,12 @@ class MCPSecurityScanner:
         """Check if two tool names are suspiciously similar (edit distance ≤ 2)."""
         if name_a == name_b:
             return False
-        # Simple Levenshtein check for short names
         la, lb = name_a.lower(), name_b.lower()
-        if abs(len(la) - len(lb)) > 2:
+        if min(len(la), len(lb)) < _TYPOSQUAT_MIN_LENGTH:
             return False
-        # Compute Levenshtein distance
-        dist = _levenshtein(la, lb)
         # Typosquat if 1-2 edits on names of length ≥ 4
-        return 1 <= dist <= 2 and min(len(la), len(lb)) >= 4
+        dist = _levenshtein(la, lb, _TYPOSQUAT_MAX_EDITS)
+        return 1 <= dist <= _TYPOSQUAT_MAX_EDITS
 
     def _record_audit(
         self,
@@ -680,17 +853,64 @@ class MCPSecurityScanner:
             )
 
 
-def _levenshtein(s: str, t: str) -> int:
-    """Compute Levenshtein edit distance between two strings."""
+def _definition_hashes(
+    description: str, schema: dict[str, Any] | None,
+) -> tuple[str, str]:
+    """SHA-256 of a tool's description and of its canonical JSON schema."""
+    desc_hash = hashlib.sha256(description.encode("utf-8")).hexdigest()
+    schema_hash = hashlib.sha256(
+        json.dumps(schema, sort_keys=True, default=str).encode("utf-8")
+        if schema else b""
+    ).hexdigest()
+    return desc_hash, schema_hash
+
+
+def _levenshtein(s: str, t: str, max_distance: int | None = None) -> int:
+    """Compute Levenshtein edit distance between two strings.
+
+    With *max_distance*, only the diagonal band of that width is filled in
+    and ``max_distance + 1`` is returned as soon as the distance is known
+    to exceed it.
+    """
+    # A shared prefix or suffix never changes the distance
+    start = 0
+    stop = min(len(s), len(t))
+    while start < stop and s[start] == t[start]:
+        start += 1
+    end = 0
+    while end < stop - start and s[-1 - end] == t[-1 - end]:
+        end += 1
+    s, t = s[start:len(s) - end], t[start:len(t) - end]
     if len(s) < len(t):
-        return _levenshtein(t, s)
+        s, t = t, s
+    if max_distance is None:
+        max_distance = len(s)
+    if len(s) - len(t) > max_distance:
+        return max_distance + 1
     if len(t) == 0:
         return len(s)
-    prev = list(range(len(t) + 1))
-    for i, cs in enumerate(s):
-        curr = [i + 1]
-        for j, ct in enumerate(t):
-            cost = 0 if cs == ct else 1
-            curr.append(min(curr[j] + 1, prev[j + 1] + 1, prev[j] + cost))
+    over = max_distance + 1
+    size = len(t)
+    # Cells outside the band only need to be known to exceed max_distance
+    prev = [j if j <= max_distance else over for j in range(size + 1)]
+    for i, cs in enumerate(s, 1):
+        lo = i - max_distance if i > max_distance else 1
+        hi = i + max_distance if i + max_distance < size else size
+        curr = [over] * (size + 1)
+        if lo == 1:
+            curr[0] = i if i <= max_distance else over
+        best = curr[0]
+        left = curr[lo - 1]
+        for j in range(lo, hi + 1):
+            value = prev[j - 1] if cs == t[j - 1] else prev[j - 1] + 1
+            if left + 1 < value:
+                value = left + 1
+            if prev[j] + 1 < value:
+                value = prev[j] + 1
+            curr[j] = left = value
+            if value < best:
+                best = value
+        if best > max_distance:
+            return over
         prev = curr
-    return prev[-1]
+    return min(prev[-1], over)
@@ -17,20 +17,25 @@ Architecture:
     MemoryGuard
         ├─ validate_write()   — pre-write content screening
         ├─ verify_integrity() — post-read hash verification
-        └─ scan_memory()      — batch scan for poisoning indicators
+        └─ scan_memory()      — incremental batch scan for poisoning indicators
 """
 
 from __future__ import annotations
 
 import hashlib
 import logging
+import os
 import re
+import threading
 import unicodedata
 from collections.abc import Sequence
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from enum import Enum
 
+from agent_os._regex_prefilter import required_literals
+
 logger = logging.getLogger(__name__)
 
 
@@ -160,6 +165,184 @@ _CODE_INJECTION_PATTERNS: list[re.Pattern[str]] = [
 # Fraction of characters that are "special" before we flag the entry
 _SPECIAL_CHAR_THRESHOLD = 0.3
 
+# Matches exactly the characters that are neither ``str.isalnum()`` nor
+# ``str.isspace()``, so counting runs in one C-level pass
+_SPECIAL_CHAR = re.compile(r"[^\w\s]|_")
+
+_BIDI_CHARS = frozenset({
+    "\u200e",  # LRM
+    "\u200f",  # RLM
+    "\u202a",  # LRE
+    "\u202b",  # RLE
+    "\u202c",  # PDF
+    "\u202d",  # LRO
+    "\u202e",  # RLO
+    "\u2066",  # LRI
+    "\u2067",  # RLI
+    "\u2068",  # FSI
+    "\u2069",  # PDI
+})
+
+# Each pattern paired with the lower-case literals of which one occurs in
+# every match; ASCII content skips the regexes whose literals are absent
+_KEYED_INJECTION_PATTERNS = [
+    (required_literals(p.pattern), p) for p in _INJECTION_PATTERNS
+]
+_KEYED_CODE_INJECTION_PATTERNS = [
+    (required_literals(p.pattern), p) for p in _CODE_INJECTION_PATTERNS
+]
+
+# scan_memory hands entries that need scanning to worker processes once there
+# are at least this many, in chunks of _SCAN_CHUNK_SIZE
+_PARALLEL_SCAN_THRESHOLD = 20_000
+_SCAN_CHUNK_SIZE = 5_000
+
+# SHA-256 digest and content alerts of one scanned entry
+_Scanned = tuple[str, list[Alert]]
+
+
+# ---------------------------------------------------------------------------
+# Content checks
+# ---------------------------------------------------------------------------
+
+def _content_alerts(content: str, source: str) -> list[Alert]:
+    """Run every content check against *content*."""
+    # Unicode case folding can match ASCII patterns, so only prefilter ASCII text
+    ascii_only = content.isascii()
+    lowered = content.lower() if ascii_only else None
+    alerts = _pattern_alerts(
+        content, lowered, source, _KEYED_INJECTION_PATTERNS,
+        AlertType.INJECTION_PATTERN, "Prompt injection",
+    )
+    alerts.extend(_pattern_alerts(
+        content, lowered, source, _KEYED_CODE_INJECTION_PATTERNS,
+        AlertType.CODE_INJECTION, "Code injection",
+    ))
+    alerts.extend(_check_special_characters(content, source))
+    # Bidi controls are non-ASCII and ASCII letters are all Latin
+    if not ascii_only:
+        alerts.extend(_check_unicode_manipulation(content, source))
+    return alerts
+
+
+def _pattern_alerts(
+    content: str,
+    lowered: str | None,
+    source: str,
+    patterns: list[tuple[frozenset[str] | None, re.Pattern[str]]],
+    alert_type: AlertType,
+    label: str,
+) -> list[Alert]:
+    alerts: list[Alert] = []
+    for literals, pattern in patterns:
+        if (
+            lowered is not None
+            and literals is not None
+            and not any(lit in lowered for lit in literals)
+        ):
+            continue
+        if pattern.search(content):
+            alerts.append(Alert(
+                alert_type=alert_type,
+                severity=AlertSeverity.HIGH,
+                message=f"{label} pattern detected: {pattern.pattern}",
+                entry_source=source,
+                matched_pattern=pattern.pattern,
+            ))
+    return alerts
+
+
+def _check_special_characters(content: str, source: str) -> list[Alert]:
+    if not content:
+        return []
+    ratio = len(_SPECIAL_CHAR.findall(content)) / len(content)
+    if ratio > _SPECIAL_CHAR_THRESHOLD:
+        return [Alert(
+            alert_type=AlertType.EXCESSIVE_SPECIAL_CHARS,
+            severity=AlertSeverity.MEDIUM,
+            message=(
+                f"Excessive special characters ({ratio:.0%}) "
+                f"from source {source}"
+            ),
+            entry_source=source,
+        )]
+    return []
+
+
+def _check_unicode_manipulation(content: str, source: str) -> list[Alert]:
+    alerts: list[Alert] = []
+    # Detect right-to-left override and other bidi control characters
+    found = [c for c in content if c in _BIDI_CHARS]
+    if found:
+        alerts.append(Alert(
+            alert_type=AlertType.UNICODE_MANIPULATION,
+            severity=AlertSeverity.HIGH,
+            message=(
+                f"Bidirectional unicode control characters detected "
+                f"({len(found)} occurrences) from source {source}"
+            ),
+            entry_source=source,
+        ))
+
+    # Detect homoglyph-heavy content (characters from mixed scripts)
+    scripts: set[str] = set()
+    for c in content:
+        if c.isalpha():
+            # Use unicodedata to get script-like categorisation
+            name = unicodedata.name(c, "")
+            if name.startswith("LATIN"):
+                scripts.add("LATIN")
+            elif name.startswith("CYRILLIC"):
+                scripts.add("CYRILLIC")
+            elif name.startswith("GREEK"):
+                scripts.add("GREEK")
+    if len(scripts) > 1:
+        alerts.append(Alert(
+            alert_type=AlertType.UNICODE_MANIPULATION,
+            severity=AlertSeverity.MEDIUM,
+            message=(
+                f"Mixed unicode scripts detected ({', '.join(sorted(scripts))}) "
+                f"— possible homoglyph attack from source {source}"
+            ),
+            entry_source=source,
+        ))
+
+    return alerts
+
+
+def _log_integrity_violation(entry: MemoryEntry, expected: str) -> None:
+    logger.warning(
+        "Integrity violation for entry from source=%s "
+        "(expected=%s, stored=%s)",
+        entry.source,
+        expected,
+        entry.content_hash,
+    )
+
+
+def _scan_chunk(
+    items: list[tuple[str, str]],
+) -> list[_Scanned | None]:
+    """Hash and content-check ``(source, content)`` pairs.
+
+    Runs in worker processes for large scans. Returns the SHA-256 digest and
+    alerts per pair, or ``None`` where scanning raised.
+    """
+    results: list[_Scanned | None] = []
+    for source, content in items:
+        try:
+            results.append((
+                MemoryEntry.compute_hash(content),
+                _content_alerts(content, source),
+            ))
+        except Exception:
+            logger.error(
+                "Error scanning memory entry — flagging as suspicious | source=%s",
+                source, exc_info=True,
+            )
+            results.append(None)
+    return results
+
 
 # ---------------------------------------------------------------------------
 # MemoryGuard
@@ -168,16 +351,44 @@ _SPECIAL_CHAR_THRESHOLD = 0.3
 class MemoryGuard:
     """Guards agent memory against poisoning attacks (OWASP ASI06).
 
+    ``scan_memory`` is incremental: entries are remembered by source and
+    content together with their SHA-256 digest and findings, so a rescan only
+    hashes and checks entries that are new or modified since the previous
+    scan.  When many entries need checking they are split into chunks and
+    scanned on a process pool.
+
     Usage::
 
         guard = MemoryGuard()
         result = guard.validate_write("some content", source="rag-loader")
         if result.allowed:
             store.save(MemoryEntry.create("some content", "rag-loader"))
+
+    Args:
+        max_workers: Worker processes for large scans. Defaults to the CPU
+            count; ``1`` always scans in the calling thread.
+        parallel_threshold: Minimum number of entries needing a scan before
+            the pool is used.
+        chunk_size: Entries sent to a worker per task.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        parallel_threshold: int = _PARALLEL_SCAN_THRESHOLD,
+        chunk_size: int = _SCAN_CHUNK_SIZE,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
         self._audit_log: list[AuditRecord] = []
+        self._max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self._parallel_threshold = parallel_threshold
+        self._chunk_size = chunk_size
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        # (source, content) -> (SHA-256 digest, alerts) from the last scan
+        self._scanned: dict[tuple[str, str], _Scanned | None] = {}
 
     # -- public API ---------------------------------------------------------
 
@@ -190,10 +401,7 @@ class MemoryGuard:
         alerts: list[Alert] = []
 
         try:
-            alerts.extend(self._check_injection_patterns(content, source))
-            alerts.extend(self._check_code_injection(content, source))
-            alerts.extend(self._check_special_characters(content, source))
-            alerts.extend(self._check_unicode_manipulation(content, source))
+            alerts.extend(_content_alerts(content, source))
         except Exception:
             # Fail closed: block the write if validation itself errors
             logger.error(
@@ -247,161 +455,98 @@ class MemoryGuard:
         expected = MemoryEntry.compute_hash(entry.content)
         intact = expected == entry.content_hash
         if not intact:
-            logger.warning(
-                "Integrity violation for entry from source=%s "
-                "(expected=%s, stored=%s)",
-                entry.source,
-                expected,
-                entry.content_hash,
-            )
+            _log_integrity_violation(entry, expected)
         return intact
 
     def scan_memory(self, entries: Sequence[MemoryEntry]) -> list[Alert]:
         """Scan existing memory entries for poisoning indicators.
 
         Checks both content patterns and hash integrity for every entry.
+        Entries unchanged since the previous call reuse that call's digest
+        and findings; only new or modified entries are hashed and checked.
         """
-        all_alerts: list[Alert] = []
+        previous = self._scanned
+        scanned: dict[tuple[str, str], _Scanned | None] = {}
+        # Insertion-ordered set of keys that need hashing and checking
+        pending: dict[tuple[str, str], None] = {}
+        keys: list[tuple[str, str] | None] = []
         for entry in entries:
+            key: tuple[str, str] | None = (entry.source, entry.content)
             try:
-                # Integrity check
-                if not self.verify_integrity(entry):
-                    all_alerts.append(Alert(
-                        alert_type=AlertType.INTEGRITY_VIOLATION,
-                        severity=AlertSeverity.CRITICAL,
-                        message=f"Hash mismatch for entry from {entry.source}",
-                        entry_source=entry.source,
-                    ))
-
-                # Content checks (reuse validate_write logic)
-                all_alerts.extend(self._check_injection_patterns(entry.content, entry.source))
-                all_alerts.extend(self._check_code_injection(entry.content, entry.source))
-                all_alerts.extend(self._check_special_characters(entry.content, entry.source))
-                all_alerts.extend(self._check_unicode_manipulation(entry.content, entry.source))
-            except Exception:
-                logger.error(
-                    "Error scanning memory entry — flagging as suspicious | source=%s",
-                    entry.source, exc_info=True,
-                )
+                found = previous.get(key)
+            except TypeError:
+                # Unhashable content cannot be remembered; scan it every time
+                key = None
+            else:
+                if found is None:
+                    pending[key] = None
+                else:
+                    scanned[key] = found
+            keys.append(key)
+        scanned.update(zip(pending, self._scan_pending(list(pending))))
+
+        all_alerts: list[Alert] = []
+        for entry, key in zip(entries, keys):
+            if key is None:
+                (found,) = _scan_chunk([(entry.source, entry.content)])
+            else:
+                found = scanned[key]
+            if found is None:
                 all_alerts.append(Alert(
                     alert_type=AlertType.INTEGRITY_VIOLATION,
                     severity=AlertSeverity.CRITICAL,
                     message=f"Scan error for entry from {entry.source} — flagged as suspicious",
                     entry_source=entry.source,
                 ))
+                continue
+            digest, alerts = found
+            if digest != entry.content_hash:
+                _log_integrity_violation(entry, digest)
+                all_alerts.append(Alert(
+                    alert_type=AlertType.INTEGRITY_VIOLATION,
+                    severity=AlertSeverity.CRITICAL,
+                    message=f"Hash mismatch for entry from {entry.source}",
+                    entry_source=entry.source,
+                ))
+            if alerts:
+                all_alerts.extend(replace(alert) for alert in alerts)
 
+        # Failed scans are kept as None so the next call retries them
+        self._scanned = scanned
         return all_alerts
 
+    def close(self) -> None:
+        """Shut down the scan worker pool, if one was started."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
     @property
     def audit_log(self) -> list[AuditRecord]:
         """Return a copy of the audit trail."""
         return list(self._audit_log)
 
-    # -- internal checks ----------------------------------------------------
-
-    def _check_injection_patterns(
-        self, content: str, source: str
-    ) -> list[Alert]:
-        alerts: list[Alert] = []
-        for pattern in _INJECTION_PATTERNS:
-            if pattern.search(content):
-                alerts.append(Alert(
-                    alert_type=AlertType.INJECTION_PATTERN,
-                    severity=AlertSeverity.HIGH,
-                    message=f"Prompt injection pattern detected: {pattern.pattern}",
-                    entry_source=source,
-                    matched_pattern=pattern.pattern,
-                ))
-        return alerts
-
-    def _check_code_injection(
-        self, content: str, source: str
-    ) -> list[Alert]:
-        alerts: list[Alert] = []
-        for pattern in _CODE_INJECTION_PATTERNS:
-            if pattern.search(content):
-                alerts.append(Alert(
-                    alert_type=AlertType.CODE_INJECTION,
-                    severity=AlertSeverity.HIGH,
-                    message=f"Code injection pattern detected: {pattern.pattern}",
-                    entry_source=source,
-                    matched_pattern=pattern.pattern,
-                ))
-        return alerts
-
-    def _check_special_characters(
-        self, content: str, source: str
-    ) -> list[Alert]:
-        if not content:
-            return []
-        special = sum(
-            1 for c in content
-            if not c.isalnum() and not c.isspace()
-        )
-        ratio = special / len(content)
-        if ratio > _SPECIAL_CHAR_THRESHOLD:
-            return [Alert(
-                alert_type=AlertType.EXCESSIVE_SPECIAL_CHARS,
-                severity=AlertSeverity.MEDIUM,
-                message=(
-                    f"Excessive special characters ({ratio:.0%}) "
-                    f"from source {source}"
-                ),
-                entry_source=source,
-            )]
-        return []
-
-    def _check_unicode_manipulation(
-        self, content: str, source: str
-    ) -> list[Alert]:
-        alerts: list[Alert] = []
-        # Detect right-to-left override and other bidi control characters
-        bidi_chars = {
-            "\u200e",  # LRM
-            "\u200f",  # RLM
-            "\u202a",  # LRE
-            "\u202b",  # RLE
-            "\u202c",  # PDF
-            "\u202d",  # LRO
-            "\u202e",  # RLO
-            "\u2066",  # LRI
-            "\u2067",  # RLI
-            "\u2068",  # FSI
-            "\u2069",  # PDI
-        }
-        found = [c for c in content if c in bidi_chars]
-        if found:
-            alerts.append(Alert(
-                alert_type=AlertType.UNICODE_MANIPULATION,
-                severity=AlertSeverity.HIGH,
-                message=(
-                    f"Bidirectional unicode control characters detected "
-                    f"({len(found)} occurrences) from source {source}"
-                ),
-                entry_source=source,
-            ))
+    # -- internals ----------------------------------------------------------
 
-        # Detect homoglyph-heavy content (characters from mixed scripts)
-        scripts: set[str] = set()
-        for c in content:
-            if c.isalpha():
-                # Use unicodedata to get script-like categorisation
-                name = unicodedata.name(c, "")
-                if name.startswith("LATIN"):
-                    scripts.add("LATIN")
-                elif name.startswith("CYRILLIC"):
-                    scripts.add("CYRILLIC")
-                elif name.startswith("GREEK"):
-                    scripts.add("GREEK")
-        if len(scripts) > 1:
-            alerts.append(Alert(
-                alert_type=AlertType.UNICODE_MANIPULATION,
-                severity=AlertSeverity.MEDIUM,
-                message=(
-                    f"Mixed unicode scripts detected ({', '.join(sorted(scripts))}) "
-                    f"— possible homoglyph attack from source {source}"
-                ),
-                entry_source=source,
-            ))
-
-        return alerts
+    def _scan_pending(
+        self, pending: list[tuple[str, str]],
+    ) -> list[_Scanned | None]:
+        if len(pending) < self._parallel_threshold or self._max_workers < 2:
+            return _scan_chunk(pending)
+        size = self._chunk_size
+        chunks = [pending[i:i + size] for i in range(0, len(pending), size)]
+        try:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+                executor = self._executor
+            return [result for chunk in executor.map(_scan_chunk, chunks) for result in chunk]
+        except Exception:
+            # A broken or unavailable pool must not skip the scan
+            logger.warning(
+                "Parallel memory scan failed — scanning %d entries inline",
+                len(pending), exc_info=True,
+            )
+            self.close()
+            return _scan_chunk(pending)
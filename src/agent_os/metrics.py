@@ -4,6 +4,11 @@ Governance Metrics Collector — Tracks policy enforcement statistics.
 Thread-safe singleton that records policy checks, violations, approvals,
 and blocked tool calls across all governance adapters.
 
+Recording is cheap enough to leave on in production: every thread writes to
+its own shard without taking a lock, and latencies land in a fixed-size
+log-linear (HDR-style) histogram.  Readers merge the shards on demand, so a
+snapshot never blocks a writer.
+
 Example:
     >>> from agent_os.metrics import metrics
     >>>
@@ -13,32 +18,122 @@ Example:
     >>> snap = metrics.snapshot()
     >>> snap["total_checks"]  # 1
     >>> snap["violations"]    # 1
+    >>> print(prometheus_text(snap))
 """
 
 from __future__ import annotations
 
 import threading
-from dataclasses import dataclass, field
+from typing import Any, Optional
+
+# ── Latency histogram ─────────────────────────────────────────
+#
+# Latencies are bucketed in whole microseconds: values below 8 µs get exact
+# buckets, and every power of two above that is split into 8 linear
+# sub-buckets, bounding the relative error at 12.5%.  Values past ~19 hours
+# land in the last bucket.
+
+_SUB_BUCKETS = 8
+_MAX_SHIFT = 33
+HISTOGRAM_BUCKETS = _SUB_BUCKETS + (_MAX_SHIFT + 1) * _SUB_BUCKETS
+
+
+def _bucket_index(latency_ms: float) -> int:
+    """Map a latency to its histogram bucket."""
+    micros = int(latency_ms * 1000.0)
+    if micros < _SUB_BUCKETS:
+        return max(micros, 0)
+    # Keep the top four bits: 8..15 selects the sub-bucket within the octave
+    shift = micros.bit_length() - 4
+    if shift > _MAX_SHIFT:
+        return HISTOGRAM_BUCKETS - 1
+    return shift * _SUB_BUCKETS + (micros >> shift)
+
+
+# Precomputed bucket indexes for sub-4 ms latencies, the common case
+_FAST_LIMIT_US = 4096
+_FAST_INDEX = [_bucket_index(micros / 1000.0) for micros in range(_FAST_LIMIT_US)]
+
+
+def _bucket_upper_ms(index: int) -> float:
+    """Inclusive upper bound of a bucket, in milliseconds."""
+    if index < _SUB_BUCKETS:
+        return index / 1000.0
+    shift, sub = divmod(index - _SUB_BUCKETS, _SUB_BUCKETS)
+    return (((_SUB_BUCKETS + sub + 1) << shift) - 1) / 1000.0
+
+
+class _Shard:
+    """Counters written by a single thread."""
+
+    __slots__ = (
+        "checks", "approvals", "violations", "blocked", "latency_ms",
+        "adapters", "histogram", "thread",
+    )
+
+    def __init__(self, thread: Optional[threading.Thread]) -> None:
+        self.thread = thread
+        self.clear()
+
+    def clear(self) -> None:
+        self.checks = 0
+        self.approvals = 0
+        self.violations = 0
+        self.blocked = 0
+        self.latency_ms = 0.0
+        # adapter -> [checks, violations, blocked]
+        self.adapters: dict[str, list[int]] = {}
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    def absorb(self, other: _Shard) -> None:
+        """Add *other*'s counts into this shard."""
+        self.checks += other.checks
+        self.approvals += other.approvals
+        self.violations += other.violations
+        self.blocked += other.blocked
+        self.latency_ms += other.latency_ms
+        for adapter, counts in dict(other.adapters).items():
+            mine = self.adapters.setdefault(adapter, [0, 0, 0])
+            mine[0] += counts[0]
+            mine[1] += counts[1]
+            mine[2] += counts[2]
+        histogram = self.histogram
+        for i, count in enumerate(list(other.histogram)):
+            if count:
+                histogram[i] += count
 
 
-@dataclass
 class GovernanceMetrics:
     """Collects governance enforcement metrics across adapters.
 
-    All public methods are thread-safe via an internal lock.
+    All public methods are thread-safe.  Writers only touch their own
+    thread's shard; shards of finished threads are folded into a retired
+    shard so thread churn does not grow memory.
     """
 
-    total_checks: int = 0
-    violations: int = 0
-    approvals: int = 0
-    blocked: int = 0
-    avg_latency_ms: float = 0.0
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        self._retired = _Shard(None)
+        self._lock = threading.Lock()
 
-    _adapter_checks: dict[str, int] = field(default_factory=dict)
-    _adapter_violations: dict[str, int] = field(default_factory=dict)
-    _adapter_blocked: dict[str, int] = field(default_factory=dict)
-    _total_latency_ms: float = field(default=0.0, repr=False)
-    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            pass
+        shard = _Shard(threading.current_thread())
+        with self._lock:
+            live = []
+            for other in self._shards:
+                if other.thread is not None and other.thread.is_alive():
+                    live.append(other)
+                else:
+                    self._retired.absorb(other)
+            live.append(shard)
+            self._shards = live
+        self._local.shard = shard
+        return shard
 
     def record_check(self, adapter: str, latency_ms: float, approved: bool) -> None:
         """Record a policy check result.
@@ -48,18 +143,26 @@ class GovernanceMetrics:
             latency_ms: Time taken for the check in milliseconds.
             approved: Whether the action was approved.
         """
-        with self._lock:
-            self.total_checks += 1
-            self._total_latency_ms += latency_ms
-            self.avg_latency_ms = self._total_latency_ms / self.total_checks
-            self._adapter_checks[adapter] = self._adapter_checks.get(adapter, 0) + 1
-            if approved:
-                self.approvals += 1
-            else:
-                self.violations += 1
-                self._adapter_violations[adapter] = (
-                    self._adapter_violations.get(adapter, 0) + 1
-                )
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._shard()
+        counts = shard.adapters.get(adapter)
+        if counts is None:
+            counts = shard.adapters[adapter] = [0, 0, 0]
+        shard.checks += 1
+        shard.latency_ms += latency_ms
+        micros = int(latency_ms * 1000.0)
+        if 0 <= micros < _FAST_LIMIT_US:
+            shard.histogram[_FAST_INDEX[micros]] += 1
+        else:
+            shard.histogram[_bucket_index(latency_ms)] += 1
+        counts[0] += 1
+        if approved:
+            shard.approvals += 1
+        else:
+            shard.violations += 1
+            counts[1] += 1
 
     def record_violation(self, adapter: str) -> None:
         """Record a standalone policy violation.
@@ -67,11 +170,9 @@ class GovernanceMetrics:
         Args:
             adapter: Adapter name.
         """
-        with self._lock:
-            self.violations += 1
-            self._adapter_violations[adapter] = (
-                self._adapter_violations.get(adapter, 0) + 1
-            )
+        shard = self._shard()
+        shard.violations += 1
+        shard.adapters.setdefault(adapter, [0, 0, 0])[1] += 1
 
     def record_blocked(self, adapter: str) -> None:
         """Record a blocked tool call.
@@ -79,54 +180,158 @@ class GovernanceMetrics:
         Args:
             adapter: Adapter name.
         """
+        shard = self._shard()
+        shard.blocked += 1
+        shard.adapters.setdefault(adapter, [0, 0, 0])[2] += 1
+
+    def _merged(self) -> _Shard:
+        """Sum of all shards; reads racing writers see slightly stale counts."""
+        merged = _Shard(None)
+        # Writers never take this lock; it only orders readers and retirement
         with self._lock:
-            self.blocked += 1
-            self._adapter_blocked[adapter] = (
-                self._adapter_blocked.get(adapter, 0) + 1
-            )
+            merged.absorb(self._retired)
+            for shard in self._shards:
+                merged.absorb(shard)
+        return merged
+
+    @property
+    def total_checks(self) -> int:
+        return self._merged().checks
+
+    @property
+    def violations(self) -> int:
+        return self._merged().violations
+
+    @property
+    def approvals(self) -> int:
+        return self._merged().approvals
+
+    @property
+    def blocked(self) -> int:
+        return self._merged().blocked
+
+    @property
+    def avg_latency_ms(self) -> float:
+        merged = self._merged()
+        return merged.latency_ms / merged.checks if merged.checks else 0.0
 
     def snapshot(self) -> dict:
         """Return a JSON-serializable snapshot of all metrics.
 
         Returns:
-            Dictionary containing global and per-adapter metrics.
+            Dictionary containing global and per-adapter metrics, latency
+            percentiles and the non-empty histogram buckets as
+            ``[upper_bound_ms, count]`` pairs.
         """
-        with self._lock:
-            return {
-                "total_checks": self.total_checks,
-                "violations": self.violations,
-                "approvals": self.approvals,
-                "blocked": self.blocked,
-                "avg_latency_ms": round(self.avg_latency_ms, 4),
-                "adapters": {
-                    adapter: {
-                        "checks": self._adapter_checks.get(adapter, 0),
-                        "violations": self._adapter_violations.get(adapter, 0),
-                        "blocked": self._adapter_blocked.get(adapter, 0),
-                    }
-                    for adapter in sorted(
-                        set(self._adapter_checks)
-                        | set(self._adapter_violations)
-                        | set(self._adapter_blocked)
-                    )
-                },
-            }
+        merged = self._merged()
+        checks = merged.checks
+        buckets = [
+            [_bucket_upper_ms(i), count]
+            for i, count in enumerate(merged.histogram)
+            if count
+        ]
+        return {
+            "total_checks": checks,
+            "violations": merged.violations,
+            "approvals": merged.approvals,
+            "blocked": merged.blocked,
+            "avg_latency_ms": round(merged.latency_ms / checks, 4) if checks else 0.0,
+            "latency_sum_ms": merged.latency_ms,
+            "latency_percentiles_ms": {
+                f"p{int(q * 100)}": _percentile(buckets, checks, q)
+                for q in (0.5, 0.9, 0.99)
+            },
+            "latency_histogram_ms": buckets,
+            "adapters": {
+                adapter: {
+                    "checks": counts[0],
+                    "violations": counts[1],
+                    "blocked": counts[2],
+                }
+                for adapter, counts in sorted(merged.adapters.items())
+            },
+        }
 
     def reset(self) -> None:
         """Reset all counters to zero (useful for test isolation)."""
         with self._lock:
-            self.total_checks = 0
-            self.violations = 0
-            self.approvals = 0
-            self.blocked = 0
-            self.avg_latency_ms = 0.0
-            self._total_latency_ms = 0.0
-            self._adapter_checks.clear()
-            self._adapter_violations.clear()
-            self._adapter_blocked.clear()
+            self._retired.clear()
+            for shard in self._shards:
+                shard.clear()
+
+
+def _percentile(buckets: list[list[Any]], total: int, q: float) -> float:
+    """Upper bound of the bucket holding the *q* quantile (0.0 when empty)."""
+    if not total:
+        return 0.0
+    rank = q * total
+    seen = 0
+    for upper, count in buckets:
+        seen += count
+        if seen >= rank:
+            return upper
+    return buckets[-1][0]
+
+
+def _label_value(value: Any) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text(snapshot: dict, prefix: str = "agentos_governance") -> str:
+    """Render a :meth:`GovernanceMetrics.snapshot` in Prometheus text format.
+
+    The latency histogram is exported with one ``le`` bound per power of
+    two microseconds, so the series stay the same from scrape to scrape.
+    """
+    lines = [
+        f"# HELP {prefix}_checks_total Policy checks by adapter.",
+        f"# TYPE {prefix}_checks_total counter",
+    ]
+    adapters = snapshot["adapters"]
+    for adapter, counts in adapters.items():
+        lines.append(f'{prefix}_checks_total{{adapter="{_label_value(adapter)}"}} {counts["checks"]}')
+    lines += [
+        "",
+        f"# HELP {prefix}_violations_total Policy violations by adapter.",
+        f"# TYPE {prefix}_violations_total counter",
+    ]
+    for adapter, counts in adapters.items():
+        lines.append(f'{prefix}_violations_total{{adapter="{_label_value(adapter)}"}} {counts["violations"]}')
+    lines += [
+        "",
+        f"# HELP {prefix}_blocked_total Blocked tool calls by adapter.",
+        f"# TYPE {prefix}_blocked_total counter",
+    ]
+    for adapter, counts in adapters.items():
+        lines.append(f'{prefix}_blocked_total{{adapter="{_label_value(adapter)}"}} {counts["blocked"]}')
+    lines += [
+        "",
+        f"# HELP {prefix}_approvals_total Approved policy checks.",
+        f"# TYPE {prefix}_approvals_total counter",
+        f"{prefix}_approvals_total {snapshot['approvals']}",
+        "",
+        f"# HELP {prefix}_check_latency_seconds Policy check latency.",
+        f"# TYPE {prefix}_check_latency_seconds histogram",
+    ]
+    cumulative = 0
+    pending = iter(snapshot["latency_histogram_ms"])
+    bucket = next(pending, None)
+    for shift in range(3, _MAX_SHIFT + 5):
+        bound_ms = ((1 << shift) - 1) / 1000.0
+        while bucket is not None and bucket[0] <= bound_ms:
+            cumulative += bucket[1]
+            bucket = next(pending, None)
+        lines.append(f'{prefix}_check_latency_seconds_bucket{{le="{(1 << shift) / 1e6:g}"}} {cumulative}')
+    lines += [
+        f'{prefix}_check_latency_seconds_bucket{{le="+Inf"}} {snapshot["total_checks"]}',
+        f"{prefix}_check_latency_seconds_sum {snapshot['latency_sum_ms'] / 1000.0}",
+        f"{prefix}_check_latency_seconds_count {snapshot['total_checks']}",
+    ]
+    return "\n".join(lines)
 
 
 # Module-level singleton
 metrics = GovernanceMetrics()
 
-__all__ = ["GovernanceMetrics", "metrics"]
+__all__ = ["GovernanceMetrics", "metrics", "prometheus_text"]
@@ -19,7 +19,6 @@ Community: pip install agent-os-kernel (from PyPI) — works out of the box
 from __future__ import annotations
 
 import logging
-from importlib.metadata import entry_points
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -39,6 +38,17 @@ PROVIDER_GROUPS = {
 _provider_cache: dict[str, Any] = {}
 
 
+def entry_points(**params: Any) -> Any:
+    """``importlib.metadata.entry_points``, imported on first discovery.
+
+    importlib.metadata pulls in email, zipfile and csv; deferring it keeps
+    ``import agent_os.providers`` cheap when no provider is ever requested.
+    """
+    from importlib.metadata import entry_points as _entry_points
+
+    return _entry_points(**params)
+
+
 def _discover_provider(group: str) -> type | None:
     """Discover an advanced provider via entry_points.
 
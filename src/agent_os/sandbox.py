@@ -8,16 +8,27 @@ Prevents agents from bypassing the kernel via direct stdlib calls
 from __future__ import annotations
 
 import ast
+import functools
+import hashlib
 import importlib.abc
 import importlib.machinery
+import logging
+import os
+import re
 import sys
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from typing import Any, Callable
 
 from pydantic import BaseModel, Field
 
 from agent_os.exceptions import SecurityError
 
+logger = logging.getLogger(__name__)
+
 _DEFAULT_BLOCKED_MODULES: list[str] = [
     "subprocess",
     "os",
@@ -33,6 +44,10 @@ _DEFAULT_BLOCKED_BUILTINS: list[str] = [
     "__import__",
 ]
 
+# validate_many only starts a process pool for at least this many uncached
+# snippets; below that, pool startup costs more than it saves
+_PARALLEL_VALIDATE_THRESHOLD = 100
+
 
 class SandboxConfig(BaseModel):
     """Configuration for the execution sandbox."""
@@ -111,88 +126,142 @@ class SandboxImportHook(importlib.abc.MetaPathFinder):
             sys.meta_path.remove(self)
 
 
-class _ASTSecurityVisitor(ast.NodeVisitor):
-    """AST visitor that detects security violations in code."""
-
-    def __init__(self, blocked_modules: set, blocked_builtins: set) -> None:
-        self._blocked_modules = blocked_modules
-        self._blocked_builtins = blocked_builtins
-        self.violations: list[SecurityViolation] = []
-
-    def visit_Import(self, node: ast.Import) -> None:  # noqa: N802
-        for alias in node.names:
-            top_level = alias.name.split(".")[0]
-            if top_level in self._blocked_modules:
-                self.violations.append(
-                    SecurityViolation(
-                        line=node.lineno,
-                        column=node.col_offset,
-                        violation_type="blocked_import",
-                        description=f"Import of blocked module '{alias.name}'",
-                    )
-                )
-        self.generic_visit(node)
-
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:  # noqa: N802
-        if node.module:
-            top_level = node.module.split(".")[0]
-            if top_level in self._blocked_modules:
-                self.violations.append(
-                    SecurityViolation(
-                        line=node.lineno,
-                        column=node.col_offset,
-                        violation_type="blocked_import",
-                        description=f"Import from blocked module '{node.module}'",
-                    )
-                )
-        self.generic_visit(node)
-
-    def visit_Call(self, node: ast.Call) -> None:  # noqa: N802
-        # Detect calls to blocked builtins: eval(...), exec(...)
-        if isinstance(node.func, ast.Name) and node.func.id in self._blocked_builtins:
-            self.violations.append(
-                SecurityViolation(
-                    line=node.lineno,
-                    column=node.col_offset,
-                    violation_type="blocked_builtin",
-                    description=f"Call to blocked builtin '{node.func.id}'",
-                )
+@dataclass(frozen=True)
+class _Rules:
+    """Validation rules compiled from one version of a ``SandboxConfig``."""
+
+    version: int
+    blocked_modules: frozenset[str]
+    blocked_builtins: frozenset[str]
+    # Matches every blocked name as a whole identifier; only used on ASCII
+    # source, where identifiers appear verbatim (no NFKC normalization)
+    screen: re.Pattern[str] | None
+
+    @classmethod
+    def build(cls, version: int, modules: list[str], builtins: list[str]) -> _Rules:
+        names = sorted(set(modules) | set(builtins), key=len, reverse=True)
+        screen = None
+        if names:
+            alternation = "|".join(re.escape(name) for name in names)
+            screen = re.compile(rf"(?<![A-Za-z0-9_])(?:{alternation})(?![A-Za-z0-9_])")
+        return cls(version, frozenset(modules), frozenset(builtins), screen)
+
+
+def _validate_source(code: str, rules: _Rules) -> list[SecurityViolation]:
+    """Parse *code* and collect its violations in one walk over the AST."""
+    try:
+        tree = ast.parse(code)
+    except (SyntaxError, ValueError):
+        # ValueError: null bytes, reported as SyntaxError from Python 3.12
+        return [
+            SecurityViolation(
+                line=0,
+                column=0,
+                violation_type="syntax_error",
+                description="Code contains syntax errors and cannot be analyzed",
+                severity="medium",
             )
-
-        # Detect os.system(...) style calls
-        if isinstance(node.func, ast.Attribute):
-            if isinstance(node.func.value, ast.Name):
-                if node.func.value.id in self._blocked_modules:
-                    self.violations.append(
+        ]
+
+    # Every violation names a blocked module or builtin; skip the walk when
+    # none occurs in the source
+    if code.isascii() and (rules.screen is None or rules.screen.search(code) is None):
+        return []
+
+    blocked_modules = rules.blocked_modules
+    blocked_builtins = rules.blocked_builtins
+    violations: list[SecurityViolation] = []
+    for node in ast.walk(tree):
+        node_type = type(node)
+        if node_type is ast.Call:
+            func = node.func
+            func_type = type(func)
+            # Detect calls to blocked builtins: eval(...), exec(...)
+            if func_type is ast.Name:
+                if func.id in blocked_builtins:
+                    violations.append(
+                        SecurityViolation(
+                            line=node.lineno,
+                            column=node.col_offset,
+                            violation_type="blocked_builtin",
+                            description=f"Call to blocked builtin '{func.id}'",
+                        )
+                    )
+            # Detect os.system(...) style calls
+            elif func_type is ast.Attribute:
+                value = func.value
+                if type(value) is ast.Name and value.id in blocked_modules:
+                    violations.append(
                         SecurityViolation(
                             line=node.lineno,
                             column=node.col_offset,
                             violation_type="blocked_module_call",
                             description=(
                                 f"Call to blocked module "
-                                f"'{node.func.value.id}.{node.func.attr}'"
+                                f"'{value.id}.{func.attr}'"
                             ),
                         )
                     )
+        elif node_type is ast.Import:
+            for alias in node.names:
+                if alias.name.split(".")[0] in blocked_modules:
+                    violations.append(
+                        SecurityViolation(
+                            line=node.lineno,
+                            column=node.col_offset,
+                            violation_type="blocked_import",
+                            description=f"Import of blocked module '{alias.name}'",
+                        )
+                    )
+        elif node_type is ast.ImportFrom:
+            if node.module and node.module.split(".")[0] in blocked_modules:
+                violations.append(
+                    SecurityViolation(
+                        line=node.lineno,
+                        column=node.col_offset,
+                        violation_type="blocked_import",
+                        description=f"Import from blocked module '{node.module}'",
+                    )
+                )
 
-        self.generic_visit(node)
+    # ast.walk is breadth-first; report in source order (the sort is stable)
+    violations.sort(key=lambda v: (v.line, v.column))
+    return violations
 
 
 class ExecutionSandbox:
     """Restricted execution environment that prevents stdlib bypass.
 
     Uses import hooks and AST-based static analysis to enforce security
-    policies on agent code execution.
+    policies on agent code execution.  Validation results are cached by
+    source hash and config version, so resubmitted snippets are not parsed
+    again until ``config`` changes.
     """
 
     def __init__(
         self,
         config: SandboxConfig | None = None,
         policy: Any = None,
+        *,
+        cache_size: int = 4096,
     ) -> None:
+        """
+        Args:
+            config: Sandbox configuration; defaults to ``SandboxConfig()``.
+            policy: Optional governance policy attached to the sandbox.
+            cache_size: Number of validated snippets whose violations are
+                kept (0 disables the cache).
+        """
         self.config = config or SandboxConfig()
         self.policy = policy
         self._hook = SandboxImportHook(self.config.blocked_modules)
+        self._cache_size = cache_size
+        # (config version, SHA-256 of source) -> violations
+        self._validation_cache: OrderedDict[tuple[int, bytes], list[SecurityViolation]] = OrderedDict()
+        # Guards the cache and the compiled rules across threads
+        self._cache_lock = threading.Lock()
+        self._rules: _Rules | None = None
+        self._rules_signature: tuple[tuple[str, ...], tuple[str, ...]] | None = None
 
     def check_import(self, module_name: str) -> bool:
         """Check if a module import is allowed.
@@ -273,27 +342,93 @@ class ExecutionSandbox:
             code: Python source code to analyze.
 
         Returns:
-            A list of SecurityViolation instances found in the code.
+            A list of SecurityViolation instances found in the code, in
+            source order.
         """
-        try:
-            tree = ast.parse(code)
-        except SyntaxError:
-            return [
-                SecurityViolation(
-                    line=0,
-                    column=0,
-                    violation_type="syntax_error",
-                    description="Code contains syntax errors and cannot be analyzed",
-                    severity="medium",
-                )
-            ]
+        rules = self._current_rules()
+        key = (rules.version, _source_digest(code))
+        violations = self._cached(key)
+        if violations is None:
+            violations = _validate_source(code, rules)
+            self._remember(key, violations)
+        return [replace(v) for v in violations]
+
+    def validate_many(
+        self,
+        codes: Sequence[str],
+        *,
+        max_workers: int | None = None,
+    ) -> list[list[SecurityViolation]]:
+        """Validate a batch of snippets, in a process pool when it is large.
 
-        visitor = _ASTSecurityVisitor(
-            blocked_modules=set(self.config.blocked_modules),
-            blocked_builtins=set(self.config.blocked_builtins),
-        )
-        visitor.visit(tree)
-        return visitor.violations
+        Cached and duplicate snippets are validated once; the rest are spread
+        over worker processes when there are enough of them to pay for
+        starting the pool.
+
+        Args:
+            codes: Python source snippets to analyze.
+            max_workers: Worker processes to use. Defaults to the CPU count;
+                ``1`` validates in the calling process.
+
+        Returns:
+            One list of SecurityViolation instances per snippet, in order.
+        """
+        rules = self._current_rules()
+        results: list[list[SecurityViolation]] = [[] for _ in codes]
+        # key -> (source, indexes of the snippets sharing it)
+        pending: dict[tuple[int, bytes], tuple[str, list[int]]] = {}
+        for i, code in enumerate(codes):
+            key = (rules.version, _source_digest(code))
+            violations = self._cached(key)
+            if violations is not None:
+                results[i] = violations
+            elif key in pending:
+                pending[key][1].append(i)
+            else:
+                pending[key] = (code, [i])
+
+        if pending:
+            sources = [code for code, _ in pending.values()]
+            found = _validate_batch(sources, rules, max_workers or os.cpu_count() or 1)
+            for (key, (_, indexes)), violations in zip(pending.items(), found):
+                self._remember(key, violations)
+                for i in indexes:
+                    results[i] = violations
+
+        return [[replace(v) for v in violations] for violations in results]
+
+    def _current_rules(self) -> _Rules:
+        """Rules for the current config, recompiled when it has changed."""
+        config = self.config
+        signature = (tuple(config.blocked_modules), tuple(config.blocked_builtins))
+        rules = self._rules
+        if rules is None or signature != self._rules_signature:
+            with self._cache_lock:
+                rules = self._rules
+                if rules is None or signature != self._rules_signature:
+                    version = rules.version + 1 if rules is not None else 0
+                    rules = _Rules.build(version, config.blocked_modules, config.blocked_builtins)
+                    self._rules = rules
+                    self._rules_signature = signature
+                    self._validation_cache.clear()
+        return rules
+
+    def _cached(self, key: tuple[int, bytes]) -> list[SecurityViolation] | None:
+        """Cached violations for *key*, marked as most recently used."""
+        with self._cache_lock:
+            cache = self._validation_cache
+            violations = cache.get(key)
+            if violations is not None:
+                cache.move_to_end(key)
+            return violations
+
+    def _remember(self, key: tuple[int, bytes], violations: list[SecurityViolation]) -> None:
+        if self._cache_size > 0:
+            with self._cache_lock:
+                cache = self._validation_cache
+                cache[key] = violations
+                if len(cache) > self._cache_size:
+                    cache.popitem(last=False)
 
     def execute_sandboxed(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """Run a function with import hooks that enforce the sandbox.
@@ -313,6 +448,35 @@ class ExecutionSandbox:
             self._hook.uninstall()
 
 
+def _source_digest(code: str) -> bytes:
+    return hashlib.sha256(code.encode("utf-8", "surrogatepass")).digest()
+
+
+def _validate_batch(
+    sources: list[str],
+    rules: _Rules,
+    max_workers: int,
+) -> list[list[SecurityViolation]]:
+    """Validate *sources* in order, on a process pool when there are many."""
+    if len(sources) < _PARALLEL_VALIDATE_THRESHOLD or max_workers < 2:
+        return [_validate_source(code, rules) for code in sources]
+    chunksize = max(1, len(sources) // (max_workers * 4))
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                functools.partial(_validate_source, rules=rules),
+                sources,
+                chunksize=chunksize,
+            ))
+    except Exception:
+        # A broken or unavailable pool must not skip validation
+        logger.warning(
+            "Parallel code validation failed — validating %d snippets inline",
+            len(sources), exc_info=True,
+        )
+        return [_validate_source(code, rules) for code in sources]
+
+
 def _make_blocked_builtin(name: str) -> Callable[..., None]:
     """Create a function that raises SecurityError when called."""
 
@@ -21,10 +21,14 @@ Example:
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import Any, Iterable
+
+from agent_os._regex_prefilter import required_literals
+
 
 # =============================================================================
 # Intent Categories
@@ -164,6 +168,14 @@ _SIGNALS: dict[IntentCategory, list[tuple]] = {
 }
 
 
+# Flattened texts up to this length are memoised by value
+_MEMO_MAX_TEXT = 4096
+
+# Overlap between consecutive windows of capped text, so signals spanning a
+# window boundary are still seen whole
+_WINDOW_OVERLAP = 256
+
+
 # =============================================================================
 # Semantic Policy Engine
 # =============================================================================
@@ -178,6 +190,11 @@ class SemanticPolicyEngine:
 
     This is a zero-dependency heuristic classifier designed to run in <1ms.
     The API is stable — swap in an ML classifier later without changing callers.
+
+    Each signal carries the literal keywords its regex cannot match without;
+    a single pass over the lower-cased text finds the keywords present and
+    only signals with a keyword hit run their regex. Results for repeated
+    inputs are memoised.
     """
 
     def __init__(
@@ -185,12 +202,19 @@ class SemanticPolicyEngine:
         deny: list[IntentCategory] | None = None,
         confidence_threshold: float = 0.5,
         custom_signals: dict[IntentCategory, list[tuple]] | None = None,
+        max_text_length: int | None = None,
+        cache_size: int = 1024,
     ):
         """
         Args:
             deny: Intent categories to deny (default: all dangerous categories)
             confidence_threshold: Minimum confidence to trigger deny (0.0-1.0)
             custom_signals: Additional signal patterns to merge with defaults
+            max_text_length: Window size, in characters, for scanning
+                flattened action+params; longer text is scanned in
+                overlapping windows and the most confident window wins
+                (None scans the text in one pass)
+            cache_size: Classifications memoised for repeated inputs (0 disables)
         """
         self.deny_categories: set[IntentCategory] = set(deny) if deny else {
             IntentCategory.DESTRUCTIVE_DATA,
@@ -204,6 +228,7 @@ class SemanticPolicyEngine:
         if custom_signals:
             for cat, sigs in custom_signals.items():
                 self.signals.setdefault(cat, []).extend(sigs)
+        self.max_text_length = max_text_length
         # Pre-compile regexes for performance
         self._compiled: dict[IntentCategory, list[tuple]] = {}
         for cat, sigs in self.signals.items():
@@ -211,6 +236,13 @@ class SemanticPolicyEngine:
                 (re.compile(pattern, re.IGNORECASE), weight, explanation)
                 for pattern, weight, explanation in sigs
             ]
+        # Keyword prefilter, derived per compiled regex on first use
+        self._requirements: dict[re.Pattern, frozenset[str] | None] = {}
+        self._classify_memo = (
+            functools.lru_cache(maxsize=cache_size)(self._classify_text)
+            if cache_size > 0 else None
+        )
+        self._memo_state: tuple[int, ...] = ()
 
     def classify(
         self, action: str, params: dict[str, Any]
@@ -227,6 +259,48 @@ class SemanticPolicyEngine:
         """
         # Build the text corpus to scan
         text = self._build_text(action, params)
+        window = self.max_text_length
+        if window is not None and len(text) > window:
+            # Never drop text past the cap: that would let padding hide a signal
+            step = max(window - min(_WINDOW_OVERLAP, window // 2), 1)
+            best = None
+            for start in range(0, len(text) - window + step, step):
+                result = self._classify_cached(text[start:start + window])
+                if best is None or result.confidence > best.confidence:
+                    best = result
+            return best
+        return self._classify_cached(text)
+
+    def _classify_cached(self, text: str) -> IntentClassification:
+        """Classify *text*, memoising short inputs."""
+        if self._classify_memo is None or len(text) > _MEMO_MAX_TEXT:
+            return self._classify_text(text)
+        # Signals may be appended to _compiled after construction
+        state = tuple(map(len, self._compiled.values()))
+        if state != self._memo_state:
+            self._classify_memo.cache_clear()
+            self._memo_state = state
+        return self._classify_memo(text)
+
+    def classify_batch(
+        self, calls: Iterable[tuple[str, dict[str, Any]]]
+    ) -> list[IntentClassification]:
+        """
+        Classify many (action, params) pairs.
+
+        Args:
+            calls: Iterable of (action, params) tuples
+
+        Returns:
+            One IntentClassification per call, in order
+        """
+        return [self.classify(action, params) for action, params in calls]
+
+    def _classify_text(self, text: str) -> IntentClassification:
+        """Classify a flattened action+params string."""
+        # Unicode case folding can match ASCII patterns, so only prefilter ASCII text
+        lowered = text.lower() if text.isascii() else None
+        requirements = self._requirements
 
         best_category = IntentCategory.BENIGN
         best_confidence = 0.0
@@ -237,6 +311,13 @@ class SemanticPolicyEngine:
             total_weight = 0.0
 
             for regex, weight, explanation in compiled_sigs:
+                if lowered is not None:
+                    try:
+                        literals = requirements[regex]
+                    except KeyError:
+                        literals = requirements[regex] = required_literals(regex.pattern)
+                    if literals is not None and not any(lit in lowered for lit in literals):
+                        continue
                 if regex.search(text):
                     matched.append(explanation)
                     total_weight = max(total_weight, weight)
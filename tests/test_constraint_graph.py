@@ -134,6 +134,54 @@ class TestConstraintGraphResolve:
         assert len(g.edges) == 1
 
 
+# ---------------------------------------------------------------------------
+# ConstraintGraph — compiled index
+# ---------------------------------------------------------------------------
+
+class TestConstraintGraphIndex:
+    def test_equal_priority_keeps_insertion_order(self):
+        g = ConstraintGraph()
+        g.add_constraint(ConstraintEdge("*", "db_*", Permission.DENY, priority=1))
+        g.add_constraint(ConstraintEdge("*", "db_read", Permission.ALLOW, priority=1))
+        assert g.resolve("a", "db_read") is False
+        assert [e.permission for e in g.edges] == [Permission.DENY, Permission.ALLOW]
+
+    def test_exact_bucket_outranked_by_glob(self):
+        g = ConstraintGraph()
+        g.add_constraint(ConstraintEdge("*", "db_read", Permission.ALLOW, priority=0))
+        g.add_constraint(ConstraintEdge("*", "db_*", Permission.DENY, priority=5))
+        g.add_constraint(ConstraintEdge("*", "*", Permission.ALLOW, priority=9,
+                                        conditions={"role": "admin"}))
+        assert g.resolve("a", "db_read") is False
+        assert g.resolve("a", "db_read", {"role": "admin"}) is True
+        assert g.resolve("a", "dx_read") is False
+
+    def test_globs_with_inner_wildcards(self):
+        g = ConstraintGraph()
+        g.add_constraint(ConstraintEdge("agent-?", "api_*_v[12]", Permission.ALLOW))
+        assert g.resolve("agent-1", "api_get_v2") is True
+        assert g.resolve("agent-1", "api_get_v3") is False
+        assert g.resolve("agent-10", "api_get_v1") is False
+        assert g.resolve("agent-1", "api") is False
+
+    def test_constraints_added_after_resolve(self):
+        g = ConstraintGraph()
+        g.add_constraint(ConstraintEdge("*", "tool", Permission.ALLOW))
+        assert g.resolve("a", "tool") is True
+        g.add_constraint(ConstraintEdge("*", "tool", Permission.DENY, priority=1))
+        assert g.resolve("a", "tool") is False
+
+    def test_add_constraints_bulk(self):
+        g = ConstraintGraph()
+        g.add_constraints([
+            ConstraintEdge(f"agent-{i}", f"tool_{i}", Permission.ALLOW, priority=i % 3)
+            for i in range(1_000)
+        ])
+        assert g.resolve("agent-500", "tool_500") is True
+        assert g.resolve("agent-500", "tool_501") is False
+        assert [e.priority for e in g.edges[:2]] == [2, 2]
+
+
 # ---------------------------------------------------------------------------
 # ConstraintGraphEnforcer
 # ---------------------------------------------------------------------------
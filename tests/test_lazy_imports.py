@@ -0,0 +1,146 @@
+"""Regression tests for lazy loading in ``import agent_os``."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = str(Path(__file__).parent.parent / "src")
+
+# `python -X importtime` cumulative microseconds for `import agent_os`; eager
+# imports of every integration took ~300 ms, lazy loading takes under 15 ms
+IMPORT_TIME_BUDGET_US = 100_000
+
+# Heavy modules that only specific exports or integrations should load
+HEAVY_MODULES = [
+    "agent_os.integrations",
+    "agent_os.integrations.base",
+    "agent_os.stateless",
+    "agent_os.mcp_security",
+    "asyncio",
+    "importlib.metadata",
+    "opentelemetry",
+    "pydantic",
+    "yaml",
+]
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    """Run *code* in a fresh interpreter that only sees ``src``."""
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": SRC},
+        check=True,
+    )
+
+
+def _loaded_after(statement: str) -> set:
+    """Modules newly present in ``sys.modules`` after *statement*."""
+    code = (
+        "import json, sys\n"
+        "before = set(sys.modules)\n"
+        f"{statement}\n"
+        "print(json.dumps(sorted(set(sys.modules) - before)))\n"
+    )
+    return set(json.loads(_run(code).stdout))
+
+
+class TestImportAgentOS:
+    def test_import_time_bounded(self):
+        # Take the best of a few runs to keep scheduler noise out
+        timings = []
+        for _ in range(3):
+            stderr = _run("import agent_os", "-X", "importtime").stderr
+            for line in stderr.splitlines():
+                fields = [f.strip() for f in line.split("|")]
+                if fields[-1] == "agent_os":
+                    timings.append(int(fields[1]))
+        assert timings
+        assert min(timings) < IMPORT_TIME_BUDGET_US
+
+    def test_loads_no_submodules_or_heavy_dependencies(self):
+        loaded = _loaded_after("import agent_os")
+        assert {m for m in loaded if m.startswith("agent_os")} == {"agent_os"}
+        assert not loaded & set(HEAVY_MODULES)
+
+    def test_export_loads_only_its_module(self):
+        loaded = _loaded_after("from agent_os import PromptInjectionDetector")
+        assert "agent_os.prompt_injection" in loaded
+        assert "agent_os.mcp_security" not in loaded
+        assert "agent_os.integrations" not in loaded
+
+    def test_scanners_do_not_load_intent_classifier(self):
+        loaded = _loaded_after("import agent_os.mcp_gateway, agent_os.memory_guard")
+        assert "agent_os._regex_prefilter" in loaded
+        assert "agent_os.semantic_policy" not in loaded
+
+    def test_integrations_package_loads_no_adapters(self):
+        loaded = _loaded_after("import agent_os.integrations")
+        assert not {m for m in loaded if m.startswith("agent_os.integrations.")}
+
+    def test_providers_defer_entry_point_discovery(self):
+        loaded = _loaded_after("import agent_os.providers")
+        assert "importlib.metadata" not in loaded
+
+
+class TestLazyExports:
+    def test_local_exports_resolve(self):
+        import agent_os
+
+        for name in agent_os._LAZY_EXPORTS:
+            if agent_os._LAZY_EXPORTS[name][2] is None:
+                assert getattr(agent_os, name) is not None
+
+    def test_name_clashes_resolve_as_before(self):
+        import agent_os
+        from agent_os.agents_compat import AgentConfig as AgentsConfig
+        from agent_os.base_agent import AgentConfig
+        from agent_os.context_budget import AgentSignal
+        from agent_os.stateless import MemoryBackend
+
+        assert agent_os.AgentSignal is AgentSignal
+        assert agent_os.AgentConfig is AgentConfig
+        assert agent_os.AgentsConfig is AgentsConfig
+        assert agent_os.StatelessMemoryBackend is MemoryBackend
+
+    def test_all_names_are_exports(self):
+        import agent_os
+
+        module_level = {"__version__", "__author__", "AVAILABLE_PACKAGES", "check_installation"}
+        assert set(agent_os.__all__) - module_level <= set(agent_os._LAZY_EXPORTS)
+
+    def test_unknown_attribute_raises(self):
+        import agent_os
+
+        with pytest.raises(AttributeError):
+            agent_os.NoSuchExport  # noqa: B018
+
+    def test_available_packages(self):
+        import agent_os
+
+        packages = agent_os.AVAILABLE_PACKAGES
+        assert set(packages) == {
+            "primitives", "cmvk", "caas", "emk", "iatp", "amb", "atr",
+            "control_plane", "scak", "mute_agent",
+        }
+        assert all(isinstance(v, bool) for v in packages.values())
+
+    def test_check_installation_in_fresh_interpreter(self):
+        # AVAILABLE_PACKAGES is lazy, so the first lookup must come from here
+        _run("from agent_os import check_installation; check_installation()")
+
+    def test_dir_lists_lazy_exports(self):
+        import agent_os
+
+        assert "MCPSecurityScanner" in dir(agent_os)
+
+    def test_integrations_exports_resolve(self):
+        import agent_os.integrations as integrations
+
+        for name in integrations.__all__:
+            assert getattr(integrations, name) is not None
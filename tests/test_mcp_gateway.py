@@ -295,3 +295,97 @@ class TestWrapMCPServer:
         original = {"host": "localhost"}
         MCPGateway.wrap_mcp_server(original, _make_policy())
         assert original == {"host": "localhost"}
+
+
+# ── Compiled policy ─────────────────────────────────────────────────────────
+
+class TestCompiledPolicy:
+    def test_reassigning_config_invalidates_decisions(self):
+        gw = MCPGateway(_make_policy(), enable_builtin_sanitization=False)
+        assert gw.intercept_tool_call("a1", "exec_cmd", {})[0] is True
+        gw.denied_tools = ["exec_cmd"]
+        assert gw.intercept_tool_call("a1", "exec_cmd", {})[0] is False
+        gw.policy = _make_policy(allowed_tools=["read_file"])
+        allowed, reason = gw.intercept_tool_call("a1", "write_file", {})
+        assert allowed is False
+        assert "not on the allow list" in reason
+
+    def test_refresh_policy_after_in_place_change(self):
+        gw = MCPGateway(_make_policy(), enable_builtin_sanitization=False)
+        gw.intercept_tool_call("a1", "deploy", {})
+        gw.sensitive_tools.append("deploy")
+        gw.refresh_policy()
+        allowed, reason = gw.intercept_tool_call("a1", "deploy", {})
+        assert allowed is False
+        assert reason == "Awaiting human approval"
+
+    def test_in_place_changes_apply_without_refresh(self):
+        gw = MCPGateway(
+            _make_policy(allowed_tools=["read_file", "write_file"]),
+            enable_builtin_sanitization=False,
+        )
+        assert gw.intercept_tool_call("a1", "read_file", {})[0] is True
+        assert gw.intercept_tool_call("a1", "write_file", {})[0] is True
+        gw.denied_tools.append("read_file")
+        gw.policy.allowed_tools.remove("write_file")
+        allowed, reason = gw.intercept_tool_call("a1", "read_file", {})
+        assert allowed is False
+        assert "deny list" in reason
+        allowed, reason = gw.intercept_tool_call("a1", "write_file", {})
+        assert allowed is False
+        assert "not on the allow list" in reason
+        gw.policy.require_human_approval = True
+        gw.policy.allowed_tools.append("write_file")
+        assert gw.intercept_tool_call("a1", "write_file", {}) == (False, "Awaiting human approval")
+
+    def test_budget_survives_recompilation(self):
+        gw = MCPGateway(_make_policy(max_tool_calls=2), enable_builtin_sanitization=False)
+        gw.intercept_tool_call("a1", "t", {})
+        gw.intercept_tool_call("a1", "t", {})
+        gw.policy = _make_policy(max_tool_calls=3)
+        assert gw.get_agent_call_count("a1") == 2
+        assert gw.intercept_tool_call("a1", "t", {})[0] is True
+        assert gw.intercept_tool_call("a1", "t", {})[0] is False
+        gw.policy = _make_policy(max_tool_calls=1)
+        assert gw.get_agent_call_count("a1") == 3
+
+    def test_budget_is_exact_under_concurrency(self):
+        import threading
+
+        gw = MCPGateway(_make_policy(max_tool_calls=500), enable_builtin_sanitization=False)
+        allowed = []
+
+        def worker():
+            allowed.append(sum(gw.intercept_tool_call("a1", "t", {})[0] for _ in range(200)))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sum(allowed) == 500
+        assert gw.get_agent_call_count("a1") == 500
+
+    def test_glob_and_literal_keyed_patterns(self):
+        gw = MCPGateway(_make_policy(blocked_patterns=[
+            ("*}", PatternType.GLOB),
+            (r"\bDROP\s+TABLE\b", PatternType.REGEX),
+        ]), enable_builtin_sanitization=False)
+        allowed, reason = gw.intercept_tool_call("a1", "t", {"q": "drop   table users"})
+        assert allowed is False
+        expected = ["*}", r"\bDROP\s+TABLE\b"]
+        assert reason == f"Parameters matched blocked pattern(s): {expected}"
+        gw.policy = _make_policy(blocked_patterns=[(r"\bDROP\s+TABLE\b", PatternType.REGEX)])
+        assert gw.intercept_tool_call("a1", "t", {"q": "table drop"})[0] is True
+
+    def test_backreference_pattern_is_not_merged(self):
+        gw = MCPGateway(_make_policy(blocked_patterns=[
+            (r"(\w+) \1", PatternType.REGEX),
+            (r"(?P<x>a)b", PatternType.REGEX),
+            (r"(?P<x>c)d", PatternType.REGEX),
+        ]), enable_builtin_sanitization=False)
+        assert gw.intercept_tool_call("a1", "t", {"q": "hello world"})[0] is True
+        allowed, reason = gw.intercept_tool_call("a1", "t", {"q": "again again"})
+        assert allowed is False
+        assert reason == "Parameters matched blocked pattern(s): ['(\\\\w+) \\\\1']"
+        assert gw.intercept_tool_call("a1", "t", {"q": "xcdx"})[0] is False
@@ -15,6 +15,7 @@ from agent_os.mcp_security import (
     MCPThreatType,
     ScanResult,
     ToolFingerprint,
+    _levenshtein,
 )
 
 
@@ -318,6 +319,126 @@ class TestCrossServerAttacks:
         threats = self.scanner._check_cross_server("search", "server-a")
         assert len(threats) == 0
 
+    def test_findings_follow_registration_order(self):
+        self.scanner.register_tool("read_files", "Read", None, "server-a")
+        self.scanner.register_tool("read_file", "Read", None, "server-b")
+        self.scanner.register_tool("Read_Fil", "Read", None, "server-c")
+        self.scanner.register_tool("write_file", "Write", None, "server-d")
+        threats = self.scanner._check_cross_server("read_file", "server-x")
+        assert [t.details for t in threats] == [
+            {"similar_tool": "read_files", "similar_server": "server-a"},
+            {"original_server": "server-b"},
+            {"similar_tool": "Read_Fil", "similar_server": "server-c"},
+        ]
+
+    def test_case_only_difference_is_not_typosquatting(self):
+        self.scanner.register_tool("Search", "Search tool", None, "server-a")
+        assert self.scanner._check_cross_server("search", "server-b") == []
+
+    def test_short_names_are_not_compared(self):
+        self.scanner.register_tool("ls", "List", None, "server-a")
+        assert self.scanner._check_cross_server("lss", "server-b") == []
+
+    def test_index_matches_pairwise_comparison(self):
+        names = [
+            "search", "seaarch", "serach", "searches", "sea", "research",
+            "fetch_url", "fetch_uri", "fetchurl", "get_user", "get_users",
+            "delete_user", "delete_users!", "list_dir", "list_dirs", "lsdir",
+        ]
+        for i, name in enumerate(names):
+            self.scanner.register_tool(name, "Tool", None, f"server-{i}")
+        for query in names + ["SEARCH", "list_di", "fetch"]:
+            found = {
+                t.details["similar_tool"]
+                for t in self.scanner._check_cross_server(query, "server-x")
+                if "similar_tool" in t.details
+            }
+            expected = {
+                name for name in names
+                if name != query and MCPSecurityScanner._is_typosquat(query, name)
+            }
+            assert found == expected, query
+
+
+class TestLevenshtein:
+    def test_exact_distance(self):
+        assert _levenshtein("kitten", "sitting") == 3
+        assert _levenshtein("", "abc") == 3
+        assert _levenshtein("abc", "abc") == 0
+
+    def test_bounded_distance_stops_early(self):
+        assert _levenshtein("kitten", "sitting", 2) == 3
+        assert _levenshtein("kitten", "sitting", 3) == 3
+        assert _levenshtein("abcdefgh", "ab", 2) == 3
+        assert _levenshtein("search", "seaarch", 2) == 1
+
+
+# ============================================================================
+# TestScanCache — content findings are reused across repeated scans
+# ============================================================================
+
+class TestScanCache:
+    def test_repeated_scan_reuses_content_findings(self, monkeypatch):
+        scanner = MCPSecurityScanner()
+        calls = []
+        original = scanner._check_hidden_instructions
+
+        def counting(*args):
+            calls.append(args)
+            return original(*args)
+
+        monkeypatch.setattr(scanner, "_check_hidden_instructions", counting)
+        first = scanner.scan_tool("evil", "<!-- hidden -->", None, "server1")
+        second = scanner.scan_tool("evil", "<!-- hidden -->", None, "server1")
+        assert len(calls) == 1
+        assert [t.message for t in first] == [t.message for t in second]
+        assert first is not second
+        scanner.scan_tool("evil", "<!-- changed -->", None, "server1")
+        assert len(calls) == 2
+
+    def test_cached_scan_still_checks_registry(self):
+        scanner = MCPSecurityScanner()
+        assert scanner.scan_tool("search", "Search", None, "server-b") == []
+        scanner.register_tool("search", "Search", None, "server-a")
+        threats = scanner.scan_tool("search", "Search", None, "server-b")
+        assert [t.threat_type for t in threats] == [MCPThreatType.CROSS_SERVER_ATTACK]
+        scanner.register_tool("search", "Search", None, "server-b")
+        scanner.register_tool("search", "Search v2", None, "server-b")
+        threats = scanner.scan_tool("search", "Search", None, "server-b")
+        assert MCPThreatType.RUG_PULL in [t.threat_type for t in threats]
+
+    def test_cache_is_bounded(self):
+        scanner = MCPSecurityScanner(cache_size=2)
+        for i in range(5):
+            scanner.scan_tool(f"tool{i}", "Description", None, "server1")
+        assert len(scanner._content_cache) == 2
+        disabled = MCPSecurityScanner(cache_size=0)
+        disabled.scan_tool("tool", "Description", None, "server1")
+        assert len(disabled._content_cache) == 0
+
+    def test_concurrent_scans_with_small_cache(self):
+        import threading
+
+        scanner = MCPSecurityScanner(cache_size=2)
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(200):
+                    for i in range(4):
+                        scanner.scan_tool(f"tool{i}", "<!-- hidden -->", None, "server1")
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert len(scanner._content_cache) <= 2
+        assert len(scanner._cross_server_cache) <= 2
+
 
 # ============================================================================
 # TestScanTool — full scan of clean and poisoned tools
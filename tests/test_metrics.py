@@ -4,7 +4,13 @@ import threading
 
 import pytest
 
-from agent_os.metrics import GovernanceMetrics
+from agent_os.metrics import (
+    HISTOGRAM_BUCKETS,
+    GovernanceMetrics,
+    _bucket_index,
+    _bucket_upper_ms,
+    prometheus_text,
+)
 
 
 # ── Fixtures ──────────────────────────────────────────────────
@@ -168,3 +174,103 @@ def test_multiple_adapters_independent(m: GovernanceMetrics) -> None:
     assert m.approvals == 2
     assert m.violations == 2
     assert m.blocked == 1
+
+
+# ── 11. Per-thread shards ────────────────────────────────────
+
+
+def test_counts_from_finished_threads_are_retained(m: GovernanceMetrics) -> None:
+    for _ in range(20):
+        t = threading.Thread(target=m.record_check, args=("a", 1.0, False))
+        t.start()
+        t.join()
+    m.record_blocked("a")  # registers this thread, retiring the dead shards
+
+    assert len(m._shards) <= 2
+    assert m.total_checks == 20
+    assert m.snapshot()["adapters"]["a"] == {"checks": 20, "violations": 20, "blocked": 1}
+
+
+def test_snapshot_while_writers_run(m: GovernanceMetrics) -> None:
+    stop = threading.Event()
+
+    def writer() -> None:
+        while not stop.is_set():
+            m.record_check("a", latency_ms=0.5, approved=True)
+
+    threads = [threading.Thread(target=writer) for _ in range(4)]
+    for t in threads:
+        t.start()
+    seen = [m.snapshot()["total_checks"] for _ in range(50)]
+    stop.set()
+    for t in threads:
+        t.join()
+
+    assert seen == sorted(seen)
+    assert m.snapshot()["total_checks"] == m.approvals
+
+
+# ── 12. Latency histogram ────────────────────────────────────
+
+
+def test_histogram_buckets_bound_relative_error() -> None:
+    for micros in (0, 1, 7, 8, 15, 16, 999, 1_000, 123_456, 10**9):
+        index = _bucket_index(micros / 1000.0)
+        assert 0 <= index < HISTOGRAM_BUCKETS
+        upper = _bucket_upper_ms(index) * 1000.0
+        assert micros <= upper + 1e-6
+        assert upper - micros <= max(1.0, micros * 0.125)
+
+
+def test_histogram_memory_is_constant(m: GovernanceMetrics) -> None:
+    for i in range(10_000):
+        m.record_check("a", latency_ms=i * 0.37, approved=True)
+    assert len(m._shards[0].histogram) == HISTOGRAM_BUCKETS
+
+
+def test_latency_percentiles(m: GovernanceMetrics) -> None:
+    for _ in range(90):
+        m.record_check("a", latency_ms=1.0, approved=True)
+    for _ in range(10):
+        m.record_check("a", latency_ms=100.0, approved=True)
+
+    p = m.snapshot()["latency_percentiles_ms"]
+    assert p["p50"] == pytest.approx(1.0, rel=0.125)
+    assert p["p90"] == pytest.approx(1.0, rel=0.125)
+    assert p["p99"] == pytest.approx(100.0, rel=0.125)
+
+
+# ── 13. Prometheus exposition ────────────────────────────────
+
+
+def test_prometheus_text_from_snapshot(m: GovernanceMetrics) -> None:
+    m.record_check("langchain", latency_ms=0.5, approved=True)
+    m.record_check("langchain", latency_ms=20.0, approved=False)
+    m.record_blocked("crewai")
+
+    text = prometheus_text(m.snapshot())
+
+    assert 'agentos_governance_checks_total{adapter="langchain"} 2' in text
+    assert 'agentos_governance_blocked_total{adapter="crewai"} 1' in text
+    assert "# TYPE agentos_governance_check_latency_seconds histogram" in text
+    assert 'agentos_governance_check_latency_seconds_bucket{le="+Inf"} 2' in text
+    assert "agentos_governance_check_latency_seconds_count 2" in text
+    buckets = [
+        int(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if line.startswith("agentos_governance_check_latency_seconds_bucket")
+    ]
+    assert buckets == sorted(buckets)
+    assert 'le="0.000256"} 0' in text
+    assert 'le="0.000512"} 1' in text
+
+
+def test_prometheus_text_escapes_label_values(m: GovernanceMetrics) -> None:
+    m.record_check('my "agent"\\v2\nprod', latency_ms=1.0, approved=True)
+
+    text = prometheus_text(m.snapshot())
+
+    assert (
+        'agentos_governance_checks_total{adapter="my \\"agent\\"\\\\v2\\nprod"} 1'
+        in text.splitlines()
+    )
@@ -3,13 +3,20 @@
 Run with: python -m pytest tests/test_rate_limiter.py -v --tb=short
 """
 
+import asyncio
+import multiprocessing
 import threading
 import time
 
 import pytest
 
 from agent_os.integrations.base import GovernancePolicy
-from agent_os.integrations.rate_limiter import RateLimiter, RateLimitStatus
+from agent_os.integrations.rate_limiter import (
+    AsyncRateLimiter,
+    RateLimiter,
+    RateLimitStatus,
+    SharedMemoryRateLimiter,
+)
 
 
 # =============================================================================
@@ -223,3 +230,153 @@ class TestThreadSafety:
 
         assert not errors
         assert sum(successes) == 1000
+
+    def test_concurrent_allow_across_shards(self):
+        limiter = RateLimiter(max_calls=10, time_window=60.0, shards=4)
+        keys = [f"agent-{i}" for i in range(50)]
+        counts = []
+
+        def worker():
+            counts.append(sum(limiter.allow(k) for _ in range(20) for k in keys))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sum(counts) == 10 * len(keys)
+
+
+# =============================================================================
+# Eviction
+# =============================================================================
+
+
+class TestEviction:
+    def test_idle_buckets_are_evicted(self):
+        limiter = RateLimiter(max_calls=2, time_window=0.05, shards=1)
+        for i in range(100):
+            limiter.allow(f"agent-{i}")
+        assert len(limiter) == 100
+        time.sleep(0.06)
+        limiter.allow("fresh")
+        assert len(limiter) == 1
+
+    def test_active_bucket_survives_idle_sweep(self):
+        limiter = RateLimiter(max_calls=2, time_window=60.0, shards=1, idle_ttl=0.05)
+        limiter.allow("busy")
+        limiter.allow("busy")
+        time.sleep(0.06)
+        limiter.allow("busy")  # touch: moves to the recent end
+        limiter.allow("other")
+        assert limiter.check("busy").remaining_calls == 0
+
+    def test_max_keys_bounds_memory(self):
+        limiter = RateLimiter(max_calls=1, time_window=60.0, shards=4, max_keys=100)
+        for i in range(10_000):
+            limiter.allow(f"agent-{i}")
+        assert len(limiter) <= 100
+
+    def test_max_keys_evicts_least_recently_used(self):
+        limiter = RateLimiter(max_calls=1, time_window=60.0, shards=1, max_keys=2)
+        limiter.allow("a")
+        limiter.allow("b")
+        limiter.allow("a")
+        limiter.allow("c")  # evicts "b"
+        assert limiter.allow("a") is False
+        assert limiter.allow("b") is True
+
+    def test_invalid_shards_and_max_keys(self):
+        with pytest.raises(ValueError):
+            RateLimiter(shards=0)
+        with pytest.raises(ValueError):
+            RateLimiter(max_keys=0)
+
+
+# =============================================================================
+# Async variant
+# =============================================================================
+
+
+class TestAsyncRateLimiter:
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill(self):
+        limiter = AsyncRateLimiter(max_calls=2, time_window=0.1)
+        start = time.monotonic()
+        for _ in range(3):
+            assert await limiter.acquire("agent-1") is True
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_acquire_times_out(self):
+        limiter = AsyncRateLimiter(max_calls=1, time_window=10.0)
+        assert await limiter.acquire("agent-1") is True
+        assert await limiter.acquire("agent-1", timeout=0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_share_bucket(self):
+        limiter = AsyncRateLimiter(max_calls=5, time_window=60.0)
+        results = await asyncio.gather(*(asyncio.sleep(0, limiter.allow("a")) for _ in range(10)))
+        assert sum(results) == 5
+
+
+# =============================================================================
+# Shared-memory variant
+# =============================================================================
+
+
+def _consume(limiter, key, calls, results):
+    results.put(sum(limiter.allow(key) for _ in range(calls)))
+    limiter.close()
+
+
+class TestSharedMemoryRateLimiter:
+    @pytest.fixture
+    def shared(self):
+        limiter = SharedMemoryRateLimiter(max_calls=5, time_window=60.0, max_keys=64)
+        yield limiter
+        limiter.close()
+        limiter.unlink()
+
+    def test_allow_and_check(self, shared):
+        assert shared.check("agent-1").remaining_calls == 5
+        assert all(shared.allow("agent-1") for _ in range(5))
+        assert shared.allow("agent-1") is False
+        assert shared.check("agent-1").wait_seconds > 0
+        assert shared.allow("agent-2") is True
+
+    def test_reset(self, shared):
+        for _ in range(5):
+            shared.allow("agent-1")
+        shared.reset("agent-1")
+        assert shared.allow("agent-1") is True
+
+    def test_full_set_evicts_least_recent(self):
+        limiter = SharedMemoryRateLimiter(max_calls=1, time_window=60.0, max_keys=1, ways=1)
+        try:
+            limiter.allow("a")
+            limiter.allow("b")  # single slot: replaces "a"
+            assert limiter.allow("a") is True
+        finally:
+            limiter.close()
+            limiter.unlink()
+
+    def test_limit_holds_across_processes(self):
+        ctx = multiprocessing.get_context("spawn")
+        limiter = SharedMemoryRateLimiter(max_calls=50, time_window=60.0, mp_context=ctx)
+        results = ctx.Queue()
+        try:
+            procs = [
+                ctx.Process(target=_consume, args=(limiter, "shared", 40, results))
+                for _ in range(3)
+            ]
+            for p in procs:
+                p.start()
+            total = sum(results.get(timeout=30) for _ in procs)
+            for p in procs:
+                p.join(timeout=30)
+        finally:
+            limiter.close()
+            limiter.unlink()
+        assert total == 50
@@ -148,6 +148,166 @@ class TestValidateCode:
         assert len(violations) == 1
         assert violations[0].violation_type == "syntax_error"
 
+    def test_null_bytes_return_syntax_violation(self):
+        sandbox = ExecutionSandbox()
+        violations = sandbox.validate_code("x = 1\x00")
+        assert [v.violation_type for v in violations] == ["syntax_error"]
+
+    def test_violations_in_source_order(self):
+        sandbox = ExecutionSandbox()
+        code = (
+            "@eval('f')\n"
+            "def f():\n"
+            "    import os\n"
+            "    return exec(os.getcwd())\n"
+        )
+        violations = sandbox.validate_code(code)
+        assert [(v.line, v.violation_type) for v in violations] == [
+            (1, "blocked_builtin"),
+            (3, "blocked_import"),
+            (4, "blocked_builtin"),
+            (4, "blocked_module_call"),
+        ]
+
+    def test_blocked_name_inside_identifier_or_string_is_clean(self):
+        sandbox = ExecutionSandbox()
+        code = "cosine = 1\nmy_eval = 'os.system'\nprint(cosine, my_eval)"
+        assert sandbox.validate_code(code) == []
+
+    def test_normalized_non_ascii_identifier_detected(self):
+        # Identifiers are NFKC-normalized: fullwidth "ｅval" is the builtin eval
+        sandbox = ExecutionSandbox()
+        violations = sandbox.validate_code("\uff45val('1+1')")
+        assert [v.violation_type for v in violations] == ["blocked_builtin"]
+
+
+class TestValidationCache:
+    @pytest.fixture
+    def analyzed(self, monkeypatch):
+        """Sources that reached the parser, in call order."""
+        from agent_os import sandbox as sandbox_module
+
+        seen = []
+        original = sandbox_module._validate_source
+
+        def spy(code, rules):
+            seen.append(code)
+            return original(code, rules)
+
+        monkeypatch.setattr(sandbox_module, "_validate_source", spy)
+        return seen
+
+    def test_resubmitted_snippet_not_reparsed(self, analyzed):
+        sandbox = ExecutionSandbox()
+        first = sandbox.validate_code("import os")
+        second = sandbox.validate_code("import os")
+        assert analyzed == ["import os"]
+        assert first == second
+        assert first[0] is not second[0]
+
+    def test_config_change_invalidates(self, analyzed):
+        sandbox = ExecutionSandbox()
+        assert sandbox.validate_code("import requests") == []
+        sandbox.config.blocked_modules.append("requests")
+        assert len(sandbox.validate_code("import requests")) == 1
+        sandbox.config = SandboxConfig(blocked_modules=[])
+        assert sandbox.validate_code("import requests") == []
+        assert len(analyzed) == 3
+
+    def test_unrelated_config_change_keeps_cache(self, analyzed):
+        sandbox = ExecutionSandbox()
+        sandbox.validate_code("x = 1")
+        sandbox.config.max_memory_mb = 128
+        sandbox.validate_code("x = 1")
+        assert analyzed == ["x = 1"]
+
+    def test_cache_disabled(self, analyzed):
+        sandbox = ExecutionSandbox(cache_size=0)
+        sandbox.validate_code("x = 1")
+        sandbox.validate_code("x = 1")
+        assert len(analyzed) == 2
+
+    def test_cache_bounded(self):
+        sandbox = ExecutionSandbox(cache_size=2)
+        for i in range(5):
+            sandbox.validate_code(f"x = {i}")
+        assert len(sandbox._validation_cache) == 2
+
+    def test_concurrent_use_of_small_cache(self):
+        import threading
+
+        sandbox = ExecutionSandbox(cache_size=2)
+        codes = [f"import os\nx = {i}" for i in range(4)]
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(300):
+                    for code in codes:
+                        assert len(sandbox.validate_code(code)) == 1
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert len(sandbox._validation_cache) <= 2
+
+
+class TestValidateMany:
+    CODES = [
+        "import subprocess",
+        "x = 1",
+        "def (broken",
+        "import subprocess",
+        "os.system('ls')",
+        "print(eval('2'))",
+    ]
+
+    def test_matches_validate_code(self):
+        expected = [ExecutionSandbox().validate_code(c) for c in self.CODES]
+        assert ExecutionSandbox().validate_many(self.CODES) == expected
+
+    def test_duplicates_and_cached_validated_once(self, monkeypatch):
+        from agent_os import sandbox as sandbox_module
+
+        seen = []
+        original = sandbox_module._validate_source
+        monkeypatch.setattr(
+            sandbox_module, "_validate_source",
+            lambda code, rules: seen.append(code) or original(code, rules),
+        )
+        sandbox = ExecutionSandbox()
+        sandbox.validate_code("x = 1")
+        results = sandbox.validate_many(self.CODES)
+        assert sorted(seen) == sorted(set(self.CODES))
+        assert results[0] == results[3]
+        assert results[0][0] is not results[3][0]
+
+    def test_empty_batch(self):
+        assert ExecutionSandbox().validate_many([]) == []
+
+    def test_process_pool(self, monkeypatch):
+        from agent_os import sandbox as sandbox_module
+
+        monkeypatch.setattr(sandbox_module, "_PARALLEL_VALIDATE_THRESHOLD", 1)
+        expected = [ExecutionSandbox().validate_code(c) for c in self.CODES]
+        assert ExecutionSandbox().validate_many(self.CODES, max_workers=2) == expected
+
+    def test_pool_failure_falls_back_to_inline(self, monkeypatch):
+        from agent_os import sandbox as sandbox_module
+
+        def broken(*args, **kwargs):
+            raise OSError("no processes")
+
+        monkeypatch.setattr(sandbox_module, "_PARALLEL_VALIDATE_THRESHOLD", 1)
+        monkeypatch.setattr(sandbox_module, "ProcessPoolExecutor", broken)
+        results = ExecutionSandbox().validate_many(self.CODES, max_workers=2)
+        assert [len(r) for r in results] == [1, 0, 1, 1, 1, 1]
+
 
 # ---------------------------------------------------------------------------
 # Restricted globals
@@ -1,10 +1,13 @@
 """Tests for webhook notification system."""
 
+import base64
 import json
+import os
 import threading
 import time
 import urllib.error
 from http.client import HTTPResponse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from io import BytesIO
 from unittest.mock import MagicMock, patch
 
@@ -185,19 +188,6 @@ class TestWebhookNotifier:
         assert req.get_header("Content-type") == "application/json"
         assert req.get_header("X-custom") == "val"
 
-    def test_notify_async_runs_in_background(self):
-        cfg = WebhookConfig(url="https://a.com/hook")
-        notifier = WebhookNotifier([cfg])
-        event = WebhookEvent(event_type="test", agent_id="a1", action="run")
-
-        with patch("urllib.request.urlopen", return_value=_mock_response(200)):
-            thread = notifier.notify_async(event)
-            thread.join(timeout=5.0)
-
-        assert not thread.is_alive()
-        assert len(notifier.get_history()) == 1
-        assert notifier.get_history()[0].success
-
     def test_notify_violation(self):
         cfg = WebhookConfig(url="https://a.com/hook")
         notifier = WebhookNotifier([cfg])
@@ -290,3 +280,225 @@ class TestWebhookNotifier:
         event = WebhookEvent(event_type="test", agent_id="a1", action="run")
         records = notifier.notify(event)
         assert records == []
+
+
+# =============================================================================
+# Asynchronous delivery against a local HTTP stand-in
+# =============================================================================
+
+
+class _Receiver:
+    """Local keep-alive HTTP endpoint that records the JSON bodies it receives."""
+
+    def __init__(self, fail_first=0, delay=0.0):
+        receiver = self
+        self.bodies = []
+        self.paths = []
+        self.proxy_auth = []
+        self.connections = set()
+        self.fail_first = fail_first
+        self.delay = delay
+        self.lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if receiver.delay:
+                    time.sleep(receiver.delay)
+                with receiver.lock:
+                    receiver.connections.add(self.client_address)
+                    receiver.paths.append(self.path)
+                    receiver.proxy_auth.append(self.headers.get("Proxy-Authorization"))
+                    failing = receiver.fail_first > 0
+                    if failing:
+                        receiver.fail_first -= 1
+                    else:
+                        receiver.bodies.append(body)
+                self.send_response(503 if failing else 200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/hook"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def receiver():
+    r = _Receiver()
+    yield r
+    r.close()
+
+
+def _event(i=0):
+    return WebhookEvent(event_type=f"e{i}", agent_id="a1", action="run")
+
+
+class TestAsyncDelivery:
+    def test_notify_async_returns_future_of_records(self, receiver):
+        notifier = WebhookNotifier([WebhookConfig(url=receiver.url)])
+        records = notifier.notify_async(_event()).result(timeout=5.0)
+        notifier.close(timeout=5.0)
+
+        assert len(records) == 1
+        assert records[0].success
+        assert records[0].status_code == 200
+        assert notifier.get_history()[0].success
+        assert receiver.bodies[0]["event_type"] == "e0"
+
+    def test_burst_uses_fixed_workers_and_keep_alive(self, receiver):
+        notifier = WebhookNotifier([WebhookConfig(url=receiver.url)], workers_per_endpoint=2)
+        for i in range(200):
+            notifier.notify_async(_event(i))
+        netloc = receiver.url.split("/")[2]
+        workers = [t for t in threading.enumerate() if t.name.startswith(f"webhook-{netloc}-")]
+        assert len(workers) == 2
+        assert notifier.flush(timeout=10.0)
+        notifier.close(timeout=5.0)
+
+        assert len(receiver.bodies) == 200
+        assert len(receiver.connections) <= 2
+        assert notifier.stats()["delivered"] == 200
+
+    def test_batching_groups_events(self, receiver):
+        cfg = WebhookConfig(url=receiver.url, batch_window=0.2, max_batch_size=50)
+        notifier = WebhookNotifier([cfg], workers_per_endpoint=1)
+        futures = [notifier.notify_async(_event(i)) for i in range(100)]
+        notifier.close(timeout=10.0)
+
+        assert all(f.result(timeout=1.0)[0].success for f in futures)
+        assert len(receiver.bodies) <= 4
+        events = [e["event_type"] for b in receiver.bodies for e in b["events"]]
+        assert sorted(events) == sorted(f"e{i}" for i in range(100))
+
+    def test_retries_with_backoff(self):
+        receiver = _Receiver(fail_first=2)
+        try:
+            cfg = WebhookConfig(url=receiver.url, retry_count=3, retry_delay=0.01)
+            notifier = WebhookNotifier([cfg])
+            records = notifier.notify_async(_event()).result(timeout=5.0)
+            notifier.close(timeout=5.0)
+        finally:
+            receiver.close()
+        assert records[0].success
+        assert len(receiver.bodies) == 1
+
+    def test_exhausted_retries_record_failure(self):
+        receiver = _Receiver(fail_first=10)
+        try:
+            cfg = WebhookConfig(url=receiver.url, retry_count=2, retry_delay=0.0)
+            notifier = WebhookNotifier([cfg])
+            records = notifier.notify_async(_event()).result(timeout=5.0)
+            notifier.close(timeout=5.0)
+        finally:
+            receiver.close()
+        assert not records[0].success
+        assert records[0].status_code == 503
+        assert notifier.stats()["failed"] == 1
+
+    def test_full_queue_drops(self):
+        receiver = _Receiver(delay=0.2)
+        try:
+            notifier = WebhookNotifier(
+                [WebhookConfig(url=receiver.url)], workers_per_endpoint=1, queue_size=2,
+            )
+            futures = [notifier.notify_async(_event(i)) for i in range(10)]
+            results = [f.result(timeout=5.0)[0] for f in futures]
+            notifier.close(timeout=5.0)
+        finally:
+            receiver.close()
+        dropped = [r for r in results if r.error == "queue full: event dropped"]
+        assert len(dropped) >= 5
+        assert notifier.stats()["dropped"] == len(dropped)
+
+    def test_full_queue_spills_and_replays(self, tmp_path):
+        receiver = _Receiver(delay=0.05)
+        try:
+            notifier = WebhookNotifier(
+                [WebhookConfig(url=receiver.url)],
+                workers_per_endpoint=1,
+                queue_size=2,
+                overflow="spill",
+                spill_dir=str(tmp_path),
+            )
+            for i in range(10):
+                notifier.notify_async(_event(i))
+            assert notifier.stats()["spilled"] > 0
+            deadline = time.monotonic() + 10.0
+            while len(receiver.bodies) < 10 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            notifier.close(timeout=5.0)
+        finally:
+            receiver.close()
+        assert sorted(b["event_type"] for b in receiver.bodies) == sorted(f"e{i}" for i in range(10))
+        assert os.listdir(tmp_path) == []
+
+    def test_unserializable_event_fails_without_killing_worker(self, receiver):
+        notifier = WebhookNotifier([WebhookConfig(url=receiver.url)], workers_per_endpoint=1)
+        bad = WebhookEvent(event_type="bad", agent_id="a1", action="run", details={"obj": object()})
+        bad_records = notifier.notify_async(bad).result(timeout=5.0)
+        good_records = notifier.notify_async(_event()).result(timeout=5.0)
+        notifier.close(timeout=5.0)
+
+        assert not bad_records[0].success
+        assert "not serializable" in bad_records[0].error
+        assert good_records[0].success
+        assert [b["event_type"] for b in receiver.bodies] == ["e0"]
+        assert notifier.stats()["failed"] == 1
+
+    def test_corrupt_spill_line_is_skipped(self, receiver, tmp_path):
+        notifier = WebhookNotifier(
+            [WebhookConfig(url=receiver.url)],
+            workers_per_endpoint=1,
+            overflow="spill",
+            spill_dir=str(tmp_path),
+        )
+        with open(tmp_path / "endpoint-0.jsonl", "w", encoding="utf-8") as f:
+            f.write("{not json\n")
+            f.write(json.dumps({"event_type": "spilled", "agent_id": "a1", "action": "run"}) + "\n")
+        assert notifier.notify_async(_event()).result(timeout=5.0)[0].success
+        deadline = time.monotonic() + 10.0
+        while len(receiver.bodies) < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        notifier.close(timeout=5.0)
+
+        assert sorted(b["event_type"] for b in receiver.bodies) == ["e0", "spilled"]
+        assert notifier.stats()["dropped"] == 1
+        assert os.listdir(tmp_path) == []
+
+    def test_delivers_through_http_proxy(self, receiver, monkeypatch):
+        proxy = receiver.url.replace("http://", "http://user:secret@").rsplit("/", 1)[0]
+        monkeypatch.setenv("HTTP_PROXY", proxy)
+        monkeypatch.setenv("NO_PROXY", "")
+        notifier = WebhookNotifier([WebhookConfig(url="http://hooks.example/hook?team=1")])
+        records = notifier.notify_async(_event()).result(timeout=5.0)
+        notifier.close(timeout=5.0)
+
+        assert records[0].success
+        assert receiver.paths == ["http://hooks.example/hook?team=1"]
+        assert receiver.proxy_auth == ["Basic " + base64.b64encode(b"user:secret").decode()]
+
+    def test_no_proxy_bypasses_proxy(self, receiver, monkeypatch):
+        monkeypatch.setenv("HTTP_PROXY", "http://127.0.0.1:9")
+        monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+        notifier = WebhookNotifier([WebhookConfig(url=receiver.url, retry_count=1)])
+        records = notifier.notify_async(_event()).result(timeout=5.0)
+        notifier.close(timeout=5.0)
+
+        assert records[0].success
+        assert receiver.paths == ["/hook"]
+
+    def test_invalid_overflow(self):
+        with pytest.raises(ValueError):
+            WebhookNotifier([], overflow="block")
+        with pytest.raises(ValueError):
+            WebhookNotifier([], overflow="spill")